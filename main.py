@@ -101,6 +101,7 @@ async def run_server(
     finally:
         if orchestrator:
             orchestrator.stop()
+        await container.aclose()
 
 
 async def run_collect_now(settings: Settings, config: AppConfig, sources: list[str]) -> None:
@@ -132,6 +133,8 @@ async def run_collect_now(settings: Settings, config: AppConfig, sources: list[s
         except Exception as e:
             print(f"[{source}] 오류: {e}")
 
+    await container.aclose()
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="SNS Tech Briefing System")
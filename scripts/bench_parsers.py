@@ -0,0 +1,99 @@
+"""수집기 파서 벤치마크 — 기록된 원본 페이로드를 오프라인 재생.
+
+소스별 record_payloads: true로 한동안 수집하면 data/payloads/<source>/에 원본
+(GraphQL JSON·HTML·XML)이 쌓인다. 이 스크립트는 그 파일을 브라우저·네트워크 없이
+각 파서에 먹여 파서별 처리량(posts/sec)·할당 블록·피크 메모리를 재고, 결과를
+이력 파일(JSONL)에 덧붙인 뒤 직전 실행들의 중앙값과 비교해 회귀를 알린다.
+
+사용법:
+    python scripts/bench_parsers.py                       # data/payloads, 5회 재생
+    python scripts/bench_parsers.py path/to/payloads --runs 20
+    python scripts/bench_parsers.py --no-history          # 이력에 남기지 않고 보기만
+회귀가 있으면 종료 코드 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.collectors.payload_recorder import DEFAULT_PAYLOAD_DIR  # noqa: E402
+from src.infrastructure.collectors.replay import (  # noqa: E402
+    compare_to_history,
+    discover,
+    replay,
+)
+
+_HISTORY = Path("data/bench/parsers.jsonl")
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def _load_history(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("root", nargs="?", default=str(DEFAULT_PAYLOAD_DIR), help="페이로드 디렉터리")
+    ap.add_argument("--runs", type=int, default=5, help="파서별 반복 재생 횟수")
+    ap.add_argument("--history", default=str(_HISTORY), help="결과 이력 JSONL")
+    ap.add_argument("--no-history", action="store_true", help="이력에 기록하지 않음")
+    ap.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 비율 (0.2 = 20%%)")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.ERROR)  # 파서의 구조 변경 경고만 보인다
+
+    fixtures = discover(args.root)
+    if not fixtures:
+        print(f"페이로드 없음: {args.root} — 소스 설정에 record_payloads: true로 먼저 수집하세요")
+        return 0
+
+    rows = [replay(key, paths, args.runs).as_dict() for key, paths in sorted(fixtures.items())]
+
+    hdr = f"{'파서':24} {'파일':>5} {'KB':>8} {'항목':>6} {'posts/s':>10} {'할당블록':>9} {'피크KB':>8}"
+    print(hdr)
+    print("-" * len(hdr))
+    for r in rows:
+        print(
+            f"{r['parser']:24} {r['fixtures']:5} {r['payload_kb']:8.1f} {r['items']:6} "
+            f"{r['posts_per_sec']:10.0f} {r['alloc_blocks']:9} {r['peak_kb']:8.0f}"
+        )
+
+    history_path = Path(args.history)
+    regressions = compare_to_history(rows, _load_history(history_path), args.threshold)
+    if not args.no_history:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().isoformat(timespec="seconds")
+        rev = _git_rev()
+        with history_path.open("a", encoding="utf-8") as f:
+            for r in rows:
+                f.write(json.dumps({"at": stamp, "rev": rev, **r}, ensure_ascii=False) + "\n")
+
+    print()
+    if regressions:
+        print("회귀 의심 (직전 실행 중앙값 대비)")
+        for line in regressions:
+            print(f"  · {line}")
+        return 1
+    print("회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+"""data/posts.db의 파생 인덱스를 posts 원본 기준으로 다시 만든다.
+
+- post_hourly_counts: 시간별 (source, relevant, category) 집계 롤업.
+  평소엔 posts 트리거가 증분 갱신한다. 트리거 도입 전 데이터를 처음 채울 때
+  (init 시 자동 1회)나 DB를 외부 도구로 고친 뒤 불일치가 의심될 때 쓴다.
+- --fts: posts_fts 전문 검색 인덱스도 함께 재색인한다.
+
+사용법:
+    python scripts/rebuild_rollups.py
+    python scripts/rebuild_rollups.py --fts
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.database.repositories import post_repo_sqlite as repo_mod  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--fts", action="store_true", help="posts_fts 전문 검색 인덱스도 재색인")
+    args = ap.parse_args()
+
+    if not repo_mod.DB_PATH.exists():
+        print(f"DB 파일이 없다: {repo_mod.DB_PATH}")
+        return 1
+    repo_mod.init_sqlite_db()
+
+    t0 = time.perf_counter()
+    rows = repo_mod.rebuild_rollups()
+    print(f"post_hourly_counts: {rows:,}행 재계산 ({time.perf_counter() - t0:.2f}s)")
+
+    if args.fts:
+        t0 = time.perf_counter()
+        repo_mod.rebuild_search_index()
+        print(f"posts_fts: 재색인 완료 ({time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,9 @@ reasoning 을 따로 보는 이유: 추론 모델(gpt-5-mini)은 reasoning 토
 요금에 포함된다. out 중 reasoning 비중이 크면 줄일 자리는 '프롬프트'가
 아니라 '추론 깊이/작업 난이도'다.
 
+응답 캐시(llm_cache, response_cache.py)에 적중한 호출은 CLI를 띄우지 않는다 —
+`llm_cache=hit` 줄은 호출·토큰에 넣지 않고 '응답캐시' 열에 따로 센다.
+
 cache 를 따로 보는 이유: Claude CLI는 호출당 고정 오버헤드(~23k)가 거의
 전부 cache_read 로 잡히고, 한도 가중치가 다르다(cache_read ~0.1x,
 cache_write ~1.25x). in+out 만 보면 오버헤드가 실제보다 10배 커 보인다.
@@ -34,6 +37,7 @@ LINE = re.compile(
     r"(?:\s+\(reasoning=(?P<reasoning>\d+)\))?"
     r"(?:\s+\(cache_read=(?P<cache_read>\d+)\s+cache_write=(?P<cache_write>\d+)\))?"
     r"(?:\s+\(cached=(?P<cached>\d+)\s+reasoning=(?P<codex_reasoning>\d+)\))?"
+    r"(?:\s+llm_cache=(?P<llm_cache>hit|miss|bypass))?"
 )
 
 _KEYS = ("in", "out", "reasoning", "cache_read", "cache_write")
@@ -46,7 +50,7 @@ def main() -> int:
         return 1
 
     stats: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"calls": 0, **{k: 0 for k in _KEYS}}
+        lambda: {"calls": 0, "llm_cache_hits": 0, **{k: 0 for k in _KEYS}}
     )
     with path.open(encoding="utf-8", errors="ignore") as f:
         for line in f:
@@ -54,6 +58,9 @@ def main() -> int:
             if not m:
                 continue
             s = stats[m.group("model")]
+            if m.group("llm_cache") == "hit":
+                s["llm_cache_hits"] += 1
+                continue
             s["calls"] += 1
             for k in _KEYS:
                 value = m.group(k)
@@ -73,22 +80,24 @@ def main() -> int:
     print()
     hdr = (
         f"{'모델':22} {'호출':>6} {'입력tok':>12} {'출력tok':>11} "
-        f"{'추론tok':>11} {'캐시읽기':>12} {'캐시쓰기':>11}"
+        f"{'추론tok':>11} {'캐시읽기':>12} {'캐시쓰기':>11} {'응답캐시':>8}"
     )
     print(hdr)
     print("-" * len(hdr))
-    tot = {"calls": 0, **{k: 0 for k in _KEYS}}
+    tot = {"calls": 0, "llm_cache_hits": 0, **{k: 0 for k in _KEYS}}
     for model, s in sorted(stats.items(), key=lambda kv: -kv[1]["in"]):
         print(
             f"{model:22} {s['calls']:6,} {s['in']:12,} {s['out']:11,} "
-            f"{s['reasoning']:11,} {s['cache_read']:12,} {s['cache_write']:11,}"
+            f"{s['reasoning']:11,} {s['cache_read']:12,} {s['cache_write']:11,} "
+            f"{s['llm_cache_hits']:8,}"
         )
         for k in tot:
             tot[k] += s[k]
     print("-" * len(hdr))
     print(
         f"{'합계':22} {tot['calls']:6,} {tot['in']:12,} {tot['out']:11,} "
-        f"{tot['reasoning']:11,} {tot['cache_read']:12,} {tot['cache_write']:11,}"
+        f"{tot['reasoning']:11,} {tot['cache_read']:12,} {tot['cache_write']:11,} "
+        f"{tot['llm_cache_hits']:8,}"
     )
 
     if tot["calls"]:
@@ -96,6 +105,9 @@ def main() -> int:
         print(f"호출당 평균: 입력 {tot['in']//tot['calls']:,}tok / 출력 {tot['out']//tot['calls']:,}tok")
         if tot["out"]:
             print(f"추론 비중(출력 대비): {100 * tot['reasoning'] / tot['out']:.1f}%")
+    if tot["llm_cache_hits"]:
+        asked = tot["calls"] + tot["llm_cache_hits"]
+        print(f"응답 캐시 적중: {tot['llm_cache_hits']:,}/{asked:,} ({100 * tot['llm_cache_hits'] / asked:.1f}%)")
 
     print()
     print("해석 가이드")
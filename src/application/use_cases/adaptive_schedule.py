@@ -0,0 +1,205 @@
+"""소스별 수집 주기 adaptive 조정 — 관련 게시물 수확률(요일×시간) 기반.
+
+고정 interval_minutes는 한산한 새벽에도 붐비는 낮과 똑같이 브라우저 시간과 필터
+토큰을 쓴다. 최근 lookback_days의 collection_runs(분모: 끝난 실행 수)와 새로 들어온
+관련 게시물 수(분자: posts.created_at — 처음 저장된 시각)를 KST 요일×시간 168칸으로
+모아 칸별 '실행당 새 관련 게시물'을 구하고, 소스 평균 대비 배율로 주기를 늘리거나 줄인다:
+
+    계획 주기 = interval_minutes × (소스 평균 수확률 / 칸 수확률)
+              → [하한, 상한]으로 자르고 KST 정렬 가능한 값(ALIGNED_INTERVALS)으로 맞춤
+
+칸 수확률에는 prior_runs개의 가상 실행(소스 평균)을 섞어 표본이 적은 칸이 튀지 않게
+한다. 주기를 늘리면 실행당 수확이 늘어 배율이 1 쪽으로 돌아오므로 한쪽으로 쏠리지
+않는다. 이력이 모자라거나 관련 게시물이 아예 없는 소스(AI 필터를 거치지 않는
+donga_series 등)는 고정 주기 그대로 둔다.
+
+분자를 post_hourly_counts로 세지 않는 이유: 그 롤업은 collected_at 기준인데, 재수집에서
+인게이지먼트가 바뀔 때마다 collected_at이 옮겨 간다. 관련 글이 처음 발견된 시간이
+아니라 마지막으로 좋아요가 늘어난 시간에 잡혀, 옛 글만 출렁이는 붐비는 시간대가
+수확이 좋은 것처럼 보인다.
+
+처리 지연: 관련 여부는 AI 처리(processing_interval_minutes 주기, 밀리면 더 늦게)가
+정한다. 방금 수집된 글은 아직 미처리(is_relevant NULL)라 최근 몇 시간 칸은 분자만
+덜 세어진다. 그래서 분자·분모 모두 최근 _SETTLE 구간을 빼고 센다 — 처리가 그보다
+더 밀리면 최근 칸이 여전히 한산해 보여 주기가 조금 늘 수 있다(다음 재계획에서 회복).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from src.domain.repositories.collection_run_repository import CollectionRunRepository
+from src.domain.repositories.post_repository import PostRepository
+from src.infrastructure.config.settings import CollectorConfig, ScheduleConfig
+
+# Orchestrator._collection_trigger가 KST 벽시계에 정렬할 수 있는 주기(60의 약수·배수)
+ALIGNED_INTERVALS = (10, 15, 20, 30, 60, 120, 180, 240, 360, 480, 720)
+
+_HOUR_KEY = "%Y-%m-%d %H:00:00"  # count_relevant_by_first_seen / count_runs_by_hour 키 (UTC)
+
+# 수확률 집계에서 빼는 최근 구간 — 이 안의 글은 아직 AI 처리 전일 수 있다
+_SETTLE = timedelta(hours=2)
+
+# 대시보드가 호출할 때 이보다 오래된 집계면 다시 읽는다
+_SNAPSHOT_MAX_AGE = timedelta(minutes=10)
+
+
+def hour_of_week(dt: datetime) -> int:
+    """월요일 0시 = 0 … 일요일 23시 = 167 (dt의 시간대 기준)."""
+    return dt.weekday() * 24 + dt.hour
+
+
+def snap_interval(minutes: float, low: int, high: int) -> int:
+    """[low, high] 안의 정렬 가능한 주기 중 minutes에 가장 가까운 값 (비율 거리).
+    범위 안에 정렬 가능한 값이 없으면 범위로 자른 분 값 — 트리거는 인터벌 방식이 된다."""
+    candidates = [m for m in ALIGNED_INTERVALS if low <= m <= high]
+    if not candidates:
+        return int(min(max(round(minutes), low), high))
+    return min(candidates, key=lambda m: abs(math.log(m / max(minutes, 1e-9))))
+
+
+@dataclass
+class _YieldProfile:
+    """소스 1개의 요일×시간 칸별 실행 수·관련 게시물 수."""
+
+    runs: list[int] = field(default_factory=lambda: [0] * 168)
+    relevant: list[int] = field(default_factory=lambda: [0] * 168)
+
+    @property
+    def total_runs(self) -> int:
+        return sum(self.runs)
+
+    @property
+    def mean_yield(self) -> float:
+        total = self.total_runs
+        return sum(self.relevant) / total if total else 0.0
+
+    def cell_yield(self, how: int, prior_runs: float) -> float:
+        mean = self.mean_yield
+        return (self.relevant[how] + prior_runs * mean) / (self.runs[how] + prior_runs)
+
+
+@dataclass
+class SourcePlan:
+    """대시보드용 — 소스 1개의 고정 주기 대비 계획."""
+
+    source: str
+    fixed: int
+    planned: int  # 지금 시간대 계획 주기
+    applied: int | None  # 스케줄러에 실제로 걸린 주기 (스케줄러가 꺼져 있으면 None)
+    runs: int
+    mean_yield: float
+    next_24h: list[tuple[str, int]]  # [(KST "HH시", 계획 주기)]
+
+    def as_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "fixed": self.fixed,
+            "planned": self.planned,
+            "applied": self.applied,
+            "runs": self.runs,
+            "mean_yield": round(self.mean_yield, 2),
+            "next_24h": [{"hour": h, "interval": m} for h, m in self.next_24h],
+        }
+
+
+class AdaptiveSchedulePlanner:
+    """수확률 집계를 들고 있다가 (소스, 시각) → 주기(분)를 정한다.
+
+    집계는 refresh()로 갱신한다 — Orchestrator가 매시 replan_minute에, 대시보드는
+    집계가 오래됐을 때 부른다. applied는 Orchestrator가 실제 건 주기를 적어 두는 곳.
+    """
+
+    def __init__(
+        self,
+        config: ScheduleConfig,
+        collectors: dict[str, CollectorConfig],
+        run_repo: CollectionRunRepository,
+        post_repo: PostRepository,
+        tz: ZoneInfo,
+    ):
+        self._config = config
+        self._collectors = collectors
+        self._run_repo = run_repo
+        self._post_repo = post_repo
+        self._tz = tz
+        self._profiles: dict[str, _YieldProfile] = {}
+        self.applied: dict[str, int] = {}
+        self.refreshed_at: datetime | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.adaptive
+
+    async def refresh(self) -> None:
+        now = datetime.utcnow()
+        since = now - timedelta(days=self._config.lookback_days)
+        until = (now - _SETTLE).strftime(_HOUR_KEY)  # 이 시 키부터는 처리 전일 수 있다
+        runs = {
+            key: count
+            for key, count in (await self._run_repo.count_runs_by_hour(since)).items()
+            if key[1] < until
+        }
+        first_seen = await self._post_repo.count_relevant_by_first_seen(
+            since, datetime.strptime(until, _HOUR_KEY)
+        )
+
+        profiles: dict[str, _YieldProfile] = {}
+        for (source, hour), count in runs.items():
+            profiles.setdefault(source, _YieldProfile()).runs[self._how(hour)] += count
+        for (source, hour), count in first_seen.items():
+            if (source, hour) not in runs:
+                # 정시를 넘겨 끝난 실행이 저장한 글 — 실행이 시작된 앞 시간으로 돌린다
+                prev = datetime.strptime(hour, _HOUR_KEY) - timedelta(hours=1)
+                hour = prev.strftime(_HOUR_KEY)
+            profiles.setdefault(source, _YieldProfile()).relevant[self._how(hour)] += count
+        self._profiles = profiles
+        self.refreshed_at = now
+
+    def _how(self, utc_hour_key: str) -> int:
+        dt = datetime.strptime(utc_hour_key, _HOUR_KEY).replace(tzinfo=timezone.utc)
+        return hour_of_week(dt.astimezone(self._tz))
+
+    def bounds(self, source: str) -> tuple[int, int]:
+        cfg = self._collectors[source]
+        fixed = cfg.interval_minutes
+        low = cfg.min_interval_minutes or math.ceil(fixed * self._config.min_factor)
+        high = cfg.max_interval_minutes or int(fixed * self._config.max_factor)
+        return max(1, low), max(low, high)
+
+    def plan(self, source: str, at: datetime) -> int:
+        """at이 속한 KST 시간대에 쓸 주기(분). 판단 근거가 없으면 고정 주기."""
+        fixed = self._collectors[source].interval_minutes
+        profile = self._profiles.get(source)
+        if profile is None or profile.total_runs < self._config.min_runs or not profile.mean_yield:
+            return fixed
+        cell = profile.cell_yield(hour_of_week(at.astimezone(self._tz)), self._config.prior_runs)
+        low, high = self.bounds(source)
+        target = fixed * profile.mean_yield / cell if cell > 0 else high
+        return snap_interval(target, low, high)
+
+    async def snapshot(self, sources: list[str]) -> list[SourcePlan]:
+        """대시보드 패널 — 소스별 고정·적용·계획 주기와 앞으로 24시간 계획."""
+        if self.refreshed_at is None or datetime.utcnow() - self.refreshed_at > _SNAPSHOT_MAX_AGE:
+            await self.refresh()
+        now = datetime.now(tz=self._tz).replace(minute=0, second=0, microsecond=0)
+        hours = [now + timedelta(hours=h) for h in range(24)]
+        plans = []
+        for source in sources:
+            if source not in self._collectors:
+                continue
+            profile = self._profiles.get(source) or _YieldProfile()
+            day = [(f"{h.hour:02d}시", self.plan(source, h)) for h in hours]
+            plans.append(SourcePlan(
+                source=source,
+                fixed=self._collectors[source].interval_minutes,
+                planned=day[0][1],
+                applied=self.applied.get(source),
+                runs=profile.total_runs,
+                mean_yield=profile.mean_yield,
+                next_24h=day,
+            ))
+        return plans
@@ -16,6 +16,7 @@ from src.domain.exceptions import CollectionError, SessionExpiredError
 from src.domain.repositories.collection_run_repository import CollectionRunRepository
 from src.domain.repositories.post_repository import PostRepository
 from src.domain.services.collector import Collector
+from src.domain.services.seen_filter import SeenPostFilter
 from src.domain.value_objects.content_hash import compute_content_hash
 
 logger = logging.getLogger(__name__)
@@ -30,11 +31,13 @@ class CollectPostsUseCase:
         post_repo: PostRepository,
         run_repo: CollectionRunRepository,
         max_retries: int = 3,
+        seen: SeenPostFilter | None = None,
     ):
         self._collector = collector
         self._post_repo = post_repo
         self._run_repo = run_repo
         self._max_retries = max_retries
+        self._seen = seen
 
     async def execute(self) -> CollectionRun:
         source = self._collector.source_name
@@ -56,17 +59,45 @@ class CollectPostsUseCase:
 
             # 재시도 로직으로 수집
             posts = await self._collect_with_retry()
+            collected = len(posts)
+
+            # 저장된 글과 지문이 같은 재수집분은 해시·저장 전에 걸러낸다 (UPSERT 가드까지 갈 필요 없음)
+            skipped = 0
+            if self._seen is not None:
+                posts, skipped = self._seen.split_unchanged(posts)
 
             # 콘텐츠 해시 계산 및 저장
             for post in posts:
                 post.content_hash = compute_content_hash(post.content_text)
 
-            saved_count = self._post_repo.save_many(posts)
+            result = await self._post_repo.save_many_async(posts)
+            if self._seen is not None:
+                self._seen.remember(posts)
+            # HTTP 조건부 GET 검증자는 저장까지 끝난 뒤에 반영 — 실패한 수집의 본문을
+            # 다음 사이클이 304·본문 동일로 건너뛰지 않게
+            fetch_stats = getattr(self._collector, "fetch_stats", None)
+            commit_validators = getattr(fetch_stats, "commit_validators", None)
+            if commit_validators is not None:
+                await commit_validators()
 
             run.status = "success"
-            run.posts_collected = saved_count
+            run.posts_collected = result.total + skipped
+            run.posts_inserted = result.inserted
+            run.posts_updated = result.updated
+            run.posts_unchanged = result.unchanged + skipped
+            # HTTP 수집기는 조건부 GET 적중 집계를 남긴다 (CDP 수집기엔 없음)
+            if fetch_stats is not None:
+                run.http_requests = fetch_stats.requests
+                run.http_cache_hits = fetch_stats.hits
+            # 스크롤 수집기는 라운드별 신규 수확을 남긴다 (scroll_rounds 튜닝용)
+            scroll_stats = getattr(self._collector, "scroll_stats", None)
+            if scroll_stats is not None:
+                run.scroll_yields = list(scroll_stats.yields)
             run.completed_at = datetime.utcnow()
-            logger.info(f"[{source}] 수집 완료: {saved_count}건 저장 (전체 {len(posts)}건)")
+            logger.info(
+                f"[{source}] 수집 완료: 신규 {result.inserted} / 변경 {result.updated} / "
+                f"무변경 {run.posts_unchanged} (전체 {collected}건, 저장 전 생략 {skipped}건)"
+            )
 
         except SessionExpiredError:
             run.status = "failed"
@@ -24,6 +24,7 @@ from src.domain.repositories.briefing_repository import BriefingRepository
 from src.domain.repositories.post_repository import PostRepository
 from src.domain.services.ai_processor import AIProcessor
 from src.domain.services.briefing_generator import BriefingGenerator
+from src.domain.services.seen_filter import SeenPostFilter
 from src.infrastructure.ai.importance_scorer import (
     renormalize_topics_by_category,
     score_posts_by_category,
@@ -61,6 +62,7 @@ class GenerateBriefingUseCase:
         briefing_generator: BriefingGenerator,
         scoring_config: ScoringConfig,
         feedback_repo=None,
+        seen: SeenPostFilter | None = None,
     ):
         self._post_repo = post_repo
         self._briefing_repo = briefing_repo
@@ -68,10 +70,16 @@ class GenerateBriefingUseCase:
         self._gen = briefing_generator
         self._scoring = scoring_config
         self._feedback_repo = feedback_repo
+        self._seen = seen
 
     async def execute(self, period_start: datetime, period_end: datetime) -> Briefing:
-        """미브리핑 게시물로 브리핑 생성."""
-        posts = await self._post_repo.get_unbriefed(limit=10000)
+        """미브리핑 게시물로 브리핑 생성.
+
+        ①~⑤.5는 경량 PostSummary(컬럼 프로젝션)로만 돈다 — 점수·클러스터링·검증은
+        id·소스·인게이지먼트·요약·카테고리·시각만 쓴다. 원문이 필요한 ⑥ 작문 직전에
+        발행 확정 토픽의 구성 게시물만 id로 하이드레이션한다.
+        """
+        posts = await self._post_repo.get_unbriefed_summaries(limit=10000)
         if not posts:
             logger.warning("브리핑 생성할 미브리핑 게시물 없음")
             return Briefing(
@@ -113,7 +121,10 @@ class GenerateBriefingUseCase:
         selected = self._gen.select_topics(merged_topics)
         logger.info(f"발행 항목 확정: {len(merged_topics)}개 토픽 중 {len(selected)}개")
         selected = await self._final_dedup_guard(selected)
-        selected = await self._ai.compose_topics(selected, posts)
+        member_posts = await self._post_repo.get_by_ids(
+            [pid for t in selected for pid in (t.post_ids or [])]
+        )
+        selected = await self._ai.compose_topics(selected, member_posts)
 
         # ⑦ 브리핑 문서 생성 (generate 내부 재선별은 멱등)
         briefing = await self._gen.generate(
@@ -137,7 +148,12 @@ class GenerateBriefingUseCase:
         try:
             purged = await self._post_repo.delete_low_importance(PURGE_MAX_SCORE)
             if purged:
-                logger.info(f"저중요도({PURGE_MAX_SCORE} 이하) 브리핑 완료 게시물 삭제: {purged}건")
+                # 지운 글이 다시 수집되면 새 글로 받도록 이미 본 글 인덱스에서도 뺀다
+                if self._seen is not None:
+                    self._seen.forget(purged)
+                logger.info(
+                    f"저중요도({PURGE_MAX_SCORE} 이하) 브리핑 완료 게시물 삭제: {len(purged)}건"
+                )
         except Exception as e:
             logger.warning(f"저중요도 게시물 삭제 실패(무시): {e}")
 
@@ -2,6 +2,7 @@
 
 미처리 게시물(SQLite)을 청크 단위로 가져와 필터링·요약·분류를 수행하고
 결과를 DB에 반영한다. 비관련 게시물은 삭제하지 않고 is_relevant=False로만 표시한다.
+필터와 분류·저장은 두 단계 파이프라인으로 겹쳐 돈다(청크 N 분류 중 N+1 필터).
 """
 
 from __future__ import annotations
@@ -9,7 +10,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
 import unicodedata
+from dataclasses import dataclass, field
 
 from src.domain.repositories.post_repository import PostRepository
 from src.domain.services.ai_processor import AIProcessor
@@ -125,6 +128,55 @@ def _sanitize_categories(post, categories: list[str]) -> list[str]:
     return cleaned
 
 
+@dataclass
+class _FilteredChunk:
+    """필터 단계를 마치고 분류·저장을 기다리는 청크."""
+
+    total: int
+    relevant: list
+    irrelevant: list
+
+
+@dataclass
+class _StageStats:
+    name: str
+    chunks: int = 0
+    posts: int = 0
+    busy_s: float = 0.0
+
+    def add(self, posts: int, elapsed: float) -> None:
+        self.chunks += 1
+        self.posts += posts
+        self.busy_s += elapsed
+
+    def __str__(self) -> str:
+        rate = self.posts / self.busy_s if self.busy_s else 0.0
+        return f"{self.name} {self.chunks}청크·{self.posts}건 {self.busy_s:.1f}s ({rate:.1f}건/s)"
+
+
+@dataclass
+class _PipelineStats:
+    """단계별 처리량과 큐 점유 — 어느 쪽이 병목인지 로그로 본다.
+
+    occupancy는 분류·저장 단계가 다음 청크를 꺼내러 올 때의 큐 길이다. 0이 잦으면
+    필터(LLM)가, 꽉 차 있고 put_wait가 길면 분류·저장이 병목이다.
+    """
+
+    depth: int
+    filter: _StageStats = field(default_factory=lambda: _StageStats("필터"))
+    store: _StageStats = field(default_factory=lambda: _StageStats("분류·저장"))
+    occupancy: list[int] = field(default_factory=list)
+    put_wait_s: float = 0.0
+    get_wait_s: float = 0.0
+
+    def __str__(self) -> str:
+        avg = sum(self.occupancy) / len(self.occupancy) if self.occupancy else 0.0
+        return (
+            f"{self.filter} → {self.store}, 큐 평균 {avg:.1f}/{self.depth} "
+            f"(필터 대기 {self.put_wait_s:.1f}s, 분류 대기 {self.get_wait_s:.1f}s)"
+        )
+
+
 class ProcessPostsUseCase:
     """미처리 게시물에 대해 AI 처리를 수행하는 유즈케이스."""
 
@@ -133,12 +185,15 @@ class ProcessPostsUseCase:
         post_repo: PostRepository,
         ai_processor: AIProcessor,
         run_lock: asyncio.Lock | None = None,
+        pipeline_depth: int = 1,
     ):
         self._post_repo = post_repo
         self._ai = ai_processor
         # 컨테이너가 공유 락을 주입하면 interval 잡·브리핑 전 처리·수동 트리거가
         # 동시에 돌아도 같은 미처리 배치를 2중으로 LLM에 태우지 않는다.
         self._run_lock = run_lock
+        # 필터를 마치고 분류·저장을 기다릴 수 있는 청크 수 (필터가 앞서 나가는 한도)
+        self._pipeline_depth = max(1, pipeline_depth)
 
     async def execute(
         self,
@@ -160,51 +215,107 @@ class ProcessPostsUseCase:
         chunk_size: int,
         min_posts_threshold: int,
     ) -> dict[str, int]:
-        totals = {"total": 0, "relevant": 0, "filtered_out": 0}
-        processed_total = 0
-        first_fetch = True
-        # 분류 실패로 미처리 상태로 남긴 게시물이 같은 실행에서 재fetch돼
-        # 필터를 또 타는 것을 방지 (재시도는 다음 실행에서)
-        seen_ids: set[str] = set()
-
-        while processed_total < limit:
-            remaining = limit - processed_total
-            # 첫 fetch는 threshold 검사를 위해 max(chunk_size, threshold)만큼 가져옴
-            fetch_size = (
-                max(chunk_size, min_posts_threshold) if first_fetch
-                else min(chunk_size, remaining)
-            )
-            chunk = self._post_repo.get_unprocessed(limit=fetch_size)
-            chunk = [p for p in chunk if str(p.id) not in seen_ids]
+        """청크 단위 2단 파이프라인: [조회→프리필터→필터] → 큐 → [분류→DB 반영].
 
-            if not chunk:
-                if first_fetch:
-                    logger.info("처리할 새 게시물 없음")
-                break
-
-            if first_fetch and len(chunk) < min_posts_threshold:
-                logger.info(
-                    f"처리 건수 부족 ({len(chunk)}건 < {min_posts_threshold}건), 스킵"
-                )
-                break
-
-            # 첫 fetch에서 chunk_size를 초과해 가져왔어도 처리는 chunk_size씩
-            chunk = chunk[: min(chunk_size, remaining)]
-            first_fetch = False
-            seen_ids.update(str(p.id) for p in chunk)
+        청크 N을 분류·저장하는 동안 청크 N+1을 필터한다 — LLM 백엔드가 DB·분류
+        차례를 기다리며 노는 시간을 없앤다. 큐는 pipeline_depth로 묶여 필터가
+        저장보다 멀리 앞서 나가지 않는다(크래시 시 유실되는 진행분 상한).
+        """
+        totals = {"total": 0, "relevant": 0, "filtered_out": 0}
+        stats = _PipelineStats(self._pipeline_depth)
+        queue: asyncio.Queue[_FilteredChunk | None] = asyncio.Queue(maxsize=self._pipeline_depth)
 
-            chunk_stats = await self._process_chunk(chunk)
-            totals["total"] += chunk_stats["total"]
-            totals["relevant"] += chunk_stats["relevant"]
-            totals["filtered_out"] += chunk_stats["filtered_out"]
-            processed_total += len(chunk)
+        started = time.perf_counter()
+        producer = asyncio.create_task(
+            self._filter_stage(queue, stats, limit, chunk_size, min_posts_threshold)
+        )
+        try:
+            while True:
+                stats.occupancy.append(queue.qsize())
+                t0 = time.perf_counter()
+                filtered = await queue.get()
+                stats.get_wait_s += time.perf_counter() - t0
+                if filtered is None:
+                    break
+                t0 = time.perf_counter()
+                chunk_stats = await self._categorize_and_store(filtered)
+                stats.store.add(filtered.total, time.perf_counter() - t0)
+                totals["total"] += chunk_stats["total"]
+                totals["relevant"] += chunk_stats["relevant"]
+                totals["filtered_out"] += chunk_stats["filtered_out"]
+        except BaseException:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        # 필터 단계 예외(LLMBackendError 등)는 이미 필터된 청크를 다 저장한 뒤 전파
+        await producer
 
         logger.info(
             f"AI 처리 완료: 전체 {totals['total']}건, "
             f"관련 {totals['relevant']}건, 비관련 {totals['filtered_out']}건"
         )
+        if stats.filter.chunks:
+            logger.info(
+                f"AI 처리 파이프라인: {stats}, 소요 {time.perf_counter() - started:.1f}s"
+            )
         return totals
 
+    async def _filter_stage(
+        self,
+        queue: asyncio.Queue,
+        stats: _PipelineStats,
+        limit: int,
+        chunk_size: int,
+        min_posts_threshold: int,
+    ) -> None:
+        """미처리 게시물을 청크로 읽어 필터까지 마치고 큐에 넣는다. 끝나면 None."""
+        processed_total = 0
+        first_fetch = True
+        # 분류 실패로 미처리 상태로 남긴 게시물이 같은 실행에서 재fetch돼
+        # 필터를 또 타는 것을 방지 (재시도는 다음 실행에서). 아직 분류·저장 중인
+        # 앞 청크도 DB상 미처리라 여기서 걸러진다.
+        seen_ids: set[str] = set()
+
+        try:
+            while processed_total < limit:
+                t0 = time.perf_counter()
+                remaining = limit - processed_total
+                # 첫 fetch는 threshold 검사를 위해 max(chunk_size, threshold)만큼 가져옴
+                fetch_size = (
+                    max(chunk_size, min_posts_threshold) if first_fetch
+                    else min(chunk_size, remaining)
+                )
+                # 이미 본 게시물(저장 대기·재시도분)이 앞자리를 차지해도 새 청크가 차도록 더 읽는다
+                chunk = self._post_repo.get_unprocessed(limit=fetch_size + len(seen_ids))
+                chunk = [p for p in chunk if str(p.id) not in seen_ids]
+
+                if not chunk:
+                    if first_fetch:
+                        logger.info("처리할 새 게시물 없음")
+                    break
+
+                if first_fetch and len(chunk) < min_posts_threshold:
+                    logger.info(
+                        f"처리 건수 부족 ({len(chunk)}건 < {min_posts_threshold}건), 스킵"
+                    )
+                    break
+
+                # 첫 fetch에서 chunk_size를 초과해 가져왔어도 처리는 chunk_size씩
+                chunk = chunk[: min(chunk_size, remaining)]
+                first_fetch = False
+                seen_ids.update(str(p.id) for p in chunk)
+
+                filtered = await self._filter_chunk(chunk)
+                stats.filter.add(len(chunk), time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                await queue.put(filtered)
+                stats.put_wait_s += time.perf_counter() - t0
+                processed_total += len(chunk)
+        except Exception:
+            await queue.put(None)  # 분류·저장 단계가 받은 청크까지 마저 반영하게
+            raise
+        await queue.put(None)
+
     def _split_previously_rejected(self, posts: list) -> tuple[list, list]:
         """동일 content_hash가 과거에 비관련 판정된 게시물을 분리해 즉시 기각 처리.
 
@@ -251,6 +362,10 @@ class ProcessPostsUseCase:
 
     async def _process_chunk(self, posts: list) -> dict[str, int]:
         """단일 청크에 대해 필터→검증→분류→업데이트 파이프라인을 실행."""
+        return await self._categorize_and_store(await self._filter_chunk(posts))
+
+    async def _filter_chunk(self, posts: list) -> _FilteredChunk:
+        """결정적 컷 + LLM 필터/요약 — 관련·비관련으로 나눈다 (DB 반영 전)."""
         logger.info(f"AI 처리 시작: {len(posts)}건")
 
         # 0. 결정적 컷 2종 — LLM을 태우지 않는다:
@@ -307,6 +422,14 @@ class ProcessPostsUseCase:
                 post.summary = "[filtered]"
                 irrelevant_posts.append(post)
 
+        return _FilteredChunk(total_count, relevant_posts, irrelevant_posts)
+
+    async def _categorize_and_store(self, chunk: _FilteredChunk) -> dict[str, int]:
+        """필터된 청크의 관련분 분류 + 중요도, 그리고 DB 반영."""
+        total_count = chunk.total
+        relevant_posts = chunk.relevant
+        irrelevant_posts = chunk.irrelevant
+
         # 2. (웹 검색 교차 검증은 여기서 하지 않는다 — 처리량 확보)
         #    검증은 비싸고(웹검색) 발행할 항목에만 필요하므로 브리핑 직전 후보에만 수행한다.
         #    (generate_briefing에서 verify_claims 실행)
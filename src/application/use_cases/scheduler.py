@@ -5,6 +5,7 @@ APScheduler를 사용해 수집, AI 처리, 브리핑 생성/전달을 자동화
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -55,18 +56,23 @@ class Orchestrator:
         self._c = container
         self._tz = ZoneInfo(container.config.timezone)
         self.scheduler = AsyncIOScheduler(timezone=self._tz)
+        self._planner = container.schedule_planner
+        self._stagger: dict[str, int] = {}  # 소스별 스태거 오프셋(분) — 주기를 바꿔도 유지
 
     def setup_jobs(self) -> None:
         """모든 정기 작업을 등록."""
         configs = self._c.config.collectors
 
         # ─── 수집 작업 (서버 시작 시 순차 실행 후 interval 반복) ───
-        # CDP 수집기 동시 실행 방지: 2분 간격으로 stagger
+        # 시작 부하 분산: 2분 간격으로 stagger (겹쳐 떠도 CDP 작업은 TabScheduler가
+        # 탭 예산·플랫폼 배제·수집 우선으로 배정한다)
         now = datetime.now(tz=self._tz)
         stagger_minutes = 0
         for source, cfg in configs.items():
             if not cfg.enabled or source not in self._c.collectors:
                 continue
+            self._stagger[source] = stagger_minutes
+            self._planner.applied[source] = cfg.interval_minutes
             trig = self._collection_trigger(cfg.interval_minutes, stagger_minutes)
             # 시작 직후 '너무 이른' 첫 슬롯은 건너뛴다: 한 인터벌 뒤부터의 정렬 슬롯을 첫 실행으로.
             # (예: 13:07 시작·10분 주기 → 13:10 건너뛰고 13:20부터)
@@ -102,6 +108,20 @@ class Orchestrator:
             )
             stagger_minutes += 2
 
+        # ─── adaptive 수집 주기 (매시 replan_minute에 다음 시간대 주기를 정해 트리거 교체) ───
+        if self._planner.enabled:
+            replan_minute = self._c.config.schedule.replan_minute
+            self.scheduler.add_job(
+                self._replan_collection,
+                trigger=CronTrigger(minute=replan_minute, timezone=self._tz),
+                id="replan_collection",
+                name="Replan Collection Intervals",
+                max_instances=1,
+                misfire_grace_time=600,
+                next_run_time=now + timedelta(minutes=1),  # 시작 직후 현재 시간대부터
+            )
+            logger.info(f"adaptive 수집 주기 등록: 매시 :{replan_minute:02d} 재계획")
+
         # ─── AI 처리 (설정 간격마다, 시작 시 5분 후 첫 실행 — 수집 완료 대기) ───
         processing_interval = self._c.config.processing.processing_interval_minutes
         self.scheduler.add_job(
@@ -183,13 +203,15 @@ class Orchestrator:
                 )
                 logger.info(f"Claude 토큰 만료 알림 등록: 매일 09:00 (만료일 {expires_at})")
 
-    def _collection_trigger(self, interval_minutes: int, offset: int):
+    def _collection_trigger(self, interval_minutes: int, offset: int, hourly_offset: bool = False):
         """수집 트리거를 KST 벽시계 정각에 정렬해서 만든다 (스태거 오프셋 유지).
 
         - interval이 60의 약수(10·30 등): 매시 [offset, offset+interval, ...]분에 실행
           (예: 10분·offset 2 → :02,:12,:22,:32,:42,:52)
         - interval이 60의 배수(60·120 등): **매 N시간 정각(:00)** (예: 120 → 짝수시 0·2·4…시 :00)
-          (이 소스들은 HTTP 수집이라 CDP 스태거가 필요 없어 정각으로 정렬)
+          (이 소스들은 HTTP 수집이라 CDP 스태거가 필요 없어 정각으로 정렬).
+          hourly_offset이면 정각 대신 :offset — adaptive 모드가 CDP 소스 주기를 60분 이상으로
+          늘렸을 때 스태거를 지키기 위해
         - 그 외(60의 약수·배수 아님): 정렬 불가 → 기존 인터벌 방식 폴백
         """
         tz = self._tz
@@ -203,7 +225,8 @@ class Orchestrator:
         if interval % 60 == 0:
             hours = interval // 60
             hour_spec = "*" if hours == 1 else f"*/{hours}"
-            return CronTrigger(minute=0, hour=hour_spec, timezone=tz)  # 정각(:00)
+            minute = offset % 60 if hourly_offset else 0
+            return CronTrigger(minute=minute, hour=hour_spec, timezone=tz)  # 정각(:00) 또는 :offset
 
         # 60의 약수/배수가 아니면 정각 정렬이 불가능 → 인터벌 유지
         logger.warning(f"정각 정렬 불가(interval={interval}) — 인터벌 방식 유지")
@@ -233,6 +256,37 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"[scheduler] 수집 오류 {source}: {e}")
 
+    async def _replan_collection(self) -> None:
+        """adaptive 모드 — 다가오는 시간대의 소스별 주기를 정하고, 바뀐 소스만 트리거를 교체.
+
+        :55에 돌면 10분 뒤(다음 시간대)를, 시작 직후에는 현재 시간대를 계획한다.
+        """
+        try:
+            await self._planner.refresh()
+        except Exception as e:
+            logger.error(f"[scheduler] 수확률 집계 오류 — 현재 주기 유지: {e}")
+            return
+
+        at = datetime.now(tz=self._tz) + timedelta(minutes=10)
+        configs = self._c.config.collectors
+        for source, offset in self._stagger.items():
+            interval = self._planner.plan(source, at)
+            current = self._planner.applied.get(source)
+            if interval == current:
+                continue
+            fixed = configs[source].interval_minutes
+            trig = self._collection_trigger(interval, offset, hourly_offset=fixed < 60)
+            try:
+                self.scheduler.reschedule_job(f"collect_{source}", trigger=trig)
+            except Exception as e:
+                logger.error(f"[scheduler] {source} 주기 변경 실패: {e}")
+                continue
+            self._planner.applied[source] = interval
+            logger.info(
+                f"[scheduler] {source} 수집 주기 {current}→{interval}분 "
+                f"({at.strftime('%a %H')}시대, 고정 {fixed}분)"
+            )
+
     async def _run_processing(self) -> None:
         logger.info("[scheduler] AI 처리 시작")
         try:
@@ -298,8 +352,9 @@ class Orchestrator:
             logger.error(f"[scheduler] 슬랙 투표 처리 오류: {e}")
 
     async def _health_check(self) -> None:
-        """각 소스의 연속 실패 횟수를 확인하고 임계치 초과 시 알림. RSS도 함께 로깅."""
+        """각 소스의 연속 실패 횟수를 확인하고 임계치 초과 시 알림. RSS·DB 쓰기 지표도 함께 로깅."""
         self._log_memory_usage()
+        self._log_db_write_stats()
         for source in self._c.collectors:
             try:
                 failures = await self._c.run_repo.count_consecutive_failures(source)
@@ -336,24 +391,59 @@ class Orchestrator:
         except Exception as e:
             logger.warning(f"[health] 메모리 측정 실패: {e}")
 
+    def _log_db_write_stats(self) -> None:
+        """SQLite 단일 writer의 큐 깊이·그룹 커밋 지연을 로깅 (쓰기 경합 감시)."""
+        try:
+            ws = self._c.post_repo.get_write_stats()
+            if not ws:
+                return
+            logger.info(
+                f"[health] sqlite-writer queue={ws['queue_depth']} (max {ws['max_queue_depth']}), "
+                f"commit avg={ws['commit_ms_avg']}ms p95={ws['commit_ms_p95']}ms, "
+                f"batch avg={ws['avg_batch_size']}건, 실패 {ws['failed_ops']}건"
+            )
+        except Exception as e:
+            logger.warning(f"[health] DB 쓰기 지표 조회 실패: {e}")
+
     async def _cleanup_old_posts(self) -> None:
-        """포스트 자동 삭제 (로컬 SQLite 정리).
+        """포스트 보존기한 정리 (로컬 SQLite → 월별 콜드 스토리지).
 
-        - 필터 탈락(비관련) 글: 3일간 재수집 안 됐으면 삭제
-          (수집 컷오프 max_age_days=2를 넘겨야 삭제→재수집→재필터링 루프가 없다)
-        - 그 외: 30일 경과 시 삭제
+        - 필터 탈락(비관련) 글: collected_at이 irrelevant_retention_days(3일) 지나면 정리
+          (collected_at >= published_at 이므로 보존일이 수집 컷오프 max_age_days(2일)보다
+          길면 정리된 글은 게시일 컷오프에 걸려 재수집·재필터링되지 않는다)
+        - 그 외: 30일 경과 시 정리
+        정리 대상은 storage.archive_enabled면 아카이브로 옮기고, 아니면 삭제한다.
         """
-        logger.info("[scheduler] 데이터 정리 시작 (비관련 3일 / 전체 30일)")
+        storage = self._c.config.storage
+        logger.info(
+            f"[scheduler] 데이터 정리 시작 (비관련 {storage.irrelevant_retention_days}일 / "
+            f"전체 {storage.retention_days}일)"
+        )
         try:
-            irrelevant_deleted = self._c.post_repo.delete_irrelevant_older_than(days=3)
-            if irrelevant_deleted:
-                logger.info(f"[scheduler] 필터 탈락 게시물 정리: {irrelevant_deleted}건 삭제")
-            deleted_count = self._c.post_repo.delete_older_than(days=30)
-            storage_info = self._c.post_repo.get_storage_info()
+            repo = self._c.post_repo
+            # 아카이브 파일 쓰기(압축·fsync)가 이벤트 루프를 막지 않게 스레드에서
+            irrelevant_moved = await asyncio.to_thread(
+                repo.archive_irrelevant_older_than, storage.irrelevant_retention_days
+            )
+            if irrelevant_moved:
+                logger.info(f"[scheduler] 필터 탈락 게시물 정리: {irrelevant_moved}건")
+            moved_count = await asyncio.to_thread(
+                repo.archive_older_than, storage.retention_days
+            )
+            if irrelevant_moved or moved_count:
+                # 옮겨진 글이 '이미 본 글'로 남지 않게 인덱스를 다시 적재
+                await asyncio.to_thread(self._c.seen_index.warm)
+            storage_info = repo.get_storage_info()
+            archive_info = await asyncio.to_thread(repo.get_archive_stats)
             logger.info(
-                f"[scheduler] 데이터 정리 완료: {deleted_count}건 삭제, "
+                f"[scheduler] 데이터 정리 완료: {moved_count}건 "
+                f"{'아카이브' if archive_info else '삭제'}, "
                 f"남은 데이터: {storage_info['document_count']}건 "
                 f"({storage_info['size_mb']}MB)"
+                + (
+                    f", 아카이브 {archive_info['rows']}건 ({archive_info['size_mb']}MB)"
+                    if archive_info else ""
+                )
             )
         except Exception as e:
             logger.error(f"[scheduler] 데이터 정리 오류: {e}")
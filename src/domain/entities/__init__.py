@@ -1,6 +1,6 @@
 from src.domain.entities.briefing import Briefing, BriefingItem
 from src.domain.entities.category import Category
 from src.domain.entities.collection_run import CollectionRun
-from src.domain.entities.post import Post
+from src.domain.entities.post import Post, PostSummary
 
-__all__ = ["Post", "Briefing", "BriefingItem", "Category", "CollectionRun"]
+__all__ = ["Post", "PostSummary", "Briefing", "BriefingItem", "Category", "CollectionRun"]
@@ -15,5 +15,19 @@ class CollectionRun:
     id: Optional[int] = None
     completed_at: Optional[datetime] = None
     status: str = "running"  # running, success, failed, partial
-    posts_collected: int = 0
+    posts_collected: int = 0  # 수집기가 가져온 전체 건수 (= 신규 + 변경 + 무변경)
+    posts_inserted: int = 0
+    posts_updated: int = 0
+    posts_unchanged: int = 0
+    http_requests: int = 0  # HTTP 수집기만 — 보낸 GET 수
+    http_cache_hits: int = 0  # 그중 304·본문 동일로 파싱을 건너뛴 수
+    # CDP 스크롤 수집기만 — [첫 로드, 1라운드, 2라운드, ...]별 처음 보는 게시물 수
+    scroll_yields: list[int] = field(default_factory=list)
     error_message: Optional[str] = None
+
+    @property
+    def http_cache_hit_rate(self) -> Optional[float]:
+        """조건부 GET 적중률 (HTTP 요청이 없던 소스는 None)."""
+        if not self.http_requests:
+            return None
+        return self.http_cache_hits / self.http_requests
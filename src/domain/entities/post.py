@@ -44,3 +44,37 @@ class Post:
     dedup_cluster_id: Optional[int] = None
 
     raw_data: Optional[dict] = None
+
+
+@dataclass(slots=True)
+class PostSummary:
+    """브리핑 경로용 경량 게시물 (컬럼 프로젝션).
+
+    점수 산정·클러스터링·검증 프롬프트가 쓰는 필드만 담는다 — content_html·
+    media_urls·원문 전체는 읽지 않는다. 속성 이름을 Post와 맞춰 두어 같은 코드가
+    그대로 받는다. 원문이 필요한 소수(발행 확정 토픽)는 id로 Post를 다시 읽는다
+    (PostRepository.get_by_ids).
+    """
+
+    id: str
+    source: str
+    url: Optional[str] = None
+    summary: Optional[str] = None
+    importance_score: Optional[float] = None
+    category_names: list[str] = field(default_factory=list)
+
+    engagement_likes: int = 0
+    engagement_reposts: int = 0
+    engagement_comments: int = 0
+    engagement_views: int = 0
+
+    published_at: Optional[datetime] = None
+    collected_at: Optional[datetime] = None
+
+    # 원문 앞부분만 (요약이 비었을 때 헤드라인 폴백용)
+    content_preview: str = ""
+
+    @property
+    def content_text(self) -> str:
+        """Post 호환 — 잘린 미리보기다. 전문이 필요하면 Post로 하이드레이션할 것."""
+        return self.content_preview
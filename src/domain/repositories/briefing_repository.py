@@ -16,4 +16,10 @@ class BriefingRepository(Protocol):
 
     async def get_all(self, limit: int = 30, offset: int = 0) -> list[Briefing]: ...
 
+    async def get_page(
+        self, limit: int = 20, cursor: str | None = None
+    ) -> tuple[list[Briefing], str | None]:
+        """최신순 키셋 페이지 — (브리핑, 다음 페이지 불투명 커서 또는 None)."""
+        ...
+
     async def update(self, briefing: Briefing) -> Briefing: ...
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol
 
 from src.domain.entities import CollectionRun
@@ -17,3 +18,5 @@ class CollectionRunRepository(Protocol):
     async def count_consecutive_failures(self, source: str) -> int: ...
 
     async def get_recent(self, limit: int = 20) -> list[CollectionRun]: ...
+
+    async def count_runs_by_hour(self, since: datetime) -> dict[tuple[str, str], int]: ...
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
-from src.domain.entities import Post
+from src.domain.entities import Post, PostSummary
+from src.domain.value_objects.post_fingerprint import PostFingerprint
+from src.domain.value_objects.save_result import SaveResult
 
 
 class PostRepository(Protocol):
@@ -19,8 +21,8 @@ class PostRepository(Protocol):
         """게시물 저장. 저장된 id 반환."""
         ...
 
-    def save_many(self, posts: list[Post]) -> int:
-        """여러 게시물 일괄 저장. 저장된 건수 반환."""
+    def save_many(self, posts: list[Post]) -> SaveResult:
+        """여러 게시물 일괄 저장. 신규/변경/무변경 건수 반환."""
         ...
 
     def update_many(self, posts: list[Post]) -> int:
@@ -38,6 +40,14 @@ class PostRepository(Protocol):
         """
         ...
 
+    def find_fingerprints(self, post_ids: list[str]) -> dict[tuple[str, str], PostFingerprint]:
+        """주어진 id의 (source, id) → 변경 감지 지문."""
+        ...
+
+    def iter_fingerprints(self, days: int) -> Iterator[tuple[str, str, PostFingerprint]]:
+        """최근 days일 수집분의 (source, id, 지문)."""
+        ...
+
     def find_by_id(self, post_id: str) -> Post | None:
         """id(external_id)로 조회."""
         ...
@@ -70,6 +80,18 @@ class PostRepository(Protocol):
         """
         ...
 
+    def archive_older_than(self, days: int) -> int:
+        """N일 이상 된 게시물을 콜드 스토리지로 옮기고 핫 저장소에서 삭제. 옮긴 건수 반환."""
+        ...
+
+    def archive_irrelevant_older_than(self, days: int) -> int:
+        """delete_irrelevant_older_than과 같은 대상을 삭제 대신 콜드 스토리지로 옮긴다."""
+        ...
+
+    def get_archive_stats(self) -> dict[str, Any]:
+        """콜드 스토리지 파일 수·행 수·크기 (미사용이면 빈 dict)."""
+        ...
+
     def count(self) -> int:
         """전체 게시물 수."""
         ...
@@ -78,6 +100,10 @@ class PostRepository(Protocol):
         """저장소 용량/건수 정보."""
         ...
 
+    def get_write_stats(self) -> dict[str, Any]:
+        """쓰기 경로 지표(큐 깊이·커밋 지연). 지원하지 않는 구현은 빈 dict."""
+        ...
+
     def get_likeable(self, source: str, min_importance: float, limit: int) -> list[Post]:
         """자동 좋아요 대상: 관련 O + 중요도 임계값 이상 + 미좋아요 게시물."""
         ...
@@ -95,13 +121,48 @@ class PostRepository(Protocol):
         limit: int = 50,
         offset: int = 0,
     ) -> list[Post]:
-        """조건에 맞는 게시물 검색."""
+        """조건에 맞는 게시물 검색.
+
+        검색어가 있으면 관련도순으로 정렬하고, 하이라이트된 발췌를
+        post.raw_data["snippet"]에 담을 수 있다(구현이 지원하는 경우).
+        """
+        ...
+
+    async def search_page(
+        self,
+        query: str | None = None,
+        source: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Post], str | None]:
+        """search()의 키셋 페이지네이션 버전 — (게시물, 다음 페이지 불투명 커서 또는 None).
+
+        페이지 경계는 최신순(collected_at, id)이라 넘기는 사이 행이 바뀌어도 안정적이다.
+        검색어가 있으면 관련도는 각 페이지 안의 순서에만 반영된다.
+        """
         ...
 
     async def count_by_source(self, start: datetime, end: datetime) -> dict[str, int]:
         """기간별 소스별 게시물 수 집계."""
         ...
 
+    async def count_by_category(
+        self, start: datetime, end: datetime, relevant_only: bool = True
+    ) -> dict[str, int]:
+        """기간별 카테고리별 게시물 수 집계."""
+        ...
+
+    async def get_hourly_counts(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """시간대·소스별 수집 건수(total)와 관련 건수(relevant)."""
+        ...
+
+    async def count_relevant_by_first_seen(
+        self, start: datetime, end: datetime
+    ) -> dict[tuple[str, str], int]:
+        """(소스, 처음 저장된 UTC 시 키)별 관련 게시물 수 — 재수집으로 옮겨 가지 않는다."""
+        ...
+
     async def get_by_period(
         self, start: datetime, end: datetime, relevant_only: bool = True
     ) -> list[Post]:
@@ -116,10 +177,25 @@ class PostRepository(Protocol):
         """브리핑에 포함되지 않은 관련 게시물 조회."""
         ...
 
+    async def get_unbriefed_summaries(self, limit: int = 500) -> list[PostSummary]:
+        """get_unbriefed와 같은 대상의 경량 프로젝션 (원문·HTML·미디어 제외)."""
+        ...
+
+    async def get_by_ids(self, post_ids: list[str]) -> list[Post]:
+        """id 목록의 전체 Post (입력 순서 유지, 없는 id는 건너뜀)."""
+        ...
+
+    async def save_many_async(self, posts: list[Post]) -> SaveResult:
+        """save_many의 비동기판 — 쓰기 그룹 커밋을 await로 기다린다 (수집 경로용)."""
+        ...
+
     async def mark_briefed(self, post_ids: list[str], briefed_at: datetime) -> int:
         """게시물들의 briefed_at 설정 (브리핑 완료 마킹)."""
         ...
 
-    async def delete_low_importance(self, max_score: float) -> int:
-        """브리핑 완료된 게시물 중 중요도가 max_score 이하인 것을 삭제. 삭제 건수 반환."""
+    async def delete_low_importance(self, max_score: float) -> list[tuple[str, str]]:
+        """브리핑 완료된 게시물 중 중요도가 max_score 이하인 것을 삭제.
+
+        지운 글의 (source, external_id) 목록 반환.
+        """
         ...
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from src.domain.entities import Post
+
+
+class SeenPostFilter(Protocol):
+    """이미 저장된 게시물 (source, external_id) + 마지막 지문 조회 인터페이스.
+
+    재수집분 중 본문·인게이지먼트가 그대로인 글을 해시·저장 전에 걸러내고,
+    수집기는 '처음 보는 글인지'를 DB 왕복 없이 판단하는 데 쓴다.
+    """
+
+    def known_ids(self, source: str, external_ids: list[str]) -> set[str]:
+        """external_ids 중 이미 저장된 것의 집합."""
+        ...
+
+    def engagement_unchanged(self, post: Post) -> bool:
+        """저장된 글이고 인게이지먼트 지문이 그대로인지 (본문 재수집 생략 판단용)."""
+        ...
+
+    def split_unchanged(self, posts: list[Post]) -> tuple[list[Post], int]:
+        """(저장이 필요한 글, 무변경이라 건너뛴 건수)."""
+        ...
+
+    def remember(self, posts: list[Post]) -> None:
+        """저장을 마친 글의 지문을 기록."""
+        ...
+
+    def forget(self, keys: list[tuple[str, str]]) -> None:
+        """DB에서 지운 글 (source, external_id)을 '본 글'에서 뺀다."""
+        ...
@@ -0,0 +1,56 @@
+"""게시물 지문 — 재수집분이 저장된 행과 같은지 해시·DB 왕복 없이 판단한다."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+
+def _digest(values: tuple) -> str:
+    raw = json.dumps(values, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True)
+class PostFingerprint:
+    """재수집 게시물의 변경 여부 판단용 지문 — 본문 쪽과 인게이지먼트 쪽을 따로 둔다.
+
+    대상 필드는 save_many UPSERT의 변경 가드(WHERE ... IS NOT excluded ...)와 같다.
+    둘 다 같으면 저장해도 무변경으로 끝날 글이라 해시·쓰기를 생략할 수 있고,
+    인게이지먼트만으로도 상세 페이지를 다시 열지 판단할 수 있다(dcinside).
+    """
+
+    content: str
+    engagement: str
+
+    @staticmethod
+    def of_engagement(likes: int, reposts: int, comments: int, views: int) -> str:
+        return _digest((likes, reposts, comments, views))
+
+    @classmethod
+    def of_fields(
+        cls,
+        url: str,
+        author: str,
+        author_url: str | None,
+        content_text: str,
+        content_html: str | None,
+        media_urls: list[str],
+        likes: int,
+        reposts: int,
+        comments: int,
+        views: int,
+    ) -> "PostFingerprint":
+        return cls(
+            content=_digest((url, author, author_url, content_text, content_html, media_urls)),
+            engagement=cls.of_engagement(likes, reposts, comments, views),
+        )
+
+    @classmethod
+    def of_post(cls, post) -> "PostFingerprint":
+        return cls.of_fields(
+            post.url, post.author, post.author_url, post.content_text, post.content_html,
+            list(post.media_urls), post.engagement_likes, post.engagement_reposts,
+            post.engagement_comments, post.engagement_views,
+        )
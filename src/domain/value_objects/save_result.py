@@ -0,0 +1,26 @@
+"""일괄 저장 결과 값 객체."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SaveResult:
+    """일괄 저장(save_many) 결과 — 신규/변경/무변경 건수.
+
+    무변경(unchanged)은 이미 있던 게시물을 재수집했지만 본문·인게이지먼트가
+    그대로라 행을 다시 쓰지 않은 건수다.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def written(self) -> int:
+        return self.inserted + self.updated
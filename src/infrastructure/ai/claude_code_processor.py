@@ -17,7 +17,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import glob
 import json
 import logging
@@ -27,13 +26,16 @@ import subprocess
 import tempfile
 
 from src.domain.services.ai_processor import VerificationResult
+from src.infrastructure.ai.cli_runner import CliRunner
 from src.infrastructure.ai.llm_processor import (
     BaseLLMProcessor,
     LLMBackendError,
     _parse_json_response,
     _posts_to_json_lite,
+    record_input_tokens,
 )
 from src.infrastructure.ai.prompts import EXTRACT_CLAIMS, SYSTEM_PROMPT, VERIFY_WITH_SEARCH
+from src.infrastructure.ai.response_cache import LLMResponseCache
 from src.infrastructure.config.settings import ProcessingConfig
 
 logger = logging.getLogger(__name__)
@@ -127,8 +129,14 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         timeout: int = 300,
         oauth_token: str | None = None,
         work_dir: str | None = None,
+        concurrency: dict[str, int] | None = None,
+        response_cache: LLMResponseCache | None = None,
+        runner: CliRunner | None = None,
     ):
         self._config = config
+        self._concurrency = concurrency or {}  # 티어별 배치 동시 호출 상한
+        self._response_cache = response_cache
+        self._runner = runner or CliRunner("claude")  # 동시 claude 자식 수 상한 포함
         self._claude_bin = claude_bin or _resolve_claude_bin()
         self._claude_model_filter = model_filter
         self._claude_model_process = model_process
@@ -160,10 +168,26 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         label: str = "claude",
         use_system_prompt: bool = True,
         model: str | None = None,
+        cache_note: str = "",
+    ) -> str:
+        """_arun_claude의 동기 진입점 — 실행기 루프에서 돌리고 결과를 기다린다."""
+        return self._runner.call_sync(
+            self._arun_claude(args, prompt, label, use_system_prompt, model, cache_note)
+        )
+
+    async def _arun_claude(
+        self,
+        args: list[str],
+        prompt: str,
+        label: str = "claude",
+        use_system_prompt: bool = True,
+        model: str | None = None,
+        cache_note: str = "",
     ) -> str:
         """`claude -p`를 헤드리스로 실행하고 응답 봉투의 result(텍스트)를 반환한다.
 
-        subprocess 실행·타임아웃·종료코드·봉투 JSON 파싱·is_error 처리를 한곳에 모은다.
+        자식 실행·타임아웃·종료코드·봉투 JSON 파싱·is_error 처리를 한곳에 모은다.
+        타임아웃·취소 시 실행기(CliRunner)가 npm 셰임 아래 실제 CLI까지 트리째 죽인다.
         역할/규칙(SYSTEM_PROMPT)은 시스템 주입이 아니라 사용자 프롬프트 최상단에 둔다.
         (SYSTEM_PROMPT는 'JSON 배열만 출력'을 강제하므로 자유 텍스트 출력이 필요한
          호출은 use_system_prompt=False로 우회한다.)
@@ -173,15 +197,13 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         # CLI 수준 장애는 전부 LLMBackendError로 승격 — compose/curation의 내부
         # 예외 삼킴을 통과해 hybrid의 Codex 폴백이 실제로 작동하게 한다.
         try:
-            proc = subprocess.run(
+            proc = await self._runner.run(
                 cmd,
-                input=full_prompt,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
+                full_prompt,
                 cwd=self._work_dir,
                 env=self._env,
                 timeout=self._timeout,
+                label=label,
             )
         except subprocess.TimeoutExpired as e:
             raise LLMBackendError(f"{label} 타임아웃({self._timeout}s)") from e
@@ -202,13 +224,19 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         # 캐시를 따로 보는 이유: 한도 가중치가 다르다(cache_read ~0.1x) —
         # in+out 만 보면 고정 오버헤드(~23k)가 실제보다 10배 커 보인다.
         usage = envelope.get("usage") or {}
+        # 캐시분까지 합친 프롬프트 전체 — 배치 패킹 어림값과 비교용 (BaseLLMProcessor._call_batch)
+        record_input_tokens(
+            usage.get("input_tokens", 0)
+            + usage.get("cache_read_input_tokens", 0)
+            + usage.get("cache_creation_input_tokens", 0)
+        )
         if usage:
             log_model = model or next(iter(envelope.get("modelUsage") or {}), "claude")
             logger.info(
                 f"[usage] model={log_model} in={usage.get('input_tokens', 0)} "
                 f"out={usage.get('output_tokens', 0)} "
                 f"(cache_read={usage.get('cache_read_input_tokens', 0)} "
-                f"cache_write={usage.get('cache_creation_input_tokens', 0)})"
+                f"cache_write={usage.get('cache_creation_input_tokens', 0)}){cache_note}"
             )
 
         if envelope.get("is_error"):
@@ -225,6 +253,7 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         *,
         lean: bool = False,
         tier: str = "filter",
+        cache: bool = True,
     ) -> str:
         """호출부가 명시한 tier로 Claude 모델을 고른다. (max_tokens/model은 호환용)
 
@@ -242,17 +271,53 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         사고 이력(7/23 recall 붕괴, 7/24 precision 붕괴) 때문에 독립 설정 키로
         분리 — 하루 1회 실행이라 상위 모델을 써도 토큰 영향이 미미하다.
         """
+        claude_model, args, variant = self._plan_call(lean, tier)
+        cached, key, note = self._cache_lookup(*variant, prompt, cache, claude_model)
+        if cached is not None:
+            return cached
+        result = self._run_claude(
+            args, prompt, label="claude CLI", model=claude_model, cache_note=note
+        )
+        self._cache_store(key, result)
+        return result
+
+    async def _acall_api(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int = 4096,
+        *,
+        lean: bool = False,
+        tier: str = "filter",
+        cache: bool = True,
+    ) -> str:
+        """_call_api의 비동기판 — 스레드 없이 실행기에서 돈다. 배치 디스패치가 태스크를
+        취소하면(백엔드 장애 전파) 실행 중인 claude 자식도 트리째 죽는다."""
+        claude_model, args, variant = self._plan_call(lean, tier)
+        cached, key, note = await self._acache_lookup(*variant, prompt, cache, claude_model)
+        if cached is not None:
+            return cached
+        result = await self._arun_claude(
+            args, prompt, label="claude CLI", model=claude_model, cache_note=note
+        )
+        await self._acache_store(key, result)
+        return result
+
+    def _plan_call(self, lean: bool, tier: str) -> tuple[str, list[str], tuple[str, ...]]:
+        """tier·lean → (Claude 모델, CLI 인자, 응답 캐시 변형(백엔드·티어·모델·강도))."""
         claude_model = {
             "process": self._claude_model_process,
             "dedup": self._claude_model_dedup,
             "consolidate": self._claude_model_consolidate,
         }.get(tier, self._claude_model_filter)
+        # Claude CLI엔 추론 강도 옵션이 없다 — lean(추론·도구 끔)이 그 자리다
+        variant = ("claude", tier, claude_model, "lean" if lean else "")
         args = ["-p", "--output-format", "json", "--max-turns", "1"]
         if claude_model:
             args += ["--model", claude_model]
         if lean:
             args += ["--settings", _LEAN_SETTINGS, "--disallowed-tools", *_LEAN_TOOLS]
-        return self._run_claude(args, prompt, label="claude CLI", model=claude_model)
+        return claude_model, args, variant
 
     def _call_api_with_search(
         self,
@@ -260,20 +325,47 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         max_turns: int = 6,
         model: str | None = None,
         use_system_prompt: bool = True,
+        cache: bool = True,
     ) -> str:
-        """WebSearch 도구를 허용해 Claude가 직접 웹을 검색하며 응답하게 한다(구독, API 키 X)."""
+        """WebSearch 도구를 허용해 Claude가 직접 웹을 검색하며 응답하게 한다(구독, API 키 X).
+
+        같은 주장 묶음 재검증은 응답 캐시로 — TTL(llm_cache_ttl_hours) 안에서는
+        검색 결과가 판정을 뒤집을 만큼 바뀌지 않는다.
+        """
+        return self._runner.call_sync(
+            self._acall_api_with_search(prompt, max_turns, model, use_system_prompt, cache)
+        )
+
+    async def _acall_api_with_search(
+        self,
+        prompt: str,
+        max_turns: int = 6,
+        model: str | None = None,
+        use_system_prompt: bool = True,
+        cache: bool = True,
+    ) -> str:
+        """_call_api_with_search의 비동기판 (verify_claims·run_freeform이 await)."""
         args = [
             "-p", "--output-format", "json",
             "--allowedTools", "WebSearch",
             "--max-turns", str(max_turns),
         ]
         claude_model = model or self._claude_model_filter
+        cached, key, note = await self._acache_lookup(
+            "claude", "search", claude_model,
+            f"turns={max_turns}" + ("" if use_system_prompt else ",raw"),
+            prompt, cache, claude_model,
+        )
+        if cached is not None:
+            return cached
         if claude_model:
             args += ["--model", claude_model]
-        return self._run_claude(
+        result = await self._arun_claude(
             args, prompt, label="claude WebSearch",
-            use_system_prompt=use_system_prompt, model=claude_model,
+            use_system_prompt=use_system_prompt, model=claude_model, cache_note=note,
         )
+        await self._acache_store(key, result)
+        return result
 
     async def run_freeform(
         self, prompt: str, websearch: bool = True, max_turns: int = 8
@@ -281,22 +373,18 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         """임의 프롬프트를 process 모델로 실행해 자유 텍스트를 반환.
 
         슬랙 투표 1위 심층 글 등 파이프라인 밖 용도. SYSTEM_PROMPT(JSON 강제)를
-        붙이지 않으며, subprocess 블로킹은 to_thread로 이벤트 루프에서 분리한다.
+        붙이지 않으며, 자식 프로세스는 실행기(CliRunner)가 이벤트 루프 밖에서 돌린다.
         """
         if websearch:
-            return await asyncio.to_thread(
-                self._call_api_with_search,
-                prompt,
-                max_turns,
-                self._claude_model_process,
-                False,
+            # 자유 작문은 다시 부르면 새 글을 원하는 것 — 캐시를 읽지 않는다
+            return await self._acall_api_with_search(
+                prompt, max_turns, self._claude_model_process, False, cache=False
             )
         args = ["-p", "--output-format", "json", "--max-turns", "1"]
         if self._claude_model_process:
             args += ["--model", self._claude_model_process]
-        return await asyncio.to_thread(
-            self._run_claude, args, prompt, "claude freeform", False,
-            self._claude_model_process,
+        return await self._arun_claude(
+            args, prompt, "claude freeform", False, self._claude_model_process
         )
 
     async def verify_claims(self, posts: list) -> list:
@@ -308,7 +396,7 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
             return []
 
         try:
-            resp = self._call_api(
+            resp = await self._acall_api(
                 self._config.model_filter,
                 EXTRACT_CLAIMS.format(posts_json=_posts_to_json_lite(posts)),
             )
@@ -335,7 +423,9 @@ class ClaudeCodeProcessor(BaseLLMProcessor):
         results: list = []
         verified_ids: set = set()
         try:
-            resp = self._call_api_with_search(VERIFY_WITH_SEARCH.format(claims_json=claims_json))
+            resp = await self._acall_api_with_search(
+                VERIFY_WITH_SEARCH.format(claims_json=claims_json)
+            )
             for item in _parse_json_response(resp):
                 pid = item.get("post_id")
                 if pid is None:
@@ -0,0 +1,212 @@
+"""CLI 백엔드(`claude -p`·`codex exec`) 자식 프로세스 실행기 — asyncio 서브프로세스.
+
+subprocess.run + asyncio.to_thread 조합의 문제:
+- 동시 호출 수가 기본 스레드풀 크기에 묶인다.
+- 타임아웃에 직계 자식만 죽어 npm 셰임(cmd.exe → node) 아래의 실제 CLI가 고아로 남는다.
+- 취소된 태스크가 스레드 안에서 도는 자식을 건드릴 수 없다.
+
+여기서는 create_subprocess_exec로 띄워 stdin은 흘려 넣고 stdout/stderr는 조각 단위로
+읽는다. 자식은 새 프로세스 그룹(POSIX 세션 / Windows CREATE_NEW_PROCESS_GROUP)으로
+띄워 타임아웃·취소 시 트리째 죽인다(killpg / taskkill /T). 백엔드별 동시 자식 수는
+max_processes로 묶고, 호출마다 생성·첫 바이트·전체 시간을 [cli] 줄로 남긴다.
+
+이벤트 루프는 실행기 전용 스레드 하나에 둔다 — judge_tiers처럼 동기로 부르는
+호출부(call_sync)와 배치 디스패치처럼 비동기로 부르는 호출부(run)가 같은 상한을
+나눠 쓰고, 비동기 호출부의 취소는 이 루프의 태스크 취소로 전달돼 자식을 죽인다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_READ_CHUNK = 64 * 1024
+
+if os.name == "nt":
+    _GROUP_KW: dict[str, Any] = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _GROUP_KW = {"start_new_session": True}
+
+
+@dataclass
+class CliResult:
+    """subprocess.CompletedProcess 대응 + 구간별 시간(ms)."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    spawn_ms: float
+    first_byte_ms: float | None  # stdout 첫 조각까지 (출력이 없으면 None)
+    total_ms: float
+
+
+def _elapsed_ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000
+
+
+async def _kill_tree(proc: asyncio.subprocess.Process) -> None:
+    """자식과 그 아래 프로세스 전부를 죽이고 회수한다."""
+    if proc.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            killer = await asyncio.create_subprocess_exec(
+                "taskkill", "/F", "/T", "/PID", str(proc.pid),
+                stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+            )
+            await killer.wait()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+class CliRunner:
+    """백엔드 1개의 CLI 자식 프로세스 실행기 (동시 자식 수 상한 포함)."""
+
+    def __init__(self, label: str, max_processes: int = 4):
+        self._label = label
+        self._max_processes = max(1, max_processes)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name=f"cli-runner-{self._label}", daemon=True
+                ).start()
+                self._sem = asyncio.Semaphore(self._max_processes)  # 첫 사용 때 이 루프에 묶인다
+                self._loop = loop
+            return self._loop
+
+    def call_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """동기 호출부용 — 코루틴을 실행기 루프에서 돌리고 결과를 기다린다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def run(
+        self,
+        cmd: list[str],
+        input_text: str,
+        *,
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+        timeout: float,
+        label: str | None = None,
+    ) -> CliResult:
+        """cmd를 실행하고 끝날 때까지 기다린다. 타임아웃이면 트리를 죽이고
+        subprocess.TimeoutExpired, 실행 불가면 OSError (subprocess.run과 같은 예외)."""
+        loop = self._ensure_loop()
+        coro = self._limited(cmd, input_text, cwd, env, timeout, label or self._label)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    async def _limited(self, *args) -> CliResult:
+        async with self._sem:
+            return await self._execute(*args)
+
+    async def _execute(
+        self,
+        cmd: list[str],
+        input_text: str,
+        cwd: str | None,
+        env: dict[str, str] | None,
+        timeout: float,
+        label: str,
+    ) -> CliResult:
+        t0 = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            **_GROUP_KW,
+        )
+        spawn_ms = _elapsed_ms(t0)
+        first_byte_ms: float | None = None
+        out: list[bytes] = []
+        err: list[bytes] = []
+
+        async def feed() -> None:
+            try:
+                proc.stdin.write(input_text.encode("utf-8"))
+                await proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 자식이 stdin을 다 읽기 전에 끝났다 — 종료코드로 판정
+            finally:
+                proc.stdin.close()
+
+        async def drain(stream: asyncio.StreamReader, sink: list[bytes], first: bool) -> None:
+            nonlocal first_byte_ms
+            while chunk := await stream.read(_READ_CHUNK):
+                if first and first_byte_ms is None:
+                    first_byte_ms = _elapsed_ms(t0)
+                sink.append(chunk)
+
+        # 읽기는 종료 대기와 동시에 — 파이프가 차면 자식이 쓰기에서 멈춘다
+        tasks = [
+            asyncio.ensure_future(feed()),
+            asyncio.ensure_future(drain(proc.stdout, out, True)),
+            asyncio.ensure_future(drain(proc.stderr, err, False)),
+            asyncio.ensure_future(proc.wait()),
+        ]
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                await _kill_tree(proc)
+                logger.warning(
+                    f"[cli] {label} 타임아웃({timeout}s) — 프로세스 트리 종료 (pid={proc.pid})"
+                )
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            for task in tasks:
+                task.result()
+        except asyncio.CancelledError:
+            # 호출 태스크 취소(배치 디스패치의 백엔드 장애 전파 등) — 고아를 남기지 않는다
+            await _kill_tree(proc)
+            logger.info(f"[cli] {label} 취소 — 프로세스 트리 종료 (pid={proc.pid})")
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        total_ms = _elapsed_ms(t0)
+        first = f"{first_byte_ms:,.0f}ms" if first_byte_ms is not None else "-"
+        logger.info(
+            f"[cli] {label} 생성 {spawn_ms:,.0f}ms · 첫 바이트 {first} · 전체 {total_ms:,.0f}ms "
+            f"(rc={proc.returncode})"
+        )
+        return CliResult(
+            returncode=proc.returncode,
+            stdout=b"".join(out).decode("utf-8", "replace"),
+            stderr=b"".join(err).decode("utf-8", "replace"),
+            spawn_ms=spawn_ms,
+            first_byte_ms=first_byte_ms,
+            total_ms=total_ms,
+        )
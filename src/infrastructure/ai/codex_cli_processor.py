@@ -14,8 +14,14 @@ import shutil
 import subprocess
 import tempfile
 
-from src.infrastructure.ai.llm_processor import LLMBackendError, SearchVerificationProcessor
+from src.infrastructure.ai.cli_runner import CliResult, CliRunner
+from src.infrastructure.ai.llm_processor import (
+    LLMBackendError,
+    SearchVerificationProcessor,
+    record_input_tokens,
+)
 from src.infrastructure.ai.prompts import SYSTEM_PROMPT
+from src.infrastructure.ai.response_cache import LLMResponseCache
 from src.infrastructure.config.settings import ProcessingConfig
 
 logger = logging.getLogger(__name__)
@@ -43,8 +49,14 @@ class CodexCliProcessor(SearchVerificationProcessor):
         effort_consolidate: str = "",
         timeout: int = 600,
         work_dir: str | None = None,
+        concurrency: dict[str, int] | None = None,
+        response_cache: LLMResponseCache | None = None,
+        runner: CliRunner | None = None,
     ):
         self._config = config
+        self._concurrency = concurrency or {}  # 티어별 배치 동시 호출 상한
+        self._response_cache = response_cache
+        self._runner = runner or CliRunner("codex")  # 동시 codex 자식 수 상한 포함
         self._codex_bin = codex_bin or _resolve_codex_bin()
         self._codex_model_filter = model_filter
         self._codex_model_process = model_process
@@ -79,10 +91,11 @@ class CodexCliProcessor(SearchVerificationProcessor):
         return [self._codex_bin, *args]
 
     @staticmethod
-    def _log_usage(stdout: str, model: str) -> None:
-        """turn.completed 이벤트의 토큰 사용량을 [usage] 형식으로 남긴다.
+    def _log_usage(stdout: str, model: str, cache_note: str = "") -> int | None:
+        """turn.completed 이벤트의 토큰 사용량을 [usage] 형식으로 남기고 입력 토큰을 돌려준다.
 
         scripts/usage_report.py 가 Claude 경로와 합산할 수 있게 포맷을 맞춘다.
+        cache_note는 응답 캐시 적중 집계 꼬리표(BaseLLMProcessor._cache_lookup).
         """
         for line in (stdout or "").splitlines():
             line = line.strip()
@@ -99,9 +112,43 @@ class CodexCliProcessor(SearchVerificationProcessor):
                 f"[usage] model={model} in={u.get('input_tokens', 0)} "
                 f"out={u.get('output_tokens', 0)} "
                 f"(cached={u.get('cached_input_tokens', 0)} "
-                f"reasoning={u.get('reasoning_output_tokens', 0)})"
+                f"reasoning={u.get('reasoning_output_tokens', 0)}){cache_note}"
             )
-            return
+            return u.get("input_tokens", 0)
+        return None
+
+    async def _exec(self, args: list[str], input_text: str, label: str) -> tuple[CliResult, str]:
+        """`codex exec`를 실행기로 돌리고 (실행 결과, `-o` 파일의 최종 메시지)를 돌려준다.
+
+        최종 메시지는 stdout 파싱 대신 `-o` 파일로 받는다 — stdout에는 진행 이벤트가
+        섞여 나오므로 파일 쪽이 훨씬 견고하다. 타임아웃·취소 시 실행기가 트리째 죽인다.
+        """
+        fd, out_path = tempfile.mkstemp(prefix="codex_out_", suffix=".txt")
+        os.close(fd)
+        cmd = self._build_command([*args, "-o", out_path, "-"])  # 프롬프트는 stdin
+        try:
+            proc = await self._runner.run(
+                cmd, input_text, cwd=self._work_dir, timeout=self._timeout, label=label
+            )
+        except subprocess.TimeoutExpired as e:
+            raise LLMBackendError(f"{label} 타임아웃({self._timeout}s)") from e
+        except OSError as e:  # 미설치·실행 불가
+            raise LLMBackendError(f"{label} 실행 실패: {e}") from e
+        finally:
+            result = ""
+            try:
+                with open(out_path, encoding="utf-8") as f:
+                    result = f.read()
+            except OSError:
+                pass
+            try:
+                os.unlink(out_path)
+            except OSError:
+                pass
+
+        if proc.returncode != 0:
+            raise LLMBackendError(f"{label} 종료코드 {proc.returncode}: {(proc.stderr or '')[:300]}")
+        return proc, result
 
     def _call_api(
         self,
@@ -111,6 +158,22 @@ class CodexCliProcessor(SearchVerificationProcessor):
         *,
         lean: bool = False,
         tier: str = "filter",
+        cache: bool = True,
+    ) -> str:
+        """_acall_api의 동기 진입점 — 실행기 루프에서 돌리고 결과를 기다린다."""
+        return self._runner.call_sync(
+            self._acall_api(model, prompt, max_tokens, lean=lean, tier=tier, cache=cache)
+        )
+
+    async def _acall_api(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int = 4096,
+        *,
+        lean: bool = False,
+        tier: str = "filter",
+        cache: bool = True,
     ) -> str:
         """`codex exec`를 헤드리스로 실행하고 최종 메시지를 반환한다.
 
@@ -118,9 +181,6 @@ class CodexCliProcessor(SearchVerificationProcessor):
         호출부가 넘긴 tier로 고른다(ClaudeCodeProcessor와 같은 이유: 설정에서
         model_filter == model_process 가 되면 모델명으로는 호출 의도를 복원할 수 없다).
         max_tokens도 CLI에 대응 옵션이 없어 사용하지 않는다.
-
-        최종 메시지는 stdout 파싱 대신 `-o` 파일로 받는다 — stdout에는 진행 이벤트가
-        섞여 나오므로 파일 쪽이 훨씬 견고하다.
         """
         codex_model = {
             "process": self._codex_model_process,
@@ -136,11 +196,15 @@ class CodexCliProcessor(SearchVerificationProcessor):
             "dedup": self._effort_dedup,
             "consolidate": self._effort_consolidate,
         }.get(tier, self._effort_filter)
+        usage_model = f"{codex_model or 'codex-기본'}/{effort}"
+        cached, key, note = await self._acache_lookup(
+            "codex", tier, codex_model, effort, prompt, cache, usage_model
+        )
+        if cached is not None:
+            return cached
         # SYSTEM_PROMPT(역할·JSON 강제)는 시스템 주입 경로가 없으므로 프롬프트 최상단에 둔다.
         full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
 
-        fd, out_path = tempfile.mkstemp(prefix="codex_out_", suffix=".txt")
-        os.close(fd)
         args = [
             "exec",
             "--ephemeral",            # 세션 파일을 남기지 않는다(배치라 이력 불필요)
@@ -149,47 +213,18 @@ class CodexCliProcessor(SearchVerificationProcessor):
             "-C", self._work_dir,
             "--json",                 # stdout=이벤트 JSONL (토큰 사용량 집계용)
             "-c", f"model_reasoning_effort={effort}",
-            "-o", out_path,           # 최종 메시지만 파일로
-            "-",                      # 프롬프트는 stdin
         ]
         if codex_model:
             args[1:1] = ["-m", codex_model]
 
-        try:
-            proc = subprocess.run(
-                self._build_command(args),
-                input=full_prompt,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                cwd=self._work_dir,
-                timeout=self._timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise LLMBackendError(f"codex exec 타임아웃({self._timeout}s)") from e
-        except OSError as e:  # 미설치·실행 불가
-            raise LLMBackendError(f"codex exec 실행 실패: {e}") from e
-        finally:
-            result = ""
-            try:
-                with open(out_path, encoding="utf-8") as f:
-                    result = f.read()
-            except OSError:
-                pass
-            try:
-                os.unlink(out_path)
-            except OSError:
-                pass
+        proc, result = await self._exec(args, full_prompt, "codex exec")
 
-        if proc.returncode != 0:
-            raise LLMBackendError(
-                f"codex exec 종료코드 {proc.returncode}: {(proc.stderr or '')[:300]}"
-            )
-
-        self._log_usage(proc.stdout, f"{codex_model or 'codex-기본'}/{effort}")
+        # 입력 토큰 실측은 배치 패킹 어림값과 비교용 (BaseLLMProcessor._call_batch)
+        record_input_tokens(self._log_usage(proc.stdout, usage_model, note))
 
         if not result.strip():
             raise LLMBackendError("codex exec 빈 응답")
+        await self._acache_store(key, result)
         return result
 
     async def run_freeform(
@@ -201,44 +236,12 @@ class CodexCliProcessor(SearchVerificationProcessor):
         websearch 인자는 시그니처 호환용 — codex exec 는 read-only 샌드박스에서
         도구 없이 돌리므로 웹 검색을 쓰지 않는다.
         """
-        import asyncio
-
-        return await asyncio.to_thread(self._run_freeform_sync, prompt)
-
-    def _run_freeform_sync(self, prompt: str) -> str:
-        fd, out_path = tempfile.mkstemp(prefix="codex_ff_", suffix=".txt")
-        os.close(fd)
         args = ["exec", "--ephemeral", "--skip-git-repo-check", "-s", "read-only",
                 "-C", self._work_dir, "--json",
-                "-c", f"model_reasoning_effort={self._effort_process}",
-                "-o", out_path, "-"]
+                "-c", f"model_reasoning_effort={self._effort_process}"]
         if self._codex_model_process:
             args[1:1] = ["-m", self._codex_model_process]
-        try:
-            proc = subprocess.run(
-                self._build_command(args), input=prompt, capture_output=True,
-                text=True, encoding="utf-8", cwd=self._work_dir, timeout=self._timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise LLMBackendError(f"codex freeform 타임아웃({self._timeout}s)") from e
-        except OSError as e:
-            raise LLMBackendError(f"codex freeform 실행 실패: {e}") from e
-        finally:
-            result = ""
-            try:
-                with open(out_path, encoding="utf-8") as f:
-                    result = f.read()
-            except OSError:
-                pass
-            try:
-                os.unlink(out_path)
-            except OSError:
-                pass
-
-        if proc.returncode != 0:
-            raise LLMBackendError(
-                f"codex freeform 종료코드 {proc.returncode}: {(proc.stderr or '')[:300]}"
-            )
+        proc, result = await self._exec(args, prompt, "codex freeform")
         self._log_usage(proc.stdout, f"{self._codex_model_process or 'codex-기본'}/freeform")
         if not result.strip():
             raise LLMBackendError("codex freeform 빈 응답")
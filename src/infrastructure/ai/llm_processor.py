@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import json
 import logging
 import re
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
 from bs4 import BeautifulSoup
 
@@ -89,6 +92,115 @@ def _chunked(lst: list, size: int):
         yield lst[i : i + size]
 
 
+@dataclass
+class _BatchTiming:
+    """배치 디스패치 1회의 벽시계 vs 호출 지연 합계 — 병렬화 효과를 로그로 남긴다."""
+
+    batches: int
+    concurrency: int
+    wall_s: float
+    call_sum_s: float
+
+    def __str__(self) -> str:
+        return (
+            f"배치 {self.batches}개·동시 {self.concurrency}, "
+            f"소요 {self.wall_s:.1f}s / 호출 합계 {self.call_sum_s:.1f}s"
+        )
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 입력 토큰을 어림한다 — ASCII 4자당 1토큰, 그 밖(한글·CJK·
+    이모지)은 1자당 1토큰. 배치 패킹용이라 절대값보다 게시물 간 상대 크기가 중요하다.
+    실측과의 차이는 필터/분류 완료 로그의 '토큰 어림 / 실측'으로 본다."""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def _pack_batches(
+    posts: list[Post],
+    to_json: Callable[[list[Post]], str],
+    budget: int,
+    min_posts: int,
+    max_posts: int,
+) -> list[list[Post]]:
+    """게시물을 순서대로 배치에 채운다 — 직렬화 항목의 어림 토큰 합이 budget을
+    넘기 전까지, 배치당 [min_posts, max_posts]건. budget이 0이면 max_posts 고정 분할.
+
+    고정 건수(40)면 긴 LinkedIn 글 배치는 codex_timeout에 걸리고 한 줄 트윗 배치는
+    호출당 고정 오버헤드만 크다. min_posts는 예산보다 우선한다(항목 하나가 예산을
+    넘는 긴 글이어도 배치가 1건짜리로 잘게 쪼개지지 않게).
+    """
+    max_posts = max(1, max_posts)
+    if budget <= 0:
+        return list(_chunked(posts, max_posts))
+    batches: list[list[Post]] = []
+    batch: list[Post] = []
+    used = 0
+    for post in posts:
+        cost = estimate_tokens(to_json([post]))
+        if batch and (
+            len(batch) >= max_posts or (used + cost > budget and len(batch) >= min_posts)
+        ):
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(post)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@dataclass
+class _TokenTally:
+    """배치 프롬프트 입력 토큰 — 패킹 어림값 vs 백엔드 [usage] 실측.
+
+    실측은 CLI 고정 오버헤드(시스템 프롬프트·도구 정의)를 포함하므로 차이를 호출
+    수로 나누면 호출당 고정분이 나온다. 응답 캐시 적중·실측 없는 백엔드는 빠진다.
+    """
+
+    batches: int = 0
+    estimated: int = 0
+    measured: int = 0
+    measured_estimate: int = 0
+    actual: int = 0
+
+    def add(self, estimated: int, actual: int | None) -> None:
+        self.batches += 1
+        self.estimated += estimated
+        if actual:
+            self.measured += 1
+            self.measured_estimate += estimated
+            self.actual += actual
+
+    def __str__(self) -> str:
+        if not self.measured:
+            return f"토큰 어림 {self.estimated:,}"
+        overhead = (self.actual - self.measured_estimate) / self.measured
+        return (
+            f"토큰 어림 {self.measured_estimate:,} / 실측 {self.actual:,} "
+            f"(호출당 차이 {overhead:+,.0f}, 실측 {self.measured}/{self.batches}배치)"
+        )
+
+
+# 직전 CLI 호출의 입력 토큰([usage] 실측). 배치 태스크마다 컨텍스트가 따로라
+# 동시 배치끼리 섞이지 않는다 — _call_batch가 비우고 백엔드가 record_input_tokens로 채운다.
+_INPUT_TOKENS: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+    "llm_input_tokens", default=None
+)
+
+
+# 직전 호출이 본 응답 캐시 (프롬프트, 키). 파싱 실패 시 그 키 하나만 지우려고 남긴다 —
+# _INPUT_TOKENS와 같은 이유로 배치 태스크마다 따로다.
+_CACHE_KEY: contextvars.ContextVar[tuple[str, str] | None] = contextvars.ContextVar(
+    "llm_cache_key", default=None
+)
+
+
+def record_input_tokens(tokens: int | None) -> None:
+    """백엔드가 CLI 응답의 입력 토큰(캐시분 포함)을 남긴다 — 배치 패킹 어림값과 비교용."""
+    _INPUT_TOKENS.set(tokens or None)
+
+
 def _build_calibration_block(examples: list | None, per_side: int = 6) -> str:
     """사용자 피드백(과대/과소)을 티어 판정용 few-shot 보정 텍스트로 변환."""
     if not examples:
@@ -267,6 +379,7 @@ class BaseLLMProcessor:
         *,
         lean: bool = False,
         tier: str = "filter",
+        cache: bool = True,
     ) -> str:
         """LLM 호출. 백엔드별 서브클래스가 구현한다.
 
@@ -282,62 +395,208 @@ class BaseLLMProcessor:
         발행 작문처럼 상위 모델이 필요한 호출부는 tier="process", 기브리핑 판정은
         tier="dedup", 발행 확정분 병합 가드는 tier="consolidate"를 명시한다 —
         뒤의 둘은 Claude 백엔드에서 각각 독립된 설정 키로 모델이 갈린다.
+
+        cache=False는 응답 캐시를 읽지 않고 새로 부른다(결과는 캐시에 덮어쓴다) —
+        같은 프롬프트를 일부러 다시 묻는 재시도 호출부용.
         """
         raise NotImplementedError
 
+    def _cache_lookup(
+        self, backend: str, tier: str, model: str, effort: str, prompt: str,
+        use_cache: bool, usage_model: str,
+    ) -> tuple[str | None, str | None, str]:
+        """응답 캐시 조회 — (캐시된 응답, 저장 키, [usage] 줄 꼬리표).
+
+        서브클래스의 _call_api가 CLI를 띄우기 전에 부른다. 적중하면 [usage] 줄을 여기서
+        남기고(토큰 0), 실패하면 꼬리표를 백엔드의 [usage] 줄에 붙이게 돌려준다.
+        캐시가 없으면 (None, None, "").
+        """
+        cache, key = self._cache_key(backend, tier, model, effort, prompt)
+        cached = cache.get(key) if key is not None and use_cache else None
+        return self._cache_outcome(cached, key, use_cache, usage_model)
+
+    async def _acache_lookup(
+        self, backend: str, tier: str, model: str, effort: str, prompt: str,
+        use_cache: bool, usage_model: str,
+    ) -> tuple[str | None, str | None, str]:
+        """_cache_lookup의 비동기판 — 파일 읽기를 스레드로 넘긴다 (_acall_api용)."""
+        cache, key = self._cache_key(backend, tier, model, effort, prompt)
+        cached = await cache.aget(key) if key is not None and use_cache else None
+        return self._cache_outcome(cached, key, use_cache, usage_model)
+
+    def _cache_key(
+        self, backend: str, tier: str, model: str, effort: str, prompt: str
+    ) -> tuple[Any, str | None]:
+        cache = getattr(self, "_response_cache", None)
+        if cache is None:
+            return None, None
+        key = cache.key(backend, tier, model, effort, prompt)
+        _CACHE_KEY.set((prompt, key))
+        return cache, key
+
+    def _cache_outcome(
+        self, cached: str | None, key: str | None, use_cache: bool, usage_model: str
+    ) -> tuple[str | None, str | None, str]:
+        if key is None:
+            return None, None, ""
+        tally = self._response_cache.tally()
+        if not use_cache:
+            return None, key, f" llm_cache=bypass {tally}"
+        if cached is not None:
+            logger.info(f"[usage] model={usage_model} in=0 out=0 llm_cache=hit {tally}")
+            return cached, key, ""
+        return None, key, f" llm_cache=miss {tally}"
+
+    def _cache_store(self, key: str | None, response: str) -> None:
+        if key is not None:
+            self._response_cache.put(key, response)
+
+    async def _acache_store(self, key: str | None, response: str) -> None:
+        if key is not None:
+            await self._response_cache.aput(key, response)
+
+    async def _discard_cached(self, prompt: str) -> None:
+        """파싱에 실패한 응답을 캐시에서 뺀다 — 다음 사이클 재시도가 같은 응답을 받지 않게.
+
+        이 태스크가 그 프롬프트로 마지막에 본 키 하나만 지운다. 같은 프롬프트의 다른
+        변형(백엔드·티어·강도)은 따로 검증된 응답이라 남긴다.
+        """
+        served = _CACHE_KEY.get()
+        cache = getattr(self, "_response_cache", None)
+        if cache is not None and served is not None and served[0] == prompt:
+            _CACHE_KEY.set(None)
+            await cache.adiscard(served[1])
+
+    async def _acall_api(self, model: str, prompt: str, max_tokens: int = 4096, **kwargs) -> str:
+        """_call_api의 비동기 진입점 — 비동기 호출부는 전부 이걸 await한다.
+
+        기본 구현은 동기 _call_api를 스레드로 돌린다(이벤트 루프를 막지 않게).
+        CLI 백엔드는 asyncio 서브프로세스(cli_runner)로 직접 구현해 스레드를 쓰지 않는다.
+        스레드 안에서 기록한 입력 토큰·캐시 키는 호출한 태스크의 컨텍스트로 옮겨 온다.
+        """
+
+        def call() -> tuple[str, int | None, tuple[str, str] | None]:
+            response = self._call_api(model, prompt, max_tokens, **kwargs)
+            return response, _INPUT_TOKENS.get(), _CACHE_KEY.get()
+
+        response, tokens, served = await asyncio.to_thread(call)
+        _INPUT_TOKENS.set(tokens)
+        _CACHE_KEY.set(served)
+        return response
+
+    async def _call_batch(
+        self, tally: _TokenTally, model: str, prompt: str, max_tokens: int, **kwargs
+    ) -> str:
+        """배치 1개 호출 + 프롬프트 토큰 어림·실측 집계."""
+        _INPUT_TOKENS.set(None)  # 같은 컨텍스트의 이전 호출 값이 섞이지 않게
+        response = await self._acall_api(model, prompt, max_tokens, **kwargs)
+        tally.add(estimate_tokens(prompt), _INPUT_TOKENS.get())
+        return response
+
     def _curation_model(self) -> str:
         """Model to use for curation JSON generation."""
         return self._config.model_process
 
+    def _batch_concurrency(self, tier: str) -> int:
+        """tier 배치의 동시 호출 상한. 백엔드 서브클래스가 _concurrency(티어→상한)를
+        채운다 — 설정에 없는 티어나 테스트용 스텁은 1(순차)."""
+        limits = getattr(self, "_concurrency", None) or {}
+        return max(1, int(limits.get(tier, 1)))
+
+    async def _dispatch_batches(
+        self,
+        batches: list[list[Post]],
+        run: Callable[[list[Post]], Awaitable[list]],
+        tier: str = "filter",
+    ) -> tuple[list, _BatchTiming]:
+        """배치를 tier 상한만큼 동시에 돌리고 결과를 배치 순서대로 이어 붙인다.
+
+        run은 배치 1개의 호출·파싱·실패 처리를 맡는다(실패는 그 배치만의 몫).
+        LLMBackendError만은 남은 배치를 취소하고 상위(hybrid)로 전파한다 — 같은
+        백엔드로 계속 두드려 봐야 한도만 쓰고 폴백이 늦어진다.
+        """
+        limit = self._batch_concurrency(tier)
+        sem = asyncio.Semaphore(limit)
+        call_s: list[float] = []
+
+        async def one(batch: list[Post]) -> list:
+            async with sem:
+                t0 = time.perf_counter()
+                try:
+                    return await run(batch)
+                finally:
+                    call_s.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        tasks = [asyncio.ensure_future(one(b)) for b in batches]
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        timing = _BatchTiming(len(batches), limit, time.perf_counter() - started, sum(call_s))
+        return [r for chunk in chunks for r in chunk], timing
+
     async def filter_and_summarize(self, posts: list[Post]) -> list[FilterResult]:
         """관련성 필터 + 요약 (GPT-4o-mini 사용, 배치)."""
-        results: list[FilterResult] = []
+        tokens = _TokenTally()
 
-        for batch in _chunked(posts, self._config.batch_size_filter):
+        async def run(batch: list[Post]) -> list[FilterResult]:
             posts_json = _posts_to_json_filter(batch)
             prompt = FILTER_AND_SUMMARIZE.format(posts_json=posts_json)
 
             try:
                 # gpt-5 계열은 추론 토큰이 completion 한도를 같이 소모 — 배치 40건
                 # JSON이 잘리면 누락 게시물이 비관련 처리되므로 한도를 넉넉히 준다.
-                # to_thread: 동기 API 호출이 이벤트 루프(웹·수집 잡)를 막지 않게.
                 # lean: 규칙이 프롬프트에 명시된 기계적 분류 — 추론/도구가 품질에 기여하지 않는다.
-                response_text = await asyncio.to_thread(
-                    self._call_api, self._config.model_filter, prompt, 16384, lean=True
+                response_text = await self._call_batch(
+                    tokens, self._config.model_filter, prompt, 16384, lean=True
                 )
                 parsed = _parse_json_response(response_text)
 
-                for item in parsed:
-                    results.append(
-                        FilterResult(
-                            post_id=item["post_id"],
-                            is_relevant=item.get("is_relevant", False),
-                            summary=item.get("summary"),
-                            language=item.get("language"),
-                        )
+                return [
+                    FilterResult(
+                        post_id=item["post_id"],
+                        is_relevant=item.get("is_relevant", False),
+                        summary=item.get("summary"),
+                        language=item.get("language"),
                     )
+                    for item in parsed
+                ]
             except LLMBackendError:
                 # 백엔드 자체 장애(CLI 미설치·인증 만료·한도 소진·타임아웃)는 비관련
                 # 컷 대신 상위(hybrid)로 전파 — 여기서 삼키면 게시물이 조용히 비관련
                 # 처리되어 상위의 Codex 폴백이 작동하지 않는다.
                 raise
             except Exception as e:
+                await self._discard_cached(prompt)
                 logger.error(f"필터/요약 API 호출 실패: {e}")
                 # 실패 시 비관련으로 컷(요약 없음). 과거엔 '전부 관련'으로 통과시켰으나,
                 # 한도/파싱 실패 시 원문 쓰레기가 브리핑 풀에 쏟아져 품질이 붕괴됐다.
                 # 진행은 계속하되(큐 스톨 방지) 미검증 원문은 발행 대상에서 제외한다.
-                for p in batch:
-                    results.append(
-                        FilterResult(
-                            post_id=p.id,
-                            is_relevant=False,
-                            summary=None,
-                            language="unknown",
-                        )
+                return [
+                    FilterResult(
+                        post_id=p.id,
+                        is_relevant=False,
+                        summary=None,
+                        language="unknown",
                     )
+                    for p in batch
+                ]
 
+        batches = _pack_batches(
+            posts,
+            _posts_to_json_filter,
+            self._config.token_budget_filter,
+            self._config.batch_min_posts,
+            self._config.batch_size_filter,
+        )
+        results, timing = await self._dispatch_batches(batches, run)
         logger.info(
-            f"필터/요약 완료: {len(results)}건 (관련: {sum(1 for r in results if r.is_relevant)}건)"
+            f"필터/요약 완료: {len(results)}건 (관련: {sum(1 for r in results if r.is_relevant)}건, "
+            f"{timing}, {tokens})"
         )
         return results
 
@@ -347,7 +606,6 @@ class BaseLLMProcessor:
 
     async def categorize(self, posts: list[Post]) -> list[CategoryResult]:
         """카테고리 분류 + 중요도 (gpt-4o-mini 사용, 배치)."""
-        results: list[CategoryResult] = []
         # ClaudeCodeProcessor는 super().__init__을 안 타므로 getattr로 방어
         feedback_block = build_feedback_calibration(getattr(self, "_feedback_examples", []))
         if feedback_block:
@@ -356,7 +614,9 @@ class BaseLLMProcessor:
                 f"{len(getattr(self, '_feedback_examples', []))}건"
             )
 
-        for batch in _chunked(posts, self._config.batch_size_categorize):
+        tokens = _TokenTally()
+
+        async def run(batch: list[Post]) -> list[CategoryResult]:
             posts_json = _posts_to_json_lite(batch)
             prompt = CATEGORIZE.format(posts_json=posts_json, feedback_block=feedback_block)
 
@@ -366,30 +626,40 @@ class BaseLLMProcessor:
                 # 중요도 채점을 포함한다 — judge_tiers와 같은 품질 민감 판정이라
                 # 추론을 끄지 않는다. 물량도 필터 통과분(관련율 ~20%)뿐이라 필터와 달리
                 # 토큰 지배 요인이 아니다.
-                response_text = await asyncio.to_thread(
-                    self._call_api, self._config.model_filter, prompt, 16384
+                response_text = await self._call_batch(
+                    tokens, self._config.model_filter, prompt, 16384
                 )
                 parsed = _parse_json_response(response_text)
 
-                for item in parsed:
-                    results.append(
-                        CategoryResult(
-                            post_id=item["post_id"],
-                            categories=item.get("categories", []),
-                            importance_score=item.get("importance_score", 0.5),
-                            keywords=item.get("keywords", []),
-                        )
+                return [
+                    CategoryResult(
+                        post_id=item["post_id"],
+                        categories=item.get("categories", []),
+                        importance_score=item.get("importance_score", 0.5),
+                        keywords=item.get("keywords", []),
                     )
+                    for item in parsed
+                ]
             except LLMBackendError:
                 raise  # 백엔드 장애는 상위(hybrid)로 — Codex 폴백 트리거
             except Exception as e:
+                await self._discard_cached(prompt)
                 # 폴백 결과를 만들지 않고 배치를 통째로 누락시킨다 — 과거의
                 # ["Other"] 폴백은 sanitize에서 전멸해 배치 40건이 비관련으로
                 # 강등·삭제됐다. 누락된 게시물은 process_posts가 DB 업데이트에서
                 # 제외해 다음 사이클에 자동 재시도된다.
                 logger.error(f"분류 API 호출 실패(배치 {len(batch)}건 다음 사이클 재시도): {e}")
-
-        logger.info(f"분류 완료: {len(results)}건")
+                return []
+
+        batches = _pack_batches(
+            posts,
+            _posts_to_json_lite,
+            self._config.token_budget_categorize,
+            self._config.batch_min_posts,
+            self._config.batch_size_categorize,
+        )
+        results, timing = await self._dispatch_batches(batches, run)
+        logger.info(f"분류 완료: {len(results)}건 ({timing}, {tokens})")
         return results
 
     async def judge_tiers(self, topics: list, calibration_examples: list | None = None) -> list[str]:
@@ -417,7 +687,7 @@ class BaseLLMProcessor:
 
         tiers = ["minor"] * len(topics)
         try:
-            response_text = self._call_api(self._config.model_filter, prompt, max_tokens=4096)
+            response_text = await self._acall_api(self._config.model_filter, prompt, max_tokens=4096)
             parsed = _parse_json_response(response_text)
             for it in parsed:
                 idx = it.get("index")
@@ -427,6 +697,7 @@ class BaseLLMProcessor:
         except LLMBackendError:
             raise  # 백엔드 장애는 상위(hybrid)로 — 전부-minor 강등 대신 Codex 폴백
         except Exception as e:
+            await self._discard_cached(prompt)
             logger.warning(f"티어 판정 실패(전부 minor 처리): {e}")
 
         logger.info(f"티어 판정: major={tiers.count('major')} notable={tiers.count('notable')} minor={tiers.count('minor')}")
@@ -530,14 +801,15 @@ class BaseLLMProcessor:
             )
 
             try:
-                response_text = await asyncio.to_thread(
-                    self._call_api, self._config.model_process, prompt, 8192,
+                response_text = await self._acall_api(
+                    self._config.model_process, prompt, 8192,
                     tier="process",
                 )
                 parsed = _parse_json_response(response_text)
             except LLMBackendError:
                 raise  # 백엔드 장애는 상위(hybrid)로 — Codex 폴백 트리거
             except Exception as e:
+                await self._discard_cached(prompt)
                 logger.warning(f"발행 항목 작문 실패(결정적 초안 유지): {e}")
                 continue
 
@@ -593,9 +865,10 @@ class BaseLLMProcessor:
         data = None
         for attempt in range(2):
             try:
-                response_text = await asyncio.to_thread(
-                    self._call_api, self._curation_model(), prompt, 8192,
-                    tier="process",
+                # 재시도는 같은 프롬프트를 일부러 다시 묻는 것 — 캐시된 불량 응답을 피한다
+                response_text = await self._acall_api(
+                    self._curation_model(), prompt, 8192,
+                    tier="process", cache=attempt == 0,
                 )
                 data = _parse_json_object(response_text)
                 break
@@ -668,8 +941,8 @@ class BaseLLMProcessor:
                 candidates=candidates,
             )
             try:
-                response_text = await asyncio.to_thread(
-                    self._call_api, self._config.model_filter, prompt, 8192,
+                response_text = await self._acall_api(
+                    self._config.model_filter, prompt, 8192,
                     tier="dedup",
                 )
                 parsed = _parse_json_response(response_text)
@@ -678,6 +951,7 @@ class BaseLLMProcessor:
                 # Codex로 판정을 완주하는 쪽이 낫다.
                 raise
             except Exception as e:
+                await self._discard_cached(prompt)
                 logger.warning(f"기브리핑 판정 청크 실패(해당 청크만 스킵): {e}")
                 continue
 
@@ -737,13 +1011,14 @@ class BaseLLMProcessor:
         prompt = CROSS_CHUNK_MERGE.format(topics_json=topics_json)
 
         try:
-            response_text = self._call_api(
+            response_text = await self._acall_api(
                 self._config.model_process, prompt, max_tokens=8192, tier="consolidate"
             )
             groups = _parse_json_response(response_text)
         except LLMBackendError:
             raise  # 백엔드 장애는 상위(hybrid)로 — 유사도 폴백보다 OpenAI 의미 병합이 낫다
         except Exception as e:
+            await self._discard_cached(prompt)
             logger.warning(f"전역 통합 LLM 실패, 폴백 사용: {e}")
             return None
 
@@ -814,7 +1089,7 @@ class BaseLLMProcessor:
             prompt = CROSS_CHUNK_MERGE.format(topics_json=topics_json)
 
             try:
-                response_text = self._call_api(
+                response_text = await self._acall_api(
                     self._config.model_process, prompt, max_tokens=4096, tier="consolidate"
                 )
                 sub_groups = _parse_json_response(response_text)
@@ -838,6 +1113,7 @@ class BaseLLMProcessor:
                     merged_indices.update(group_indices)
 
             except Exception as e:
+                await self._discard_cached(prompt)
                 logger.warning(f"후보군 LLM 검증 실패, 토큰 매칭 기준으로 병합: {e}")
                 merged_topics.append(self._merger.merge_topic_group(topics, group_indices))
                 merged_indices.update(group_indices)
@@ -863,11 +1139,12 @@ class SearchVerificationProcessor(BaseLLMProcessor):
         prompt = EXTRACT_CLAIMS.format(posts_json=posts_json)
 
         try:
-            response_text = await asyncio.to_thread(
-                self._call_api, self._config.model_filter, prompt, 8192
+            response_text = await self._acall_api(
+                self._config.model_filter, prompt, 8192
             )
             claims = _parse_json_response(response_text)
         except Exception as e:
+            await self._discard_cached(prompt)
             logger.warning(f"주장 추출 실패 (검증 스킵): {e}")
             return [
                 VerificationResult(post_id=p.id, credibility="verified")
@@ -942,8 +1219,8 @@ class SearchVerificationProcessor(BaseLLMProcessor):
         verified_ids: set = set()
 
         try:
-            response_text = await asyncio.to_thread(
-                self._call_api, self._config.model_filter, verify_prompt, 8192
+            response_text = await self._acall_api(
+                self._config.model_filter, verify_prompt, 8192
             )
             parsed = _parse_json_response(response_text)
 
@@ -956,6 +1233,7 @@ class SearchVerificationProcessor(BaseLLMProcessor):
                 ))
                 verified_ids.add(str(item["post_id"]))
         except Exception as e:
+            await self._discard_cached(verify_prompt)
             logger.warning(f"신뢰도 판정 실패 (검증 스킵): {e}")
 
         # 검증 대상이 아닌 게시물은 verified로 처리
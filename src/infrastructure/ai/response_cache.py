@@ -0,0 +1,167 @@
+"""LLM 응답 디스크 캐시 — 같은 프롬프트를 CLI에 다시 태우지 않는다.
+
+같은 프롬프트가 생각보다 자주 돈다: hybrid 폴백 뒤 재시도, /api/process/trigger·
+/api/briefing/generate 재실행, 독자군별로 입력이 같은 generate_curation, 같은 주장의
+재검증. 매번 구독 한도와 수십 초를 쓴다. ClaudeCodeProcessor·CodexCliProcessor의
+_call_api 아래에서 (백엔드, 티어, 모델, 추론 강도, 프롬프트) 단위로 응답을 재사용한다.
+
+파일은 내용 주소: <root>/<프롬프트 sha256 앞 2자>/<프롬프트 sha256>-<변형 sha1 12자>.json.
+파싱에 실패한 응답은 그 키 하나만 지운다(discard) — 같은 프롬프트라도 다른 백엔드·
+티어·강도로 받은 멀쩡한 응답은 남긴다. TTL이 지난 항목은 읽지 않고, 전체 크기가
+max_mb를 넘으면 가장 오래 안 쓴 것부터 지운다(적중 시 mtime 갱신).
+
+크기와 최근 사용 시각은 메모리 색인(키 → (mtime, 크기))으로 들고 다닌다 — 디렉터리는
+처음 한 번만 훑고, 축출도 색인을 정렬할 뿐 파일을 다시 stat하지 않는다.
+비동기 호출부(배치 동시 디스패치)는 aget/aput/adiscard로 파일 I/O를 스레드에 넘긴다 —
+이벤트 루프에서 디스크를 읽고 쓰거나 락을 잡지 않는다. 색인은 락으로, 쓰기는 임시 파일 교체로.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.infrastructure.config.settings import ProcessingConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("data/llm_cache")
+
+# 크기 상한을 넘으면 이 비율까지 줄인다 — 상한 근처에서 쓰기마다 스캔하지 않게
+_EVICT_TO = 0.9
+
+
+def _prompt_digest(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        root: Path | str = DEFAULT_CACHE_DIR,
+        ttl_hours: float = 24.0,
+        max_mb: float = 64.0,
+    ):
+        self._root = Path(root)
+        self._ttl_s = ttl_hours * 3600
+        self._max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[float, int]] | None = None  # 처음 쓸 때 디렉터리를 훑어 채운다
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: ProcessingConfig) -> LLMResponseCache | None:
+        """llm_cache가 꺼져 있으면 None — 프로세서는 캐시 없이 매번 호출한다."""
+        if not config.llm_cache:
+            return None
+        return cls(config.llm_cache_dir, config.llm_cache_ttl_hours, config.llm_cache_max_mb)
+
+    def key(self, backend: str, tier: str, model: str, effort: str, prompt: str) -> str:
+        variant = hashlib.sha1(f"{backend}|{tier}|{model}|{effort}".encode()).hexdigest()[:12]
+        return f"{_prompt_digest(prompt)}-{variant}"
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def tally(self) -> str:
+        return f"(hits={self.hits} misses={self.misses})"
+
+    async def aget(self, key: str) -> str | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, response: str) -> None:
+        await asyncio.to_thread(self.put, key, response)
+
+    async def adiscard(self, key: str) -> None:
+        await asyncio.to_thread(self.discard, key)
+
+    def get(self, key: str) -> str | None:
+        """TTL 안의 응답 또는 None. 적중·실패를 센다."""
+        path = self._path(key)
+        response = None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - entry["created"] <= self._ttl_s:
+                response = entry["response"]
+                os.utime(path)  # LRU — 최근 적중한 항목은 축출 뒤로
+        except (OSError, ValueError, KeyError):
+            pass
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                index = self._ensure_index()
+                if key in index:
+                    index[key] = (time.time(), index[key][1])
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """응답 저장. 실패해도 호출 결과는 그대로 쓴다."""
+        path = self._path(key)
+        data = json.dumps({"created": time.time(), "response": response}, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"LLM 응답 캐시 저장 실패(무시): {e}")
+            return
+        with self._lock:
+            index = self._ensure_index()
+            _, old_size = index.get(key, (0.0, 0))
+            index[key] = (time.time(), size)
+            self._size += size - old_size
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def discard(self, key: str) -> None:
+        """이 키의 응답만 지운다 — 파싱에 실패한 응답을 다시 내주지 않게."""
+        self._path(key).unlink(missing_ok=True)
+        with self._lock:
+            if self._index is not None and key in self._index:
+                self._size -= self._index.pop(key)[1]
+
+    def _ensure_index(self) -> dict[str, tuple[float, int]]:
+        """색인이 없으면 디렉터리를 한 번 훑어 만든다 (락 안에서, 프로세스당 한 번)."""
+        if self._index is None:
+            index = {}
+            paths = self._root.glob("*/*.json") if self._root.exists() else []
+            for path in paths:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                index[path.stem] = (st.st_mtime, st.st_size)
+            self._index = index
+            self._size = sum(size for _, size in index.values())
+        return self._index
+
+    def _evict(self) -> None:
+        """만료분 먼저, 그다음 오래 안 쓴 순으로 상한의 _EVICT_TO까지 지운다 (락 안에서)."""
+        now = time.time()
+        index = self._ensure_index()
+        removed = 0
+        for key, (used, size) in sorted(index.items(), key=lambda kv: kv[1]):
+            if self._size <= self._max_bytes * _EVICT_TO and now - used <= self._ttl_s:
+                continue
+            self._path(key).unlink(missing_ok=True)
+            del index[key]
+            self._size -= size
+            removed += 1
+        if removed:
+            logger.info(
+                f"LLM 응답 캐시 정리: {removed}건 삭제 ({self._size / 1024 / 1024:.1f}MB 남음)"
+            )
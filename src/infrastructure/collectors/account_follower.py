@@ -29,7 +29,12 @@ import asyncio
 import logging
 import random
 
-from src.infrastructure.collectors.cdp import cdp_connection, minimize_window
+from src.infrastructure.collectors.cdp import (
+    PRIORITY_ENGAGE,
+    CdpConnectionManager,
+    cdp_connection,
+    minimize_window,
+)
 from src.infrastructure.config.settings import FollowConfig
 
 logger = logging.getLogger(__name__)
@@ -64,9 +69,12 @@ _COUNT_JS = """(labels) => labels.map(l =>
 class CdpAccountFollower:
     """사용자 Chrome(CDP)에 연결해 계정 프로필을 열고 팔로우를 누른다."""
 
-    def __init__(self, config: FollowConfig, cdp_port: int = 9222):
+    def __init__(
+        self, config: FollowConfig, cdp_port: int = 9222, cdp: CdpConnectionManager | None = None
+    ):
         self._cfg = config
         self._cdp_url = f"http://127.0.0.1:{cdp_port}"
+        self._cdp = cdp
 
     async def follow_accounts(self, source: str, candidates: list[dict]) -> list[dict]:
         """후보 계정들을 팔로우. 각 계정의 처리 결과(status 포함)를 반환한다.
@@ -81,7 +89,9 @@ class CdpAccountFollower:
 
         results: list[dict] = []
         try:
-            async with cdp_connection(self._cdp_url, source) as (pw, context):
+            async with cdp_connection(
+                self._cdp_url, source, self._cdp, PRIORITY_ENGAGE, f"{source}:follow"
+            ) as (pw, context):
                 page = await context.new_page()  # 새 탭 (완료 후 닫아 메모리 회수)
                 await minimize_window(page)
                 try:
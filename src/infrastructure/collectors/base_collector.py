@@ -3,12 +3,63 @@
 twitter/threads/linkedin 수집기가 공유하는 동일한 생성자와 source_name을 제공한다.
 서브클래스는 클래스 속성 SOURCE와 collect()/login()/is_session_valid()를 구현한다.
 (collect() 본문은 GraphQL 인터셉트 vs DOM 파싱 등으로 갈려 베이스로 올리지 않는다.)
+
+스크롤 루프만은 GraphQL 인터셉트형(twitter/threads)이 공유한다 — _scroll_for_novelty.
+라운드마다 새로 잡힌 external_id 중 '이번 수집에서도 DB에서도 처음 보는' 것의 수를 세어,
+피드가 이미 본 글만 내놓으면 일찍 멈추고 계속 새 글이 나오면 라운드를 늘린다.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from src.domain.entities import Post
+from src.infrastructure.collectors.cdp import CdpConnectionManager
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
+from src.infrastructure.collectors.resource_policy import ResourceBlockPolicy, ResourceGuard
 from src.infrastructure.config.settings import CollectorConfig, SnsCredentials
 
+logger = logging.getLogger(__name__)
+
+# 주어진 external_id 중 이미 저장된 것의 집합을 돌려주는 조회 (SeenPostIndex.known_ids)
+KnownIdsLookup = Callable[[list[str]], set[str]]
+
+
+@dataclass
+class ScrollStats:
+    """수집 1회분 스크롤 수확 — yields[0]은 첫 로드, 이후는 스크롤 라운드별 신규 건수."""
+
+    yields: list[int] = field(default_factory=list)
+    stopped_early: bool = False
+
+    @property
+    def rounds(self) -> int:
+        return max(0, len(self.yields) - 1)
+
+
+class NoveltyTracker:
+    """이번 수집에서 본 id + DB 조회로 '처음 보는' 게시물 수를 센다."""
+
+    def __init__(self, known_ids: KnownIdsLookup | None = None):
+        self._known_ids = known_ids
+        self._seen: set[str] = set()
+
+    def observe(self, external_ids: list[str]) -> int:
+        fresh = [eid for eid in dict.fromkeys(external_ids) if eid not in self._seen]
+        self._seen.update(fresh)
+        if not fresh or self._known_ids is None:
+            return len(fresh)
+        try:
+            return len(fresh) - len(self._known_ids(fresh))
+        except Exception as e:
+            # 조회 실패로 수집을 멈추지 않는다 — 세션 내 신규만으로 판단
+            logger.debug(f"[scroll] 기존 id 조회 실패: {e}")
+            return len(fresh)
+
 
 class BaseCdpCollector:
     SOURCE: str = ""
@@ -18,11 +69,86 @@ class BaseCdpCollector:
         config: CollectorConfig,
         credentials: SnsCredentials | None = None,
         cdp_port: int = 9222,
+        known_ids: KnownIdsLookup | None = None,
+        cdp: CdpConnectionManager | None = None,
     ):
         self._config = config
         self._credentials = credentials or SnsCredentials()
         self._cdp_url = f"http://127.0.0.1:{cdp_port}"
+        self._cdp = cdp  # 컨테이너의 장수명 CDP 연결 (없으면 호출마다 연결)
+        self._known_ids = known_ids
+        self.scroll_stats = ScrollStats()  # 직전 collect()의 라운드별 신규 수확
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
+        # 수집 탭 리소스 차단 (resource_policy) — collect()에서 attach/report
+        self._resources = ResourceGuard(
+            self.SOURCE, ResourceBlockPolicy.from_config(config), config.measure_resource_blocking
+        )
 
     @property
     def source_name(self) -> str:
         return self.SOURCE
+
+    @staticmethod
+    def _graphql_harvester(
+        captured: list[Any], parse: Callable[[list[Any]], list[Post]]
+    ) -> tuple[list[Post], Callable[[], list[str]]]:
+        """인터셉트 버퍼를 증분 파싱하는 harvest 함수와 누적 결과 리스트.
+
+        harvest()는 직전 호출 이후 도착한 응답만 파싱해 처음 나온 게시물을 누적하고
+        그 external_id 목록을 돌려준다 (전체를 매 라운드 다시 파싱하지 않는다).
+        """
+        posts: list[Post] = []
+        kept: set[str] = set()
+        parsed = 0
+
+        def harvest() -> list[str]:
+            nonlocal parsed
+            batch, parsed = captured[parsed:], len(captured)
+            new_ids = []
+            for post in parse(batch):
+                if post.external_id not in kept:
+                    kept.add(post.external_id)
+                    posts.append(post)
+                    new_ids.append(post.external_id)
+            return new_ids
+
+        return posts, harvest
+
+    async def _scroll_for_novelty(
+        self,
+        page,
+        harvest: Callable[[], list[str]],
+        wheel: tuple[int, int],
+    ) -> ScrollStats:
+        """신규 수확률 기반 스크롤 루프.
+
+        harvest()는 직전 호출 이후 새로 파싱된 게시물의 external_id 목록을 돌려준다.
+        - 라운드 수확이 min_new_per_round 미만이면 '저조' — stale_rounds번 연속이면 중단
+          (min_scroll_rounds 전에는 멈추지 않는다).
+        - scroll_rounds를 다 돌고도 직전 라운드가 저조하지 않으면 max_scroll_rounds까지 연장.
+        """
+        cfg = self._config
+        tracker = NoveltyTracker(self._known_ids)
+        stats = ScrollStats(yields=[tracker.observe(harvest())])
+        stale = 0
+
+        for n in range(1, max(cfg.scroll_rounds, cfg.max_scroll_rounds) + 1):
+            await page.mouse.wheel(0, random.randint(*wheel))
+            await asyncio.sleep(random.uniform(cfg.scroll_delay_min, cfg.scroll_delay_max))
+
+            new = tracker.observe(harvest())
+            stats.yields.append(new)
+            stale = stale + 1 if new < cfg.min_new_per_round else 0
+            if n < cfg.min_scroll_rounds:
+                continue
+            if stale >= cfg.stale_rounds and n < cfg.scroll_rounds:
+                stats.stopped_early = True
+                break
+            if n >= cfg.scroll_rounds and stale:
+                break
+
+        logger.info(
+            f"[{self.SOURCE}] 스크롤 {stats.rounds}라운드"
+            f"{' (조기 중단)' if stats.stopped_early else ''} — 라운드별 신규 {stats.yields}"
+        )
+        return stats
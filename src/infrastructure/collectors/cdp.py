@@ -1,16 +1,29 @@
 """CDP 연결 유틸리티.
 
 모든 SNS 수집기가 공유하는 Chrome CDP 연결 로직을 중앙화한다.
+
+컨테이너가 CdpConnectionManager 하나를 소유하면 cdp_connection(..., manager)은
+장수명 Playwright 드라이버·CDP 연결을 빌려 쓴다(lease). 잡마다 드라이버 프로세스를
+띄우고 connect_over_cdp 핸드셰이크를 다시 하던 비용(수 초)이 첫 연결 1회로 준다.
+manager가 없으면(스크립트·테스트) 예전처럼 호출마다 연결하고 정리한다.
+
+lease는 TabScheduler를 거친다 — 같은 브라우저 컨텍스트의 별도 탭에서 여러 소스를
+동시에 돌리되, 전역 탭 예산·플랫폼별 상호 배제(X 탭은 동시에 하나)·우선순위
+(수집 > 좋아요·팔로우)를 지킨다.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
 
-from playwright.async_api import BrowserContext, Page, Playwright, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
 logger = logging.getLogger(__name__)
 
@@ -101,23 +114,16 @@ def _safe_restart_chrome(source_name: str) -> None:
         logger.error(f"[{source_name}] Chrome 안전 재실행 실패: {e}")
 
 
-@asynccontextmanager
-async def cdp_connection(
-    cdp_url: str, source_name: str
-) -> AsyncGenerator[tuple[Playwright, BrowserContext], None]:
-    """Chrome CDP 연결 context manager.
+async def _connect_with_recovery(pw: Playwright, cdp_url: str, source_name: str) -> Browser:
+    """connect_over_cdp — 짧게 재시도하고, 먹통이면 쿨다운 내 1회 안전 재시작 후 재연결.
 
-    Yields (playwright, context). 종료 시 playwright를 정리한다.
-    연결 실패 시 짧게 재시도만 하고, 그래도 안 되면 예외를 던져 이번 사이클을
-    건너뛴다. (예전처럼 taskkill로 Chrome을 죽이고 재실행하지 않는다 — 사용자의
-    기존 창을 유지하고 창이 불어나는 것을 막기 위함. 디버그 Chrome이 꺼져 있으면
-    로그만 남기고 스킵하니, 9222 디버그 Chrome을 켜두면 된다.)
+    그래도 안 되면 예외를 던져 이번 사이클을 건너뛴다. (예전처럼 taskkill로 Chrome을
+    무조건 죽이고 재실행하지 않는다 — 사용자의 기존 창을 유지하고 창이 불어나는 것을
+    막기 위함. 디버그 Chrome이 꺼져 있으면 로그만 남기고 스킵하니, 9222 디버그
+    Chrome을 켜두면 된다.)
     """
-    import asyncio
-
     global _last_restart_monotonic
 
-    pw = await async_playwright().start()
     browser = None
     last_err: Exception | None = None
     for attempt in range(3):
@@ -148,14 +154,265 @@ async def cdp_connection(
                 last_err = e
 
     if browser is None:
-        await pw.stop()
         logger.error(
             f"[{source_name}] Chrome CDP 연결 실패 ({cdp_url}) — "
             f"9222 디버그 Chrome이 켜져 있는지 확인하세요. 이번 수집은 건너뜁니다: {last_err}"
         )
         raise last_err if last_err else RuntimeError("CDP 연결 실패")
+    return browser
+
+
+# TabScheduler 우선순위 — 작을수록 먼저. 대기 중인 수집이 있으면 좋아요·팔로우는 뒤로 밀린다.
+PRIORITY_COLLECT = 0
+PRIORITY_ENGAGE = 1
+
+
+@dataclass
+class JobTiming:
+    """브라우저 작업(job)별 대기·실행 시간 누적."""
+
+    runs: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    last_wait_ms: float = 0.0
+    run_total_s: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "runs": self.runs,
+            "wait_avg_ms": round(self.wait_total_ms / self.runs, 1) if self.runs else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 1),
+            "last_wait_ms": round(self.last_wait_ms, 1),
+            "run_avg_s": round(self.run_total_s / self.runs, 1) if self.runs else 0.0,
+        }
+
+
+class TabScheduler:
+    """브라우저 탭 배정 — 전역 탭 예산 + 플랫폼별 상호 배제 + 우선순위 큐.
+
+    대기열은 (priority, 도착 순서)로 정렬하고, 빈 탭이 생길 때마다 앞에서부터 '플랫폼이
+    비어 있는' 첫 대기자에게 준다. 그래서 X 탭이 돌고 있으면 다음 X 작업은 기다리고
+    그 뒤의 LinkedIn 작업이 먼저 들어간다. 같은 우선순위 안에서는 도착 순서를 지킨다.
+    """
+
+    def __init__(self, tab_budget: int):
+        self._budget = max(1, tab_budget)
+        self._running = 0
+        self._busy: set[str] = set()
+        self._queue: list[tuple[int, int, str, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, fut in self._queue if not fut.done())
+
+    async def acquire(self, platform: str, priority: int = PRIORITY_COLLECT) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), platform, fut))
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(platform)  # 배정 직후 취소 — 자리를 돌려준다
+            else:
+                fut.cancel()
+                self._dispatch()
+            raise
+
+    def release(self, platform: str) -> None:
+        self._running -= 1
+        self._busy.discard(platform)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        waiting: list[tuple[int, int, str, asyncio.Future]] = []
+        while self._queue and self._running < self._budget:
+            entry = heapq.heappop(self._queue)
+            _, _, platform, fut = entry
+            if fut.done():
+                continue  # 취소된 대기자
+            if platform in self._busy:
+                waiting.append(entry)
+                continue
+            self._busy.add(platform)
+            self._running += 1
+            fut.set_result(None)
+        for entry in waiting:
+            heapq.heappush(self._queue, entry)
+
+
+class CdpConnectionManager:
+    """장수명 CDP 연결 (컨테이너 소유) — 잡은 lease()로 빌려 쓰고 새 탭을 열고 닫는다.
+
+    - 연결은 첫 lease 때 만들고 이후 재사용한다. 빌려줄 때마다 is_connected()를 보고,
+      health_check_s 넘게 쉬었던 연결은 Browser.getVersion 왕복으로 먹통 여부까지 확인한다.
+      끊겼거나(Chrome 재시작·_safe_restart_chrome) 응답이 없으면 그 자리에서 다시 연결한다.
+      단, 빌려 간 lease가 하나라도 있으면 유휴 점검을 건너뛰고 is_connected()가 False일
+      때만 다시 연결한다 — 드라이버를 내리면(pw.stop) 작업 중인 탭이 전부 같이 죽는다.
+    - 동시에 빌려줄 탭 수(tab_budget)·플랫폼 배제·우선순위는 TabScheduler가 정한다 —
+      탭이 한꺼번에 불어나 렌더러가 먹통 되거나 같은 계정 탭이 겹치는 것 방지.
+    - Playwright 드라이버는 만든 이벤트 루프에 묶이므로 루프가 바뀌면(collect-now 재실행·
+      테스트) 새로 연결한다. SharedHttpClient와 같은 방식.
+    """
 
+    def __init__(self, cdp_url: str, tab_budget: int = 3, health_check_s: float = 60.0):
+        self._cdp_url = cdp_url
+        self._tab_budget = max(1, tab_budget)
+        self._health_check_s = health_check_s
+        self._pw: Playwright | None = None
+        self._browser: Browser | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._tabs: TabScheduler | None = None
+        self._connected_at = 0.0
+        self._last_used = 0.0
+        self._active = 0  # 빌려 가서 아직 안 돌려준 lease 수
+        self._reconnects = 0
+        self._jobs: dict[str, JobTiming] = {}
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프의 드라이버는 여기서 정리할 수 없다 — 참조만 버린다
+            self._pw = self._browser = None
+            self._active = 0
+            self._lock = asyncio.Lock()
+            self._tabs = TabScheduler(self._tab_budget)
+            self._loop = loop
+
+    async def _healthy(self) -> bool:
+        browser = self._browser
+        if browser is None or not browser.is_connected():
+            return False
+        if self._active:
+            # 다른 lease가 이 연결로 작업 중 — 오래 걸리는 수집이 _last_used를 묵혀도
+            # 점검 실패로 드라이버를 내리면 그 탭들이 중간에 죽는다
+            return True
+        if not browser.contexts:
+            return False
+        if time.monotonic() - self._last_used < self._health_check_s:
+            return True
+        try:
+            session = await browser.new_browser_cdp_session()
+            try:
+                await asyncio.wait_for(session.send("Browser.getVersion"), timeout=5)
+            finally:
+                await session.detach()
+            return True
+        except Exception as e:
+            logger.warning(f"[cdp] 유휴 연결 점검 실패 — 재연결: {e}")
+            return False
+
+    async def _context(self, source_name: str) -> BrowserContext:
+        async with self._lock:
+            if not await self._healthy():
+                had_connection = self._pw is not None
+                await self._drop()
+                pw = await async_playwright().start()
+                try:
+                    self._browser = await _connect_with_recovery(pw, self._cdp_url, source_name)
+                except BaseException:
+                    await pw.stop()
+                    raise
+                self._pw = pw
+                self._connected_at = time.monotonic()
+                if had_connection:
+                    self._reconnects += 1
+                    logger.info(f"[{source_name}] CDP 재연결 (누적 {self._reconnects}회)")
+            self._last_used = time.monotonic()
+            return self._browser.contexts[0]
+
+    async def _drop(self) -> None:
+        pw, self._pw, self._browser = self._pw, None, None
+        if pw is not None:
+            try:
+                await pw.stop()  # CDP 연결만 끊는다 — 사용자의 Chrome은 그대로
+            except Exception as e:
+                logger.debug(f"[cdp] 드라이버 정리 실패(무시): {e}")
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        source_name: str,
+        priority: int = PRIORITY_COLLECT,
+        job: str | None = None,
+    ) -> AsyncGenerator[tuple[Playwright, BrowserContext], None]:
+        """탭 자리를 배정받아 (playwright, context)를 빌려준다. 끝나도 연결은 닫지 않는다.
+
+        source_name이 곧 플랫폼 — 같은 플랫폼 lease는 동시에 하나만 나간다.
+        job은 대기·실행 시간 집계 키 (기본: source_name).
+        """
+        self._bind_loop()
+        tabs = self._tabs
+        timing = self._jobs.setdefault(job or source_name, JobTiming())
+        started = time.monotonic()
+        await tabs.acquire(source_name, priority)
+        try:
+            context = await self._context(source_name)
+            self._active += 1
+            granted = time.monotonic()
+            wait_ms = (granted - started) * 1000
+            timing.runs += 1
+            timing.wait_total_ms += wait_ms
+            timing.wait_max_ms = max(timing.wait_max_ms, wait_ms)
+            timing.last_wait_ms = wait_ms
+            try:
+                yield self._pw, context
+            finally:
+                timing.run_total_s += time.monotonic() - granted
+                self._last_used = time.monotonic()
+                self._active -= 1
+        finally:
+            tabs.release(source_name)
+
+    async def aclose(self) -> None:
+        """종료 시 드라이버 정리 (연결을 만든 루프에서만 가능)."""
+        if self._pw is not None and self._loop is asyncio.get_running_loop():
+            await self._drop()
+
+    def stats(self) -> dict[str, Any]:
+        """연결 상태·경과 시간·탭 배정 현황·작업별 대기 (/api/stats 용)."""
+        connected = self._browser is not None and self._browser.is_connected()
+        return {
+            "connected": connected,
+            "connection_age_s": round(time.monotonic() - self._connected_at) if connected else 0,
+            "reconnects": self._reconnects,
+            "tab_budget": self._tab_budget,
+            "active_tabs": self._tabs.running if self._tabs else 0,
+            "active_leases": self._active,
+            "queued": self._tabs.queued if self._tabs else 0,
+            "leases": sum(t.runs for t in self._jobs.values()),
+            "jobs": {name: t.as_dict() for name, t in sorted(self._jobs.items())},
+        }
+
+
+@asynccontextmanager
+async def cdp_connection(
+    cdp_url: str,
+    source_name: str,
+    manager: CdpConnectionManager | None = None,
+    priority: int = PRIORITY_COLLECT,
+    job: str | None = None,
+) -> AsyncGenerator[tuple[Playwright, BrowserContext], None]:
+    """Chrome CDP 연결 context manager.
+
+    Yields (playwright, context). manager가 있으면 그 장수명 연결에서 탭 자리를
+    배정받고(priority·job은 TabScheduler용, 종료 시 연결 유지), 없으면 이 호출 전용으로
+    연결한 뒤 종료 시 playwright를 정리한다.
+    """
+    if manager is not None:
+        async with manager.lease(source_name, priority, job) as conn:
+            yield conn
+        return
+
+    pw = await async_playwright().start()
     try:
+        browser = await _connect_with_recovery(pw, cdp_url, source_name)
         yield pw, browser.contexts[0]
     finally:
         await pw.stop()
@@ -187,6 +444,7 @@ async def check_session(
     invalid_keywords: list[str],
     require_substr: str | None = None,
     login_markers: str | None = None,
+    manager: CdpConnectionManager | None = None,
 ) -> bool:
     """피드로 이동해 로그인 상태를 확인한다.
 
@@ -198,7 +456,7 @@ async def check_session(
     URL 키워드만으론 SNS 로그아웃을 놓치는 경우가 많아 (b)(c)를 추가했다.
     """
     try:
-        async with cdp_connection(cdp_url, source_name) as (pw, context):
+        async with cdp_connection(cdp_url, source_name, manager) as (pw, context):
             page = await context.new_page()  # 새 탭 (확인 후 닫아 메모리 회수)
             try:
                 await minimize_window(page)
@@ -238,6 +496,7 @@ async def auto_login(
     invalid_keywords: list[str],
     initial_wait_ms: int = 3000,
     submit_wait_ms: int = 5000,
+    manager: CdpConnectionManager | None = None,
 ) -> bool:
     """SNS 플랫폼의 자동 로그인을 수행한다.
 
@@ -253,9 +512,10 @@ async def auto_login(
         invalid_keywords: 로그인 실패 시 URL에 포함될 키워드
         initial_wait_ms: 페이지 로딩 후 대기 시간
         submit_wait_ms: 제출 후 대기 시간
+        manager: 컨테이너의 장수명 CDP 연결 (없으면 이 호출 전용 연결)
     """
     try:
-        async with cdp_connection(cdp_url, source_name) as (pw, context):
+        async with cdp_connection(cdp_url, source_name, manager) as (pw, context):
             page = await context.new_page()
             try:
                 await page.goto(
@@ -2,6 +2,11 @@
 
 CDP로 사용자의 Chrome에 연결하여 이미 열려있는 개념글 탭에서
 게시물 목록을 읽고, 각 게시물 상세 페이지에서 본문을 수집한다.
+
+상세 페이지는 서버 렌더링이라 브라우저 없이 httpx로 받는다 (공유 연결 풀, 동시
+detail_concurrency건, 요청 시작 간 detail_interval초). 차단 응답(403·429·503)이나
+본문 컨테이너가 없는 200 페이지(캡차·안내)가 오면 그 회차의 나머지는 예전처럼 CDP
+탭에서 순차로 연다. 삭제된 글(404·410)·서버 오류는 그 글만 실패로 세고 제목을 유지한다.
 """
 
 from __future__ import annotations
@@ -15,7 +20,10 @@ from typing import Optional
 from bs4 import BeautifulSoup, Tag
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.cdp import cdp_connection, minimize_window
+from src.domain.services.seen_filter import SeenPostFilter
+from src.infrastructure.collectors.cdp import CdpConnectionManager, cdp_connection, minimize_window
+from src.infrastructure.collectors.http import FetchStats, HostLimiter, SharedHttpClient
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
 from src.infrastructure.config.settings import CollectorConfig
 
 logger = logging.getLogger(__name__)
@@ -25,15 +33,30 @@ _RECOMMEND_URL_DESKTOP = (
     "?id={gallery_id}&exception_mode=recommend"
 )
 
+# 이 상태면 HTTP 경로를 접고 CDP로 넘긴다 (봇 차단·레이트 리밋·점검)
+_BLOCKED_STATUS = {403, 429, 503}
+
 
 class DCInsideCollector:
     """DCInside 마이너 갤러리 개념글 수집기 (CDP 기반)."""
 
-    def __init__(self, config: CollectorConfig, cdp_port: int = 9222):
+    def __init__(
+        self,
+        config: CollectorConfig,
+        cdp_port: int = 9222,
+        seen: SeenPostFilter | None = None,
+        http: SharedHttpClient | None = None,
+        cdp: CdpConnectionManager | None = None,
+    ):
         self._config = config
+        self._seen = seen
+        self._http = http
+        self.fetch_stats = FetchStats()  # 직전 collect()의 상세 페이지 HTTP 요청 집계
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
         self._gallery_id = config.gallery_id
         self._pages = config.pages_to_scrape
         self._cdp_url = f"http://127.0.0.1:{cdp_port}"
+        self._cdp = cdp
 
     @property
     def source_name(self) -> str:
@@ -44,7 +67,7 @@ class DCInsideCollector:
 
     async def collect(self) -> list[Post]:
         """개념글 탭에서 목록을 읽고, 각 게시물 상세에서 본문 수집."""
-        async with cdp_connection(self._cdp_url, "dcinside") as (pw, context):
+        async with cdp_connection(self._cdp_url, "dcinside", self._cdp) as (pw, context):
             posts: list[Post] = []
             seen_ids: set[str] = set()
 
@@ -65,33 +88,105 @@ class DCInsideCollector:
 
             # 현재 페이지에서 게시물 목록 파싱 (최대 20건)
             html = await page.content()
+            if self._recorder:
+                self._recorder.record("dcinside", "list", html)
             posts = self._parse_list_page(html, seen_ids)[:20]
 
+            # 이미 저장됐고 댓글·조회수가 그대로인 글은 상세 페이지를 다시 열지 않는다
+            # (본문이 목록 행에 없어 여기서 빼지 않으면 제목만으로 덮어쓰게 된다)
+            if self._seen is not None:
+                listed = len(posts)
+                posts = [p for p in posts if not self._seen.engagement_unchanged(p)]
+                if len(posts) < listed:
+                    logger.info(f"[dcinside] 변화 없는 기존 글 {listed - len(posts)}건 — 상세 생략")
+
             logger.info(f"[dcinside] 목록에서 {len(posts)}건 발견, 상세 페이지 수집 시작")
 
-            # 각 게시물 상세 페이지에서 본문 가져오기
-            for post in posts:
+            # 상세 본문: HTTP로 먼저, 차단되면 남은 글만 CDP 탭에서
+            self.fetch_stats = FetchStats()
+            pending = await self._fetch_details_http(posts) if self._http else posts
+            if pending:
+                if self._http:
+                    logger.info(f"[dcinside] HTTP 상세 차단 — {len(pending)}건은 브라우저로")
+                await self._fetch_details_cdp(page, pending)
+
+            logger.info(f"[dcinside] 총 {len(posts)}건 수집 완료")
+            return posts
+
+    async def _fetch_details_http(self, posts: list[Post]) -> list[Post]:
+        """상세 페이지를 httpx로 병렬 수집. 차단돼 못 받은 글 목록을 돌려준다."""
+        limiter = HostLimiter(self._config.detail_concurrency, self._config.detail_interval)
+        referer = _RECOMMEND_URL_DESKTOP.format(gallery_id=self._gallery_id)
+        blocked = False
+
+        async def fetch(post: Post) -> bool:
+            nonlocal blocked
+            if blocked:
+                return False
+            async with limiter.slot(post.url):
+                if blocked:  # 슬롯을 기다리는 사이 다른 요청이 차단됨
+                    return False
+                self.fetch_stats.requests += 1
                 try:
-                    await asyncio.sleep(random.uniform(0.8, 1.5))
-                    await page.goto(post.url, wait_until="domcontentloaded", timeout=20000)
-                    html = await page.content()
-                    content_text, media_urls = self._parse_detail_page(html)
-                    if content_text:
-                        title = post.content_text
-                        post.content_text = f"{title}\n\n{content_text}"
-                        post.media_urls = media_urls
+                    resp = await self._http.get().get(post.url, headers={"Referer": referer})
                 except Exception as e:
-                    logger.debug(f"[dcinside] 상세 페이지 로드 실패 ({post.external_id}): {e}")
-
-            # 개념글 탭으로 복귀
+                    self.fetch_stats.failed += 1
+                    logger.debug(f"[dcinside] 상세 HTTP 실패 ({post.external_id}): {e}")
+                    return True  # 일시 오류 — CDP로 다시 열지 않고 제목만 유지 (기존과 동일)
+                if resp.status_code in _BLOCKED_STATUS:
+                    blocked = True
+                    self.fetch_stats.failed += 1
+                    logger.warning(f"[dcinside] 상세 HTTP {resp.status_code} — 차단으로 간주")
+                    return False
+                if not resp.is_success:
+                    # 삭제된 글(404·410)·서버 오류 — 그 글만 실패, 제목 유지
+                    self.fetch_stats.failed += 1
+                    logger.debug(
+                        f"[dcinside] 상세 HTTP {resp.status_code} ({post.external_id}) — 제목만 유지"
+                    )
+                    return True
+                if self._recorder:
+                    self._recorder.record("dcinside", "detail", resp.text)
+                detail = self._parse_detail_page(resp.text)
+                if detail is None:
+                    # 200이지만 본문 컨테이너가 없음 — 캡차·안내 페이지로 보고 CDP로
+                    blocked = True
+                    self.fetch_stats.failed += 1
+                    return False
+                self._apply_detail(post, *detail)
+                return True
+
+        done = await asyncio.gather(*(fetch(p) for p in posts))
+        return [p for p, ok in zip(posts, done) if not ok]
+
+    async def _fetch_details_cdp(self, page, posts: list[Post]) -> None:
+        """상세 페이지를 CDP 탭에서 하나씩 연 뒤 개념글 목록으로 복귀 (HTTP 차단 시 폴백)."""
+        for post in posts:
             try:
-                recommend_url = _RECOMMEND_URL_DESKTOP.format(gallery_id=self._gallery_id)
-                await page.goto(recommend_url, wait_until="domcontentloaded", timeout=15000)
-            except Exception:
-                pass
+                await asyncio.sleep(random.uniform(0.8, 1.5))
+                await page.goto(post.url, wait_until="domcontentloaded", timeout=20000)
+                html = await page.content()
+                if self._recorder:
+                    self._recorder.record("dcinside", "detail", html)
+                detail = self._parse_detail_page(html)
+                if detail is not None:
+                    self._apply_detail(post, *detail)
+            except Exception as e:
+                logger.debug(f"[dcinside] 상세 페이지 로드 실패 ({post.external_id}): {e}")
 
-            logger.info(f"[dcinside] 총 {len(posts)}건 수집 완료")
-            return posts
+        # 개념글 탭으로 복귀
+        try:
+            recommend_url = _RECOMMEND_URL_DESKTOP.format(gallery_id=self._gallery_id)
+            await page.goto(recommend_url, wait_until="domcontentloaded", timeout=15000)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _apply_detail(post: Post, content_text: str, media_urls: list[str]) -> None:
+        """본문을 제목 뒤에 붙인다. 이미지만 있는 글은 제목은 그대로 두고 이미지만 채운다."""
+        if content_text:
+            post.content_text = f"{post.content_text}\n\n{content_text}"
+        post.media_urls = media_urls
 
     def _find_gallery_tab(self, context) -> Optional[object]:
         """이미 열려있는 DCInside 갤러리 탭을 찾는다."""
@@ -236,8 +331,12 @@ class DCInsideCollector:
                 return None
         return None
 
-    def _parse_detail_page(self, html: str) -> tuple[str, list[str]]:
-        """데스크톱 상세 페이지에서 본문과 이미지를 추출."""
+    def _parse_detail_page(self, html: str) -> tuple[str, list[str]] | None:
+        """데스크톱 상세 페이지에서 본문과 이미지를 추출.
+
+        본문 컨테이너가 아예 없으면 None(캡차·안내 페이지), 컨테이너는 있는데
+        글자가 없으면 ("", 이미지) — 이미지만 올린 글이다.
+        """
         soup = BeautifulSoup(html, "lxml")
 
         content_div = (
@@ -247,7 +346,7 @@ class DCInsideCollector:
         )
 
         if not content_div:
-            return "", []
+            return None
 
         content_text = content_div.get_text(separator="\n", strip=True)
 
@@ -19,7 +19,8 @@ from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.http import fetch_text
+from src.infrastructure.collectors.http import FetchStats, SharedHttpClient, fetch_text
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
 from src.infrastructure.config.settings import CollectorConfig
 
 logger = logging.getLogger(__name__)
@@ -37,8 +38,11 @@ class DongaSeriesCollector:
     목록은 `ul.row_list > li`에 제목·링크·날짜·리드문이 함께 들어 있다.
     """
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(self, config: CollectorConfig, http: SharedHttpClient | None = None):
         self._config = config
+        self._http = http
+        self.fetch_stats = FetchStats()  # 직전 collect()의 요청·조건부 GET 적중 집계
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
         self._url = config.series_url
         self._name = config.series_name
 
@@ -50,17 +54,27 @@ class DongaSeriesCollector:
         return True
 
     async def collect(self) -> list[Post]:
-        html = await fetch_text(self._url, self.source_name)
+        self.fetch_stats = FetchStats()
+        html = await fetch_text(
+            self._url, self.source_name, client=self._http, stats=self.fetch_stats
+        )
         if html is None:
-            return []
+            return []  # 실패 또는 변경 없음(304·본문 동일)
+        if self._recorder:
+            self._recorder.record(self.source_name, "series", html)
 
+        cutoff = datetime.now(KST) - timedelta(days=self._config.max_age_days)
+        posts = self._parse_page(html, cutoff)
+        logger.info(f"[{self.source_name}] {len(posts)}건 수집 완료 ({self._name})")
+        return posts
+
+    def _parse_page(self, html: str, cutoff: datetime) -> list[Post]:
         soup = BeautifulSoup(html, "html.parser")
         lists = soup.select("ul.row_list")
         if not lists:
             logger.warning(f"[{self.source_name}] 목록(ul.row_list)을 찾지 못함 — 페이지 구조 변경?")
             return []
 
-        cutoff = datetime.now(KST) - timedelta(days=self._config.max_age_days)
         posts: list[Post] = []
         seen: set[str] = set()
 
@@ -69,8 +83,6 @@ class DongaSeriesCollector:
             post = self._parse_item(li, cutoff, seen)
             if post:
                 posts.append(post)
-
-        logger.info(f"[{self.source_name}] {len(posts)}건 수집 완료 ({self._name})")
         return posts
 
     def _parse_item(self, li, cutoff: datetime, seen: set[str]) -> Post | None:
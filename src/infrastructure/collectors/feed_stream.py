@@ -0,0 +1,163 @@
+"""RSS 2.0 / Atom 증분 파서 — 응답 바이트 조각을 받는 대로 파싱한다.
+
+news·producthunt 수집기가 http.fetch_stream의 consume으로 쓴다. 문서 전체 텍스트나
+트리를 만들지 않는다: <item>/<entry>가 닫힐 때마다 공통 dict로 바꾸고 요소는 트리에서
+떼어 버린다. 항목 상한(max_items)에 닿거나, 게시일 컷오프보다 오래된 항목이
+stale_stop개 연속으로 나오면(피드는 대개 최신순) feed()가 True를 돌려 남은 본문은
+받지 않는다. 날짜순이 아닌 피드(Google News 검색 등)를 위해 한 건에 멈추지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_TAGS = ("item", "entry")
+
+
+def _local(tag: str) -> str:
+    """네임스페이스 제거한 로컬 태그명."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ET.Element, *names: str) -> str:
+    """로컬명이 names 중 하나인 첫 자식의 텍스트."""
+    for child in elem:
+        if _local(child.tag) in names and child.text:
+            return child.text.strip()
+    return ""
+
+
+def _entry_link(elem: ET.Element) -> str:
+    """RSS <link>텍스트</link> 또는 Atom <link href=...> 추출."""
+    alternate = ""
+    for child in elem:
+        if _local(child.tag) != "link":
+            continue
+        if child.text and child.text.strip():  # RSS 2.0
+            return child.text.strip()
+        href = child.get("href", "")  # Atom
+        if href and child.get("rel", "alternate") == "alternate":
+            return href
+        alternate = alternate or href
+    return alternate
+
+
+def _entry_date(elem: ET.Element) -> datetime | None:
+    """pubDate(RFC822) 또는 published/updated(ISO8601) → naive UTC."""
+    raw = _child_text(elem, "pubDate", "published", "updated")
+    if not raw:
+        return None
+    try:
+        if raw[:1].isdigit():  # ISO8601
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        else:  # RFC822 ("Tue, 14 Jul 2026 ...")
+            dt = parsedate_to_datetime(raw)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt
+    except (ValueError, TypeError):
+        return None
+
+
+def _entry_dict(elem: ET.Element) -> dict:
+    link = _entry_link(elem)
+    return {
+        "title": _child_text(elem, "title"),
+        "link": link,
+        "summary": _child_text(elem, "description", "summary", "content"),
+        "published": _entry_date(elem),
+        "guid": _child_text(elem, "guid", "id") or link,
+    }
+
+
+class FeedStreamParser:
+    """바이트 조각을 feed()로 넣으면 완성된 항목을 entries에 쌓는다.
+
+    feed()가 True면 더 읽을 필요 없음(상한·연속 컷오프·XML 오류). 본문을 끝까지
+    받았으면 close()로 잘린 문서를 확인한다. 오류 전까지 닫힌 항목은 유지한다.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        max_items: int = 0,
+        cutoff: datetime | None = None,
+        stale_stop: int = 0,
+    ):
+        self.source = source
+        self.entries: list[dict] = []
+        self.done = False
+        self.stop_reason = ""  # "" | "limit" | "cutoff" | "error"
+        self._max_items = max_items
+        self._cutoff = cutoff
+        self._stale_stop = stale_stop
+        self._stale = 0
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._open: list[ET.Element] = []  # 열린 요소 스택 — 닫힌 항목을 부모에서 떼어 낸다
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.done:
+            return True
+        try:
+            self._parser.feed(chunk)
+            self._drain()
+        except ET.ParseError as e:
+            self._stop("error")
+            logger.warning(f"[{self.source}] XML 파싱 중단 — {e} (항목 {len(self.entries)}건 유지)")
+        return self.done
+
+    def close(self) -> None:
+        """본문 끝 — 남은 이벤트를 비우고, 닫히지 않은 문서면 경고."""
+        if self.done:
+            return
+        try:
+            self._parser.close()
+            self._drain()
+        except ET.ParseError as e:
+            logger.warning(f"[{self.source}] XML 파싱 실패 — {e} (항목 {len(self.entries)}건 유지)")
+        self.done = True
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._open.append(elem)
+                continue
+            self._open.pop()
+            if _local(elem.tag) not in _ENTRY_TAGS:
+                continue
+            entry = _entry_dict(elem)
+            if self._open:
+                self._open[-1].remove(elem)
+            elem.clear()
+            self.entries.append(entry)
+            if self._max_items and len(self.entries) >= self._max_items:
+                self._stop("limit")
+                return
+            if self._cutoff is not None and entry["published"]:
+                self._stale = self._stale + 1 if entry["published"] < self._cutoff else 0
+                if self._stale_stop and self._stale >= self._stale_stop:
+                    self._stop("cutoff")
+                    return
+
+    def _stop(self, reason: str) -> None:
+        self.done = True
+        self.stop_reason = reason
+
+
+def parse_feed(
+    data: str | bytes,
+    source: str,
+    max_items: int = 0,
+    cutoff: datetime | None = None,
+    stale_stop: int = 0,
+) -> list[dict]:
+    """이미 받아 둔 본문 전체를 같은 파서로 — replay·테스트용."""
+    parser = FeedStreamParser(source, max_items, cutoff, stale_stop)
+    if not parser.feed(data.encode("utf-8") if isinstance(data, str) else data):
+        parser.close()
+    return parser.entries
@@ -2,11 +2,38 @@
 
 로그인이 필요 없는 소스(36kr·Product Hunt 등)의 공통 fetch 로직 —
 User-Agent, httpx 클라이언트 설정, 예외 처리를 한곳에 모은다. (CDP/Chrome 불필요)
+
+클라이언트는 컨테이너가 소유한 SharedHttpClient 하나를 모든 HTTP 수집기가 같이 쓴다.
+요청마다 AsyncClient를 새로 만들면 매번 TCP·TLS 핸드셰이크를 다시 하고, 같은
+호스트(news.google.com 등)로 가는 요청도 연결을 재사용하지 못한다.
+
+조건부 GET: SharedHttpClient에 ValidatorCache가 붙어 있으면 URL별 ETag·Last-Modified·
+본문 해시를 기억해 두고 If-None-Match/If-Modified-Since를 보낸다. 304이거나 본문
+해시가 지난번과 같으면 fetch_text는 None을 돌려 수집기가 파싱을 건너뛴다
+(이미 저장된 내용이라 다시 파싱해도 save_many에서 무변경으로 끝날 뿐이다).
+새로 받은 검증자는 바로 캐시에 넣지 않고 FetchStats.pending에 모아 두었다가, 수집·
+저장이 성공한 뒤 CollectPostsUseCase가 commit_validators()로 반영한다 — 파싱이나
+save_many가 실패한 본문을 다음 사이클이 304·본문 동일로 건너뛰면 그 글은 피드가
+바뀔 때까지 영영 들어오지 않는다. 디스크 저장도 그때 수집 1회당 한 번, 스레드에서.
+
+스트리밍: fetch_stream은 본문을 텍스트로 모으지 않고 받은 바이트 조각을 그대로
+소비 함수에 넘긴다. RSS/Atom 수집기가 증분 파싱하다 필요한 만큼 읽으면 연결을 끊는다.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import threading
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+from urllib.parse import urlsplit
 
 import httpx
 
@@ -18,23 +45,347 @@ USER_AGENT = (
 )
 
 
+@dataclass
+class FetchStats:
+    """수집 1회분 HTTP 요청 집계 — 조건부 GET 적중률을 CollectionRun에 남긴다."""
+
+    requests: int = 0
+    not_modified: int = 0  # 304 응답
+    unchanged: int = 0  # 200이지만 본문 해시가 지난번과 같음
+    failed: int = 0
+    # 이번 수집에서 받은 URL별 새 검증자 — 저장까지 끝난 뒤에만 캐시에 반영한다
+    pending: dict[str, dict[str, Any]] = field(default_factory=dict)
+    validators: ValidatorCache | None = field(default=None, repr=False)
+
+    @property
+    def hits(self) -> int:
+        return self.not_modified + self.unchanged
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    async def commit_validators(self) -> None:
+        """수집한 글이 저장된 뒤 호출 — 이번 수집의 검증자를 캐시에 반영하고 한 번 저장한다."""
+        if self.validators is None or not self.pending:
+            return
+        self.validators.update(self.pending)
+        self.pending = {}
+        await self.validators.flush()
+
+
+class ValidatorCache:
+    """URL별 HTTP 검증자(ETag·Last-Modified)와 본문 해시 — JSON 파일에 영속화.
+
+    재시작 후 첫 수집부터 조건부 GET이 먹도록 디스크에 둔다. 항목은 피드·페이지
+    URL 수만큼이라 작다. update()는 메모리만 바꾸고, flush()가 스냅숏을 스레드에서
+    임시 파일에 쓴 뒤 교체한다(중간에 죽어도 이전 파일이 남는다). 여러 소스의 flush가
+    겹치면 늦게 찍은 스냅숏만 남긴다. path가 None이면 메모리에만 둔다.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self._path = Path(path) if path else None
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._dirty = False
+        self._version = 0  # flush 스냅숏 번호
+        self._written = 0  # 디스크에 쓴 가장 최근 스냅숏 번호
+        self._write_lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._path is None or not self._path.exists():
+            return {}
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"[http] 검증자 캐시 로드 실패 — 빈 캐시로 시작: {e}")
+            return {}
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        return self._entries.get(url)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        entry = self._entries.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def entry(etag: str | None, last_modified: str | None, body_hash: str) -> dict[str, Any]:
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "sha1": body_hash,
+            "checked_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+
+    def update(self, entries: dict[str, dict[str, Any]]) -> None:
+        """메모리에 반영만 한다 — 디스크는 flush()에서."""
+        self._entries.update(entries)
+        self._dirty = True
+
+    async def flush(self) -> None:
+        """바뀐 게 있으면 스냅숏을 스레드에서 파일로 쓴다 (이벤트 루프를 막지 않게)."""
+        if self._path is None or not self._dirty:
+            return
+        self._dirty = False
+        self._version += 1
+        await asyncio.to_thread(self._save, dict(self._entries), self._version)
+
+    def _save(self, snapshot: dict[str, dict[str, Any]], version: int) -> None:
+        with self._write_lock:
+            if version <= self._written:
+                return  # 더 최근 스냅숏이 이미 쓰였다
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+                tmp.write_text(json.dumps(snapshot, ensure_ascii=False, indent=1), encoding="utf-8")
+                os.replace(tmp, self._path)
+                self._written = version
+            except Exception as e:
+                self._dirty = True  # 다음 flush에서 다시
+                logger.warning(f"[http] 검증자 캐시 저장 실패: {e}")
+
+
+class SharedHttpClient:
+    """장수명 httpx.AsyncClient 래퍼 (연결 풀·keep-alive, 선택적 HTTP/2).
+
+    AsyncClient는 만든 이벤트 루프에 묶이므로 첫 사용 시점에 만들고, 루프가
+    바뀌면(collect-now 재실행·테스트) 새로 만든다. validators가 있으면 이 클라이언트로
+    나가는 fetch_text 요청은 조건부 GET이 된다.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 20.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        http2: bool = False,
+        validators: ValidatorCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.validators = validators
+        self._transport = transport
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=self._limits,
+                http2=self._http2 and _h2_available(),
+                transport=self._transport,
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+_h2_warned = False
+
+
+def _h2_available() -> bool:
+    """http2=True는 h2 패키지가 있어야 한다 — 없으면 HTTP/1.1로 (경고 1회)."""
+    global _h2_warned
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        if not _h2_warned:
+            logger.warning("[http] h2 패키지 없음 — HTTP/1.1로 연결 (pip install httpx[http2])")
+            _h2_warned = True
+        return False
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 상한 + 요청 시작 간 최소 간격.
+
+    전역 동시성을 올려도 같은 호스트(Google News 프록시 피드 여러 개 등)는
+    예전처럼 차례로·간격을 두고 두드리게 한다.
+    """
+
+    def __init__(self, per_host: int = 1, min_interval: float = 0.0):
+        self._per_host = max(1, per_host)
+        self._min_interval = min_interval
+        self._sems: dict[str, asyncio.Semaphore] = {}
+        self._next_at: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        host = urlsplit(url).hostname or ""
+        sem = self._sems.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with sem:
+            loop = asyncio.get_running_loop()
+            wait = self._next_at.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at[host] = loop.time() + self._min_interval
+            yield
+
+
 async def fetch_text(
     url: str,
     source: str,
     extra_headers: dict[str, str] | None = None,
     timeout: float = 20.0,
+    client: SharedHttpClient | None = None,
+    stats: FetchStats | None = None,
 ) -> str | None:
-    """GET 요청 후 본문 텍스트를 반환. 실패 시 None(에러 로그)."""
+    """GET 요청 후 본문 텍스트를 반환. 실패 시 None(에러 로그).
+
+    client가 있으면 그 연결 풀을 쓰고, 없으면 이 요청 전용 클라이언트를 만든다.
+    client에 검증자 캐시가 있으면 조건부 GET — 304이거나 본문이 지난번과 같으면
+    None(파싱 생략 신호). 실패와 적중은 stats로 구분한다.
+    """
     headers = {"User-Agent": USER_AGENT}
     if extra_headers:
         headers.update(extra_headers)
+    if stats is not None:
+        stats.requests += 1
     try:
+        if client is not None:
+            validators = client.validators
+            if validators is not None:
+                headers.update(validators.conditional_headers(url))
+            resp = await client.get().get(url, headers=headers, timeout=timeout)
+            if validators is None:
+                resp.raise_for_status()
+                return resp.text
+            return _check_validators(resp, url, source, validators, stats)
         async with httpx.AsyncClient(
             timeout=timeout, follow_redirects=True, headers=headers
-        ) as client:
-            resp = await client.get(url)
+        ) as one_shot:
+            resp = await one_shot.get(url)
             resp.raise_for_status()
             return resp.text
     except Exception as e:
+        if stats is not None:
+            stats.failed += 1
         logger.error(f"[{source}] 페이지 요청 실패: {e}")
         return None
+
+
+def _check_validators(
+    resp: httpx.Response,
+    url: str,
+    source: str,
+    validators: ValidatorCache,
+    stats: FetchStats | None,
+) -> str | None:
+    """조건부 GET 응답 처리 — 304·동일 본문이면 None, 새 본문이면 검증자를 적어 두고 텍스트."""
+    if resp.status_code == 304:
+        _count_not_modified(source, stats)
+        return None
+    resp.raise_for_status()
+
+    body_hash = hashlib.sha1(resp.content).hexdigest()
+    if not _stage_validators(resp, url, source, validators, stats, body_hash):
+        return None
+    return resp.text
+
+
+def _count_not_modified(source: str, stats: FetchStats | None) -> None:
+    if stats is not None:
+        stats.not_modified += 1
+    logger.debug(f"[{source}] 304 Not Modified — 파싱 생략")
+
+
+def _stage_validators(
+    resp: httpx.Response,
+    url: str,
+    source: str,
+    validators: ValidatorCache,
+    stats: FetchStats | None,
+    body_hash: str,
+) -> bool:
+    """새 검증자·본문 해시를 stats.pending에 적어 둔다(반영은 commit_validators).
+    본문이 캐시의 지난번과 같으면 False(파싱 결과를 버릴 신호).
+
+    stats가 없는 호출은 반영할 수집 단위가 없으니 메모리 캐시에 바로 넣는다.
+    """
+    previous = validators.get(url)
+    entry = ValidatorCache.entry(
+        resp.headers.get("etag"), resp.headers.get("last-modified"), body_hash
+    )
+    if stats is None:
+        validators.update({url: entry})
+    else:
+        stats.validators = validators
+        stats.pending[url] = entry
+    if previous and previous.get("sha1") == body_hash:
+        if stats is not None:
+            stats.unchanged += 1
+        logger.debug(f"[{source}] 본문 해시 동일 — 파싱 생략")
+        return False
+    return True
+
+
+async def fetch_stream(
+    url: str,
+    source: str,
+    consume: Callable[[bytes], bool],
+    extra_headers: dict[str, str] | None = None,
+    timeout: float = 20.0,
+    client: SharedHttpClient | None = None,
+    stats: FetchStats | None = None,
+) -> bool:
+    """GET 본문을 받는 대로 바이트 조각째 consume에 넘긴다. consume이 True를 돌려주면
+    (필요한 만큼 읽었다) 남은 본문은 받지 않고 연결을 끊는다.
+
+    새 본문을 소비했으면 True, 실패·304·본문 동일이면 False — fetch_text의 None과 같은
+    뜻이라 수집기는 consume이 쌓은 결과를 버린다. 검증자는 fetch_text처럼 stats.pending에. 본문 해시는 실제로 읽은 부분으로 잰다:
+    같은 피드면 같은 지점에서 멈추므로 비교가 성립하고, 어긋나도 한 번 더 파싱할 뿐이다.
+    """
+    headers = {"User-Agent": USER_AGENT}
+    if extra_headers:
+        headers.update(extra_headers)
+    if stats is not None:
+        stats.requests += 1
+    validators = client.validators if client is not None else None
+    if validators is not None:
+        headers.update(validators.conditional_headers(url))
+    digest = hashlib.sha1()
+    try:
+        async with AsyncExitStack() as stack:
+            if client is not None:
+                http = client.get()
+            else:
+                http = await stack.enter_async_context(
+                    httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+                )
+            resp = await stack.enter_async_context(
+                http.stream("GET", url, headers=headers, timeout=timeout)
+            )
+            if resp.status_code == 304 and validators is not None:
+                _count_not_modified(source, stats)
+                return False
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                digest.update(chunk)
+                if consume(chunk):
+                    break
+    except Exception as e:
+        if stats is not None:
+            stats.failed += 1
+        logger.error(f"[{source}] 페이지 요청 실패: {e}")
+        return False
+    if validators is not None:
+        return _stage_validators(resp, url, source, validators, stats, digest.hexdigest())
+    return True
@@ -15,7 +15,8 @@ import re
 from datetime import datetime, timedelta
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.http import fetch_text
+from src.infrastructure.collectors.http import FetchStats, SharedHttpClient, fetch_text
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
 from src.infrastructure.config.settings import CollectorConfig
 
 logger = logging.getLogger(__name__)
@@ -27,8 +28,11 @@ _STATE_RE = re.compile(r"window\.initialState\s*=\s*(\{.*)", re.S)
 class Kr36Collector:
     """36氪 뉴스플래시 수집기 (HTTP 기반, 로그인 불필요)."""
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(self, config: CollectorConfig, http: SharedHttpClient | None = None):
         self._config = config
+        self._http = http
+        self.fetch_stats = FetchStats()  # 직전 collect()의 요청·조건부 GET 적중 집계
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
 
     @property
     def source_name(self) -> str:
@@ -38,23 +42,31 @@ class Kr36Collector:
         return True  # 공개 사이트 — 로그인 불필요
 
     async def collect(self) -> list[Post]:
+        self.fetch_stats = FetchStats()
         html = await fetch_text(
-            NEWSFLASH_URL, "36kr", extra_headers={"Accept-Language": "zh-CN,zh;q=0.9"}
+            NEWSFLASH_URL, "36kr", extra_headers={"Accept-Language": "zh-CN,zh;q=0.9"},
+            client=self._http, stats=self.fetch_stats,
         )
         if html is None:
-            return []
+            return []  # 실패 또는 변경 없음(304·본문 동일)
+        if self._recorder:
+            self._recorder.record("36kr", "newsflash", html)
 
-        items = self._extract_items(html)
         cutoff = datetime.utcnow() - timedelta(days=self._config.max_age_days)
+        posts, listed = self._parse_page(html, cutoff)
+        logger.info(f"[36kr] {len(posts)}건 수집 완료 (목록 {listed}건)")
+        return posts
+
+    def _parse_page(self, html: str, cutoff: datetime) -> tuple[list[Post], int]:
+        """뉴스플래시 페이지 → (게시물, 목록 항목 수)."""
+        items = self._extract_items(html)
         seen: set[str] = set()
         posts: list[Post] = []
         for it in items:
             post = self._parse_item(it, cutoff, seen)
             if post:
                 posts.append(post)
-
-        logger.info(f"[36kr] {len(posts)}건 수집 완료 (목록 {len(items)}건)")
-        return posts
+        return posts, len(items)
 
     def _extract_items(self, html: str) -> list[dict]:
         """window.initialState JSON에서 뉴스플래시 itemList 추출."""
@@ -2,6 +2,10 @@
 
 사용자의 실행 중인 Chrome에 CDP로 연결하여 DOM 파싱으로 피드를 수집한다.
 LinkedIn 2025+ 리디자인 대응: 해시 클래스명 대신 data-testid, aria-label 등 안정적 속성 사용.
+
+라운드마다 아직 안 읽은 피드 항목 전부를 page.evaluate 한 번(_EXTRACT_JS)으로 원시 필드
+JSON 배열로 받아 Python에서 해석한다. 항목·필드마다 query_selector/get_attribute를
+CDP로 왕복하던 요소별 추출(_parse_feed_update)은 JS 추출이 실패할 때의 폴백으로 남는다.
 """
 
 from __future__ import annotations
@@ -34,6 +38,79 @@ def _normalize_profile_url(href: str) -> str:
     return f"{m.group(1)}/" if m else href
 
 
+# 아직 읽지 않은 피드 항목의 '더보기'(본문 펼치기)만 누른다 — 누른 개수 반환
+_EXPAND_JS = """() => {
+    const feed = document.querySelector('[data-testid="mainFeed"]');
+    if (!feed) return 0;
+    let clicked = 0;
+    for (const child of feed.children) {
+        if (child.dataset.snsCollected) continue;
+        // _extract_content와 같은 버튼: aria-label '더 보기' / 'see more'
+        const btn = child.querySelector(
+            'button[aria-label*="더 보기"], button[aria-label*="see more"], button[aria-label*="See more"]');
+        if (btn) {
+            try { btn.click(); clicked++; } catch (e) {}
+        }
+    }
+    return clicked;
+}"""
+
+# 아직 읽지 않은 피드 항목(mainFeed 직계 자식 중 본문 박스가 있는 것)의 원시 필드를 한 번에.
+# 읽은 항목엔 data-sns-collected를 표시해 다음 라운드에 다시 보내지 않는다.
+# 해석(정규식·작성자 대조·상대 시간)은 요소별 폴백과 같은 Python 헬퍼가 맡는다.
+# mainFeed가 없으면 null — 호출부가 요소별 폴백으로 간다.
+_EXTRACT_JS = """() => {
+    const feed = document.querySelector('[data-testid="mainFeed"]');
+    if (!feed) return null;
+    const out = [];
+    for (let i = 0; i < feed.children.length; i++) {
+        const el = feed.children[i];
+        if (el.dataset.snsCollected) continue;
+        const box = el.querySelector('[data-testid="expandable-text-box"]');
+        if (!box) continue;
+        el.dataset.snsCollected = '1';
+
+        const attr = (sel, name) => {
+            const n = el.querySelector(sel);
+            return n ? (n.getAttribute(name) || '') : '';
+        };
+        const text = (sel) => {
+            const n = el.querySelector(sel);
+            return n ? (n.innerText || '').trim() : '';
+        };
+        out.push({
+            index: i,
+            content: (box.innerText || '').trim(),
+            time_attr: attr('time[datetime]', 'datetime'),
+            sub_texts: [
+                text('.update-components-actor__sub-description'),
+                text('.feed-shared-actor__sub-description'),
+                text('a[href*="/feed/update/"] span[aria-hidden="true"]'),
+            ],
+            mgmt_label: attr('button[aria-label*="게시물에 대한 관리"]', 'aria-label'),
+            mgmt_label_en: attr('button[aria-label*="control menu for post"]', 'aria-label'),
+            profile_labels: Array.from(
+                el.querySelectorAll('[aria-label*="프로필 보기"]'),
+                n => n.getAttribute('aria-label') || ''),
+            company_label: attr('[aria-label*="회사 보기"]', 'aria-label'),
+            legacy_actor: text('.update-components-actor__name span:first-child')
+                || text('.feed-shared-actor__name'),
+            links: Array.from(
+                el.querySelectorAll('a[href*="/in/"], a[href*="/company/"]'),
+                a => [(a.innerText || '').trim(), a.getAttribute('href') || '']),
+            urn: el.getAttribute('data-urn') || '',
+            full_text: el.innerText || '',
+            legacy_counts: [
+                text('.social-details-social-counts__reactions-count'),
+                text('button.social-details-social-counts__comments'),
+                text('button.social-details-social-counts__reposts'),
+            ],
+        });
+    }
+    return out;
+}"""
+
+
 class LinkedInCollector(BaseCdpCollector):
     """LinkedIn 알고리즘 피드 수집기 (CDP 기반)."""
 
@@ -44,6 +121,7 @@ class LinkedInCollector(BaseCdpCollector):
         return await check_session(
             self._cdp_url, "linkedin", self.FEED_URL,
             ["login", "authwall", "checkpoint"],
+            manager=self._cdp,
         )
 
     async def login(self) -> bool:
@@ -65,13 +143,15 @@ class LinkedInCollector(BaseCdpCollector):
             invalid_keywords=["login", "authwall", "checkpoint"],
             initial_wait_ms=2000,
             submit_wait_ms=5000,
+            manager=self._cdp,
         )
 
     async def collect(self) -> list[Post]:
         """DOM 파싱으로 LinkedIn 피드를 수집."""
-        async with cdp_connection(self._cdp_url, "linkedin") as (pw, context):
+        async with cdp_connection(self._cdp_url, "linkedin", self._cdp) as (pw, context):
             page = await context.new_page()  # 매 사이클 새 탭 (수집 후 닫아 메모리 회수)
             await minimize_window(page)
+            meter = await self._resources.attach(page)  # 이미지·폰트·트래킹 차단
 
             try:
                 await page.goto(self.FEED_URL, wait_until="domcontentloaded", timeout=60000)
@@ -86,8 +166,15 @@ class LinkedInCollector(BaseCdpCollector):
                 seen_ids: set[str] = set()
 
                 async def _collect_current() -> None:
-                    for item in await self._get_feed_items(page):
-                        post = await self._parse_feed_update(item, page)
+                    extracted = await self._extract_batch(page)
+                    if extracted is not None:
+                        candidates = [await self._post_from_extracted(raw, page) for raw in extracted]
+                    else:  # JS 일괄 추출 실패 → 요소별 추출
+                        candidates = [
+                            await self._parse_feed_update(item, page)
+                            for item in await self._get_feed_items(page)
+                        ]
+                    for post in candidates:
                         if post and post.external_id not in seen_ids:
                             seen_ids.add(post.external_id)
                             posts.append(post)
@@ -115,6 +202,7 @@ class LinkedInCollector(BaseCdpCollector):
                 return posts
 
             finally:
+                await self._resources.report(meter)
                 await page.close()  # 탭 닫아 렌더러 메모리 회수 (누수·먹통 방지)
 
     async def _scroll_and_load_more(self, page) -> None:
@@ -216,50 +304,129 @@ class LinkedInCollector(BaseCdpCollector):
             # 포스트 URN 추출: 관리 메뉴 → embed 링크에서 실제 URN 획득
             post_urn = await self._extract_post_urn(element, page)
 
-            # URN에서 ID와 URL 생성
-            if post_urn:
-                # urn:li:ugcPost:7434660713215885312 형태
-                post_id = post_urn.split(":")[-1]
-                external_id = f"li_{post_id}"
-                post_url = f"https://www.linkedin.com/feed/update/{post_urn}/"
-            else:
-                # 폴백: 본문 해시 (URL은 작성자 프로필로 대체)
-                fallback_id = hashlib.md5(content_text[:200].encode()).hexdigest()[:16]
-                external_id = f"li_{fallback_id}"
-                post_url = author_url or self.FEED_URL
-
             # 인게이지먼트: innerText에서 "반응 N", "댓글 N", "퍼온글 N" 패턴 추출
             likes, comments, reposts = await self._extract_engagement(element)
 
-            return Post(
-                source="linkedin",
-                external_id=external_id,
-                url=post_url,
-                author=author,
-                author_url=author_url or None,
-                content_text=content_text,
-                engagement_likes=likes,
-                engagement_reposts=reposts,
-                engagement_comments=comments,
-                published_at=published_at,
-                collected_at=datetime.utcnow(),
+            return self._build_post(
+                content_text, published_at, author, author_url, post_urn, likes, comments, reposts
             )
         except Exception as e:
             logger.debug(f"[linkedin] 피드 항목 파싱 실패: {e}")
             return None
 
+    # ─── JS 일괄 추출 ───
+
+    async def _extract_batch(self, page) -> list[dict] | None:
+        """아직 읽지 않은 피드 항목 전부의 원시 필드 (evaluate 2회). 실패 시 None."""
+        try:
+            if await page.evaluate(_EXPAND_JS):
+                await asyncio.sleep(0.5)  # 펼친 본문 렌더 대기 — 항목당이 아니라 라운드당 1회
+            return await page.evaluate(_EXTRACT_JS)
+        except Exception as e:
+            logger.debug(f"[linkedin] JS 일괄 추출 실패 — 요소별 추출로: {e}")
+            return None
+
+    async def _post_from_extracted(self, raw: dict, page) -> Post | None:
+        """_EXTRACT_JS 항목 1건 → Post. 해석 규칙은 요소별 추출과 같은 헬퍼를 쓴다."""
+        try:
+            content_text = raw.get("content") or ""
+            if not content_text:
+                return None
+
+            published_at = _parse_time_attr(raw.get("time_attr") or "")
+            if published_at is None:
+                published_at = next(
+                    (dt for dt in map(_parse_relative_time, raw.get("sub_texts") or []) if dt),
+                    None,
+                )
+            if published_at:
+                cutoff = datetime.utcnow() - timedelta(days=self._config.max_age_days)
+                if published_at < cutoff:
+                    return None
+
+            author = (
+                _author_from_mgmt_label(raw.get("mgmt_label") or "")
+                or _author_from_mgmt_label_en(raw.get("mgmt_label_en") or "")
+                or next(filter(None, map(_author_from_profile_label, raw.get("profile_labels") or [])), "")
+                or _author_from_company_label(raw.get("company_label") or "")
+                or (raw.get("legacy_actor") or "").split("\n")[0].strip()
+            )
+            author_url = _match_author_url(raw.get("links") or [], author)
+
+            # URN은 data-urn이 있을 때만 JS로 얻는다 — 없으면 그 항목만 관리 메뉴 경로로
+            post_urn = raw.get("urn") or ""
+            if "urn:li:" not in post_urn:
+                element = await self._feed_child(page, raw.get("index", -1))
+                post_urn = await self._extract_post_urn(element, page) if element else ""
+
+            likes, comments, reposts = _engagement_from_text(raw.get("full_text") or "")
+            legacy = [self._parse_count(t) if t else 0 for t in raw.get("legacy_counts") or []]
+            if len(legacy) == 3:
+                likes, comments, reposts = likes or legacy[0], comments or legacy[1], reposts or legacy[2]
+
+            return self._build_post(
+                content_text, published_at, author, author_url, post_urn, likes, comments, reposts
+            )
+        except Exception as e:
+            logger.debug(f"[linkedin] 일괄 추출 항목 해석 실패: {e}")
+            return None
+
+    async def _feed_child(self, page, index: int):
+        """mainFeed의 index번째 직계 자식 ElementHandle (URN 관리 메뉴 폴백용)."""
+        if index < 0:
+            return None
+        return await page.query_selector(
+            f'[data-testid="mainFeed"] > :nth-child({index + 1})'
+        )
+
+    def _build_post(
+        self,
+        content_text: str,
+        published_at: Optional[datetime],
+        author: str,
+        author_url: str,
+        post_urn: str,
+        likes: int,
+        comments: int,
+        reposts: int,
+    ) -> Post:
+        # URN에서 ID와 URL 생성
+        if post_urn:
+            # urn:li:ugcPost:7434660713215885312 형태
+            post_id = post_urn.split(":")[-1]
+            external_id = f"li_{post_id}"
+            post_url = f"https://www.linkedin.com/feed/update/{post_urn}/"
+        else:
+            # 폴백: 본문 해시 (URL은 작성자 프로필로 대체)
+            fallback_id = hashlib.md5(content_text[:200].encode()).hexdigest()[:16]
+            external_id = f"li_{fallback_id}"
+            post_url = author_url or self.FEED_URL
+
+        return Post(
+            source="linkedin",
+            external_id=external_id,
+            url=post_url,
+            author=author,
+            author_url=author_url or None,
+            content_text=content_text,
+            engagement_likes=likes,
+            engagement_reposts=reposts,
+            engagement_comments=comments,
+            published_at=published_at,
+            collected_at=datetime.utcnow(),
+        )
+
+    # ─── 요소별 추출 (폴백) ───
+
     async def _extract_published_at(self, element) -> Optional[datetime]:
         """게시물 작성 시간을 추출. <time>의 datetime 속성 우선, 없으면 상대 시간 파싱."""
         # 1순위: <time> 태그의 datetime 속성 (절대 시간)
         try:
             time_el = await element.query_selector("time[datetime]")
             if time_el:
-                dt_attr = await time_el.get_attribute("datetime") or ""
-                if dt_attr:
-                    try:
-                        return datetime.fromisoformat(dt_attr.replace("Z", "+00:00")).replace(tzinfo=None)
-                    except ValueError:
-                        pass
+                dt = _parse_time_attr(await time_el.get_attribute("datetime") or "")
+                if dt:
+                    return dt
         except Exception:
             pass
 
@@ -334,21 +501,20 @@ class LinkedInCollector(BaseCdpCollector):
                 'button[aria-label*="게시물에 대한 관리"]'
             )
             if mgmt_btn:
-                label = await mgmt_btn.get_attribute("aria-label") or ""
-                # "Douglas Guen 님의 게시물에 대한 관리 메뉴 열기" → "Douglas Guen"
-                match = re.match(r"(.+?)\s*님의 게시물", label)
-                if match:
-                    return match.group(1).strip()
+                author = _author_from_mgmt_label(await mgmt_btn.get_attribute("aria-label") or "")
+                if author:
+                    return author
 
             # 영어 UI 대응: "Open control menu for post by ~"
             mgmt_btn_en = await element.query_selector(
                 'button[aria-label*="control menu for post"]'
             )
             if mgmt_btn_en:
-                label = await mgmt_btn_en.get_attribute("aria-label") or ""
-                match = re.match(r"Open control menu for post by (.+)", label)
-                if match:
-                    return match.group(1).strip()
+                author = _author_from_mgmt_label_en(
+                    await mgmt_btn_en.get_attribute("aria-label") or ""
+                )
+                if author:
+                    return author
         except Exception:
             pass
 
@@ -356,10 +522,9 @@ class LinkedInCollector(BaseCdpCollector):
         try:
             profile_svgs = await element.query_selector_all('[aria-label*="프로필 보기"]')
             for svg in profile_svgs:
-                label = await svg.get_attribute("aria-label") or ""
-                match = re.match(r"(.+?)님의 프로필 보기", label)
-                if match:
-                    return match.group(1).strip()
+                author = _author_from_profile_label(await svg.get_attribute("aria-label") or "")
+                if author:
+                    return author
         except Exception:
             pass
 
@@ -367,10 +532,11 @@ class LinkedInCollector(BaseCdpCollector):
         try:
             company_el = await element.query_selector('[aria-label*="회사 보기"]')
             if company_el:
-                label = await company_el.get_attribute("aria-label") or ""
-                match = re.match(r"회사 보기:\s*(.+)", label)
-                if match:
-                    return match.group(1).strip()
+                author = _author_from_company_label(
+                    await company_el.get_attribute("aria-label") or ""
+                )
+                if author:
+                    return author
         except Exception:
             pass
 
@@ -415,16 +581,10 @@ class LinkedInCollector(BaseCdpCollector):
                 text = (await link.inner_text()).strip().split("\n")[0].strip()
             except Exception:
                 continue
-            if not text:
-                continue
-            # LinkedIn은 이름 뒤에 "· 1촌", 배지 등을 덧붙이므로 startswith 도 허용
-            if text == author or text.startswith(author):
+            if _link_matches_author(text, author):
                 href = await link.get_attribute("href") or ""
-                if not href:
-                    continue
-                if href.startswith("/"):
-                    href = f"https://www.linkedin.com{href}"
-                return _normalize_profile_url(href)
+                if href:
+                    return _absolute_profile_url(href)
         return ""
 
     async def _extract_content(self, element) -> str:
@@ -465,41 +625,10 @@ class LinkedInCollector(BaseCdpCollector):
 
     async def _extract_engagement(self, element) -> tuple[int, int, int]:
         """인게이지먼트(반응, 댓글, 퍼온글) 수를 추출한다."""
-        likes = 0
-        comments = 0
-        reposts = 0
+        likes = comments = reposts = 0
 
         try:
-            full_text = await element.inner_text()
-
-            # 한국어: "반응 39", "댓글 1", "퍼온글 1"
-            likes_match = re.search(r"반응\s+([\d,.]+(?:k|K)?)", full_text)
-            if likes_match:
-                likes = self._parse_count(likes_match.group(1))
-
-            comments_match = re.search(r"댓글\s+([\d,.]+(?:k|K)?)", full_text)
-            if comments_match:
-                comments = self._parse_count(comments_match.group(1))
-
-            reposts_match = re.search(r"퍼온글\s+([\d,.]+(?:k|K)?)", full_text)
-            if reposts_match:
-                reposts = self._parse_count(reposts_match.group(1))
-
-            # 영어 UI: "39 reactions", "1 comment", "1 repost"
-            if not likes_match:
-                en_likes = re.search(r"([\d,.]+(?:k|K)?)\s+reaction", full_text)
-                if en_likes:
-                    likes = self._parse_count(en_likes.group(1))
-
-            if not comments_match:
-                en_comments = re.search(r"([\d,.]+(?:k|K)?)\s+comment", full_text)
-                if en_comments:
-                    comments = self._parse_count(en_comments.group(1))
-
-            if not reposts_match:
-                en_reposts = re.search(r"([\d,.]+(?:k|K)?)\s+repost", full_text)
-                if en_reposts:
-                    reposts = self._parse_count(en_reposts.group(1))
+            likes, comments, reposts = _engagement_from_text(await element.inner_text())
         except Exception:
             pass
 
@@ -581,3 +710,74 @@ def _parse_relative_time(text: str) -> Optional[datetime]:
             return now - timedelta(days=n * 30)
         return now - timedelta(**{unit: n})
     return None
+
+
+def _parse_time_attr(dt_attr: str) -> Optional[datetime]:
+    """<time datetime="..."> 값(ISO8601) → naive UTC."""
+    if not dt_attr:
+        return None
+    try:
+        return datetime.fromisoformat(dt_attr.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+# ─── 작성자 aria-label 해석 (JS 일괄 추출·요소별 추출 공용) ───
+
+def _author_from_mgmt_label(label: str) -> str:
+    # "Douglas Guen 님의 게시물에 대한 관리 메뉴 열기" → "Douglas Guen"
+    match = re.match(r"(.+?)\s*님의 게시물", label)
+    return match.group(1).strip() if match else ""
+
+
+def _author_from_mgmt_label_en(label: str) -> str:
+    # 영어 UI: "Open control menu for post by ~"
+    match = re.match(r"Open control menu for post by (.+)", label)
+    return match.group(1).strip() if match else ""
+
+
+def _author_from_profile_label(label: str) -> str:
+    match = re.match(r"(.+?)님의 프로필 보기", label)
+    return match.group(1).strip() if match else ""
+
+
+def _author_from_company_label(label: str) -> str:
+    match = re.match(r"회사 보기:\s*(.+)", label)
+    return match.group(1).strip() if match else ""
+
+
+def _link_matches_author(text: str, author: str) -> bool:
+    # LinkedIn은 이름 뒤에 "· 1촌", 배지 등을 덧붙이므로 startswith 도 허용
+    return bool(text) and (text == author or text.startswith(author))
+
+
+def _absolute_profile_url(href: str) -> str:
+    if href.startswith("/"):
+        href = f"https://www.linkedin.com{href}"
+    return _normalize_profile_url(href)
+
+
+def _match_author_url(links: list[list[str]], author: str) -> str:
+    """[(링크 텍스트, href)] 중 작성자 이름과 맞는 첫 링크 (못 찾으면 빈 문자열).
+
+    대조 규칙은 LinkedInCollector._extract_author_url 참조 — 틀린 URL은 없는 것만 못하다.
+    """
+    author = (author or "").strip()
+    if not author:
+        return ""
+    for text, href in links:
+        if _link_matches_author(text.split("\n")[0].strip(), author) and href:
+            return _absolute_profile_url(href)
+    return ""
+
+
+def _engagement_from_text(full_text: str) -> tuple[int, int, int]:
+    """항목 innerText에서 (반응, 댓글, 퍼온글) 수 — 한국어 UI 우선, 없으면 영어 UI 패턴."""
+    counts = []
+    for ko, en in (("반응", "reaction"), ("댓글", "comment"), ("퍼온글", "repost")):
+        # 한국어: "반응 39" / 영어: "39 reactions"
+        match = re.search(rf"{ko}\s+([\d,.]+(?:k|K)?)", full_text) or re.search(
+            rf"([\d,.]+(?:k|K)?)\s+{en}", full_text
+        )
+        counts.append(LinkedInCollector._parse_count(match.group(1)) if match else 0)
+    return counts[0], counts[1], counts[2]
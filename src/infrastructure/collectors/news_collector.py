@@ -18,72 +18,37 @@ import hashlib
 import html as _html
 import logging
 import re
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta, timezone
-from email.utils import parsedate_to_datetime
+import time
+from datetime import datetime, timedelta
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.http import fetch_text
+from src.infrastructure.collectors.feed_stream import FeedStreamParser, parse_feed
+from src.infrastructure.collectors.http import (
+    FetchStats,
+    HostLimiter,
+    SharedHttpClient,
+    fetch_stream,
+)
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
 from src.infrastructure.config.settings import CollectorConfig
 
 logger = logging.getLogger(__name__)
 
 _TAG = re.compile(r"<[^>]+>")
 
-# 피드 사이 대기(초) — Google News 프록시 피드가 여럿이라 연속 타격을 피한다
+# 같은 호스트 요청 시작 간 최소 간격(초) — Google News 프록시 피드가 여럿이라 연속 타격을 피한다.
+# 피드는 동시에 받되(feed_concurrency) 호스트별로는 per_host_concurrency개씩 이 간격을 둔다.
 _FEED_DELAY = 0.5
 
 
-def _local(tag: str) -> str:
-    """네임스페이스 제거한 로컬 태그명."""
-    return tag.rsplit("}", 1)[-1]
-
-
-def _child_text(elem: ET.Element, *names: str) -> str:
-    """로컬명이 names 중 하나인 첫 자식의 텍스트."""
-    for child in elem:
-        if _local(child.tag) in names and child.text:
-            return child.text.strip()
-    return ""
-
-
-def _entry_link(elem: ET.Element) -> str:
-    """RSS <link>텍스트</link> 또는 Atom <link href=...> 추출."""
-    alternate = ""
-    for child in elem:
-        if _local(child.tag) != "link":
-            continue
-        if child.text and child.text.strip():  # RSS 2.0
-            return child.text.strip()
-        href = child.get("href", "")  # Atom
-        if href and child.get("rel", "alternate") == "alternate":
-            return href
-        alternate = alternate or href
-    return alternate
-
-
-def _entry_date(elem: ET.Element) -> datetime | None:
-    """pubDate(RFC822) 또는 published/updated(ISO8601) → naive UTC."""
-    raw = _child_text(elem, "pubDate", "published", "updated")
-    if not raw:
-        return None
-    try:
-        if raw[:1].isdigit():  # ISO8601
-            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        else:  # RFC822 ("Tue, 14 Jul 2026 ...")
-            dt = parsedate_to_datetime(raw)
-        if dt.tzinfo is not None:
-            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-        return dt
-    except (ValueError, TypeError):
-        return None
-
-
 class NewsCollector:
     """설정 선언 피드 목록 기반 뉴스 수집기 (HTTP, 로그인 불필요)."""
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(self, config: CollectorConfig, http: SharedHttpClient | None = None):
         self._config = config
+        self._http = http
+        self.fetch_stats = FetchStats()  # 직전 collect()의 요청·조건부 GET 적중 집계
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
 
     @property
     def source_name(self) -> str:
@@ -96,51 +61,85 @@ class NewsCollector:
         cutoff = datetime.utcnow() - timedelta(days=self._config.max_age_days)
         seen: set[str] = set()
         posts: list[Post] = []
+        self.fetch_stats = FetchStats()
 
-        for i, feed in enumerate(self._config.feeds):
-            name, url = feed.get("name", ""), feed.get("url", "")
-            if not name or not url:
+        feeds = []
+        for feed in self._config.feeds:
+            if not feed.get("name") or not feed.get("url"):
                 logger.warning(f"[news] 피드 설정 불완전 — 스킵: {feed}")
                 continue
-            if i:
-                await asyncio.sleep(_FEED_DELAY)
-
-            xml = await fetch_text(url, f"news:{name}")
-            if xml is None:
-                continue  # 개별 피드 실패가 나머지 피드를 막지 않는다
+            feeds.append(feed)
+
+        global_sem = asyncio.Semaphore(max(1, self._config.feed_concurrency))
+        hosts = HostLimiter(self._config.per_host_concurrency, _FEED_DELAY)
+        started = time.perf_counter()
+        fetched = await asyncio.gather(
+            *(self._fetch(f, global_sem, hosts, cutoff) for f in feeds)
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        # 파싱은 받으면서 끝났다. Post 변환·dedup은 설정 순서대로 — 같은 기사가 여러 피드에
+        # 있으면 앞 피드가 가져간다
+        for feed, (parsed, elapsed_ms) in zip(feeds, fetched):
+            name = feed["name"]
+            if parsed is None:
+                continue  # 실패(개별 피드가 나머지를 막지 않는다) 또는 304·본문 동일
 
-            entries = self._parse_feed(xml, name)
             kept = 0
-            for entry in entries[: self._config.max_items_per_feed]:
+            for entry in parsed.entries:
                 post = self._to_post(entry, name, cutoff, seen)
                 if post:
                     posts.append(post)
                     kept += 1
-            logger.info(f"[news] {name}: {kept}건 (피드 {len(entries)}건)")
+            stopped = {"limit": ", 상한 도달", "cutoff": ", 컷오프 도달"}.get(parsed.stop_reason, "")
+            logger.info(
+                f"[news] {name}: {kept}건 (피드 {len(parsed.entries)}건{stopped}, {elapsed_ms:.0f}ms)"
+            )
 
-        logger.info(f"[news] 전체 {len(posts)}건 수집 완료 (피드 {len(self._config.feeds)}개)")
+        fetch_sum_ms = sum(ms for _, ms in fetched)
+        stats = self.fetch_stats
+        logger.info(
+            f"[news] 전체 {len(posts)}건 수집 완료 (피드 {len(self._config.feeds)}개, "
+            f"소요 {wall_ms:.0f}ms / 피드 합계 {fetch_sum_ms:.0f}ms, "
+            f"변경 없음 {stats.hits}/{stats.requests})"
+        )
         return posts
 
-    def _parse_feed(self, xml: str, feed_name: str) -> list[dict]:
-        """RSS 2.0 <item> / Atom <entry>를 공통 dict로 파싱."""
-        try:
-            root = ET.fromstring(xml)
-        except ET.ParseError as e:
-            logger.warning(f"[news] {feed_name}: XML 파싱 실패 — {e}")
-            return []
-
-        entries = []
-        for elem in root.iter():
-            if _local(elem.tag) not in ("item", "entry"):
-                continue
-            entries.append({
-                "title": _child_text(elem, "title"),
-                "link": _entry_link(elem),
-                "summary": _child_text(elem, "description", "summary", "content"),
-                "published": _entry_date(elem),
-                "guid": _child_text(elem, "guid", "id") or _entry_link(elem),
-            })
-        return entries
+    async def _fetch(
+        self, feed: dict, global_sem: asyncio.Semaphore, hosts: HostLimiter, cutoff: datetime
+    ) -> tuple[FeedStreamParser | None, float]:
+        """피드 1개를 받으면서 파싱 — (파서 또는 None, 소요 ms). 항목 상한이나 연속 컷오프에
+        닿으면 남은 본문은 받지 않는다. 호스트 슬롯을 먼저 잡아 같은 호스트 대기 중인
+        피드가 전역 슬롯을 붙잡고 있지 않게 한다."""
+        name, url = feed["name"], feed["url"]
+        parser = FeedStreamParser(
+            f"news:{name}", self._config.max_items_per_feed, cutoff, self._config.feed_stale_stop
+        )
+        raw: list[bytes] | None = [] if self._recorder else None
+
+        def consume(chunk: bytes) -> bool:
+            if raw is not None:
+                raw.append(chunk)
+            return parser.feed(chunk)
+
+        async with hosts.slot(url):
+            async with global_sem:
+                t0 = time.perf_counter()
+                ok = await fetch_stream(
+                    url, f"news:{name}", consume, client=self._http, stats=self.fetch_stats
+                )
+                elapsed_ms = (time.perf_counter() - t0) * 1000
+        if not ok:
+            return None, elapsed_ms
+        parser.close()
+        if raw is not None:
+            # 조기 종료했으면 읽은 앞부분만 — replay의 증분 파서는 잘린 문서도 읽는다
+            self._recorder.record("news", "feed", b"".join(raw).decode("utf-8", "replace"))
+        return parser, elapsed_ms
+
+    def _parse_feed(self, xml: str | bytes, feed_name: str) -> list[dict]:
+        """기록된 본문 전체를 수집 경로와 같은 증분 파서로 (replay용)."""
+        return parse_feed(xml, f"news:{feed_name}", self._config.max_items_per_feed)
 
     def _to_post(
         self, entry: dict, feed_name: str, cutoff: datetime, seen: set[str]
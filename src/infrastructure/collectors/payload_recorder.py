@@ -0,0 +1,64 @@
+"""수집 원본 페이로드 기록 (record 모드).
+
+소스별 설정 record_payloads: true면 수집기가 받은 원본 — GraphQL 응답 JSON, 목록·상세
+HTML, RSS/Atom XML — 을 파싱 전에 data/payloads/<source>/ 아래 파일로 남긴다.
+replay.py가 이 파일을 브라우저·네트워크 없이 파서에 다시 먹여 처리량·할당·피크
+메모리를 잰다 (scripts/bench_parsers.py).
+
+파일명: <UTC 시각>-<순번>-<label>.<json|html|xml>. label은 같은 소스 안에서 파서를
+가른다(dcinside의 list/detail 등). 소스당 keep개를 넘으면 오래된 것부터 지운다.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.config.settings import CollectorConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAYLOAD_DIR = Path("data/payloads")
+
+_EXT = {"graphql": "json", "feed": "xml", "atom": "xml"}
+
+
+class PayloadRecorder:
+    def __init__(self, root: Path | str = DEFAULT_PAYLOAD_DIR, keep: int = 50):
+        self._root = Path(root)
+        self._keep = keep
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_config(cls, config: CollectorConfig) -> PayloadRecorder | None:
+        """record_payloads가 꺼져 있으면 None — 수집기는 `if self._recorder:`로 건너뛴다."""
+        return cls() if config.record_payloads else None
+
+    def record(self, source: str, label: str, payload: str | Any) -> Path | None:
+        """페이로드 1건 저장. 문자열이 아니면 JSON으로. 실패해도 수집은 계속한다."""
+        ext = _EXT.get(label, "html" if isinstance(payload, str) else "json")
+        text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        directory = self._root / source
+        path = directory / f"{stamp}-{next(self._seq):04d}-{label}.{ext}"
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+            self._prune(directory)
+            return path
+        except Exception as e:
+            logger.debug(f"[{source}] 페이로드 기록 실패(무시): {e}")
+            return None
+
+    def record_many(self, source: str, label: str, payloads: list[Any]) -> None:
+        for payload in payloads:
+            self.record(source, label, payload)
+
+    def _prune(self, directory: Path) -> None:
+        files = sorted(p for p in directory.iterdir() if p.is_file())
+        for old in files[: max(0, len(files) - self._keep)]:
+            old.unlink(missing_ok=True)
@@ -17,7 +17,12 @@ import logging
 import random
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.cdp import cdp_connection, minimize_window
+from src.infrastructure.collectors.cdp import (
+    PRIORITY_ENGAGE,
+    CdpConnectionManager,
+    cdp_connection,
+    minimize_window,
+)
 from src.infrastructure.config.settings import LikeConfig
 
 logger = logging.getLogger(__name__)
@@ -93,9 +98,12 @@ async def _get_like_state(page, source: str):
 class CdpPostLiker:
     """사용자 Chrome(CDP)에 연결해 게시물 URL을 열고 좋아요를 누르는 Liker."""
 
-    def __init__(self, config: LikeConfig, cdp_port: int = 9222):
+    def __init__(
+        self, config: LikeConfig, cdp_port: int = 9222, cdp: CdpConnectionManager | None = None
+    ):
         self._cfg = config
         self._cdp_url = f"http://127.0.0.1:{cdp_port}"
+        self._cdp = cdp
 
     async def like_posts(self, source: str, posts: list[Post]) -> list[str]:
         if not posts:
@@ -103,7 +111,9 @@ class CdpPostLiker:
 
         done: list[str] = []
         try:
-            async with cdp_connection(self._cdp_url, source) as (pw, context):
+            async with cdp_connection(
+                self._cdp_url, source, self._cdp, PRIORITY_ENGAGE, f"{source}:like"
+            ) as (pw, context):
                 page = await context.new_page()  # 매번 새 탭 (완료 후 닫아 메모리 회수)
                 await minimize_window(page)
                 try:
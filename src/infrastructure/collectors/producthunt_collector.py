@@ -3,6 +3,7 @@
 AI 카테고리 제품 런칭을 가져온다. '만든 결과물'이라 사실 검증 대상이 아니므로,
 verify_claims 단계에서 source='producthunt'는 제외된다(process_posts에서 분기).
 PH 피드는 큐레이션된 최신 런칭이라 게시일 컷오프는 적용하지 않는다(dedup은 external_id로).
+피드는 받으면서 증분 파싱하고(feed_stream), max_items_per_feed건을 채우면 나머지는 받지 않는다.
 """
 
 from __future__ import annotations
@@ -10,29 +11,28 @@ from __future__ import annotations
 import html as _html
 import logging
 import re
-from datetime import datetime, timezone
+from datetime import datetime
 
 from src.domain.entities import Post
-from src.infrastructure.collectors.http import fetch_text
+from src.infrastructure.collectors.feed_stream import FeedStreamParser, parse_feed
+from src.infrastructure.collectors.http import FetchStats, SharedHttpClient, fetch_stream
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
 from src.infrastructure.config.settings import CollectorConfig
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://www.producthunt.com/feed?category=artificial-intelligence"
-_ENTRY = re.compile(r"<entry>(.*?)</entry>", re.S)
 _TAG = re.compile(r"<[^>]+>")
 
 
-def _field(entry: str, tag: str) -> str:
-    m = re.search(rf"<{tag}[^>]*>(.*?)</{tag}>", entry, re.S)
-    return m.group(1).strip() if m else ""
-
-
 class ProductHuntCollector:
     """Product Hunt AI 런칭 수집기 (HTTP 기반, 로그인 불필요)."""
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(self, config: CollectorConfig, http: SharedHttpClient | None = None):
         self._config = config
+        self._http = http
+        self.fetch_stats = FetchStats()  # 직전 collect()의 요청·조건부 GET 적중 집계
+        self._recorder = PayloadRecorder.from_config(config)  # record 모드 (replay.py)
 
     @property
     def source_name(self) -> str:
@@ -42,50 +42,61 @@ class ProductHuntCollector:
         return True
 
     async def collect(self) -> list[Post]:
-        xml = await fetch_text(FEED_URL, "producthunt")
-        if xml is None:
-            return []
+        self.fetch_stats = FetchStats()
+        parser = FeedStreamParser("producthunt", self._config.max_items_per_feed)
+        raw: list[bytes] | None = [] if self._recorder else None
+
+        def consume(chunk: bytes) -> bool:
+            if raw is not None:
+                raw.append(chunk)
+            return parser.feed(chunk)
+
+        ok = await fetch_stream(
+            FEED_URL, "producthunt", consume, client=self._http, stats=self.fetch_stats
+        )
+        if not ok:
+            return []  # 실패 또는 변경 없음(304·본문 동일)
+        parser.close()
+        if raw is not None:
+            self._recorder.record("producthunt", "atom", b"".join(raw).decode("utf-8", "replace"))
+
+        posts = self._to_posts(parser.entries)
+        logger.info(f"[producthunt] {len(posts)}건 수집 완료")
+        return posts
+
+    def _parse_feed(self, xml: str | bytes) -> list[Post]:
+        """기록된 본문 전체를 수집 경로와 같은 증분 파서로 (replay용)."""
+        return self._to_posts(parse_feed(xml, "producthunt", self._config.max_items_per_feed))
 
+    def _to_posts(self, entries: list[dict]) -> list[Post]:
         seen: set[str] = set()
         posts: list[Post] = []
-        for entry in _ENTRY.findall(xml):
+        for entry in entries:
             p = self._parse(entry, seen)
             if p:
                 posts.append(p)
-        logger.info(f"[producthunt] {len(posts)}건 수집 완료")
         return posts
 
-    def _parse(self, entry: str, seen: set[str]) -> Post | None:
+    def _parse(self, entry: dict, seen: set[str]) -> Post | None:
         try:
-            title = _html.unescape(_field(entry, "title")).strip()
+            title = _html.unescape(entry["title"]).strip()
             if not title:
                 return None
 
-            m = re.search(r"Post/(\d+)", _field(entry, "id"))
+            m = re.search(r"Post/(\d+)", entry["guid"])
             pid = m.group(1) if m else ""
             if not pid or pid in seen:
                 return None
             seen.add(pid)
 
-            link_m = re.search(r'<link[^>]*href="([^"]+)"', entry)
-            url = _html.unescape(link_m.group(1)) if link_m else ""
+            url = entry["link"]
 
             # content(HTML) → 태그라인 텍스트
-            text = _html.unescape(_field(entry, "content"))
-            text = re.sub(r"\s+", " ", _TAG.sub(" ", text)).strip()
+            text = _html.unescape(_TAG.sub(" ", entry["summary"]))
+            text = re.sub(r"\s+", " ", text).strip()
             tagline = text.split("Discussion")[0].strip()[:300]
 
-            published_at = None
-            pub = _field(entry, "published")
-            if pub:
-                try:
-                    published_at = (
-                        datetime.fromisoformat(pub.replace("Z", "+00:00"))
-                        .astimezone(timezone.utc)
-                        .replace(tzinfo=None)
-                    )
-                except ValueError:
-                    pass
+            published_at = entry["published"]
 
             body = f"{title} — {tagline}" if tagline else title
             return Post(
@@ -0,0 +1,179 @@
+"""기록된 페이로드 오프라인 재생 + 파서 계측 (replay 모드).
+
+PayloadRecorder가 남긴 data/payloads/<source>/*.{json,html,xml}을 브라우저·네트워크
+없이 각 수집기의 파서에 그대로 먹인다. 파서별로 잰다:
+  - posts/sec: 반복 재생 처리량 (파서가 내놓은 게시물·항목 수 기준)
+  - alloc_blocks: 1회 재생 동안 할당돼 결과와 함께 살아 있는 메모리 블록 수 (tracemalloc)
+  - peak_kb: 1회 재생 중 추적 메모리 최고치 — 일시 할당(DOM 트리·JSON 파싱)까지 포함
+
+게시일 컷오프는 끈다(과거 기록분이 전부 걸러지면 잴 게 없다). 회귀 추적은
+scripts/bench_parsers.py가 결과를 이력 파일에 쌓고 compare_to_history로 비교한다.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from src.infrastructure.config.settings import CollectorConfig
+
+# 컷오프 없음 — 어떤 기록분도 나이 때문에 버려지지 않게
+_NO_CUTOFF = datetime(1970, 1, 1)
+_REPLAY_CONFIG = {"max_age_days": 365 * 100}
+
+
+@lru_cache(maxsize=None)
+def _collector(name: str):
+    # 수집기 모듈은 무겁고(playwright·bs4) 서로 순환 참조가 없도록 필요할 때만 import
+    config = CollectorConfig(_REPLAY_CONFIG)
+    if name == "twitter":
+        from src.infrastructure.collectors.twitter_collector import TwitterCollector
+        return TwitterCollector(config)
+    if name == "threads":
+        from src.infrastructure.collectors.threads_collector import ThreadsCollector
+        return ThreadsCollector(config)
+    if name == "dcinside":
+        from src.infrastructure.collectors.dcinside_collector import DCInsideCollector
+        return DCInsideCollector(config)
+    if name == "news":
+        from src.infrastructure.collectors.news_collector import NewsCollector
+        return NewsCollector(config)
+    if name == "36kr":
+        from src.infrastructure.collectors.kr36_collector import Kr36Collector
+        return Kr36Collector(config)
+    if name == "producthunt":
+        from src.infrastructure.collectors.producthunt_collector import ProductHuntCollector
+        return ProductHuntCollector(config)
+    if name == "donga_series":
+        from src.infrastructure.collectors.donga_series_collector import DongaSeriesCollector
+        return DongaSeriesCollector(config)
+    raise KeyError(name)
+
+
+def _news(xml: str) -> list:
+    collector = _collector("news")
+    seen: set[str] = set()
+    posts = (collector._to_post(e, "replay", _NO_CUTOFF, seen) for e in collector._parse_feed(xml, "replay"))
+    return [p for p in posts if p]
+
+
+def _dcinside_detail(html: str) -> list:
+    detail = _collector("dcinside")._parse_detail_page(html)
+    return [detail[0]] if detail and detail[0] else []
+
+
+# (source, label) → 페이로드 1건을 파싱해 결과 목록을 돌려주는 함수
+REPLAY_PARSERS: dict[tuple[str, str], Callable[[str], list]] = {
+    ("twitter", "graphql"): lambda s: _collector("twitter")._parse_graphql_responses([json.loads(s)]),
+    ("threads", "graphql"): lambda s: _collector("threads")._parse_graphql_data([json.loads(s)]),
+    ("dcinside", "list"): lambda s: _collector("dcinside")._parse_list_page(s, set()),
+    ("dcinside", "detail"): _dcinside_detail,
+    ("news", "feed"): _news,
+    ("36kr", "newsflash"): lambda s: _collector("36kr")._parse_page(s, _NO_CUTOFF)[0],
+    ("producthunt", "atom"): lambda s: _collector("producthunt")._parse_feed(s),
+    ("donga_series", "series"): lambda s: _collector("donga_series")._parse_page(
+        s, _NO_CUTOFF.replace(tzinfo=timezone(timedelta(hours=9)))
+    ),
+}
+
+
+@dataclass
+class ReplayResult:
+    parser: str  # "source/label"
+    fixtures: int
+    payload_kb: float
+    items: int  # 1회 재생에서 나온 게시물·항목 수
+    runs: int
+    seconds: float  # runs회 재생 총 소요
+    alloc_blocks: int
+    peak_kb: float
+
+    @property
+    def posts_per_sec(self) -> float:
+        return self.items * self.runs / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "posts_per_sec": round(self.posts_per_sec, 1)}
+
+
+def discover(root: Path | str) -> dict[tuple[str, str], list[Path]]:
+    """기록 디렉터리에서 파서별 페이로드 파일 목록. 파서가 없는 label은 건너뛴다."""
+    found: dict[tuple[str, str], list[Path]] = {}
+    for path in sorted(Path(root).glob("*/*.*")):
+        label = path.stem.rsplit("-", 1)[-1]
+        key = (path.parent.name, label)
+        if key in REPLAY_PARSERS:
+            found.setdefault(key, []).append(path)
+    return found
+
+
+def replay(key: tuple[str, str], paths: list[Path], runs: int = 5) -> ReplayResult:
+    parse = REPLAY_PARSERS[key]
+    payloads = [p.read_text(encoding="utf-8") for p in paths]
+    items = sum(len(parse(p)) for p in payloads)  # 예열 겸 항목 수
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        for payload in payloads:
+            parse(payload)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        kept = [parse(p) for p in payloads]  # 결과를 붙잡아 둔 채 스냅샷
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    alloc_blocks = sum(max(0, d.count_diff) for d in after.compare_to(before, "lineno"))
+    del kept
+
+    return ReplayResult(
+        parser="/".join(key),
+        fixtures=len(payloads),
+        payload_kb=round(sum(len(p.encode()) for p in payloads) / 1024, 1),
+        items=items,
+        runs=runs,
+        seconds=seconds,
+        alloc_blocks=alloc_blocks,
+        peak_kb=round((peak - base) / 1024, 1),
+    )
+
+
+def compare_to_history(
+    current: list[dict], history: list[dict], threshold: float = 0.2, window: int = 5
+) -> list[str]:
+    """직전 window회 중앙값 대비 처리량 하락·피크 메모리 증가가 threshold를 넘는 파서.
+
+    history는 이전 실행의 as_dict() 행들(시간순). 같은 픽스처 집합끼리만 비교한다
+    (fixtures·payload_kb가 다르면 기록분이 바뀐 것이라 회귀로 보지 않는다).
+    """
+    regressions = []
+    for row in current:
+        past = [
+            h for h in history
+            if h["parser"] == row["parser"]
+            and h["fixtures"] == row["fixtures"]
+            and h["payload_kb"] == row["payload_kb"]
+        ][-window:]
+        if not past:
+            continue
+        pps = statistics.median(h["posts_per_sec"] for h in past)
+        peak = statistics.median(h["peak_kb"] for h in past)
+        if pps and row["posts_per_sec"] < pps * (1 - threshold):
+            regressions.append(
+                f"{row['parser']}: 처리량 {row['posts_per_sec']:.0f}/s (기준 {pps:.0f}/s)"
+            )
+        if peak and row["peak_kb"] > peak * (1 + threshold):
+            regressions.append(f"{row['parser']}: 피크 {row['peak_kb']:.0f}KB (기준 {peak:.0f}KB)")
+    return regressions
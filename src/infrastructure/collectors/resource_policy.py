@@ -0,0 +1,156 @@
+"""CDP 수집 탭 리소스 차단 정책 + 측정 모드.
+
+twitter/threads/linkedin 수집에 필요한 건 피드 API 응답(GraphQL)이나 DOM 텍스트뿐인데,
+스크롤하는 동안 탭은 이미지·동영상·폰트·트래킹 스크립트를 전부 내려받는다. 그만큼
+chrome.exe RSS가 불어난다(_log_memory_usage 로그). 수집 탭에 page.route를 걸어
+소스별 설정에 맞는 요청을 abort한다.
+
+- 판정 순서: allow_url_patterns(부분 문자열) → 통과, block_resource_types(Playwright
+  resource_type) 또는 block_url_patterns → 차단. allow가 항상 이기므로 GraphQL 등
+  수집 엔드포인트는 어떤 차단 규칙에도 걸리지 않는다.
+- 문서(document) 요청은 설정과 무관하게 막지 않는다 — 피드 페이지 자체가 안 열린다.
+- 측정 모드(measure_resource_blocking): 회차마다 차단 on/off를 번갈아 적용하고,
+  탭이 받은 바이트(Network.loadingFinished encodedDataLength)와 닫기 직전 렌더러
+  JS 힙(Performance.getMetrics)을 모드별 평균으로 로깅한다.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from src.infrastructure.config.settings import CollectorConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResourceBlockPolicy:
+    block_types: frozenset[str] = frozenset()
+    block_patterns: tuple[str, ...] = ()
+    allow_patterns: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: CollectorConfig) -> ResourceBlockPolicy:
+        return cls(
+            block_types=frozenset(config.block_resource_types),
+            block_patterns=tuple(config.block_url_patterns),
+            allow_patterns=tuple(config.allow_url_patterns),
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.block_types or self.block_patterns)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return False
+        if any(p in url for p in self.allow_patterns):
+            return False
+        return resource_type in self.block_types or any(p in url for p in self.block_patterns)
+
+
+@dataclass
+class TabMeter:
+    """수집 탭 1개분 — 차단 건수와 (측정 모드면) 전송 바이트·렌더러 힙."""
+
+    blocking: bool
+    blocked: int = 0
+    bytes_received: int = 0
+    js_heap_bytes: int = 0
+    cdp: object | None = None  # 측정용 CDP 세션
+
+
+@dataclass
+class _ModeTotals:
+    tabs: int = 0
+    bytes_received: int = 0
+    js_heap_bytes: int = 0
+
+    def add(self, meter: TabMeter) -> None:
+        self.tabs += 1
+        self.bytes_received += meter.bytes_received
+        self.js_heap_bytes += meter.js_heap_bytes
+
+    def averages_mb(self) -> tuple[float, float]:
+        if not self.tabs:
+            return 0.0, 0.0
+        mb = 1024 * 1024
+        return self.bytes_received / self.tabs / mb, self.js_heap_bytes / self.tabs / mb
+
+
+class ResourceGuard:
+    """수집기 1개의 탭 리소스 정책 — attach()로 탭에 걸고 report()로 정리한다."""
+
+    def __init__(self, source: str, policy: ResourceBlockPolicy, measure: bool = False):
+        self.source = source
+        self.policy = policy
+        self.measure = measure
+        self._tabs = 0
+        self._totals = {True: _ModeTotals(), False: _ModeTotals()}  # 차단 여부별 누적
+
+    async def attach(self, page) -> TabMeter:
+        """탭에 차단 라우트(와 측정 세션)를 건다. 측정 모드면 회차마다 차단을 번갈아 끈다."""
+        self._tabs += 1
+        blocking = self.policy.active and (not self.measure or self._tabs % 2 == 1)
+        meter = TabMeter(blocking=blocking)
+
+        if blocking:
+            async def route_handler(route):
+                request = route.request
+                if self.policy.should_block(request.resource_type, request.url):
+                    meter.blocked += 1
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            try:
+                await page.route("**/*", route_handler)
+            except Exception as e:
+                meter.blocking = False
+                logger.debug(f"[{self.source}] 리소스 차단 라우트 설정 실패(무시): {e}")
+
+        if self.measure:
+            try:
+                cdp = await page.context.new_cdp_session(page)
+                await cdp.send("Network.enable")
+                await cdp.send("Performance.enable")
+
+                def on_finished(event):
+                    meter.bytes_received += int(event.get("encodedDataLength") or 0)
+
+                cdp.on("Network.loadingFinished", on_finished)
+                meter.cdp = cdp
+            except Exception as e:
+                logger.debug(f"[{self.source}] 리소스 측정 세션 실패(무시): {e}")
+        return meter
+
+    async def report(self, meter: TabMeter | None) -> None:
+        """탭을 닫기 직전에 호출 — 차단 건수 로깅, 측정 모드면 모드별 평균 갱신."""
+        if meter is None:
+            return
+        if meter.blocked:
+            logger.debug(f"[{self.source}] 리소스 {meter.blocked}건 차단")
+        if meter.cdp is None:
+            return
+        try:
+            metrics = await meter.cdp.send("Performance.getMetrics")
+            meter.js_heap_bytes = int(next(
+                (m["value"] for m in metrics.get("metrics", []) if m.get("name") == "JSHeapUsedSize"),
+                0,
+            ))
+            await meter.cdp.detach()
+        except Exception as e:
+            logger.debug(f"[{self.source}] 렌더러 메모리 측정 실패(무시): {e}")
+
+        totals = self._totals[meter.blocking]
+        totals.add(meter)
+        on_bytes, on_heap = self._totals[True].averages_mb()
+        off_bytes, off_heap = self._totals[False].averages_mb()
+        logger.info(
+            f"[{self.source}] 리소스 측정 ({'차단' if meter.blocking else '미차단'}) — "
+            f"이번 탭 {meter.bytes_received / 1024 / 1024:.1f}MB·힙 "
+            f"{meter.js_heap_bytes / 1024 / 1024:.0f}MB, 차단 {meter.blocked}건 | "
+            f"평균 차단 {on_bytes:.1f}MB·{on_heap:.0f}MB ({self._totals[True].tabs}회) vs "
+            f"미차단 {off_bytes:.1f}MB·{off_heap:.0f}MB ({self._totals[False].tabs}회)"
+        )
@@ -6,9 +6,7 @@ GraphQL 응답 인터셉트 + DOM 파싱 하이브리드로 피드를 수집한
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import random
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -33,6 +31,7 @@ class ThreadsCollector(BaseCdpCollector):
         return await check_session(
             self._cdp_url, "threads", self.FEED_URL, ["login"],
             login_markers='a[href*="/login"], input[autocomplete="username"], input[name="username"]',
+            manager=self._cdp,
         )
 
     async def login(self) -> bool:
@@ -54,13 +53,15 @@ class ThreadsCollector(BaseCdpCollector):
             invalid_keywords=["login"],
             initial_wait_ms=3000,
             submit_wait_ms=5000,
+            manager=self._cdp,
         )
 
     async def collect(self) -> list[Post]:
         """GraphQL 인터셉트 + DOM 파싱 하이브리드 방식으로 수집."""
-        async with cdp_connection(self._cdp_url, "threads") as (pw, context):
+        async with cdp_connection(self._cdp_url, "threads", self._cdp) as (pw, context):
             page = await context.new_page()  # 매 사이클 새 탭 (수집 후 닫아 메모리 회수)
             await minimize_window(page)
+            meter = await self._resources.attach(page)  # 이미지·폰트·트래킹 차단
             captured_data: list[dict[str, Any]] = []
 
             async def on_response(response):
@@ -82,13 +83,12 @@ class ThreadsCollector(BaseCdpCollector):
                 if "login" in page.url:
                     raise SessionExpiredError("threads — Chrome에서 Threads에 로그인 해주세요")
 
-                for _ in range(self._config.scroll_rounds):
-                    await page.mouse.wheel(0, random.randint(600, 1200))
-                    await asyncio.sleep(
-                        random.uniform(self._config.scroll_delay_min, self._config.scroll_delay_max)
-                    )
-
-                posts = self._parse_graphql_data(captured_data)
+                # 라운드마다 새로 잡힌 응답만 파싱해 누적 — 신규 수확률로 스크롤 중단/연장
+                posts, harvest = self._graphql_harvester(captured_data, self._parse_graphql_data)
+                self.scroll_stats = await self._scroll_for_novelty(page, harvest, (600, 1200))
+                harvest()  # 마지막 대기 중 도착한 응답까지
+                if self._recorder:
+                    self._recorder.record_many("threads", "graphql", captured_data)
 
                 if len(posts) < 5:
                     dom_posts = await self._collect_via_dom(page)
@@ -101,6 +101,7 @@ class ThreadsCollector(BaseCdpCollector):
                 return posts
 
             finally:
+                await self._resources.report(meter)
                 await page.close()  # 탭 닫아 렌더러 메모리 회수 (누수·먹통 방지)
 
     # ─── GraphQL 파싱 ───
@@ -6,9 +6,7 @@ GraphQL 응답을 인터셉트하는 방식으로 타임라인을 수집한다.
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import random
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -33,6 +31,7 @@ class TwitterCollector(BaseCdpCollector):
             self._cdp_url, "twitter", self.FEED_URL, ["login", "flow"],
             require_substr="/home",
             login_markers='[data-testid="loginButton"], a[href*="/i/flow/login"], a[href="/login"]',
+            manager=self._cdp,
         )
 
     async def login(self) -> bool:
@@ -43,7 +42,7 @@ class TwitterCollector(BaseCdpCollector):
 
         logger.info("[twitter] 자동 로그인 시도")
         try:
-            async with cdp_connection(self._cdp_url, "twitter") as (pw, context):
+            async with cdp_connection(self._cdp_url, "twitter", self._cdp) as (pw, context):
                 page = await context.new_page()
                 try:
                     await page.goto(
@@ -81,9 +80,10 @@ class TwitterCollector(BaseCdpCollector):
 
     async def collect(self) -> list[Post]:
         """Chrome CDP로 연결하여 GraphQL 인터셉트 방식으로 타임라인을 수집한다."""
-        async with cdp_connection(self._cdp_url, "twitter") as (pw, context):
+        async with cdp_connection(self._cdp_url, "twitter", self._cdp) as (pw, context):
             page = await context.new_page()  # 매 사이클 새 탭 (수집 후 닫아 메모리 회수)
             await minimize_window(page)
+            meter = await self._resources.attach(page)  # 이미지·폰트·트래킹 차단
             captured: list[dict[str, Any]] = []
 
             async def on_response(response):
@@ -106,17 +106,18 @@ class TwitterCollector(BaseCdpCollector):
                 if "login" in page.url or "flow" in page.url or "/home" not in page.url:
                     raise SessionExpiredError("twitter — Chrome에서 X에 로그인 해주세요 (로그아웃 감지)")
 
-                for _ in range(self._config.scroll_rounds):
-                    await page.mouse.wheel(0, random.randint(800, 1500))
-                    await asyncio.sleep(
-                        random.uniform(self._config.scroll_delay_min, self._config.scroll_delay_max)
-                    )
+                # 라운드마다 새로 잡힌 응답만 파싱해 누적 — 신규 수확률로 스크롤 중단/연장
+                posts, harvest = self._graphql_harvester(captured, self._parse_graphql_responses)
+                self.scroll_stats = await self._scroll_for_novelty(page, harvest, (800, 1500))
+                harvest()  # 마지막 대기 중 도착한 응답까지
+                if self._recorder:
+                    self._recorder.record_many("twitter", "graphql", captured)
 
-                posts = self._parse_graphql_responses(captured)
                 logger.info(f"[twitter] GraphQL 인터셉트: {len(posts)}건 수집")
                 return posts
 
             finally:
+                await self._resources.report(meter)
                 await page.close()  # 탭 닫아 렌더러 메모리 회수 (누수·먹통 방지)
 
     # ─── GraphQL 파싱 ───
@@ -9,20 +9,27 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from src.domain.entities import Category
+from src.application.use_cases.adaptive_schedule import AdaptiveSchedulePlanner
 from src.application.use_cases.collect_posts import CollectPostsUseCase
 from src.application.use_cases.follow_accounts import FollowAccountsUseCase
 from src.application.use_cases.generate_briefing import GenerateBriefingUseCase
 from src.application.use_cases.like_posts import LikePostsUseCase
 from src.application.use_cases.process_posts import ProcessPostsUseCase
 from src.infrastructure.ai.claude_code_processor import ClaudeCodeProcessor
+from src.infrastructure.ai.cli_runner import CliRunner
 from src.infrastructure.ai.codex_cli_processor import CodexCliProcessor
 from src.infrastructure.ai.hybrid_processor import HybridAIProcessor
+from src.infrastructure.ai.response_cache import LLMResponseCache
 from src.infrastructure.collectors.account_follower import CdpAccountFollower
+from src.infrastructure.collectors.cdp import CdpConnectionManager
 from src.infrastructure.collectors.dcinside_collector import DCInsideCollector
 from src.infrastructure.collectors.donga_series_collector import DongaSeriesCollector
+from src.infrastructure.collectors.http import SharedHttpClient, ValidatorCache
 from src.infrastructure.collectors.kr36_collector import Kr36Collector
 from src.infrastructure.collectors.linkedin_collector import LinkedInCollector
 from src.infrastructure.collectors.news_collector import NewsCollector
@@ -31,11 +38,13 @@ from src.infrastructure.collectors.producthunt_collector import ProductHuntColle
 from src.infrastructure.collectors.threads_collector import ThreadsCollector
 from src.infrastructure.collectors.twitter_collector import TwitterCollector
 from src.infrastructure.config.settings import AppConfig, Settings, SnsCredentials
+from src.infrastructure.database.post_archive import PostArchive
 from src.infrastructure.database.repositories.briefing_repo import FirestoreBriefingRepository
 from src.infrastructure.database.repositories.category_repo_memory import MemoryCategoryRepository
 from src.infrastructure.database.repositories.collection_run_repo_sqlite import SQLiteCollectionRunRepository
 from src.infrastructure.database.repositories.feedback_repo_sqlite import FeedbackRepositorySQLite
 from src.infrastructure.database.repositories.post_repo_sqlite import PostRepositorySQLite
+from src.infrastructure.database.seen_index import SeenPostIndex
 from src.infrastructure.delivery.briefing_builder import DefaultBriefingGenerator
 from src.infrastructure.delivery.email_sender import EmailNotifier
 from src.infrastructure.delivery.slack_sender import SlackNotifier
@@ -60,19 +69,42 @@ class Container:
         self._process_run_lock = asyncio.Lock()
 
         # ─── Repositories ───
-        self.post_repo = PostRepositorySQLite()
+        # 보존기한 경과 게시물은 월별 압축 아카이브로 (재채점·감사·백필용 이력)
+        self.post_archive = (
+            PostArchive(Path(app_config.storage.archive_dir))
+            if app_config.storage.archive_enabled
+            else None
+        )
+        self.post_repo = PostRepositorySQLite(archive=self.post_archive)
         self.briefing_repo = FirestoreBriefingRepository(firestore_db)  # 브리핑만 Firestore
         self.feedback_repo = FeedbackRepositorySQLite()  # 항목 피드백(적절/과대/과소)
         self.category_repo = MemoryCategoryRepository(
             [Category(name=c.name, name_ko=c.name_ko, color=c.color) for c in app_config.categories]
         )
         self.run_repo = SQLiteCollectionRunRepository()
+        # 이미 저장된 글 (source, external_id)+지문 인덱스 — 수집기·수집 유즈케이스 공용
+        self.seen_index = SeenPostIndex(
+            load_recent=partial(self.post_repo.iter_fingerprints, app_config.storage.seen_index_days),
+            lookup=self.post_repo.find_fingerprints,
+            capacity=app_config.storage.seen_index_capacity,
+        )
+        self.seen_index.warm()
+        # 소스별 수확률 → 수집 주기 (schedule.adaptive). 꺼져 있어도 대시보드에 계획을 보여 준다
+        self.schedule_planner = AdaptiveSchedulePlanner(
+            app_config.schedule,
+            app_config.collectors,
+            self.run_repo,
+            self.post_repo,
+            ZoneInfo(app_config.timezone),
+        )
 
         # ─── Infrastructure Services ───
         # AI 백엔드는 하이브리드: 고빈도 배치(필터·분류·검증 등)는 routine_backend
         # 설정으로 선택(현재 claude=정액 구독), 발행 작문·큐레이션은 Claude 고정.
         # Claude 장애 시 Codex CLI로 폴백한다. 두 경로 모두 구독 인증을 사용한다.
         # Codex 웹검증은 공용 DuckDuckGo 검증 파이프라인을 상속한다.
+        # 두 백엔드가 캐시 하나를 나눠 쓴다 (키에 백엔드가 들어간다)
+        response_cache = LLMResponseCache.from_config(app_config.processing)
         fallback_processor = CodexCliProcessor(
             config=app_config.processing,
             model_filter=app_config.processing.codex_model_filter,
@@ -84,6 +116,9 @@ class Container:
             effort_dedup=app_config.processing.codex_effort_dedup,
             effort_consolidate=app_config.processing.codex_effort_consolidate,
             timeout=app_config.processing.codex_timeout,
+            concurrency=app_config.processing.codex_concurrency,
+            response_cache=response_cache,
+            runner=CliRunner("codex", app_config.processing.codex_max_processes),
         )
         claude_processor = ClaudeCodeProcessor(
             config=app_config.processing,
@@ -93,6 +128,9 @@ class Container:
             model_consolidate=app_config.processing.claude_model_consolidate,
             timeout=app_config.processing.claude_timeout,
             oauth_token=settings.claude_code_oauth_token or None,
+            concurrency=app_config.processing.claude_concurrency,
+            response_cache=response_cache,
+            runner=CliRunner("claude", app_config.processing.claude_max_processes),
         )
         self.ai_processor = HybridAIProcessor(fallback_processor, claude_processor)
         # 슬랙 투표 1위 심층 글 등 파이프라인 밖 자유 프롬프트 실행용 직접 참조
@@ -105,11 +143,32 @@ class Container:
         # 슬랙 브리핑 게시 (헤더+스레드, 항목별 투표 리액션 선부착)
         self.slack_notifier = SlackNotifier(settings, app_config.slack)
 
+        # 사용자 Chrome(9222) 장수명 CDP 연결 — 수집기·좋아요·팔로우가 탭 단위로 빌려 쓴다
+        # (탭 예산·플랫폼 배제·수집 우선). 종료 시 aclose()
+        browser_config = app_config.browser
+        self.cdp = CdpConnectionManager(
+            f"http://127.0.0.1:{browser_config.cdp_port}",
+            tab_budget=browser_config.tab_budget,
+            health_check_s=browser_config.health_check_seconds,
+        )
+
         # 자동 좋아요 (AI 처리 후 관련+중요 게시물에만)
-        self.post_liker = CdpPostLiker(app_config.like)
-        self.account_follower = CdpAccountFollower(app_config.follow)
+        self.post_liker = CdpPostLiker(app_config.like, cdp=self.cdp)
+        self.account_follower = CdpAccountFollower(app_config.follow, cdp=self.cdp)
 
         # ─── Collectors ───
+        # HTTP 수집기 공용 연결 풀 (keep-alive·선택적 HTTP/2, 조건부 GET) — 종료 시 aclose()
+        http_config = app_config.http
+        self.http_client = SharedHttpClient(
+            timeout=http_config.timeout,
+            max_connections=http_config.max_connections,
+            max_keepalive_connections=http_config.max_keepalive_connections,
+            http2=http_config.http2,
+            validators=(
+                ValidatorCache(http_config.validator_cache_path)
+                if http_config.conditional_get else None
+            ),
+        )
         self.collectors: dict[str, object] = {}
         self._init_collectors()
 
@@ -117,7 +176,12 @@ class Container:
         collector_configs = self.config.collectors
 
         if "dcinside" in collector_configs and collector_configs["dcinside"].enabled:
-            self.collectors["dcinside"] = DCInsideCollector(collector_configs["dcinside"])
+            self.collectors["dcinside"] = DCInsideCollector(
+                collector_configs["dcinside"],
+                seen=self.seen_index,
+                http=self.http_client,
+                cdp=self.cdp,
+            )
 
         if (
             "donga_series" in collector_configs
@@ -125,17 +189,19 @@ class Container:
             and collector_configs["donga_series"].series_url
         ):
             self.collectors["donga_series"] = DongaSeriesCollector(
-                collector_configs["donga_series"]
+                collector_configs["donga_series"], http=self.http_client
             )
 
         if "36kr" in collector_configs and collector_configs["36kr"].enabled:
-            self.collectors["36kr"] = Kr36Collector(collector_configs["36kr"])
+            self.collectors["36kr"] = Kr36Collector(collector_configs["36kr"], http=self.http_client)
 
         if "producthunt" in collector_configs and collector_configs["producthunt"].enabled:
-            self.collectors["producthunt"] = ProductHuntCollector(collector_configs["producthunt"])
+            self.collectors["producthunt"] = ProductHuntCollector(
+                collector_configs["producthunt"], http=self.http_client
+            )
 
         if "news" in collector_configs and collector_configs["news"].enabled:
-            self.collectors["news"] = NewsCollector(collector_configs["news"])
+            self.collectors["news"] = NewsCollector(collector_configs["news"], http=self.http_client)
 
         # SNS 수집기 — 모두 CDP 기반 (사용자의 Chrome에 연결)
         if "twitter" in collector_configs and collector_configs["twitter"].enabled:
@@ -145,6 +211,8 @@ class Container:
                     self.settings.twitter_username,
                     self.settings.twitter_password,
                 ),
+                known_ids=partial(self.seen_index.known_ids, "twitter"),
+                cdp=self.cdp,
             )
         if "threads" in collector_configs and collector_configs["threads"].enabled:
             self.collectors["threads"] = ThreadsCollector(
@@ -153,6 +221,8 @@ class Container:
                     self.settings.threads_username,
                     self.settings.threads_password,
                 ),
+                known_ids=partial(self.seen_index.known_ids, "threads"),
+                cdp=self.cdp,
             )
         if "linkedin" in collector_configs and collector_configs["linkedin"].enabled:
             self.collectors["linkedin"] = LinkedInCollector(
@@ -161,10 +231,16 @@ class Container:
                     self.settings.linkedin_email,
                     self.settings.linkedin_password,
                 ),
+                cdp=self.cdp,
             )
 
     # ─── Use Case 팩토리 ───
 
+    async def aclose(self) -> None:
+        """종료 시 장수명 자원 정리 (HTTP 연결 풀·CDP 연결)."""
+        await self.http_client.aclose()
+        await self.cdp.aclose()
+
     def collect_posts_use_case(self, source: str) -> CollectPostsUseCase:
         collector = self.collectors.get(source)
         if collector is None:
@@ -173,6 +249,7 @@ class Container:
             collector=collector,
             post_repo=self.post_repo,
             run_repo=self.run_repo,
+            seen=self.seen_index,
         )
 
     def process_posts_use_case(self) -> ProcessPostsUseCase:
@@ -186,6 +263,7 @@ class Container:
             post_repo=self.post_repo,
             ai_processor=self.ai_processor,
             run_lock=self._process_run_lock,
+            pipeline_depth=self.config.processing.pipeline_depth,
         )
 
     def like_posts_use_case(self) -> LikePostsUseCase:
@@ -210,6 +288,7 @@ class Container:
             briefing_generator=self.briefing_generator,
             scoring_config=self.config.scoring,
             feedback_repo=self.feedback_repo,
+            seen=self.seen_index,
         )
 
     @staticmethod
@@ -68,21 +68,48 @@ class CollectorConfig:
     def __init__(self, data: dict[str, Any]):
         self.enabled: bool = data.get("enabled", True)
         self.interval_minutes: int = data.get("interval_minutes", 30)
+        # schedule.adaptive 모드에서 주기 하한/상한(분). 0이면 interval_minutes × min/max_factor
+        self.min_interval_minutes: int = data.get("min_interval_minutes", 0)
+        self.max_interval_minutes: int = data.get("max_interval_minutes", 0)
         self.scroll_rounds: int = data.get("scroll_rounds", 6)
         self.scroll_delay_min: float = data.get("scroll_delay_min", 2.0)
         self.scroll_delay_max: float = data.get("scroll_delay_max", 4.0)
+        # 신규 수확률 기반 스크롤 (twitter/threads) — 라운드당 처음 보는 글이 min_new_per_round
+        # 미만이면 저조. stale_rounds번 연속 저조면 scroll_rounds 전이라도 멈추고, 끝까지
+        # 수확이 이어지면 max_scroll_rounds까지 연장한다. min_scroll_rounds 전에는 멈추지 않는다.
+        self.min_new_per_round: int = data.get("min_new_per_round", 2)
+        self.stale_rounds: int = data.get("stale_rounds", 2)
+        self.min_scroll_rounds: int = data.get("min_scroll_rounds", 2)
+        self.max_scroll_rounds: int = data.get("max_scroll_rounds", self.scroll_rounds)
         self.use_graphql_interception: bool = data.get("use_graphql_interception", True)
+        # 수집 탭 리소스 차단 (twitter/threads/linkedin) — Playwright resource_type·URL 부분 문자열.
+        # allow_url_patterns가 우선(GraphQL 등 수집 엔드포인트 보호). 측정 모드는 회차마다
+        # 차단 on/off를 번갈아 전송 바이트·렌더러 힙을 비교 로깅한다.
+        self.block_resource_types: list[str] = data.get("block_resource_types", [])
+        self.block_url_patterns: list[str] = data.get("block_url_patterns", [])
+        self.allow_url_patterns: list[str] = data.get("allow_url_patterns", [])
+        self.measure_resource_blocking: bool = data.get("measure_resource_blocking", False)
+        # 원본 페이로드(JSON·HTML·XML)를 data/payloads/<source>/에 기록 — 오프라인 재생·파서 벤치용
+        self.record_payloads: bool = data.get("record_payloads", False)
         # DCInside 전용
         self.gallery_id: str = data.get("gallery_id", "thesingularity")
         self.gallery_type: str = data.get("gallery_type", "mgallery")
         self.pages_to_scrape: int = data.get("pages_to_scrape", 3)
         self.request_delay_min: float = data.get("request_delay_min", 1.5)
         self.request_delay_max: float = data.get("request_delay_max", 3.0)
+        # 상세 페이지 HTTP 수집 — 동시 요청 상한 / 요청 시작 간 최소 간격(초)
+        self.detail_concurrency: int = data.get("detail_concurrency", 3)
+        self.detail_interval: float = data.get("detail_interval", 0.4)
         # 수집 단계 게시일 컷오프 (collection.max_age_days에서 주입)
         self.max_age_days: int = data.get("max_age_days", 2)
         # news 전용 — RSS/Atom 피드 선언 목록 [{name, tier, url}] + 피드당 항목 상한
         self.feeds: list[dict[str, Any]] = data.get("feeds", [])
         self.max_items_per_feed: int = data.get("max_items_per_feed", 30)
+        # 컷오프보다 오래된 항목이 이만큼 연속이면 남은 피드는 받지 않는다 (0이면 끝까지)
+        self.feed_stale_stop: int = data.get("feed_stale_stop", 3)
+        # news 전용 — 동시에 받는 피드 수 상한 / 같은 호스트 동시 요청 상한(Google News 프록시 보호)
+        self.feed_concurrency: int = data.get("feed_concurrency", 6)
+        self.per_host_concurrency: int = data.get("per_host_concurrency", 1)
         # donga_series 전용 — 연재 페이지 URL과 표시용 시리즈명
         self.series_url: str = data.get("series_url", "")
         self.series_name: str = data.get("series_name", "연재")
@@ -133,12 +160,32 @@ class ProcessingConfig:
         self.routine_backend: str = data.get(
             "routine_backend", data.get("filter_backend", "codex")
         )
+        # 필터·분류 배치 동시 호출 상한 — 백엔드별, 티어별({"filter": 3}).
+        # 없는 티어는 1(순차). CLI 프로세스가 그만큼 동시에 떠 구독 한도를 빨리 쓴다.
+        self.claude_concurrency: dict[str, int] = data.get("claude_concurrency", {})
+        self.codex_concurrency: dict[str, int] = data.get("codex_concurrency", {})
+        # 백엔드별 동시 CLI 자식 프로세스 상한 (cli_runner.CliRunner) — 배치 동시 호출·
+        # 큐레이션·검증 등 모든 호출이 나눠 쓴다.
+        self.claude_max_processes: int = data.get("claude_max_processes", 4)
+        self.codex_max_processes: int = data.get("codex_max_processes", 4)
+        # LLM 응답 디스크 캐시 (response_cache.py) — 같은 프롬프트 재호출을 한도 소비 없이
+        self.llm_cache: bool = data.get("llm_cache", True)
+        self.llm_cache_dir: str = data.get("llm_cache_dir", "data/llm_cache")
+        self.llm_cache_ttl_hours: float = data.get("llm_cache_ttl_hours", 24.0)
+        self.llm_cache_max_mb: float = data.get("llm_cache_max_mb", 64.0)
+        # 배치 크기 상한(건). token_budget_*가 0이 아니면 게시물 JSON 어림 토큰 합이
+        # 예산에 찰 때까지 채운다 — 배치당 batch_min_posts ~ batch_size_* 건.
         self.batch_size_filter: int = data.get("batch_size_filter", 20)
         self.batch_size_categorize: int = data.get("batch_size_categorize", 20)
+        self.token_budget_filter: int = data.get("token_budget_filter", 0)
+        self.token_budget_categorize: int = data.get("token_budget_categorize", 0)
+        self.batch_min_posts: int = data.get("batch_min_posts", 5)
         self.dedup_chunk_size: int = data.get("dedup_chunk_size", 80)
         # verify_claims: 웹검증 대상 주장 상한(C) — 호출/쿼터 절감
         self.verify_max_claims: int = data.get("verify_max_claims", 8)
         self.processing_interval_minutes: int = data.get("processing_interval_minutes", 30)
+        # 필터를 마치고 분류·저장을 기다릴 수 있는 청크 수 (ProcessPostsUseCase 파이프라인)
+        self.pipeline_depth: int = data.get("pipeline_depth", 1)
         self.min_posts_to_process: int = data.get("min_posts_to_process", 5)
 
 
@@ -335,6 +382,66 @@ class ScoringConfig:
         self.category_base: dict[str, float] = data.get("category_base", {})
 
 
+class StorageConfig:
+    """로컬 게시물 DB 보존기한·콜드 스토리지 설정."""
+
+    def __init__(self, data: dict[str, Any]):
+        # 보존기한 경과분을 지우지 않고 월별 압축 아카이브로 옮긴다 (false면 기존처럼 삭제)
+        self.archive_enabled: bool = data.get("archive_enabled", True)
+        self.archive_dir: str = data.get("archive_dir", "data/archive")
+        self.retention_days: int = data.get("retention_days", 30)
+        # 수집 컷오프(max_age_days)보다 길어야 정리→재수집→재필터링 루프가 없다
+        self.irrelevant_retention_days: int = data.get("irrelevant_retention_days", 3)
+        # 이미 저장된 글 인덱스(블룸+LRU) — 시작 시 최근 N일치를 적재, LRU 상한
+        self.seen_index_days: int = data.get("seen_index_days", 7)
+        self.seen_index_capacity: int = data.get("seen_index_capacity", 50_000)
+
+
+class HttpConfig:
+    """HTTP 수집기 공용 클라이언트(SharedHttpClient) 설정."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.timeout: float = data.get("timeout", 20.0)
+        self.max_connections: int = data.get("max_connections", 20)
+        self.max_keepalive_connections: int = data.get("max_keepalive_connections", 10)
+        # HTTP/2는 h2 패키지 필요 (없으면 경고 후 HTTP/1.1)
+        self.http2: bool = data.get("http2", False)
+        # 조건부 GET (ETag·Last-Modified·본문 해시) — 변경 없는 피드·페이지는 파싱 생략
+        self.conditional_get: bool = data.get("conditional_get", True)
+        self.validator_cache_path: str = data.get(
+            "validator_cache_path", "data/http_validators.json"
+        )
+
+
+class BrowserConfig:
+    """사용자 디버그 Chrome(CDP) 공용 연결·탭 스케줄링 설정."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.cdp_port: int = data.get("cdp_port", 9222)
+        # 동시에 열어 둘 작업 탭 수 상한 (수집·좋아요·팔로우 합산, 플랫폼당은 항상 1)
+        self.tab_budget: int = data.get("tab_budget", 3)
+        # 이 시간(초) 넘게 쉰 연결은 빌려주기 전에 Browser.getVersion으로 점검
+        self.health_check_seconds: float = data.get("health_check_seconds", 60.0)
+
+
+class ScheduleConfig:
+    """수집 주기 adaptive 모드 — 소스·요일시간대별 관련 게시물 수확률로 주기를 늘리고 줄인다."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.adaptive: bool = data.get("adaptive", False)
+        # 수확률 집계 기간(일) — 요일×시간 168칸이 각각 몇 번씩은 차도록 몇 주
+        self.lookback_days: int = data.get("lookback_days", 28)
+        # 표본이 적은 칸은 이만큼의 가상 실행(소스 평균 수확률)을 섞어 평균 쪽으로 당긴다
+        self.prior_runs: float = data.get("prior_runs", 4.0)
+        # 소스 전체 실행이 이보다 적으면 판단을 미루고 고정 주기
+        self.min_runs: int = data.get("min_runs", 20)
+        # 고정 주기 대비 배율 범위 (소스별 min/max_interval_minutes가 있으면 그쪽)
+        self.min_factor: float = data.get("min_factor", 0.5)
+        self.max_factor: float = data.get("max_factor", 4.0)
+        # 매시 이 분에 다음 시간대 주기를 다시 정한다
+        self.replan_minute: int = data.get("replan_minute", 55)
+
+
 class WebConfig:
     def __init__(self, data: dict[str, Any]):
         self.host: str = data.get("host", "0.0.0.0")
@@ -371,6 +478,10 @@ class AppConfig:
         self.email = EmailConfig(data.get("email", {}))
         self.slack = SlackConfig(data.get("slack", {}))
         self.web = WebConfig(data.get("web", {}))
+        self.storage = StorageConfig(data.get("storage", {}))
+        self.http = HttpConfig(data.get("http", {}))
+        self.browser = BrowserConfig(data.get("browser", {}))
+        self.schedule = ScheduleConfig(data.get("schedule", {}))
 
         # 수신자 개인화 한도(코딩 10개 등)를 생성 단계 슈퍼셋 상한에 반영.
         # 생성 시 넉넉히 뽑아 저장하고, 발송 시 수신자별로 트리밍한다.
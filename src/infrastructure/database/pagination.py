@@ -0,0 +1,38 @@
+"""키셋(커서) 페이지네이션용 불투명 커서 토큰.
+
+OFFSET 페이지네이션은 앞 페이지 행을 전부 읽고 버리므로 깊은 페이지일수록
+느려지고, Firestore에서는 건너뛴 문서까지 읽기 요금이 붙는다. 대신 직전 페이지
+마지막 행의 정렬 키(예: collected_at, id)를 커서로 넘겨 "그 다음부터" 읽는다.
+
+커서 내용은 저장소 구현이 정하고, 바깥(API·템플릿)에는 base64url 문자열로만
+보인다 — 클라이언트는 받은 next_cursor를 그대로 돌려주기만 하면 된다.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """해독할 수 없거나 현재 조회 조건과 맞지 않는 커서."""
+
+
+def encode_cursor(key: dict[str, Any]) -> str:
+    """정렬 키 dict → 불투명 커서 문자열."""
+    raw = json.dumps(key, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    """불투명 커서 문자열 → 정렬 키 dict. 손상된 토큰이면 InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"잘못된 커서: {token[:40]}") from e
+    if not isinstance(key, dict):
+        raise InvalidCursorError(f"잘못된 커서: {token[:40]}")
+    return key
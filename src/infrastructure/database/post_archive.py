@@ -0,0 +1,213 @@
+"""오래된 게시물 콜드 스토리지 — 월별 압축 아카이브 파일.
+
+핫 DB(data/posts.db)에서 보존기한이 지난 게시물을 지우는 대신 이리로 옮긴다.
+재채점·감사·백필용 이력은 남기고, 핫 DB는 작게 유지해 인덱스가 캐시에 머물게 한다.
+
+- 파일: {root}/posts-YYYY-MM.db (collected_at 기준 월) — 월별 SQLite 파일.
+- 행: 조회 조건용 컬럼(id·source·collected_at·is_relevant·importance_score)만
+  평문으로 두고, 원본 posts 행 전체(content_html 포함)는 JSON을 zlib으로 압축한 BLOB.
+- 추가 전용(append-only): 같은 id는 INSERT OR IGNORE — 이동 도중 실패해 재시도돼도
+  중복되지 않는다. 아카이브에서 행을 고치거나 지우는 경로는 없다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.domain.entities import Post
+
+_FILE_RE = re.compile(r"^posts-(\d{4}-\d{2})\.db$")
+
+# zlib 압축 레벨 — 6(기본)이 속도·압축률 균형. 아카이브는 쓰기 1회·읽기 드묾
+_COMPRESS_LEVEL = 6
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS archived_posts (
+        id TEXT PRIMARY KEY,
+        source TEXT NOT NULL,
+        collected_at TIMESTAMP,
+        is_relevant INTEGER,
+        importance_score REAL,
+        reason TEXT,
+        archived_at TIMESTAMP NOT NULL,
+        payload BLOB NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_archived_collected ON archived_posts(collected_at);
+    CREATE INDEX IF NOT EXISTS idx_archived_source ON archived_posts(source, collected_at);
+"""
+
+
+def _month_of(collected_at: Any) -> str:
+    """collected_at(저장된 문자열 또는 datetime) → 'YYYY-MM'. 알 수 없으면 이번 달."""
+    if isinstance(collected_at, datetime):
+        return collected_at.strftime("%Y-%m")
+    if isinstance(collected_at, str) and re.match(r"^\d{4}-\d{2}", collected_at):
+        return collected_at[:7]
+    return datetime.now().strftime("%Y-%m")
+
+
+def _compress(row: dict[str, Any]) -> bytes:
+    raw = json.dumps(row, ensure_ascii=False, default=str).encode("utf-8")
+    return zlib.compress(raw, _COMPRESS_LEVEL)
+
+
+def _decompress(blob: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class PostArchive:
+    """월별 압축 아카이브 파일 묶음 (쓰기: append, 읽기: iter_posts/get)."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, month: str) -> Path:
+        return self.root / f"posts-{month}.db"
+
+    def _connect(self, path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # ─── 쓰기 ───
+
+    def append(self, rows: list[dict[str, Any]], reason: str = "") -> int:
+        """posts 행(dict) 목록을 해당 월 파일에 추가. 새로 들어간 건수 반환.
+
+        호출부는 이 함수가 정상 반환한 뒤에만 핫 DB에서 지워야 한다(커밋 후 반환).
+        """
+        if not rows:
+            return 0
+        by_month: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            by_month.setdefault(_month_of(row.get("collected_at")), []).append(row)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        archived_at = datetime.now().isoformat(sep=" ")
+        added = 0
+        for month, month_rows in sorted(by_month.items()):
+            conn = self._connect(self._path(month))
+            try:
+                conn.executescript(_SCHEMA)
+                before = conn.total_changes
+                conn.executemany(
+                    """INSERT OR IGNORE INTO archived_posts
+                       (id, source, collected_at, is_relevant, importance_score,
+                        reason, archived_at, payload)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    [
+                        (
+                            r["id"], r["source"], r.get("collected_at"), r.get("is_relevant"),
+                            r.get("importance_score"), reason, archived_at, _compress(r),
+                        )
+                        for r in month_rows
+                    ],
+                )
+                conn.commit()
+                added += conn.total_changes - before
+            finally:
+                conn.close()
+        return added
+
+    # ─── 읽기 (백필·감사용) ───
+
+    def months(self) -> list[str]:
+        """아카이브가 있는 월 목록 ('YYYY-MM', 오래된 순)."""
+        if not self.root.exists():
+            return []
+        found = (_FILE_RE.match(p.name) for p in self.root.iterdir())
+        return sorted(m.group(1) for m in found if m)
+
+    def iter_rows(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        source: str | None = None,
+        relevant_only: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """조건에 맞는 원본 posts 행(dict)을 오래된 순으로 하나씩 돌려준다.
+
+        월 파일 단위로 범위 밖 파일은 열지 않고, 행은 커서로 흘려보내 메모리를 일정하게 유지한다.
+        """
+        first = start.strftime("%Y-%m") if start else None
+        last = end.strftime("%Y-%m") if end else None
+        conditions, params = [], []
+        if start:
+            conditions.append("collected_at >= ?")
+            params.append(start)
+        if end:
+            conditions.append("collected_at < ?")
+            params.append(end)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if relevant_only:
+            conditions.append("is_relevant = 1")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        for month in self.months():
+            if (first and month < first) or (last and month > last):
+                continue
+            conn = self._connect(self._path(month))
+            try:
+                cursor = conn.execute(
+                    f"SELECT payload FROM archived_posts {where} ORDER BY collected_at",
+                    params,
+                )
+                for (blob,) in cursor:
+                    yield _decompress(blob)
+            finally:
+                conn.close()
+
+    def iter_posts(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        source: str | None = None,
+        relevant_only: bool = False,
+    ) -> Iterator[Post]:
+        """iter_rows의 Post 엔티티 버전 (재채점·백필 입력용)."""
+        from src.infrastructure.database.repositories.post_repo_sqlite import _post_from_row
+
+        for row in self.iter_rows(start, end, source=source, relevant_only=relevant_only):
+            yield _post_from_row(row)
+
+    def get(self, post_id: str) -> Post | None:
+        """id로 아카이브된 게시물 1건 조회 (최근 월부터 탐색)."""
+        from src.infrastructure.database.repositories.post_repo_sqlite import _post_from_row
+
+        for month in reversed(self.months()):
+            conn = self._connect(self._path(month))
+            try:
+                row = conn.execute(
+                    "SELECT payload FROM archived_posts WHERE id = ?", (post_id,)
+                ).fetchone()
+            finally:
+                conn.close()
+            if row:
+                return _post_from_row(_decompress(row[0]))
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """월별 파일 수·행 수·크기 (정리 로그·/api/stats 용)."""
+        months = self.months()
+        total_rows, total_bytes = 0, 0
+        for month in months:
+            path = self._path(month)
+            total_bytes += path.stat().st_size
+            conn = self._connect(path)
+            try:
+                total_rows += conn.execute("SELECT COUNT(*) FROM archived_posts").fetchone()[0]
+            finally:
+                conn.close()
+        return {
+            "files": len(months),
+            "rows": total_rows,
+            "size_mb": round(total_bytes / (1024 * 1024), 2),
+        }
@@ -12,6 +12,11 @@ from datetime import datetime
 from typing import Any
 
 from src.domain.entities import Briefing, BriefingItem
+from src.infrastructure.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 def _briefing_to_dict(b: Briefing) -> dict[str, Any]:
@@ -134,6 +139,40 @@ class FirestoreBriefingRepository:
 
         return await asyncio.to_thread(_get)
 
+    async def get_page(
+        self, limit: int = 20, cursor: str | None = None
+    ) -> tuple[list[Briefing], str | None]:
+        """최신순 키셋 페이지 — (브리핑, 다음 페이지 커서 또는 None).
+
+        (generated_at DESC, 문서 id DESC)로 정렬해 커서 뒤(start_after)부터 limit+1건만
+        읽는다. offset 방식은 건너뛴 문서도 읽기 요금이 붙어 깊은 페이지일수록 비싸다.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if after is not None:
+            try:
+                after_at = datetime.fromisoformat(after["g"])
+                after_id = str(after["i"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise InvalidCursorError("브리핑 커서 형식 오류") from e
+
+        def _get():
+            query = (
+                self._col()
+                .order_by("generated_at", direction="DESCENDING")
+                .order_by("__name__", direction="DESCENDING")
+            )
+            if after is not None:
+                query = query.start_after({"generated_at": after_at, "__name__": after_id})
+            docs = list(query.limit(limit + 1).stream())
+            briefings = [_briefing_from_doc(d) for d in docs[:limit]]
+            next_cursor = None
+            if len(docs) > limit and briefings:
+                last = briefings[-1]
+                next_cursor = encode_cursor({"g": last.generated_at.isoformat(), "i": last.id})
+            return briefings, next_cursor
+
+        return await asyncio.to_thread(_get)
+
     async def update(self, briefing: Briefing) -> Briefing:
         def _update():
             self._col().document(briefing.id).update({
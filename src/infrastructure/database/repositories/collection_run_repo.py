@@ -6,6 +6,8 @@ Firestore 컬렉션: 'collection_runs'
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
+from datetime import datetime
 
 from src.domain.entities import CollectionRun
 
@@ -17,6 +19,12 @@ def _run_to_dict(run: CollectionRun) -> dict:
         "completed_at": run.completed_at,
         "status": run.status,
         "posts_collected": run.posts_collected,
+        "posts_inserted": run.posts_inserted,
+        "posts_updated": run.posts_updated,
+        "posts_unchanged": run.posts_unchanged,
+        "http_requests": run.http_requests,
+        "http_cache_hits": run.http_cache_hits,
+        "scroll_yields": run.scroll_yields,
         "error_message": run.error_message,
     }
 
@@ -30,6 +38,12 @@ def _run_from_doc(doc) -> CollectionRun:
         completed_at=d.get("completed_at"),
         status=d.get("status", "running"),
         posts_collected=d.get("posts_collected", 0),
+        posts_inserted=d.get("posts_inserted", 0),
+        posts_updated=d.get("posts_updated", 0),
+        posts_unchanged=d.get("posts_unchanged", 0),
+        http_requests=d.get("http_requests", 0),
+        http_cache_hits=d.get("http_cache_hits", 0),
+        scroll_yields=d.get("scroll_yields") or [],
         error_message=d.get("error_message"),
     )
 
@@ -58,6 +72,12 @@ class FirestoreCollectionRunRepository:
                 "completed_at": run.completed_at,
                 "status": run.status,
                 "posts_collected": run.posts_collected,
+                "posts_inserted": run.posts_inserted,
+                "posts_updated": run.posts_updated,
+                "posts_unchanged": run.posts_unchanged,
+                "http_requests": run.http_requests,
+                "http_cache_hits": run.http_cache_hits,
+                "scroll_yields": run.scroll_yields,
                 "error_message": run.error_message,
             })
             return run
@@ -106,3 +126,16 @@ class FirestoreCollectionRunRepository:
             return [_run_from_doc(d) for d in query.stream()]
 
         return await asyncio.to_thread(_get)
+
+    async def count_runs_by_hour(self, since: datetime) -> dict[tuple[str, str], int]:
+        def _count():
+            query = self._col().where("started_at", ">=", since)
+            runs: Counter[tuple[str, str]] = Counter()
+            for doc in query.stream():
+                d = doc.to_dict()
+                if d.get("status") in ("success", "partial") and d.get("started_at"):
+                    hour = d["started_at"].strftime("%Y-%m-%d %H:00:00")
+                    runs[(d.get("source", ""), hour)] += 1
+            return dict(runs)
+
+        return await asyncio.to_thread(_count)
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from datetime import datetime
 
 from src.domain.entities import CollectionRun
-from src.infrastructure.database.repositories.post_repo_sqlite import _get_db, _parse_dt, DB_PATH
+from src.infrastructure.database.repositories.post_repo_sqlite import (
+    DB_PATH,
+    _get_db,
+    _get_read_db,
+    _parse_dt,
+    _write_async,
+)
 
 
 def _init_table() -> None:
@@ -22,6 +29,15 @@ def _init_table() -> None:
             error_message TEXT
         )
     """)
+    # 신규/변경/무변경 건수·조건부 GET 적중 컬럼 마이그레이션 (기존 DB 호환)
+    existing_cols = {row[1] for row in conn.execute("PRAGMA table_info(collection_runs)")}
+    for col in (
+        "posts_inserted", "posts_updated", "posts_unchanged", "http_requests", "http_cache_hits",
+    ):
+        if col not in existing_cols:
+            conn.execute(f"ALTER TABLE collection_runs ADD COLUMN {col} INTEGER DEFAULT 0")
+    if "scroll_yields" not in existing_cols:
+        conn.execute("ALTER TABLE collection_runs ADD COLUMN scroll_yields TEXT")
     conn.commit()
 
 
@@ -33,6 +49,12 @@ def _run_from_row(row: sqlite3.Row) -> CollectionRun:
         completed_at=_parse_dt(row["completed_at"]),
         status=row["status"],
         posts_collected=row["posts_collected"],
+        posts_inserted=row["posts_inserted"] or 0,
+        posts_updated=row["posts_updated"] or 0,
+        posts_unchanged=row["posts_unchanged"] or 0,
+        http_requests=row["http_requests"] or 0,
+        http_cache_hits=row["http_cache_hits"] or 0,
+        scroll_yields=json.loads(row["scroll_yields"]) if row["scroll_yields"] else [],
         error_message=row["error_message"],
     )
 
@@ -42,29 +64,29 @@ class SQLiteCollectionRunRepository:
         _init_table()
 
     async def save(self, run: CollectionRun) -> CollectionRun:
-        conn = _get_db()
-        cur = conn.execute(
+        run.id = await _write_async(lambda conn: conn.execute(
             """INSERT INTO collection_runs (source, started_at, status, posts_collected, error_message)
                VALUES (?, ?, ?, ?, ?)""",
             (run.source, run.started_at, run.status, run.posts_collected, run.error_message),
-        )
-        conn.commit()
-        run.id = cur.lastrowid
+        ).lastrowid)
         return run
 
     async def update(self, run: CollectionRun) -> CollectionRun:
-        conn = _get_db()
-        conn.execute(
+        await _write_async(lambda conn: conn.execute(
             """UPDATE collection_runs
-               SET completed_at=?, status=?, posts_collected=?, error_message=?
+               SET completed_at=?, status=?, posts_collected=?, posts_inserted=?,
+                   posts_updated=?, posts_unchanged=?, http_requests=?, http_cache_hits=?,
+                   scroll_yields=?, error_message=?
                WHERE id=?""",
-            (run.completed_at, run.status, run.posts_collected, run.error_message, run.id),
-        )
-        conn.commit()
+            (run.completed_at, run.status, run.posts_collected, run.posts_inserted,
+             run.posts_updated, run.posts_unchanged, run.http_requests, run.http_cache_hits,
+             json.dumps(run.scroll_yields) if run.scroll_yields else None,
+             run.error_message, run.id),
+        ))
         return run
 
     async def get_last_successful(self, source: str) -> CollectionRun | None:
-        conn = _get_db()
+        conn = _get_read_db()
         row = conn.execute(
             """SELECT * FROM collection_runs
                WHERE source=? AND status='success'
@@ -74,7 +96,7 @@ class SQLiteCollectionRunRepository:
         return _run_from_row(row) if row else None
 
     async def count_consecutive_failures(self, source: str) -> int:
-        conn = _get_db()
+        conn = _get_read_db()
         rows = conn.execute(
             """SELECT status FROM collection_runs
                WHERE source=? ORDER BY started_at DESC LIMIT 10""",
@@ -89,9 +111,22 @@ class SQLiteCollectionRunRepository:
         return count
 
     async def get_recent(self, limit: int = 20) -> list[CollectionRun]:
-        conn = _get_db()
+        conn = _get_read_db()
         rows = conn.execute(
             "SELECT * FROM collection_runs ORDER BY started_at DESC LIMIT ?",
             (limit,),
         ).fetchall()
         return [_run_from_row(r) for r in rows]
+
+    async def count_runs_by_hour(self, since: datetime) -> dict[tuple[str, str], int]:
+        """(소스, 시작 시각의 UTC 시 키)별 끝난 수집 횟수 — 수확률(관련 게시물/실행)의 분모.
+        시 키는 post_hourly_counts.hour와 같은 포맷이다."""
+        conn = _get_read_db()
+        rows = conn.execute(
+            """SELECT source, strftime('%Y-%m-%d %H:00:00', started_at) AS hour, COUNT(*) AS runs
+               FROM collection_runs
+               WHERE started_at >= ? AND status IN ('success', 'partial')
+               GROUP BY source, hour""",
+            (since,),
+        ).fetchall()
+        return {(r["source"], r["hour"]): r["runs"] for r in rows}
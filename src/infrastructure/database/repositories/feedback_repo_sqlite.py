@@ -11,12 +11,32 @@ from __future__ import annotations
 
 import json
 
-# 같은 DB 파일(data/posts.db)을 쓰므로 post_repo의 커넥션 팩토리(WAL/타임아웃 포함)를
-# 공유한다 — 스레드당 핸들을 하나로 통일해 락 경합을 줄인다.
-from src.infrastructure.database.repositories.post_repo_sqlite import DB_PATH, _get_db
+# 같은 DB 파일(data/posts.db)을 쓰므로 post_repo의 커넥션 팩토리(WAL/타임아웃 포함)와
+# 단일 writer를 공유한다 — 쓰기는 writer 스레드 하나로 모아 락 경합을 없앤다.
+from src.infrastructure.database.repositories.post_repo_sqlite import (
+    DB_PATH,
+    _get_db,
+    _get_read_db,
+    _write,
+    _write_async,
+)
 
 VALID_LABELS = {"appropriate", "over", "under"}
 
+_UPSERT_SQL = """
+    INSERT INTO briefing_feedback
+        (briefing_id, item_index, headline, category, importance_score,
+         tier, features, label, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(briefing_id, item_index) DO UPDATE SET
+        label=excluded.label,
+        headline=excluded.headline,
+        category=excluded.category,
+        importance_score=excluded.importance_score,
+        tier=excluded.tier,
+        features=excluded.features
+"""
+
 
 class FeedbackRepositorySQLite:
     def __init__(self):
@@ -53,31 +73,31 @@ class FeedbackRepositorySQLite:
         label: str,
     ) -> None:
         """항목 피드백 저장(같은 항목 재클릭 시 라벨 갱신)."""
-        conn = _get_db()
-        conn.execute(
-            """
-            INSERT INTO briefing_feedback
-                (briefing_id, item_index, headline, category, importance_score,
-                 tier, features, label, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(briefing_id, item_index) DO UPDATE SET
-                label=excluded.label,
-                headline=excluded.headline,
-                category=excluded.category,
-                importance_score=excluded.importance_score,
-                tier=excluded.tier,
-                features=excluded.features
-            """,
-            (
-                str(briefing_id), int(item_index), headline, category,
-                importance_score, tier, json.dumps(features or {}, ensure_ascii=False), label,
-            ),
+        params = _upsert_params(
+            briefing_id, item_index, headline, category, importance_score, tier, features, label,
         )
-        conn.commit()
+        _write(lambda conn: conn.execute(_UPSERT_SQL, params))
+
+    async def upsert_async(
+        self,
+        briefing_id: str,
+        item_index: int,
+        headline: str,
+        category: str | None,
+        importance_score: float | None,
+        tier: str | None,
+        features: dict | None,
+        label: str,
+    ) -> None:
+        """upsert의 비동기판 — 웹 라우트에서 그룹 커밋을 기다리며 이벤트 루프를 막지 않는다."""
+        params = _upsert_params(
+            briefing_id, item_index, headline, category, importance_score, tier, features, label,
+        )
+        await _write_async(lambda conn: conn.execute(_UPSERT_SQL, params))
 
     def get_for_briefing(self, briefing_id: str) -> dict[int, str]:
         """해당 브리핑의 {item_index: label} 조회 (버튼 상태 표시용)."""
-        conn = _get_db()
+        conn = _get_read_db()
         rows = conn.execute(
             "SELECT item_index, label FROM briefing_feedback WHERE briefing_id = ?",
             (str(briefing_id),),
@@ -86,7 +106,7 @@ class FeedbackRepositorySQLite:
 
     def get_examples(self, limit: int = 40) -> list[dict]:
         """캘리브레이션용 예시 — 과대/과소로 라벨된 최근 항목 (few-shot 재료)."""
-        conn = _get_db()
+        conn = _get_read_db()
         rows = conn.execute(
             """
             SELECT headline, category, label, tier FROM briefing_feedback
@@ -98,5 +118,14 @@ class FeedbackRepositorySQLite:
         return [dict(r) for r in rows]
 
     def count(self) -> int:
-        conn = _get_db()
+        conn = _get_read_db()
         return conn.execute("SELECT COUNT(*) FROM briefing_feedback").fetchone()[0]
+
+
+def _upsert_params(
+    briefing_id, item_index, headline, category, importance_score, tier, features, label,
+) -> tuple:
+    return (
+        str(briefing_id), int(item_index), headline, category,
+        importance_score, tier, json.dumps(features or {}, ensure_ascii=False), label,
+    )
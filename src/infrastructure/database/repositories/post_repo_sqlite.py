@@ -7,14 +7,29 @@ Firestore 대신 파일 기반 데이터베이스 사용 (비용 $0).
 from __future__ import annotations
 
 import asyncio
+import atexit
+import html
+import logging
 import sqlite3
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from src.domain.entities import Post
+from src.domain.entities import Post, PostSummary
+from src.domain.value_objects.post_fingerprint import PostFingerprint
+from src.domain.value_objects.save_result import SaveResult
+from src.infrastructure.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from src.infrastructure.database.sqlite_writer import SQLiteWriter, WriteFn
 
+if TYPE_CHECKING:
+    from src.infrastructure.database.post_archive import PostArchive
+
+logger = logging.getLogger(__name__)
 
 DB_PATH = Path("data/posts.db")
 
@@ -43,6 +58,61 @@ def _get_db() -> sqlite3.Connection:
     return _thread_local.db
 
 
+def _get_read_db() -> sqlite3.Connection:
+    """스레드 로컬 읽기 전용 연결 (query_only).
+
+    쓰기는 전부 writer 스레드(_write/_write_async)로 간다 — 읽기 연결이 실수로
+    쓰기 락을 잡지 못하게 query_only로 연다. DB_PATH가 바뀌면(테스트 등) 새로 연다.
+    """
+    cached = getattr(_thread_local, "read_db", None)
+    if cached is None or cached[0] != DB_PATH:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("PRAGMA query_only=ON")
+        except sqlite3.Error:
+            pass
+        cached = (DB_PATH, conn)
+        _thread_local.read_db = cached
+    return cached[1]
+
+
+# 단일 writer — 모든 SQLite 쓰기(게시물·수집이력·피드백)가 이 스레드 하나로 직렬화된다.
+_writer: SQLiteWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> SQLiteWriter:
+    """현재 DB_PATH의 writer (없거나 경로가 바뀌었으면 새로 띄운다)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None or _writer.path != DB_PATH or not _writer.alive:
+            if _writer is None:
+                # 종료 시 큐에 남은 쓰기를 커밋하고 연결을 닫는다 (daemon 스레드라 강제 종료 대비)
+                atexit.register(lambda: _writer and _writer.close())
+            else:
+                _writer.close()
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _writer = SQLiteWriter(DB_PATH)
+        return _writer
+
+
+def _write(fn: WriteFn) -> Any:
+    """쓰기 작업을 writer 스레드에서 실행하고 커밋까지 기다린다 (동기 호출부용)."""
+    return _get_writer().write(fn)
+
+
+async def _write_async(fn: WriteFn) -> Any:
+    """쓰기 작업을 writer 스레드에서 실행 — 이벤트 루프를 막지 않는다."""
+    return await _get_writer().write_async(fn)
+
+
+def writer_stats() -> dict[str, Any]:
+    """writer 큐 깊이·커밋 지연 지표 (아직 쓰기가 없었으면 빈 dict)."""
+    return _writer.stats() if _writer is not None else {}
+
+
 def init_sqlite_db() -> None:
     """SQLite 데이터베이스 초기화 및 스키마 생성."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -114,16 +184,327 @@ def init_sqlite_db() -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_external_id ON posts(external_id);")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_is_relevant ON posts(is_relevant);")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_is_relevant ON posts(source, is_relevant);")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_is_relevant_collected ON posts(is_relevant, collected_at DESC);")
+    # 키셋 페이지네이션 정렬 (collected_at DESC, id DESC)과 같은 순서 — 페이지 경계 탐색이 인덱스 한 번
+    cursor.execute("DROP INDEX IF EXISTS idx_is_relevant_collected;")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_is_relevant_collected_id ON posts(is_relevant, collected_at DESC, id DESC);")
+    # 처음 저장된 시각(created_at, UPSERT가 건드리지 않는다)별 관련 게시물 — adaptive 수집 주기의 수확률
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_is_relevant_created ON posts(is_relevant, created_at, source);")
+
+    _init_search_index(cursor)
+    _init_side_tables(cursor)
+    _init_rollups(cursor)
 
     conn.commit()
 
 
+# 카테고리·키워드 정규화 테이블 — posts의 JSON 컬럼(category_names/keywords)을 그대로
+# 두되, 필터·집계는 여기서 인덱스로 찾는다. 과거엔 카테고리 필터가
+# category_names LIKE '%"AI"%' 풀스캔, 키워드 top K가 매 호출 json_each 전수 파싱이었다.
+# 관련 게시물(is_relevant=1)만 담는다 — 두 조회 모두 관련 게시물 대상이라서다.
+# update_many가 같은 트랜잭션에서 갱신하고, 삭제·재수집(collected_at 갱신)은 트리거가 따라간다.
+_SIDE_TABLE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_side_ad AFTER DELETE ON posts BEGIN
+        DELETE FROM post_categories WHERE post_id = old.id;
+        DELETE FROM post_keywords WHERE post_id = old.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_keywords_au AFTER UPDATE OF collected_at ON posts BEGIN
+        UPDATE post_keywords SET collected_at = new.collected_at WHERE post_id = new.id;
+    END;
+    """,
+)
+
+
+def _init_side_tables(cursor: sqlite3.Cursor) -> None:
+    """post_categories·post_keywords 생성. 최초 생성 시 기존 JSON 컬럼에서 1회 이관한다."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'post_keywords'")
+    existed = cursor.fetchone() is not None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS post_categories (
+            post_id TEXT NOT NULL,
+            category TEXT NOT NULL,
+            PRIMARY KEY (post_id, category)
+        ) WITHOUT ROWID;
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS post_keywords (
+            post_id TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            collected_at TIMESTAMP,
+            PRIMARY KEY (post_id, keyword)
+        ) WITHOUT ROWID;
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_post_categories_category ON post_categories(category, post_id);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_post_keywords_collected ON post_keywords(collected_at, keyword);")
+
+    for trigger_sql in _SIDE_TABLE_TRIGGERS:
+        cursor.execute(trigger_sql)
+
+    if not existed:
+        cursor.execute("""
+            INSERT OR IGNORE INTO post_categories (post_id, category)
+            SELECT p.id, j.value
+            FROM posts p, json_each(p.category_names) j
+            WHERE p.is_relevant = 1 AND json_valid(p.category_names)
+              AND j.type = 'text' AND j.value != ''
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO post_keywords (post_id, keyword, collected_at)
+            SELECT p.id, j.value, p.collected_at
+            FROM posts p, json_each(p.keywords) j
+            WHERE p.is_relevant = 1 AND json_valid(p.keywords)
+              AND j.type = 'text' AND j.value != ''
+        """)
+
+
+def _sync_side_tables(cursor: sqlite3.Cursor, post: Post) -> None:
+    """게시물 1건의 post_categories·post_keywords를 현재 값으로 교체 (호출부 트랜잭션 안에서)."""
+    cursor.execute("DELETE FROM post_categories WHERE post_id = ?", (post.id,))
+    cursor.execute("DELETE FROM post_keywords WHERE post_id = ?", (post.id,))
+    if not post.is_relevant:
+        return
+    cursor.executemany(
+        "INSERT OR IGNORE INTO post_categories (post_id, category) VALUES (?, ?)",
+        [(post.id, c) for c in post.category_names or [] if c],
+    )
+    # collected_at은 DB 값을 쓴다 — 엔티티 값은 처리 중 재수집으로 뒤처졌을 수 있다
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO post_keywords (post_id, keyword, collected_at)
+        SELECT ?, ?, collected_at FROM posts WHERE id = ?
+        """,
+        [(post.id, k, post.id) for k in post.keywords or [] if k],
+    )
+
+
+# 시간별 집계 롤업 — (hour, source, relevant, category)별 게시물 수.
+# /api/stats·대시보드가 새로고침마다 posts를 collected_at 범위로 스캔하던 것을
+# O(시간 수) 행 읽기로 바꾼다. posts 트리거가 증감을 따라가므로 save_many(INSERT·
+# 재수집 UPDATE)·update_many(관련도·카테고리)·삭제/아카이브 어느 경로든 같은 트랜잭션에서
+# 반영된다. category=''는 게시물당 1행(소스·관련도 합계용), 그 외는 카테고리별 행이다
+# (다중 카테고리 게시물은 각 카테고리에 1씩 — 카테고리 행끼리 합하면 중복 집계된다).
+# relevant: 1 관련 / 0 탈락 / -1 미처리(is_relevant NULL).
+_ROLLUP_RELEVANT = "COALESCE({ref}.is_relevant, -1)"
+_ROLLUP_HOUR = "COALESCE(strftime('%Y-%m-%d %H:00:00', {ref}.collected_at), '')"
+_ROLLUP_CATEGORIES = """
+    json_each(CASE WHEN json_valid({ref}.category_names) THEN {ref}.category_names ELSE '[]' END) j
+"""
+
+
+def _rollup_add_sql(ref: str) -> str:
+    hour, rel = _ROLLUP_HOUR.format(ref=ref), _ROLLUP_RELEVANT.format(ref=ref)
+    cats = _ROLLUP_CATEGORIES.format(ref=ref)
+    return f"""
+        INSERT INTO post_hourly_counts (hour, source, relevant, category, count)
+        SELECT {hour}, {ref}.source, {rel}, '', 1 WHERE 1
+        ON CONFLICT (hour, source, relevant, category) DO UPDATE SET count = count + 1;
+        INSERT INTO post_hourly_counts (hour, source, relevant, category, count)
+        SELECT DISTINCT {hour}, {ref}.source, {rel}, j.value, 1 FROM {cats}
+        WHERE j.type = 'text' AND j.value != ''
+        ON CONFLICT (hour, source, relevant, category) DO UPDATE SET count = count + 1;
+    """
+
+
+def _rollup_sub_sql(ref: str) -> str:
+    hour, rel = _ROLLUP_HOUR.format(ref=ref), _ROLLUP_RELEVANT.format(ref=ref)
+    cats = _ROLLUP_CATEGORIES.format(ref=ref)
+    return f"""
+        UPDATE post_hourly_counts SET count = count - 1
+        WHERE hour = {hour} AND source = {ref}.source AND relevant = {rel}
+          AND (category = '' OR category IN (
+              SELECT j.value FROM {cats} WHERE j.type = 'text' AND j.value != ''
+          ));
+    """
+
+
+_ROLLUP_TRIGGERS = (
+    f"CREATE TRIGGER IF NOT EXISTS posts_rollup_ai AFTER INSERT ON posts BEGIN "
+    f"{_rollup_add_sql('new')} END;",
+    f"CREATE TRIGGER IF NOT EXISTS posts_rollup_ad AFTER DELETE ON posts BEGIN "
+    f"{_rollup_sub_sql('old')} END;",
+    # 집계 키가 실제로 바뀐 경우만 (update_many는 같은 값을 다시 쓰는 일이 많다)
+    f"""CREATE TRIGGER IF NOT EXISTS posts_rollup_au
+        AFTER UPDATE OF collected_at, source, is_relevant, category_names ON posts
+        WHEN {_ROLLUP_HOUR.format(ref='old')} IS NOT {_ROLLUP_HOUR.format(ref='new')}
+          OR old.source IS NOT new.source
+          OR {_ROLLUP_RELEVANT.format(ref='old')} IS NOT {_ROLLUP_RELEVANT.format(ref='new')}
+          OR old.category_names IS NOT new.category_names
+        BEGIN {_rollup_sub_sql('old')} {_rollup_add_sql('new')} END;""",
+)
+
+_ROLLUP_REBUILD_SQL = (
+    "DELETE FROM post_hourly_counts",
+    f"""
+    INSERT INTO post_hourly_counts (hour, source, relevant, category, count)
+    SELECT {_ROLLUP_HOUR.format(ref='p')} AS h, p.source, {_ROLLUP_RELEVANT.format(ref='p')} AS r,
+           '', COUNT(*)
+    FROM posts p GROUP BY h, p.source, r
+    """,
+    f"""
+    INSERT INTO post_hourly_counts (hour, source, relevant, category, count)
+    SELECT h, source, r, category, COUNT(*) FROM (
+        SELECT DISTINCT p.id, {_ROLLUP_HOUR.format(ref='p')} AS h, p.source,
+               {_ROLLUP_RELEVANT.format(ref='p')} AS r, j.value AS category
+        FROM posts p, {_ROLLUP_CATEGORIES.format(ref='p')}
+        WHERE j.type = 'text' AND j.value != ''
+    ) GROUP BY h, source, r, category
+    """,
+)
+
+
+def _init_rollups(cursor: sqlite3.Cursor) -> None:
+    """post_hourly_counts 생성. 최초 생성 시 기존 posts에서 한 번 채운다."""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'post_hourly_counts'"
+    )
+    existed = cursor.fetchone() is not None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS post_hourly_counts (
+            hour TEXT NOT NULL,
+            source TEXT NOT NULL,
+            relevant INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (hour, source, relevant, category)
+        ) WITHOUT ROWID;
+    """)
+    for trigger_sql in _ROLLUP_TRIGGERS:
+        cursor.execute(trigger_sql)
+
+    if not existed:
+        for sql in _ROLLUP_REBUILD_SQL[1:]:
+            cursor.execute(sql)
+
+
+def rebuild_rollups() -> int:
+    """post_hourly_counts를 posts 기준으로 다시 계산 (트리거 도입 전 데이터·불일치 의심 시).
+
+    반환: 재계산된 롤업 행 수. 0이 된 행(삭제·이동으로 비워진 시간대)도 이때 정리된다.
+    """
+    def _rebuild(conn: sqlite3.Connection) -> int:
+        for sql in _ROLLUP_REBUILD_SQL:
+            conn.execute(sql)
+        return conn.execute("SELECT COUNT(*) FROM post_hourly_counts").fetchone()[0]
+
+    return _write(_rebuild)
+
+
+def _rollup_hour(dt: datetime) -> str:
+    """롤업 hour 키 (시 단위 절삭, 저장 포맷과 같은 문자열)."""
+    return dt.strftime("%Y-%m-%d %H:00:00")
+
+
+# 전문 검색 인덱스 (FTS5 external-content, posts.rowid 기준).
+# LIKE '%q%'는 30일치가 쌓일수록 매 검색마다 풀스캔이라 느려진다.
+# trigram 토크나이저는 공백 분리가 안 되는 한국어(조사 붙은 어절)도 부분일치로
+# 잡는다 — 대신 3글자 미만 검색어는 인덱스를 못 타므로 search()가 LIKE로 보완한다.
+# 동기화는 트리거가 맡는다: UPSERT(INSERT·ON CONFLICT UPDATE)·update_many·삭제
+# 경로를 가리지 않고 posts 변경이 그대로 반영된다.
+# ⚠️ VACUUM은 명시적 INTEGER PK가 없는 테이블의 rowid를 바꿀 수 있다 —
+#    VACUUM 후엔 rebuild_search_index()로 재색인할 것.
+_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, content_text, summary, author)
+        VALUES (new.rowid, new.content_text, new.summary, new.author);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, content_text, summary, author)
+        VALUES ('delete', old.rowid, old.content_text, old.summary, old.author);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF content_text, summary, author ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, content_text, summary, author)
+        VALUES ('delete', old.rowid, old.content_text, old.summary, old.author);
+        INSERT INTO posts_fts (rowid, content_text, summary, author)
+        VALUES (new.rowid, new.content_text, new.summary, new.author);
+    END;
+    """,
+)
+
+# FTS5(trigram)를 못 쓰는 SQLite 빌드(< 3.34)면 False — search()가 LIKE 경로만 쓴다.
+_fts_enabled = True
+
+# trigram 토크나이저의 최소 검색어 길이 (이보다 짧으면 MATCH가 아무것도 못 찾는다)
+_FTS_MIN_TERM_LEN = 3
+
+# snippet() 하이라이트 구분자 — 본문 HTML 이스케이프 후 <mark>로 바꾼다
+_SNIPPET_OPEN, _SNIPPET_CLOSE = "\x02", "\x03"
+
+# 관련도 점수 — bm25 가중치: content_text 1.0, summary 2.0(AI 요약이 핵심을 압축), author 0.5
+_FTS_RANK = "bm25(posts_fts, 1.0, 2.0, 0.5)"
+
+
+def _init_search_index(cursor: sqlite3.Cursor) -> None:
+    """posts_fts 가상 테이블·동기화 트리거 생성. 최초 생성 시 기존 행을 색인한다."""
+    global _fts_enabled
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+    existed = cursor.fetchone() is not None
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+                content_text, summary, author,
+                content='posts', content_rowid='rowid',
+                tokenize='trigram'
+            );
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"FTS5(trigram) 미지원 SQLite — LIKE 검색 사용: {e}")
+        _fts_enabled = False
+        return
+
+    for trigger_sql in _FTS_TRIGGERS:
+        cursor.execute(trigger_sql)
+    if not existed:
+        cursor.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+    _fts_enabled = True
+
+
+def rebuild_search_index() -> None:
+    """posts_fts를 posts 기준으로 전부 재색인 (VACUUM 후·인덱스 의심 시)."""
+    _write(lambda conn: conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')"))
+
+
+def _split_search_terms(query: str) -> tuple[str | None, list[str]]:
+    """검색어를 (FTS5 MATCH 식, LIKE로 보완할 짧은 단어 목록)으로 나눈다.
+
+    공백으로 나눈 단어들은 AND로 묶인다. 각 단어는 큰따옴표 구문으로 감싸
+    FTS5 연산자(AND/OR/NEAR, *, -)가 사용자 입력에서 해석되지 않게 한다.
+    """
+    long_terms: list[str] = []
+    short_terms: list[str] = []
+    for term in query.split():
+        if _fts_enabled and len(term) >= _FTS_MIN_TERM_LEN:
+            long_terms.append('"' + term.replace('"', '""') + '"')
+        else:
+            short_terms.append(term)
+    return (" ".join(long_terms) or None), short_terms
+
+
+def _highlight(snippet: str | None) -> str | None:
+    """snippet() 결과를 HTML 안전한 하이라이트 문자열로 변환 (<mark>…</mark>)."""
+    if not snippet:
+        return None
+    escaped = html.escape(snippet)
+    return escaped.replace(_SNIPPET_OPEN, "<mark>").replace(_SNIPPET_CLOSE, "</mark>")
+
+
 # 재수집 시 처리 상태(is_relevant·summary·category·briefed_at·liked_at 등)를 보존하는 UPSERT.
 # 과거 INSERT OR REPLACE는 같은 게시물을 재수집할 때 행을 통째로 덮어써 처리상태를 NULL로
 # 리셋했고, 그 결과 이미 처리한 글이 매 사이클 재필터링(토큰 낭비)·재브리핑·재추천됐다.
 # 충돌(=이미 존재) 시엔 인게이지먼트/본문/collected_at만 갱신하고 처리·상태 필드는 건드리지 않는다.
 # (liked_at은 INSERT 컬럼에 없어 신규행에선 기본 NULL, 기존행에선 보존된다.)
+# 재수집분의 상당수(트위터는 인터셉트의 절반 가까이)는 아무것도 안 바뀐 글이다 — WHERE 가드로
+# 본문·인게이지먼트가 실제로 달라진 행만 다시 쓴다. 무변경 행은 페이지·WAL·FTS 트리거를
+# 건드리지 않고, collected_at도 마지막으로 변경이 관측된 시각에 머문다.
 _UPSERT_SQL = """
     INSERT INTO posts
     (id, source, external_id, url, author, author_url, content_text,
@@ -145,6 +526,16 @@ _UPSERT_SQL = """
         engagement_views=excluded.engagement_views,
         collected_at=excluded.collected_at,
         updated_at=CURRENT_TIMESTAMP
+    WHERE posts.url IS NOT excluded.url
+       OR posts.author IS NOT excluded.author
+       OR posts.author_url IS NOT excluded.author_url
+       OR posts.content_text IS NOT excluded.content_text
+       OR posts.content_html IS NOT excluded.content_html
+       OR posts.media_urls IS NOT excluded.media_urls
+       OR posts.engagement_likes IS NOT excluded.engagement_likes
+       OR posts.engagement_reposts IS NOT excluded.engagement_reposts
+       OR posts.engagement_comments IS NOT excluded.engagement_comments
+       OR posts.engagement_views IS NOT excluded.engagement_views
 """
 
 
@@ -236,25 +627,82 @@ def _post_from_row(row: sqlite3.Row) -> Post:
     )
 
 
+# 브리핑 경로 프로젝션 — PostSummary가 쓰는 컬럼만 (content_html·media_urls·원문 제외)
+_SUMMARY_PREVIEW_CHARS = 300
+_SUMMARY_COLUMNS = f"""
+    id, source, url, summary, importance_score, category_names,
+    engagement_likes, engagement_reposts, engagement_comments, engagement_views,
+    published_at, collected_at,
+    substr(content_text, 1, {_SUMMARY_PREVIEW_CHARS}) AS content_preview
+"""
+
+# get_by_ids의 IN (...) 청크 크기 (SQLite 바인드 변수 상한 999 아래로)
+_ID_CHUNK = 500
+
+
+# SeenPostIndex 지문 계산용 — UPSERT 변경 가드와 같은 컬럼
+_FINGERPRINT_COLUMNS = (
+    "source, id, url, author, author_url, content_text, content_html, media_urls, "
+    "engagement_likes, engagement_reposts, engagement_comments, engagement_views"
+)
+
+
+def _fingerprint_from_row(row: sqlite3.Row) -> PostFingerprint:
+    import json
+
+    return PostFingerprint.of_fields(
+        row["url"], row["author"], row["author_url"], row["content_text"],
+        row["content_html"], json.loads(row["media_urls"]) if row["media_urls"] else [],
+        row["engagement_likes"], row["engagement_reposts"],
+        row["engagement_comments"], row["engagement_views"],
+    )
+
+
+def _summary_from_row(row: sqlite3.Row) -> PostSummary:
+    """프로젝션 행을 PostSummary로 변환."""
+    import json
+
+    return PostSummary(
+        id=row["id"],
+        source=row["source"],
+        url=row["url"],
+        summary=row["summary"],
+        importance_score=row["importance_score"],
+        category_names=json.loads(row["category_names"] or "[]"),
+        engagement_likes=row["engagement_likes"] or 0,
+        engagement_reposts=row["engagement_reposts"] or 0,
+        engagement_comments=row["engagement_comments"] or 0,
+        engagement_views=row["engagement_views"] or 0,
+        published_at=_parse_dt(row["published_at"]),
+        collected_at=_parse_dt(row["collected_at"]),
+        content_preview=row["content_preview"] or "",
+    )
+
+
+# 아카이브 이동 1회분 (읽기→아카이브 커밋→핫 DB 삭제) — 메모리·writer 점유 상한
+_ARCHIVE_BATCH = 1000
+
+
 class PostRepositorySQLite:
-    """SQLite 기반 Post 저장소."""
+    """SQLite 기반 Post 저장소.
 
-    def __init__(self):
+    archive가 주어지면 보존기한 정리(archive_*_older_than)가 행을 지우기 전에
+    월별 콜드 스토리지로 옮긴다. 없으면 기존처럼 바로 삭제한다.
+    """
+
+    def __init__(self, archive: PostArchive | None = None):
         init_sqlite_db()
+        self._archive = archive
 
     def save(self, post: Post) -> str:
         """Post 저장 (신규 또는 업데이트)."""
-        conn = _get_db()
-        cursor = conn.cursor()
         data = _post_to_dict(post)
-
-        cursor.execute(_UPSERT_SQL, tuple(data.values()))
-        conn.commit()
+        _write(lambda conn: conn.execute(_UPSERT_SQL, tuple(data.values())))
         return data["id"]
 
     def find_by_id(self, post_id: str) -> Post | None:
         """ID로 Post 조회."""
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
 
         cursor.execute("SELECT * FROM posts WHERE id = ?", (post_id,))
@@ -267,7 +715,7 @@ class PostRepositorySQLite:
 
     def find_recent(self, limit: int = 100) -> list[Post]:
         """최근 Post 조회."""
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -285,7 +733,7 @@ class PostRepositorySQLite:
         """
         if not hashes:
             return set()
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
         placeholders = ",".join("?" * len(hashes))
         cursor.execute(f"""
@@ -294,9 +742,35 @@ class PostRepositorySQLite:
         """, hashes)
         return {row[0] for row in cursor.fetchall()}
 
+    def find_fingerprints(self, post_ids: list[str]) -> dict[tuple[str, str], PostFingerprint]:
+        """주어진 id의 (source, id) → 변경 감지 지문 (SeenPostIndex 미스 보충용)."""
+        conn = _get_read_db()
+        found: dict[tuple[str, str], PostFingerprint] = {}
+        for start in range(0, len(post_ids), _ID_CHUNK):
+            chunk = post_ids[start:start + _ID_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {_FINGERPRINT_COLUMNS} FROM posts WHERE id IN ({placeholders})", chunk
+            )
+            for row in rows:
+                found[(row[0], row[1])] = _fingerprint_from_row(row)
+        return found
+
+    def iter_fingerprints(self, days: int) -> Iterator[tuple[str, str, PostFingerprint]]:
+        """최근 days일 수집분의 (source, id, 지문) — 오래된 것부터 (SeenPostIndex 적재용)."""
+        conn = _get_read_db()
+        since = datetime.now() - timedelta(days=days)
+        cursor = conn.execute(
+            f"SELECT {_FINGERPRINT_COLUMNS} FROM posts WHERE collected_at >= ? "
+            "ORDER BY collected_at",
+            (since,),
+        )
+        for row in cursor:
+            yield row[0], row[1], _fingerprint_from_row(row)
+
     def find_by_source(self, source: str, limit: int = 100) -> list[Post]:
         """소스별 Post 조회."""
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -309,90 +783,166 @@ class PostRepositorySQLite:
 
     def delete(self, post_id: str) -> None:
         """Post 삭제."""
-        conn = _get_db()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
-        conn.commit()
+        _write(lambda conn: conn.execute("DELETE FROM posts WHERE id = ?", (post_id,)))
 
     def update_many(self, posts: list[Post]) -> int:
-        """여러 Post를 한 번에 업데이트 (배치 처리, 성능 최적화)."""
-        conn = _get_db()
-        cursor = conn.cursor()
-        updated = 0
+        """여러 Post를 한 번에 업데이트 (배치 처리, 성능 최적화).
 
-        for post in posts:
-            if post.id is None:
-                continue
-            data = _post_to_dict(post)
-            cursor.execute("""
-                UPDATE posts SET
-                    summary = ?, importance_score = ?, language = ?,
-                    is_relevant = ?, category_names = ?, keywords = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (
-                post.summary, post.importance_score, post.language,
-                1 if post.is_relevant else 0,
-                data["category_names"], data["keywords"],
-                post.id
-            ))
-            updated += cursor.rowcount
-
-        conn.commit()
-        return updated
+        post_categories·post_keywords도 같은 트랜잭션에서 갱신한다 —
+        중간에 실패하면 전부 롤백돼 JSON 컬럼과 정규화 테이블이 어긋나지 않는다
+        (writer가 작업 단위 SAVEPOINT로 되돌린다).
+        """
+        def _update(conn: sqlite3.Connection) -> int:
+            cursor = conn.cursor()
+            updated = 0
+            for post in posts:
+                if post.id is None:
+                    continue
+                data = _post_to_dict(post)
+                cursor.execute("""
+                    UPDATE posts SET
+                        summary = ?, importance_score = ?, language = ?,
+                        is_relevant = ?, category_names = ?, keywords = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (
+                    post.summary, post.importance_score, post.language,
+                    1 if post.is_relevant else 0,
+                    data["category_names"], data["keywords"],
+                    post.id
+                ))
+                if cursor.rowcount:
+                    _sync_side_tables(cursor, post)
+                updated += cursor.rowcount
+            return updated
+
+        return _write(_update)
 
     def delete_older_than(self, days: int) -> int:
         """N일 이상 된 Post 삭제 (자동 정리용)."""
         cutoff_date = datetime.now() - timedelta(days=days)
-        conn = _get_db()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        return _write(lambda conn: conn.execute(
             "DELETE FROM posts WHERE collected_at < ?",
             (cutoff_date,)
-        )
-        conn.commit()
-        return cursor.rowcount
+        ).rowcount)
 
     def delete_irrelevant_older_than(self, days: int) -> int:
-        """필터 탈락(is_relevant=0) 게시물 중 N일간 재수집되지 않은 것 삭제.
-
-        collected_at은 재수집 때마다 갱신되므로 'N일 경과' = 'N일간 피드에 없음'.
-        수집 컷오프(max_age_days)보다 길게 잡으면 삭제 직후 같은 글이 신규로
-        재수집돼 재필터링(토큰 낭비)되는 루프가 원천 차단된다.
+        """필터 탈락(is_relevant=0) 게시물 중 collected_at이 N일 지난 것 삭제.
+
+        collected_at은 '피드에서 마지막으로 본 시각'이 아니다 — UPSERT 가드와 이미 본 글
+        인덱스 때문에 내용·인게이지먼트가 바뀐 재수집 때만 옮겨 간다. 재수집 루프
+        (삭제 → 신규로 재수집 → 재필터링 토큰 낭비)는 다음 불변식으로 막는다:
+        collected_at >= published_at 이고 days(irrelevant_retention_days) > max_age_days
+        이면, 지워지는 글은 published_at < 지금 - max_age_days 라 수집기 게시일 컷오프에
+        걸려 다시 들어오지 않는다. 게시일이 없는 글은 컷오프가 없어 이 보장 밖이다.
         """
         cutoff_date = datetime.now() - timedelta(days=days)
-        conn = _get_db()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        return _write(lambda conn: conn.execute(
             "DELETE FROM posts WHERE is_relevant = 0 AND collected_at < ?",
             (cutoff_date,)
+        ).rowcount)
+
+    def archive_older_than(self, days: int) -> int:
+        """N일 이상 된 Post를 아카이브로 옮기고 핫 DB에서 삭제. 옮긴 건수 반환."""
+        cutoff_date = datetime.now() - timedelta(days=days)
+        return self._move_to_archive("collected_at < ?", (cutoff_date,), reason="retention")
+
+    def archive_irrelevant_older_than(self, days: int) -> int:
+        """필터 탈락 게시물 중 collected_at이 N일 지난 것을 아카이브로 옮긴다.
+
+        조건과 재수집 루프 방지 불변식은 delete_irrelevant_older_than과 같다.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        return self._move_to_archive(
+            "is_relevant = 0 AND collected_at < ?", (cutoff_date,), reason="irrelevant"
         )
-        conn.commit()
-        return cursor.rowcount
+
+    def _move_to_archive(self, where: str, params: tuple, reason: str) -> int:
+        """where에 맞는 행을 배치 단위로 아카이브 → 삭제.
+
+        두 DB 파일을 한 트랜잭션으로 묶을 수 없으므로 순서로 안전을 지킨다:
+        아카이브 커밋이 끝난 배치만 지우고, 삭제 때도 where를 다시 걸어 그 사이
+        재수집으로 갱신된 행은 남긴다. 중간에 죽으면 다음 정리 때 같은 행이 다시
+        아카이브되지만 INSERT OR IGNORE라 중복되지 않는다.
+        """
+        if self._archive is None:
+            return _write(lambda conn: conn.execute(
+                f"DELETE FROM posts WHERE {where}", params
+            ).rowcount)
+
+        moved = 0
+        while True:
+            rows = _get_read_db().execute(
+                f"SELECT * FROM posts WHERE {where} ORDER BY collected_at LIMIT ?",
+                (*params, _ARCHIVE_BATCH),
+            ).fetchall()
+            if not rows:
+                break
+            self._archive.append([dict(row) for row in rows], reason=reason)
+            ids = [row["id"] for row in rows]
+            placeholders = ",".join("?" * len(ids))
+            moved += _write(lambda conn: conn.execute(
+                f"DELETE FROM posts WHERE id IN ({placeholders}) AND {where}",
+                (*ids, *params),
+            ).rowcount)
+            if len(rows) < _ARCHIVE_BATCH:
+                break
+        return moved
+
+    def get_archive_stats(self) -> dict[str, Any]:
+        """콜드 스토리지 파일 수·행 수·크기 (아카이브 미사용이면 빈 dict)."""
+        return self._archive.stats() if self._archive is not None else {}
 
     def count(self) -> int:
         """전체 Post 수."""
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM posts")
         return cursor.fetchone()[0]
 
-    def save_many(self, posts: list[Post]) -> int:
-        """여러 Post 일괄 저장 (배치 처리, 성능 최적화)."""
-        conn = _get_db()
-        cursor = conn.cursor()
-        saved = 0
-
-        for post in posts:
-            data = _post_to_dict(post)
-            cursor.execute(_UPSERT_SQL, tuple(data.values()))
-            saved += 1
+    def save_many(self, posts: list[Post]) -> SaveResult:
+        """여러 Post 일괄 저장 (배치 처리, 성능 최적화).
 
-        conn.commit()
-        return saved
+        바뀐 것이 없는 기존 게시물은 다시 쓰지 않고 unchanged로 센다.
+        """
+        save = self._save_many_fn(posts)
+        return _write(save) if save is not None else SaveResult()
+
+    async def save_many_async(self, posts: list[Post]) -> SaveResult:
+        """save_many의 비동기판 — 그룹 커밋을 기다리는 동안 이벤트 루프를 막지 않는다 (수집 경로용)."""
+        save = self._save_many_fn(posts)
+        return await _write_async(save) if save is not None else SaveResult()
+
+    @staticmethod
+    def _save_many_fn(posts: list[Post]) -> WriteFn | None:
+        """save_many 쓰기 작업 (writer 스레드에서 실행). 저장할 게 없으면 None."""
+        rows = [tuple(_post_to_dict(post).values()) for post in posts]
+        if not rows:
+            return None
+
+        def _save(conn: sqlite3.Connection) -> SaveResult:
+            # 같은 트랜잭션 안에서 기존 id를 먼저 확인 — 쓰기 건수(rowcount)에서 신규분을 가른다
+            ids = list(dict.fromkeys(row[0] for row in rows))
+            existing: set[str] = set()
+            for start in range(0, len(ids), _ID_CHUNK):
+                chunk = ids[start:start + _ID_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                existing.update(
+                    r[0] for r in conn.execute(
+                        f"SELECT id FROM posts WHERE id IN ({placeholders})", chunk
+                    )
+                )
+            # executemany rowcount = 삽입 + 가드를 통과한 갱신 (가드에 걸린 충돌은 0)
+            written = conn.executemany(_UPSERT_SQL, rows).rowcount
+            inserted = len(ids) - len(existing)
+            return SaveResult(
+                inserted=inserted,
+                updated=written - inserted,
+                unchanged=len(rows) - written,
+            )
+
+        return _save
 
     def get_likeable(self, source: str, min_importance: float, limit: int) -> list[Post]:
         """자동 좋아요 대상 조회.
@@ -400,7 +950,7 @@ class PostRepositorySQLite:
         관련 O(is_relevant=1) + 중요도 임계값 이상 + 아직 좋아요 안 함(liked_at IS NULL)
         + URL 보유. 중요도 높은 순으로 반환.
         """
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -421,15 +971,11 @@ class PostRepositorySQLite:
         """게시물들의 liked_at 설정 (자동 좋아요 완료 마킹)."""
         if not post_ids:
             return 0
-        conn = _get_db()
-        cursor = conn.cursor()
         placeholders = ",".join("?" * len(post_ids))
-        cursor.execute(
+        return _write(lambda conn: conn.execute(
             f"UPDATE posts SET liked_at = ? WHERE id IN ({placeholders})",
             [liked_at.isoformat(), *post_ids],
-        )
-        conn.commit()
-        return cursor.rowcount
+        ).rowcount)
 
     # ─── 자동 팔로우 ───
 
@@ -442,7 +988,7 @@ class PostRepositorySQLite:
         비어 있어(스키마 변경 미추적) 집계에서 자연히 빠진다.
         이미 처리된 계정(followed/already)과 재시도 한도를 넘긴 실패 계정은 제외한다.
         """
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -476,10 +1022,8 @@ class PostRepositorySQLite:
         self, author_url: str, source: str, screen_name: str, like_count: int, status: str
     ) -> None:
         """팔로우 시도 결과 기록. 실패는 attempts를 올려 무한 재시도를 막는다."""
-        conn = _get_db()
-        cursor = conn.cursor()
         followed_at = datetime.utcnow().isoformat() if status in ("followed", "already") else None
-        cursor.execute(
+        _write(lambda conn: conn.execute(
             """
             INSERT INTO followed_accounts
                 (author_url, source, screen_name, like_count, status, attempts, followed_at)
@@ -492,12 +1036,11 @@ class PostRepositorySQLite:
                 updated_at=CURRENT_TIMESTAMP
             """,
             (author_url, source, screen_name, like_count, status, followed_at),
-        )
-        conn.commit()
+        ))
 
     def get_unprocessed(self, limit: int = 100) -> list[Post]:
         """AI 처리 안 된 게시물 조회 (summary가 None)."""
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -508,6 +1051,93 @@ class PostRepositorySQLite:
         """, (limit,))
         return [_post_from_row(row) for row in cursor.fetchall()]
 
+    def _search_rows(
+        self,
+        query: str | None,
+        source: str | None,
+        category: str | None,
+        limit: int,
+        offset: int = 0,
+        after: dict[str, Any] | None = None,
+        by_rank: bool = True,
+    ) -> list[tuple[Post, dict[str, Any]]]:
+        """검색 본체 (동기). (게시물, 그 행의 정렬 키) 목록을 돌려준다.
+
+        검색어가 있고 by_rank면 bm25 관련도를 앞에 둔 (rank, collected_at DESC, id DESC),
+        아니면 (collected_at DESC, id DESC) 순이다. 키셋(after)은 뒤쪽 순서에서만 건다 —
+        bm25는 말뭉치 통계에 따라 값이 바뀌므로 커서로 쓰면 삽입·삭제 사이에 페이지가
+        행을 건너뛰거나 되풀이한다. 키의 "m"은 검색어 유무, "r"은 정렬용 관련도(커서엔 안 싣는다).
+        """
+        conn = _get_read_db()
+        cursor = conn.cursor()
+
+        match_expr, short_terms = _split_search_terms(query or "")
+        if after is not None and (
+            "c" not in after or "i" not in after or ("m" in after) != bool(match_expr)
+        ):
+            raise InvalidCursorError("검색 조건과 맞지 않는 커서")
+
+        conditions = ["p.is_relevant = 1"]
+        params: list[Any] = []
+
+        if match_expr:
+            conditions.append("posts_fts MATCH ?")
+            params.append(match_expr)
+
+        if source:
+            conditions.append("p.source = ?")
+            params.append(source)
+
+        for term in short_terms:
+            conditions.append(
+                "(p.content_text LIKE ? OR p.summary LIKE ? OR p.author LIKE ?)"
+            )
+            search_term = f"%{term}%"
+            params.extend([search_term, search_term, search_term])
+
+        if category:
+            conditions.append(
+                "p.id IN (SELECT post_id FROM post_categories WHERE category = ?)"
+            )
+            params.append(category)
+
+        if after is not None:
+            conditions.append("(p.collected_at, p.id) < (?, ?)")
+            params.extend([after["c"], after["i"]])
+
+        where_clause = " AND ".join(conditions)
+        if match_expr:
+            sql = f"""
+                SELECT p.*, snippet(posts_fts, -1, ?, ?, '…', 32) AS snippet,
+                       {_FTS_RANK} AS rank
+                FROM posts_fts
+                JOIN posts p ON p.rowid = posts_fts.rowid
+                WHERE {where_clause}
+                ORDER BY {"rank, " if by_rank else ""}p.collected_at DESC, p.id DESC
+                LIMIT ? OFFSET ?
+            """
+            params = [_SNIPPET_OPEN, _SNIPPET_CLOSE, *params]
+        else:
+            sql = f"""
+                SELECT p.* FROM posts p
+                WHERE {where_clause}
+                ORDER BY p.collected_at DESC, p.id DESC
+                LIMIT ? OFFSET ?
+            """
+        params.extend([limit, offset])
+
+        cursor.execute(sql, params)
+        results = []
+        for row in cursor.fetchall():
+            post = _post_from_row(row)
+            # 정렬 키는 저장된 원본 값 그대로 — 파싱/재직렬화로 비교 결과가 바뀌지 않게
+            key: dict[str, Any] = {"c": row["collected_at"], "i": row["id"]}
+            if match_expr:
+                post.raw_data = {"snippet": _highlight(row["snippet"])}
+                key["m"], key["r"] = 1, row["rank"]
+            results.append((post, key))
+        return results
+
     async def search(
         self,
         query: str | None = None,
@@ -516,65 +1146,136 @@ class PostRepositorySQLite:
         limit: int = 50,
         offset: int = 0,
     ) -> list[Post]:
-        """게시물 검색 (비동기 래퍼)."""
-        def _search():
-            import json
-            conn = _get_db()
-            cursor = conn.cursor()
+        """게시물 검색 (비동기 래퍼).
 
-            conditions = ["is_relevant = 1"]
-            params = []
+        검색어가 있으면 FTS5 인덱스(posts_fts)로 찾아 bm25 관련도순으로 정렬하고,
+        하이라이트된 발췌를 post.raw_data["snippet"]에 담는다. 3글자 미만 단어는
+        trigram 인덱스를 못 타므로 LIKE 조건으로 보완한다.
+        페이지를 넘기는 화면은 OFFSET 대신 search_page()의 커서를 쓴다.
+        """
+        def _search():
+            rows = self._search_rows(query, source, category, limit, offset=offset)
+            return [post for post, _ in rows]
 
-            if source:
-                conditions.append("source = ?")
-                params.append(source)
+        return await asyncio.to_thread(_search)
 
-            if query:
-                conditions.append(f"(content_text LIKE ? OR summary LIKE ?)")
-                search_term = f"%{query}%"
-                params.extend([search_term, search_term])
+    async def search_page(
+        self,
+        query: str | None = None,
+        source: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Post], str | None]:
+        """키셋 페이지네이션 검색 — (게시물, 다음 페이지 커서 또는 None).
 
-            if category:
-                conditions.append(f"category_names LIKE ?")
-                params.append(f'%"{category}"%')
+        cursor는 직전 호출이 돌려준 불투명 토큰. 잘못된 토큰이면 InvalidCursorError.
+        limit+1건을 읽어 다음 페이지 존재 여부를 판단한다 (COUNT 쿼리 없음).
 
-            where_clause = " AND ".join(conditions)
-            sql = f"""
-                SELECT * FROM posts
-                WHERE {where_clause}
-                ORDER BY collected_at DESC
-                LIMIT ? OFFSET ?
-            """
-            params.extend([limit, offset])
+        검색어가 있어도 페이지 경계는 (collected_at DESC, id DESC)로 나눈다 — 페이지를
+        넘기는 사이 글이 들어오거나 지워져도 빠짐·중복이 없다. bm25 관련도는 각 페이지
+        안의 순서에만 쓴다 (전체 관련도순이 필요하면 search()).
+        """
+        after = decode_cursor(cursor) if cursor else None
 
-            cursor.execute(sql, params)
-            return [_post_from_row(row) for row in cursor.fetchall()]
+        def _search():
+            rows = self._search_rows(
+                query, source, category, limit + 1, after=after, by_rank=False
+            )
+            next_cursor = None
+            if len(rows) > limit:
+                key = rows[limit - 1][1]
+                next_cursor = encode_cursor({k: v for k, v in key.items() if k != "r"})
+            page = sorted(rows[:limit], key=lambda row: row[1].get("r", 0))  # 안정 정렬
+            return [post for post, _ in page], next_cursor
 
         return await asyncio.to_thread(_search)
 
     async def count_by_source(self, start: datetime, end: datetime) -> dict[str, int]:
-        """기간별 소스별 게시물 수."""
+        """기간별 소스별 게시물 수 (시간별 롤업 — 시 단위로 절삭된 구간)."""
         def _count():
-            conn = _get_db()
+            conn = _get_read_db()
             cursor = conn.cursor()
 
             cursor.execute("""
-                SELECT source, COUNT(*) as count
-                FROM posts
-                WHERE collected_at BETWEEN ? AND ?
+                SELECT source, SUM(count) AS count
+                FROM post_hourly_counts
+                WHERE category = '' AND hour BETWEEN ? AND ?
                 GROUP BY source
-            """, (start, end))
+                HAVING SUM(count) > 0
+            """, (_rollup_hour(start), _rollup_hour(end)))
 
             return {row[0]: row[1] for row in cursor.fetchall()}
 
         return await asyncio.to_thread(_count)
 
+    async def count_by_category(
+        self, start: datetime, end: datetime, relevant_only: bool = True
+    ) -> dict[str, int]:
+        """기간별 카테고리별 게시물 수 (시간별 롤업). 다중 카테고리 게시물은 각각에 1씩."""
+        def _count():
+            conn = _get_read_db()
+            rows = conn.execute(f"""
+                SELECT category, SUM(count) AS count
+                FROM post_hourly_counts
+                WHERE category != '' AND hour BETWEEN ? AND ?
+                  {"AND relevant = 1" if relevant_only else ""}
+                GROUP BY category
+                HAVING SUM(count) > 0
+                ORDER BY count DESC
+            """, (_rollup_hour(start), _rollup_hour(end))).fetchall()
+            return {row[0]: row[1] for row in rows}
+
+        return await asyncio.to_thread(_count)
+
+    async def get_hourly_counts(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """시간대·소스별 수집 건수와 그중 관련 건수 (소스 차트용, 시간순)."""
+        def _query():
+            conn = _get_read_db()
+            rows = conn.execute("""
+                SELECT hour, source,
+                       SUM(count) AS total,
+                       SUM(CASE WHEN relevant = 1 THEN count ELSE 0 END) AS relevant
+                FROM post_hourly_counts
+                WHERE category = '' AND hour BETWEEN ? AND ?
+                GROUP BY hour, source
+                HAVING SUM(count) > 0
+                ORDER BY hour, source
+            """, (_rollup_hour(start), _rollup_hour(end))).fetchall()
+            return [
+                {"hour": r["hour"], "source": r["source"],
+                 "total": r["total"], "relevant": r["relevant"]}
+                for r in rows
+            ]
+
+        return await asyncio.to_thread(_query)
+
+    async def count_relevant_by_first_seen(
+        self, start: datetime, end: datetime
+    ) -> dict[tuple[str, str], int]:
+        """(소스, 처음 저장된 UTC 시 키)별 관련 게시물 수 — adaptive 수집 주기의 분자.
+
+        post_hourly_counts는 collected_at 기준이라 인게이지먼트가 바뀔 때마다 글이 마지막
+        변경 시각으로 옮겨 간다. created_at(INSERT 때만 채워짐)은 처음 발견한 시각 그대로다.
+        """
+        def _count():
+            conn = _get_read_db()
+            rows = conn.execute("""
+                SELECT source, strftime('%Y-%m-%d %H:00:00', created_at) AS hour, COUNT(*) AS n
+                FROM posts
+                WHERE is_relevant = 1 AND created_at >= ? AND created_at < ?
+                GROUP BY source, hour
+            """, (_rollup_hour(start), _rollup_hour(end))).fetchall()
+            return {(r["source"], r["hour"]): r["n"] for r in rows}
+
+        return await asyncio.to_thread(_count)
+
     async def get_by_period(
         self, start: datetime, end: datetime, relevant_only: bool = True
     ) -> list[Post]:
         """기간별 게시물 조회."""
         def _get():
-            conn = _get_db()
+            conn = _get_read_db()
             cursor = conn.cursor()
 
             sql = """
@@ -595,23 +1296,22 @@ class PostRepositorySQLite:
 
     async def get_top_keywords(self, limit: int = 20, days: int = 2) -> list[dict]:
         """최근 N일간 is_relevant 게시물의 키워드 빈도 top K.
-        결과가 없으면 날짜 제한 없이 전체에서 조회한다."""
+        결과가 없으면 날짜 제한 없이 전체에서 조회한다.
+
+        post_keywords(관련 게시물만 보관)의 (collected_at, keyword) 인덱스만 읽는다 —
+        posts 본문 행이나 JSON 파싱을 거치지 않는다."""
         def _query():
-            conn = _get_db()
+            conn = _get_read_db()
             cursor = conn.cursor()
 
             def _run(date_filter: str | None):
-                base = """
-                    SELECT value AS keyword, COUNT(*) AS cnt
-                    FROM posts, json_each(posts.keywords)
-                    WHERE is_relevant = 1
-                      AND keywords IS NOT NULL
-                      AND keywords != '[]'
-                """
+                base = "SELECT keyword, COUNT(*) AS cnt FROM post_keywords"
+                params: list[Any] = []
                 if date_filter:
-                    base += f" AND collected_at >= datetime('now', '{date_filter}')"
-                base += " GROUP BY value ORDER BY cnt DESC LIMIT ?"
-                cursor.execute(base, (limit,))
+                    base += " WHERE collected_at >= datetime('now', ?)"
+                    params.append(date_filter)
+                base += " GROUP BY keyword ORDER BY cnt DESC LIMIT ?"
+                cursor.execute(base, (*params, limit))
                 return [{"keyword": row[0], "count": row[1]} for row in cursor.fetchall()]
 
             results = _run(f"-{days} days")
@@ -629,7 +1329,7 @@ class PostRepositorySQLite:
         단계에서 별도 섹션으로 붙는다(get_slack_only_unbriefed).
         """
         def _query():
-            conn = _get_db()
+            conn = _get_read_db()
             cursor = conn.cursor()
             placeholders = ",".join("?" * len(SLACK_ONLY_SOURCES))
             cursor.execute(f"""
@@ -644,10 +1344,55 @@ class PostRepositorySQLite:
 
         return await asyncio.to_thread(_query)
 
+    async def get_unbriefed_summaries(self, limit: int = 500) -> list[PostSummary]:
+        """get_unbriefed와 같은 대상을 경량 PostSummary로 조회 (브리핑 점수·클러스터링용).
+
+        SELECT * 대신 필요한 컬럼만 읽고 원문은 앞부분만 잘라 온다 — 미브리핑
+        적체가 수천 건이어도 content_html·media_urls 디코드와 메모리를 쓰지 않는다.
+        """
+        def _query():
+            conn = _get_read_db()
+            cursor = conn.cursor()
+            placeholders = ",".join("?" * len(SLACK_ONLY_SOURCES))
+            cursor.execute(f"""
+                SELECT {_SUMMARY_COLUMNS} FROM posts
+                WHERE is_relevant = 1
+                  AND briefed_at IS NULL
+                  AND source NOT IN ({placeholders})
+                ORDER BY collected_at DESC
+                LIMIT ?
+            """, (*SLACK_ONLY_SOURCES, limit))
+            return [_summary_from_row(row) for row in cursor.fetchall()]
+
+        return await asyncio.to_thread(_query)
+
+    async def get_by_ids(self, post_ids: list[str]) -> list[Post]:
+        """id 목록의 전체 Post 하이드레이션 (발행 확정 토픽 구성 게시물용).
+
+        입력 순서를 유지하고, 그새 삭제된 id는 건너뛴다.
+        """
+        ids = list(dict.fromkeys(str(pid) for pid in post_ids if pid is not None))
+        if not ids:
+            return []
+
+        def _query():
+            conn = _get_read_db()
+            cursor = conn.cursor()
+            found: dict[str, Post] = {}
+            for start in range(0, len(ids), _ID_CHUNK):
+                chunk = ids[start:start + _ID_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT * FROM posts WHERE id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    found[row["id"]] = _post_from_row(row)
+            return [found[pid] for pid in ids if pid in found]
+
+        return await asyncio.to_thread(_query)
+
     async def get_slack_only_unbriefed(self, limit: int = 20) -> list[Post]:
         """슬랙 전용 소스의 미발송분 (오래된 것부터 — 올라온 순서대로 보여준다)."""
         def _query():
-            conn = _get_db()
+            conn = _get_read_db()
             cursor = conn.cursor()
             placeholders = ",".join("?" * len(SLACK_ONLY_SOURCES))
             cursor.execute(f"""
@@ -666,39 +1411,32 @@ class PostRepositorySQLite:
         if not post_ids:
             return 0
 
-        def _update():
-            conn = _get_db()
-            cursor = conn.cursor()
-            placeholders = ",".join("?" * len(post_ids))
-            cursor.execute(f"""
-                UPDATE posts
-                SET briefed_at = ?
-                WHERE id IN ({placeholders})
-            """, [briefed_at.isoformat(), *post_ids])
-            conn.commit()
-            return cursor.rowcount
-
-        return await asyncio.to_thread(_update)
+        placeholders = ",".join("?" * len(post_ids))
+        return await _write_async(lambda conn: conn.execute(f"""
+            UPDATE posts
+            SET briefed_at = ?
+            WHERE id IN ({placeholders})
+        """, [briefed_at.isoformat(), *post_ids]).rowcount)
 
-    async def delete_low_importance(self, max_score: float) -> int:
+    async def delete_low_importance(self, max_score: float) -> list[tuple[str, str]]:
         """브리핑 완료(briefed_at NOT NULL)이고 중요도 max_score 이하인 게시물 삭제.
 
         브리핑이 끝난 저중요도 게시물은 재사용처가 없으므로 30일 정리를 기다리지
-        않고 즉시 지워 저장공간·조회 부담을 줄인다.
+        않고 즉시 지워 저장공간·조회 부담을 줄인다. 지운 글의 (source, external_id)를
+        돌려준다 — 호출부가 이미 본 글 인덱스에서도 빼도록.
         """
-        def _delete():
-            conn = _get_db()
-            cursor = conn.cursor()
-            cursor.execute("""
-                DELETE FROM posts
-                WHERE briefed_at IS NOT NULL
-                  AND importance_score IS NOT NULL
-                  AND importance_score <= ?
-            """, (max_score,))
-            conn.commit()
-            return cursor.rowcount
-
-        return await asyncio.to_thread(_delete)
+        rows = await _write_async(lambda conn: conn.execute("""
+            DELETE FROM posts
+            WHERE briefed_at IS NOT NULL
+              AND importance_score IS NOT NULL
+              AND importance_score <= ?
+            RETURNING source, external_id
+        """, (max_score,)).fetchall())
+        return [(r[0], r[1]) for r in rows]
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """SQLite 단일 writer의 큐 깊이·그룹 커밋 지연 지표."""
+        return writer_stats()
 
     def get_storage_info(self) -> dict[str, Any]:
         """저장 공간 정보."""
@@ -708,7 +1446,7 @@ class PostRepositorySQLite:
         size_bytes = DB_PATH.stat().st_size
         size_mb = size_bytes / (1024 * 1024)
 
-        conn = _get_db()
+        conn = _get_read_db()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM posts")
         count = cursor.fetchone()[0]
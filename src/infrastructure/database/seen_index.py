@@ -0,0 +1,180 @@
+"""이미 저장된 게시물 인덱스 — 블룸 필터 + 정확한 LRU (프로세스 전역, DB 백업).
+
+재수집분의 상당수는 본문·인게이지먼트가 그대로인 글이다. 이런 글은 콘텐츠 해시를
+계산하고 save_many로 보내 봐야 UPSERT 가드에서 무변경으로 끝난다. 여기서 미리 걸러낸다.
+
+- 블룸 필터: (source, external_id)가 '확실히 처음'인지 메모리만으로 판정 (오탐률 ~1%).
+  음성이면 LRU·DB를 볼 필요가 없다 — 새 글 대부분이 여기서 끝난다.
+- LRU: 최근 본 글의 정확한 지문(PostFingerprint). 블룸 양성 → LRU 확인 → 없으면 DB 조회
+  후 LRU에 올린다. 블룸 오탐은 DB 조회 1회로 끝나고 결과는 항상 정확하다.
+- 시작 시 최근 N일치(storage.seen_index_days)를 DB에서 읽어 데운다. 그보다 오래된 글은
+  블룸 음성 → '새 글'로 취급돼 기존 경로(save_many 가드)로 간다 — 틀리진 않고 덜 아낄 뿐.
+- DB에서 행이 빠지면 인덱스에서도 뺀다 — 지워진 글을 '본 글'로 남기면 재수집 때 건너뛰어
+  프로세스 수명에 따라 결과가 달라진다. 보존기한 정리(대량)는 warm()으로 다시 만들고,
+  브리핑 뒤 저중요도 삭제는 지운 키만 forget()으로 LRU에서 뺀다. 블룸에는 남지만
+  양성이어도 LRU 미스 → DB 조회에서 없음으로 끝나 새 글로 취급된다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+from src.domain.entities import Post
+from src.domain.value_objects.post_fingerprint import PostFingerprint
+
+logger = logging.getLogger(__name__)
+
+SeenKey = tuple[str, str]  # (source, external_id)
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 블룸 필터 (blake2b 이중 해싱)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self._m = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._k = max(1, round(self._m / capacity * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._m for i in range(self._k))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def size_kb(self) -> float:
+        return round(len(self._bits) / 1024, 1)
+
+
+def _bloom_key(key: SeenKey) -> str:
+    return f"{key[0]}\x00{key[1]}"
+
+
+class SeenPostIndex:
+    """SeenPostFilter 구현 — 블룸 필터 + LRU, 미스는 DB 조회로 보충."""
+
+    def __init__(
+        self,
+        load_recent: Callable[[], Iterable[tuple[str, str, PostFingerprint]]],
+        lookup: Callable[[list[str]], dict[SeenKey, PostFingerprint]],
+        capacity: int = 50_000,
+        expected_items: int = 200_000,
+        error_rate: float = 0.01,
+    ):
+        self._load_recent = load_recent
+        self._lookup = lookup
+        self._capacity = capacity
+        self._expected = expected_items
+        self._error_rate = error_rate
+        self._bloom = BloomFilter(expected_items, error_rate)
+        self._lru: OrderedDict[SeenKey, PostFingerprint] = OrderedDict()
+        self._db_lookups = 0
+        self._skipped = 0
+
+    # ─── 적재 ───
+
+    def warm(self) -> int:
+        """DB의 최근 게시물로 블룸·LRU를 새로 만들어 교체. 적재 건수 반환."""
+        bloom = BloomFilter(self._expected, self._error_rate)
+        lru: OrderedDict[SeenKey, PostFingerprint] = OrderedDict()
+        for source, external_id, fp in self._load_recent():
+            key = (source, external_id)
+            bloom.add(_bloom_key(key))
+            lru[key] = fp
+            if len(lru) > self._capacity:
+                lru.popitem(last=False)
+        self._bloom, self._lru = bloom, lru
+        logger.info(f"[seen] 인덱스 적재: {bloom.count}건 (블룸 {bloom.size_kb}KB, LRU {len(lru)}건)")
+        return bloom.count
+
+    def _put(self, key: SeenKey, fp: PostFingerprint) -> None:
+        if key not in self._lru:
+            self._bloom.add(_bloom_key(key))
+        self._lru[key] = fp
+        self._lru.move_to_end(key)
+        if len(self._lru) > self._capacity:
+            self._lru.popitem(last=False)
+
+    def _fingerprints(self, keys: list[SeenKey]) -> dict[SeenKey, PostFingerprint]:
+        """저장된 글의 지문 (없으면 키 자체가 빠진다)."""
+        found: dict[SeenKey, PostFingerprint] = {}
+        misses: list[SeenKey] = []
+        for key in dict.fromkeys(keys):
+            if _bloom_key(key) not in self._bloom:
+                continue  # 확실히 처음
+            fp = self._lru.get(key)
+            if fp is not None:
+                self._lru.move_to_end(key)
+                found[key] = fp
+            else:
+                misses.append(key)
+        if misses:
+            self._db_lookups += 1
+            try:
+                rows = self._lookup([eid for _, eid in misses])
+            except Exception as e:
+                logger.debug(f"[seen] DB 조회 실패 — 새 글로 취급: {e}")
+                return found
+            for key in misses:
+                fp = rows.get(key)
+                if fp is not None:
+                    self._put(key, fp)
+                    found[key] = fp
+        return found
+
+    # ─── SeenPostFilter ───
+
+    def known_ids(self, source: str, external_ids: list[str]) -> set[str]:
+        found = self._fingerprints([(source, eid) for eid in external_ids])
+        return {eid for _, eid in found}
+
+    def engagement_unchanged(self, post: Post) -> bool:
+        key = (post.source, post.external_id)
+        fp = self._fingerprints([key]).get(key)
+        return fp is not None and fp.engagement == PostFingerprint.of_engagement(
+            post.engagement_likes, post.engagement_reposts,
+            post.engagement_comments, post.engagement_views,
+        )
+
+    def split_unchanged(self, posts: list[Post]) -> tuple[list[Post], int]:
+        stored = self._fingerprints([(p.source, p.external_id) for p in posts])
+        changed: list[Post] = []
+        for post in posts:
+            fp = stored.get((post.source, post.external_id))
+            if fp is None or fp != PostFingerprint.of_post(post):
+                changed.append(post)
+        skipped = len(posts) - len(changed)
+        self._skipped += skipped
+        return changed, skipped
+
+    def remember(self, posts: list[Post]) -> None:
+        for post in posts:
+            self._put((post.source, post.external_id), PostFingerprint.of_post(post))
+
+    def forget(self, keys: list[SeenKey]) -> None:
+        for key in keys:
+            self._lru.pop(key, None)
+
+    def stats(self) -> dict[str, int | float]:
+        """적재 규모·DB 보충 조회 수·누적 생략 건수 (/api/stats 용)."""
+        return {
+            "bloom_items": self._bloom.count,
+            "bloom_kb": self._bloom.size_kb,
+            "lru_items": len(self._lru),
+            "db_lookups": self._db_lookups,
+            "skipped_unchanged": self._skipped,
+        }
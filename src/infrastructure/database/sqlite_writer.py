@@ -0,0 +1,180 @@
+"""SQLite 단일 writer 스레드 — 쓰기 직렬화 + 그룹 커밋.
+
+스케줄러 스레드·asyncio.to_thread 워커·uvicorn 핸들러가 각자 스레드 로컬
+연결로 쓰면 WAL 쓰기 락을 서로 잡으려 다투고, busy_timeout(30s)이 그 경합을
+수 초짜리 정지로 바꾼다. 쓰기는 전부 이 스레드 하나의 연결로 모은다.
+
+- 호출부는 `fn(conn) -> 결과` 형태의 쓰기 작업을 큐에 넣고 Future로 결과를 받는다
+  (동기: write(), 비동기: write_async()).
+- writer는 큐에 쌓인 작업을 최대 max_batch개씩 꺼내 **한 트랜잭션**으로 실행하고
+  한 번만 커밋한다(그룹 커밋 — fsync 1회를 여러 쓰기가 나눠 쓴다). 기다려서 모으지
+  않는다: 직전 커밋 동안 쌓인 만큼만 묶이므로 한가할 땐 지연이 늘지 않는다.
+- 작업마다 SAVEPOINT로 감싸 하나가 실패해도 같은 배치의 다른 작업은 커밋된다.
+  작업 함수는 conn.commit()/rollback()을 호출하면 안 된다(배치 트랜잭션이 깨진다).
+- 결과(Future)는 커밋이 끝난 뒤에 풀린다 — 반환 직후의 읽기는 항상 쓴 값을 본다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+WriteFn = Callable[[sqlite3.Connection], Any]
+
+# 종료 신호 (큐에 넣으면 남은 작업을 처리한 뒤 스레드가 끝난다)
+_STOP = object()
+
+
+class SQLiteWriter:
+    """DB 파일 하나에 대한 전용 쓰기 스레드."""
+
+    def __init__(self, path: Path, max_batch: int = 64, latency_window: int = 200):
+        self.path = path
+        self._max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._commit_ms: deque[float] = deque(maxlen=latency_window)
+        self._batches = 0
+        self._ops = 0
+        self._failed_ops = 0
+        self._max_depth = 0
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, timeout=30.0, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=30000")
+        except sqlite3.Error:
+            pass
+        self._thread = threading.Thread(
+            target=self._run, name=f"sqlite-writer:{path.name}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, fn: WriteFn) -> Future:
+        """쓰기 작업을 큐에 넣고 Future를 돌려준다 (커밋 후 결과/예외가 채워진다)."""
+        fut: Future = Future()
+        if threading.current_thread() is self._thread:
+            # 작업 안에서 다시 쓰기를 부르면 자기 자신을 기다리며 멈춘다 — 즉시 실행
+            try:
+                fut.set_result(fn(self._conn))
+            except BaseException as e:
+                fut.set_exception(e)
+            return fut
+        self._queue.put((fn, fut))
+        depth = self._queue.qsize()
+        if depth > self._max_depth:
+            self._max_depth = depth
+        return fut
+
+    def write(self, fn: WriteFn) -> Any:
+        """동기 쓰기 — 커밋될 때까지 블록하고 fn의 반환값을 돌려준다."""
+        return self.submit(fn).result()
+
+    async def write_async(self, fn: WriteFn) -> Any:
+        """비동기 쓰기 — 이벤트 루프를 막지 않고 커밋을 기다린다."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def stats(self) -> dict[str, Any]:
+        """큐 깊이·커밋 지연 지표 (health 로그·/api/stats 용)."""
+        samples = sorted(self._commit_ms)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self._max_depth,
+            "batches": self._batches,
+            "ops": self._ops,
+            "failed_ops": self._failed_ops,
+            "avg_batch_size": round(self._ops / self._batches, 2) if self._batches else 0.0,
+            "commit_ms_last": round(self._commit_ms[-1], 2) if self._commit_ms else 0.0,
+            "commit_ms_avg": round(sum(samples) / len(samples), 2) if samples else 0.0,
+            "commit_ms_p95": round(p95, 2),
+        }
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 작업을 처리하고 스레드·연결을 정리한다."""
+        if self.alive:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    # ─── writer 스레드 ───
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            while len(batch) < self._max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _STOP:
+                    stopping = True
+                    break
+                batch.append(nxt)
+            self._run_batch(batch)
+        self._conn.close()
+
+    def _run_batch(self, batch: list[tuple[WriteFn, Future]]) -> None:
+        conn = self._conn
+        outcomes: list[tuple[Future, bool, Any]] = []
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, fut in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT op")
+                try:
+                    result = fn(conn)
+                except BaseException as e:
+                    conn.execute("ROLLBACK TO op")
+                    conn.execute("RELEASE op")
+                    outcomes.append((fut, False, e))
+                    continue
+                conn.execute("RELEASE op")
+                outcomes.append((fut, True, result))
+            conn.execute("COMMIT")
+        except BaseException as e:
+            # BEGIN/COMMIT 자체 실패 — 배치 전체가 반영되지 않았다
+            logger.error(f"[sqlite-writer] 배치 커밋 실패({len(batch)}건): {e}")
+            try:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            for _, fut in batch:
+                if fut.done():
+                    continue
+                if fut.running() or fut.set_running_or_notify_cancel():
+                    fut.set_exception(e)
+            self._failed_ops += len(batch)
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._commit_ms.append(elapsed_ms)
+        self._batches += 1
+        self._ops += len(outcomes)
+        for fut, ok, value in outcomes:
+            if ok:
+                fut.set_result(value)
+            else:
+                self._failed_ops += 1
+                fut.set_exception(value)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
@@ -47,33 +48,44 @@ async def search_posts(
     source: str | None = None,
     category: str | None = None,
     limit: int = 30,
-    offset: int = 0,
+    cursor: str | None = None,
 ):
-    """게시물 검색 API."""
-    cache_key = f"posts:{q}:{source}:{category}:{limit}:{offset}"
+    """게시물 검색 API — 응답의 next_cursor를 cursor로 넘기면 다음 페이지.
+
+    페이지는 최신순으로 나뉘고, 검색어가 있으면 각 페이지 안에서만 관련도순이다.
+    """
+    cache_key = f"posts:{q}:{source}:{category}:{limit}:{cursor}"
     cached = _cache_get(cache_key)
     if cached is not None:
         return cached
 
     c = _get_container(request)
-    posts = await c.post_repo.search(
-        query=q, source=source, category=category, limit=limit, offset=offset
-    )
-    result = [
-        {
-            "id": p.id,
-            "source": p.source,
-            "author": p.author,
-            "content_text": p.content_text[:200],
-            "summary": p.summary,
-            "url": p.url,
-            "importance_score": p.importance_score,
-            "category_names": p.category_names,
-            "keywords": p.keywords,
-            "collected_at": _iso(p.collected_at),
-        }
-        for p in posts
-    ]
+    try:
+        posts, next_cursor = await c.post_repo.search_page(
+            query=q, source=source, category=category, limit=limit, cursor=cursor
+        )
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "잘못된 커서"})
+    result = {
+        "posts": [
+            {
+                "id": p.id,
+                "source": p.source,
+                "author": p.author,
+                "content_text": p.content_text[:200],
+                "summary": p.summary,
+                "url": p.url,
+                "importance_score": p.importance_score,
+                "category_names": p.category_names,
+                "keywords": p.keywords,
+                "collected_at": _iso(p.collected_at),
+                # 검색어 하이라이트 발췌(<mark>, HTML 이스케이프 완료) — 검색어 없으면 None
+                "snippet": (p.raw_data or {}).get("snippet"),
+            }
+            for p in posts
+        ],
+        "next_cursor": next_cursor,
+    }
     _cache_set(cache_key, result)
     return result
 
@@ -88,6 +100,12 @@ async def trigger_collection(request: Request, source: str):
         return {
             "status": run.status,
             "posts_collected": run.posts_collected,
+            "posts_inserted": run.posts_inserted,
+            "posts_updated": run.posts_updated,
+            "posts_unchanged": run.posts_unchanged,
+            "http_requests": run.http_requests,
+            "http_cache_hits": run.http_cache_hits,
+            "scroll_yields": run.scroll_yields,
             "error": run.error_message,
         }
     except ValueError as e:
@@ -289,19 +307,47 @@ async def stats(request: Request):
     c = _get_container(request)
     try:
         now = datetime.utcnow()
-        counts = await c.post_repo.count_by_source(now - timedelta(hours=24), now)
+        since = now - timedelta(hours=24)
+        # 시간별 롤업(post_hourly_counts)에서 읽는다 — posts 스캔 없음
+        counts = await c.post_repo.count_by_source(since, now)
+        category_counts = await c.post_repo.count_by_category(since, now)
+        hourly = await c.post_repo.get_hourly_counts(since, now)
         runs = await c.run_repo.get_recent(limit=10)
         result = {
             "source_counts_24h": counts,
+            "category_counts_24h": category_counts,
+            "hourly_24h": hourly,
             "recent_runs": [
                 {
                     "source": r.source,
                     "status": r.status,
                     "posts_collected": r.posts_collected,
+                    "posts_inserted": r.posts_inserted,
+                    "posts_updated": r.posts_updated,
+                    "posts_unchanged": r.posts_unchanged,
+                    "http_requests": r.http_requests,
+                    "http_cache_hits": r.http_cache_hits,
+                    "http_cache_hit_rate": r.http_cache_hit_rate,
+                    "scroll_yields": r.scroll_yields,
                     "started_at": _iso(r.started_at),
                 }
                 for r in runs
             ],
+            # SQLite 단일 writer 큐 깊이·그룹 커밋 지연 (쓰기 경합 감시용)
+            "db_writer": c.post_repo.get_write_stats(),
+            # 콜드 스토리지(월별 압축 아카이브) 규모 — 월 파일마다 COUNT(*)라 스레드에서
+            "archive": await asyncio.to_thread(c.post_repo.get_archive_stats),
+            # 이미 저장된 글 인덱스(블룸+LRU) 규모·저장 전 생략 누적
+            "seen_index": c.seen_index.stats(),
+            # 장수명 CDP 연결 — 연결 경과 시간·재연결 수·lease 대기
+            "cdp": c.cdp.stats(),
+            # 수집 주기 — 고정 대비 adaptive 계획·적용 중 주기
+            "schedule": {
+                "adaptive": c.schedule_planner.enabled,
+                "sources": [
+                    p.as_dict() for p in await c.schedule_planner.snapshot(list(c.collectors))
+                ],
+            },
         }
         _cache_set("stats", result)
         return result
@@ -310,25 +356,28 @@ async def stats(request: Request):
 
 
 @router.get("/briefings")
-async def list_briefings(request: Request, limit: int = 20, offset: int = 0):
-    """브리핑 목록 API."""
+async def list_briefings(request: Request, limit: int = 20, cursor: str | None = None):
+    """브리핑 목록 API — 응답의 next_cursor를 cursor로 넘기면 다음 페이지."""
     c = _get_container(request)
     try:
-        briefings = await c.briefing_repo.get_all(limit=limit * 2, offset=offset)
-        return {
-            "briefings": [
-                {
-                    "id": b.id,
-                    "title": b.title,
-                    "generated_at": _iso(b.generated_at),
-                    "total_items": b.total_items,
-                }
-                for b in briefings[:limit]
-            ],
-            "has_more": len(briefings) > limit,
-        }
+        briefings, next_cursor = await c.briefing_repo.get_page(limit=limit, cursor=cursor)
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "잘못된 커서"})
     except Exception:
         return JSONResponse(status_code=500, content={"error": "브리핑 조회 실패"})
+    return {
+        "briefings": [
+            {
+                "id": b.id,
+                "title": b.title,
+                "generated_at": _iso(b.generated_at),
+                "total_items": b.total_items,
+            }
+            for b in briefings
+        ],
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
 
 
 @router.get("/briefings/{briefing_id}")
@@ -377,7 +426,7 @@ async def submit_feedback(request: Request):
             return JSONResponse(status_code=404, content={"error": "항목을 찾을 수 없음"})
 
         it = b.items[item_index]
-        c.feedback_repo.upsert(
+        await c.feedback_repo.upsert_async(
             briefing_id=str(briefing_id),
             item_index=item_index,
             headline=it.headline,
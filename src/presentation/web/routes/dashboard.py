@@ -28,11 +28,11 @@ async def dashboard(request: Request):
     recent_posts = c.post_repo.find_recent(limit=30)
     recent_runs = await c.run_repo.get_recent(limit=10)
 
-    source_counts = {}  # SQLite는 아직 count_by_source 미구현
+    # 최근 24시간 소스별 수집 건수 (시간별 롤업 — posts 스캔 없음)
+    source_counts = {}
     try:
-        for source in ["twitter", "threads", "linkedin"]:
-            posts = c.post_repo.find_by_source(source, limit=100)
-            source_counts[source] = len(posts)
+        now = datetime.utcnow()
+        source_counts = await c.post_repo.count_by_source(now - timedelta(hours=24), now)
     except Exception:
         pass
 
@@ -49,17 +49,27 @@ async def dashboard(request: Request):
 
 
 @router.get("/briefings", response_class=HTMLResponse)
-async def briefing_archive(request: Request, page: int = 1):
-    """브리핑 아카이브."""
+async def briefing_archive(request: Request, cursor: str | None = None):
+    """브리핑 아카이브 (커서 페이지네이션)."""
     c = _get_container(request)
     templates = _get_templates(request)
 
     per_page = 20
-    briefings = await c.briefing_repo.get_all(limit=per_page, offset=(page - 1) * per_page)
+    try:
+        briefings, next_cursor = await c.briefing_repo.get_page(limit=per_page, cursor=cursor)
+    except ValueError:
+        # 손상된 커서 링크 — 첫 페이지로
+        cursor = None
+        briefings, next_cursor = await c.briefing_repo.get_page(limit=per_page)
 
     return templates.TemplateResponse(
         "archive.html",
-        {"request": request, "briefings": briefings, "page": page},
+        {
+            "request": request,
+            "briefings": briefings,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+        },
     )
 
 
@@ -83,16 +93,23 @@ async def posts_page(
     source: str | None = None,
     category: str | None = None,
     q: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
 ):
-    """게시물 탐색 (검색 + 필터)."""
+    """게시물 탐색 (검색 + 필터, 커서 페이지네이션)."""
     c = _get_container(request)
     templates = _get_templates(request)
 
     per_page = 50
-    posts = await c.post_repo.search(
-        query=q, source=source, category=category, limit=per_page, offset=(page - 1) * per_page
-    )
+    try:
+        posts, next_cursor = await c.post_repo.search_page(
+            query=q, source=source, category=category, limit=per_page, cursor=cursor
+        )
+    except ValueError:
+        # 손상됐거나 검색 조건과 안 맞는 커서 — 첫 페이지로
+        cursor = None
+        posts, next_cursor = await c.post_repo.search_page(
+            query=q, source=source, category=category, limit=per_page
+        )
     categories = await c.category_repo.get_all()
 
     return templates.TemplateResponse(
@@ -104,7 +121,8 @@ async def posts_page(
             "current_source": source,
             "current_category": category,
             "current_query": q,
-            "page": page,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
         },
     )
 
@@ -122,6 +140,13 @@ async def system_status(request: Request):
     for source in c.collectors:
         last_success[source] = await c.run_repo.get_last_successful(source)
 
+    # 수집 주기 — 고정 대비 adaptive 계획 (모드가 꺼져 있어도 켰을 때의 계획을 보여 준다)
+    schedule = []
+    try:
+        schedule = await c.schedule_planner.snapshot(list(c.collectors.keys()))
+    except Exception:
+        pass
+
     return templates.TemplateResponse(
         "status.html",
         {
@@ -129,5 +154,7 @@ async def system_status(request: Request):
             "runs": runs,
             "last_success": last_success,
             "collectors": list(c.collectors.keys()),
+            "schedule": schedule,
+            "adaptive": c.schedule_planner.enabled,
         },
     )
@@ -0,0 +1,85 @@
+"""adaptive 수집 주기 — 한산한 시간대는 늘리고 붐비는 시간대는 줄이되, 범위·KST 정렬을 지킨다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from src.application.use_cases.adaptive_schedule import AdaptiveSchedulePlanner, snap_interval
+from src.application.use_cases.scheduler import Orchestrator
+from src.infrastructure.config.settings import CollectorConfig, ScheduleConfig
+
+KST = ZoneInfo("Asia/Seoul")
+BUSY = (0, 10)  # 월 10시
+QUIET = (0, 3)  # 월 03시
+
+
+class _Repos:
+    """4주 × 168시간, 시간당 3회 실행. 평소 실행당 관련 1건, BUSY 4건, QUIET 0건."""
+
+    def __init__(self, source: str = "twitter"):
+        self.runs: dict[tuple[str, str], int] = {}
+        self.first_seen: dict[tuple[str, str], int] = {}
+        start = datetime(2026, 9, 7, tzinfo=KST)  # 월요일 0시
+        for h in range(24 * 7 * 4):
+            at = start + timedelta(hours=h)
+            key = at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:00:00")
+            per_run = {BUSY: 4, QUIET: 0}.get((at.weekday(), at.hour), 1)
+            self.runs[(source, key)] = 3
+            self.first_seen[(source, key)] = 3 * per_run
+
+    async def count_runs_by_hour(self, since):
+        return self.runs
+
+    async def count_relevant_by_first_seen(self, start, end):
+        return self.first_seen
+
+
+def _planner(repos, **schedule) -> AdaptiveSchedulePlanner:
+    collectors = {"twitter": CollectorConfig({"interval_minutes": 20})}
+    return AdaptiveSchedulePlanner(
+        ScheduleConfig({"adaptive": True, **schedule}), collectors, repos, repos, KST
+    )
+
+
+def _at(weekday: int, hour: int) -> datetime:
+    return datetime(2026, 10, 5, hour, 30, tzinfo=KST) + timedelta(days=weekday)
+
+
+async def test_stretches_quiet_hours_and_shrinks_busy_ones():
+    planner = _planner(_Repos())
+    await planner.refresh()
+
+    assert planner.plan("twitter", _at(*QUIET)) == 60  # ×4 상한(80) 안의 정렬 가능한 최댓값
+    assert planner.plan("twitter", _at(*BUSY)) == 10  # ×0.5 하한
+    assert planner.plan("twitter", _at(2, 15)) == 20  # 평소 시간대는 고정 주기
+
+    plans = await planner.snapshot(["twitter"])
+    assert plans[0].fixed == 20 and len(plans[0].next_24h) == 24
+
+
+async def test_falls_back_to_fixed_without_enough_history():
+    repos = _Repos()
+    planner = _planner(repos, min_runs=len(repos.runs) * 3 + 1)
+    await planner.refresh()
+    assert planner.plan("twitter", _at(*QUIET)) == 20
+
+
+def test_snap_keeps_alignable_intervals_within_bounds():
+    assert snap_interval(80, 10, 80) == 60
+    assert snap_interval(100, 60, 240) == 120
+    assert snap_interval(7, 10, 80) == 10
+    assert snap_interval(50, 45, 55) == 50  # 범위 안에 정렬 값이 없으면 분 값 그대로
+
+
+def test_stretched_cdp_source_keeps_stagger_minute():
+    container = SimpleNamespace(
+        config=SimpleNamespace(timezone="Asia/Seoul"), schedule_planner=None
+    )
+    orch = Orchestrator(container)
+    now = datetime(2026, 10, 5, 13, 10, tzinfo=KST)
+
+    staggered = orch._collection_trigger(60, 4, hourly_offset=True)
+    assert staggered.get_next_fire_time(None, now).minute == 4
+    assert orch._collection_trigger(60, 4).get_next_fire_time(None, now).minute == 0
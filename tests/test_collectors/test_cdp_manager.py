@@ -0,0 +1,173 @@
+"""장수명 CDP 연결 — 잡 사이에 연결을 재사용하고, 끊기면 다음 lease에서 다시 연결한다.
+탭 배정은 전역 예산·플랫폼 배제·우선순위를 지킨다."""
+
+from __future__ import annotations
+
+import asyncio
+
+import src.infrastructure.collectors.cdp as cdp
+from src.infrastructure.collectors.cdp import (
+    PRIORITY_COLLECT,
+    PRIORITY_ENGAGE,
+    CdpConnectionManager,
+    TabScheduler,
+    cdp_connection,
+)
+
+
+class _Browser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = [object()]
+
+    def is_connected(self):
+        return self.connected
+
+
+class _Chromium:
+    def __init__(self, driver):
+        self._driver = driver
+
+    async def connect_over_cdp(self, url, timeout=None):
+        browser = _Browser()
+        self._driver.browsers.append(browser)
+        return browser
+
+
+class _Driver:
+    """async_playwright() 대역 — start()/stop() 횟수와 만든 연결을 기록."""
+
+    def __init__(self):
+        self.starts = 0
+        self.stops = 0
+        self.browsers: list[_Browser] = []
+        self.chromium = _Chromium(self)
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        self.starts += 1
+        return self
+
+    async def stop(self):
+        self.stops += 1
+
+
+def _patch(monkeypatch) -> _Driver:
+    driver = _Driver()
+    monkeypatch.setattr(cdp, "async_playwright", driver)
+    return driver
+
+
+async def test_leases_reuse_one_connection(monkeypatch):
+    driver = _patch(monkeypatch)
+    manager = CdpConnectionManager("http://127.0.0.1:9222")
+
+    for source in ("twitter", "threads", "linkedin"):
+        async with cdp_connection("http://127.0.0.1:9222", source, manager) as (_, context):
+            assert context is driver.browsers[0].contexts[0]
+
+    assert (driver.starts, driver.stops, len(driver.browsers)) == (1, 0, 1)
+    stats = manager.stats()
+    assert stats["connected"] and stats["leases"] == 3 and stats["reconnects"] == 0
+
+    await manager.aclose()
+    assert driver.stops == 1
+
+
+async def test_reconnects_after_chrome_restart(monkeypatch):
+    driver = _patch(monkeypatch)
+    manager = CdpConnectionManager("http://127.0.0.1:9222")
+
+    async with manager.lease("twitter"):
+        pass
+    driver.browsers[0].connected = False  # Chrome 재시작으로 연결이 끊김
+
+    async with manager.lease("twitter") as (_, context):
+        assert context is driver.browsers[1].contexts[0]
+    assert manager.stats()["reconnects"] == 1
+    assert driver.stops == 1  # 끊긴 드라이버는 정리
+
+
+async def test_tab_budget_bounds_concurrent_jobs(monkeypatch):
+    _patch(monkeypatch)
+    manager = CdpConnectionManager("http://127.0.0.1:9222", tab_budget=1)
+    order: list[str] = []
+
+    async def job(name: str):
+        async with manager.lease(name):
+            order.append(f"{name}+")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-")
+
+    await asyncio.gather(job("a"), job("b"))
+    assert order == ["a+", "a-", "b+", "b-"]
+    assert manager.stats()["jobs"]["b"]["wait_max_ms"] > 0
+
+
+async def _run(scheduler: TabScheduler, log: list[str], platform: str, name: str, priority: int = 0):
+    await scheduler.acquire(platform, priority)
+    log.append(f"{name}+")
+    await asyncio.sleep(0.01)
+    log.append(f"{name}-")
+    scheduler.release(platform)
+
+
+async def test_scheduler_excludes_same_platform_but_runs_others_in_parallel():
+    scheduler = TabScheduler(tab_budget=3)
+    log: list[str] = []
+    await asyncio.gather(
+        _run(scheduler, log, "twitter", "x1"),
+        _run(scheduler, log, "twitter", "x2"),
+        _run(scheduler, log, "linkedin", "li"),
+    )
+    # x2는 x1이 끝날 때까지 대기, 그 사이 linkedin은 다른 탭에서 동시에
+    assert log.index("li+") < log.index("x1-")
+    assert log.index("x2+") > log.index("x1-")
+
+
+async def test_scheduler_prefers_collection_over_engagement():
+    scheduler = TabScheduler(tab_budget=1)
+    log: list[str] = []
+    await scheduler.acquire("dcinside")  # 자리 점유 — 아래 셋은 모두 대기열로
+    waiters = [
+        asyncio.create_task(_run(scheduler, log, "twitter", "like", PRIORITY_ENGAGE)),
+        asyncio.create_task(_run(scheduler, log, "threads", "follow", PRIORITY_ENGAGE)),
+        asyncio.create_task(_run(scheduler, log, "linkedin", "collect", PRIORITY_COLLECT)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 3
+    scheduler.release("dcinside")
+    await asyncio.gather(*waiters)
+    assert [e for e in log if e.endswith("+")] == ["collect+", "like+", "follow+"]
+
+
+async def test_without_manager_connects_per_call(monkeypatch):
+    driver = _patch(monkeypatch)
+    for _ in range(2):
+        async with cdp_connection("http://127.0.0.1:9222", "dcinside"):
+            pass
+    assert (driver.starts, driver.stops) == (2, 2)
+
+
+async def test_idle_probe_skipped_while_another_lease_is_working(monkeypatch):
+    """오래 걸리는 lease 중에 다음 lease가 점검 실패로 드라이버를 내리면 안 된다."""
+    driver = _patch(monkeypatch)
+    manager = CdpConnectionManager("http://127.0.0.1:9222", health_check_s=0)
+
+    async with manager.lease("twitter") as (_, first):
+        # 대역 브라우저엔 CDP 세션이 없어 유휴 점검은 항상 실패한다
+        async with manager.lease("threads") as (_, second):
+            assert second is first
+        assert (driver.starts, driver.stops) == (1, 0)
+        assert manager.stats()["active_leases"] == 1
+
+        driver.browsers[0].connected = False  # 정말 끊긴 경우는 작업 중이어도 다시 연결
+        async with manager.lease("linkedin") as (_, third):
+            assert third is driver.browsers[1].contexts[0]
+
+    # 모두 돌려준 뒤의 유휴 점검 실패는 그대로 재연결
+    async with manager.lease("twitter") as (_, context):
+        assert context is driver.browsers[2].contexts[0]
+    assert manager.stats()["reconnects"] == 2
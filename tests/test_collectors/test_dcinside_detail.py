@@ -0,0 +1,119 @@
+"""DCInside 상세 페이지 HTTP 수집 — 병렬로 받고, 차단되면 남은 글을 CDP 폴백으로 넘긴다."""
+
+from __future__ import annotations
+
+import httpx
+
+from src.domain.entities import Post
+from src.infrastructure.collectors.dcinside_collector import DCInsideCollector
+from src.infrastructure.collectors.http import SharedHttpClient
+from src.infrastructure.config.settings import CollectorConfig
+
+DETAIL = '<html><body><div class="write_div">본문 {no}<img src="https://dcimg8.dcinside.co.kr/{no}.jpg"></div></body></html>'
+
+
+def _post(no: int) -> Post:
+    return Post(
+        source="dcinside", external_id=f"dc_thesingularity_{no}",
+        url=f"https://gall.dcinside.com/mgallery/board/view/?id=thesingularity&no={no}",
+        author="ㅇㅇ", content_text=f"제목 {no}",
+    )
+
+
+def _collector(handler) -> tuple[DCInsideCollector, SharedHttpClient]:
+    client = SharedHttpClient(transport=httpx.MockTransport(handler))
+    config = CollectorConfig({"detail_concurrency": 3, "detail_interval": 0})
+    return DCInsideCollector(config, http=client), client
+
+
+async def test_details_fetched_over_http():
+    referers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        referers.append(request.headers.get("referer", ""))
+        return httpx.Response(200, text=DETAIL.format(no=request.url.params["no"]))
+
+    collector, client = _collector(handler)
+    posts = [_post(n) for n in range(1, 6)]
+    try:
+        pending = await collector._fetch_details_http(posts)
+    finally:
+        await client.aclose()
+
+    assert pending == []
+    assert posts[2].content_text == "제목 3\n\n본문 3"
+    assert posts[2].media_urls == ["https://dcimg8.dcinside.co.kr/3.jpg"]
+    assert all("exception_mode=recommend" in r for r in referers)
+    assert collector.fetch_stats.requests == 5
+
+
+async def test_block_hands_remaining_posts_to_cdp():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["no"] == "2":
+            return httpx.Response(429)
+        return httpx.Response(200, text=DETAIL.format(no=request.url.params["no"]))
+
+    collector, client = _collector(handler)
+    collector._config.detail_concurrency = 1  # 순서대로 — 2번에서 막히면 3번부터는 보내지 않는다
+    posts = [_post(n) for n in range(1, 5)]
+    try:
+        pending = await collector._fetch_details_http(posts)
+    finally:
+        await client.aclose()
+
+    assert [p.external_id for p in pending] == [
+        "dc_thesingularity_2", "dc_thesingularity_3", "dc_thesingularity_4",
+    ]
+    assert posts[0].content_text.endswith("본문 1")
+    assert pending[0].content_text == "제목 2"
+    assert collector.fetch_stats.requests == 2
+
+
+async def test_page_without_body_counts_as_blocked():
+    collector, client = _collector(lambda r: httpx.Response(200, text="<html>캡차</html>"))
+    try:
+        pending = await collector._fetch_details_http([_post(1)])
+    finally:
+        await client.aclose()
+    assert len(pending) == 1
+
+
+async def test_image_only_post_keeps_http_path():
+    image_only = '<div class="write_div"><img src="https://dcimg8.dcinside.co.kr/1.jpg"></div>'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        no = request.url.params["no"]
+        return httpx.Response(200, text=image_only if no == "1" else DETAIL.format(no=no))
+
+    collector, client = _collector(handler)
+    collector._config.detail_concurrency = 1
+    posts = [_post(n) for n in range(1, 4)]
+    try:
+        pending = await collector._fetch_details_http(posts)
+    finally:
+        await client.aclose()
+
+    assert pending == []
+    assert posts[0].content_text == "제목 1"
+    assert posts[0].media_urls == ["https://dcimg8.dcinside.co.kr/1.jpg"]
+    assert posts[2].content_text == "제목 3\n\n본문 3"
+    assert collector.fetch_stats.failed == 0
+
+
+async def test_deleted_post_fails_alone():
+    def handler(request: httpx.Request) -> httpx.Response:
+        no = request.url.params["no"]
+        return httpx.Response(404) if no == "1" else httpx.Response(200, text=DETAIL.format(no=no))
+
+    collector, client = _collector(handler)
+    collector._config.detail_concurrency = 1
+    posts = [_post(n) for n in range(1, 4)]
+    try:
+        pending = await collector._fetch_details_http(posts)
+    finally:
+        await client.aclose()
+
+    assert pending == []
+    assert posts[0].content_text == "제목 1"
+    assert posts[1].content_text == "제목 2\n\n본문 2"
+    assert (collector.fetch_stats.requests, collector.fetch_stats.failed) == (3, 1)
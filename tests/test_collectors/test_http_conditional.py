@@ -0,0 +1,179 @@
+"""조건부 GET — ETag/Last-Modified를 되돌려 보내고, 304·동일 본문이면 파싱을 건너뛴다."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import httpx
+
+from src.application.use_cases.collect_posts import CollectPostsUseCase
+from src.infrastructure.collectors.http import (
+    FetchStats,
+    SharedHttpClient,
+    ValidatorCache,
+    fetch_stream,
+    fetch_text,
+)
+from src.infrastructure.collectors.producthunt_collector import FEED_URL, ProductHuntCollector
+from src.infrastructure.config.settings import CollectorConfig
+
+FEED = """<feed><entry><id>tag:www.producthunt.com,2005:Post/{pid}</id>
+<title>Tool {pid}</title><link href="https://www.producthunt.com/products/t{pid}"/>
+<content>A tool</content></entry></feed>"""
+
+
+def _server(log: list[dict], etag: str | None = '"v1"', body: str = "<rss/>"):
+    """If-None-Match가 현재 etag와 같으면 304, 아니면 200."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        log.append(dict(request.headers))
+        if etag and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        headers = {"Last-Modified": "Tue, 14 Jul 2026 00:00:00 GMT"}
+        if etag:
+            headers["ETag"] = etag
+        return httpx.Response(200, text=body, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+async def test_etag_roundtrip_and_304_short_circuit(tmp_path):
+    log: list[dict] = []
+    cache_path = tmp_path / "validators.json"
+    client = SharedHttpClient(validators=ValidatorCache(cache_path), transport=_server(log))
+    stats = FetchStats()
+    try:
+        assert await fetch_text("https://a.example/rss", "t", client=client, stats=stats) == "<rss/>"
+        assert not cache_path.exists()  # 저장이 끝나기 전엔 반영하지 않는다
+        await stats.commit_validators()
+        assert await fetch_text("https://a.example/rss", "t", client=client, stats=stats) is None
+    finally:
+        await client.aclose()
+
+    assert "if-none-match" not in log[0]
+    assert log[1]["if-none-match"] == '"v1"'
+    assert log[1]["if-modified-since"] == "Tue, 14 Jul 2026 00:00:00 GMT"
+    assert (stats.requests, stats.not_modified, stats.unchanged, stats.failed) == (2, 1, 0, 0)
+
+    # 재시작해도 디스크의 검증자로 첫 요청부터 조건부
+    reloaded = ValidatorCache(cache_path)
+    assert reloaded.conditional_headers("https://a.example/rss")["If-None-Match"] == '"v1"'
+
+
+async def test_body_hash_catches_servers_without_validators():
+    log: list[dict] = []
+    client = SharedHttpClient(validators=ValidatorCache(), transport=_server(log, etag=None))
+    stats = FetchStats()
+    try:
+        assert await fetch_text("https://b.example/", "t", client=client, stats=stats)
+        await stats.commit_validators()
+        assert await fetch_text("https://b.example/", "t", client=client, stats=stats) is None
+    finally:
+        await client.aclose()
+    assert stats.unchanged == 1 and stats.hit_rate == 0.5
+
+
+async def test_collector_reports_hits_and_skips_parse():
+    pid = {"n": 1}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = FEED.format(pid=pid["n"])
+        etag = f'"{pid["n"]}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text=body, headers={"ETag": etag})
+
+    client = SharedHttpClient(validators=ValidatorCache(), transport=httpx.MockTransport(handler))
+    collector = ProductHuntCollector(CollectorConfig({}), http=client)
+    try:
+        assert len(await collector.collect()) == 1
+        await collector.fetch_stats.commit_validators()
+        assert await collector.collect() == []  # 304 — 파싱 생략
+        assert (collector.fetch_stats.requests, collector.fetch_stats.hits) == (1, 1)
+
+        pid["n"] = 2  # 피드 갱신
+        posts = await collector.collect()
+        assert [p.external_id for p in posts] == ["ph_2"]
+        assert collector.fetch_stats.hits == 0
+    finally:
+        await client.aclose()
+
+
+async def test_stream_stops_early_and_keeps_validators():
+    body = b"x" * 10_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"s1"':
+            return httpx.Response(304)
+        async def chunks():
+            for i in range(0, len(body), 1000):
+                yield body[i:i + 1000]
+
+        return httpx.Response(200, content=chunks(), headers={"ETag": '"s1"'})
+
+    client = SharedHttpClient(validators=ValidatorCache(), transport=httpx.MockTransport(handler))
+    stats = FetchStats()
+    seen: list[int] = []
+
+    def consume(chunk: bytes) -> bool:
+        seen.append(len(chunk))
+        return sum(seen) >= 3000  # 필요한 만큼 읽었다
+
+    try:
+        assert await fetch_stream("https://s.example/rss", "t", consume, client=client, stats=stats)
+        assert sum(seen) == 3000
+        await stats.commit_validators()
+        assert not await fetch_stream("https://s.example/rss", "t", consume, client=client, stats=stats)
+    finally:
+        await client.aclose()
+    assert (stats.requests, stats.not_modified) == (2, 1)
+
+
+class _FlakyRepo:
+    """첫 저장은 실패(DB 잠김 등), 그다음부터 성공."""
+
+    def __init__(self):
+        self.calls = 0
+        self.saved: list[str] = []
+
+    async def save_many_async(self, posts):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("database is locked")
+        self.saved.extend(p.external_id for p in posts)
+        return SimpleNamespace(total=len(posts), inserted=len(posts), updated=0, unchanged=0)
+
+
+class _RunRepo:
+    async def save(self, run):
+        return run
+
+    async def update(self, run):
+        return run
+
+
+async def test_failed_save_keeps_validators_uncommitted(tmp_path):
+    """저장에 실패한 본문은 다음 사이클에 304로 건너뛰지 않고 다시 받아 저장한다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=FEED.format(pid=1), headers={"ETag": '"1"'})
+
+    cache = ValidatorCache(tmp_path / "validators.json")
+    client = SharedHttpClient(validators=cache, transport=httpx.MockTransport(handler))
+    collector = ProductHuntCollector(CollectorConfig({}), http=client)
+    repo = _FlakyRepo()
+    try:
+        failed = await CollectPostsUseCase(collector, repo, _RunRepo()).execute()
+        assert failed.status == "failed"
+        assert cache.get(FEED_URL) is None
+
+        run = await CollectPostsUseCase(collector, repo, _RunRepo()).execute()
+        assert run.status == "success" and repo.saved == ["ph_1"]
+        assert run.http_cache_hits == 0  # 조건부 GET 없이 전체 본문
+
+        again = await CollectPostsUseCase(collector, repo, _RunRepo()).execute()
+        assert again.http_cache_hits == 1  # 저장 성공 뒤에야 304
+    finally:
+        await client.aclose()
+    reloaded = ValidatorCache(tmp_path / "validators.json")
+    assert reloaded.conditional_headers(FEED_URL) == {"If-None-Match": '"1"'}
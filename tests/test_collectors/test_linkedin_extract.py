@@ -0,0 +1,73 @@
+"""LinkedIn JS 일괄 추출 — 원시 필드 해석이 요소별 추출과 같은 규칙을 따른다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from src.infrastructure.collectors.linkedin_collector import (
+    LinkedInCollector,
+    _engagement_from_text,
+    _match_author_url,
+)
+from src.infrastructure.config.settings import CollectorConfig
+
+
+def _raw(**over) -> dict:
+    raw = {
+        "index": 3,
+        "content": "에이전트 평가 파이프라인 정리",
+        "time_attr": "",
+        "sub_texts": ["", "", "3시간 • "],
+        "mgmt_label": "Douglas Guen 님의 게시물에 대한 관리 메뉴 열기",
+        "mgmt_label_en": "",
+        "profile_labels": ["Jane Doe님의 프로필 보기"],
+        "company_label": "",
+        "legacy_actor": "",
+        "links": [
+            ["Jane Doe", "/in/jane-doe/"],  # 소셜 프루프 헤더 — 작성자 아님
+            ["Douglas Guen\n· 1촌", "https://www.linkedin.com/in/dguen/?trk=feed"],
+        ],
+        "urn": "urn:li:activity:7434660713215885312",
+        "full_text": "반응 1,204\n댓글 37\n퍼온글 5",
+        "legacy_counts": ["", "", ""],
+    }
+    raw.update(over)
+    return raw
+
+
+def _collector() -> LinkedInCollector:
+    return LinkedInCollector(CollectorConfig({"max_age_days": 7}))
+
+
+async def test_post_from_extracted_with_urn():
+    post = await _collector()._post_from_extracted(_raw(), page=None)
+
+    assert post.external_id == "li_7434660713215885312"
+    assert post.url == "https://www.linkedin.com/feed/update/urn:li:activity:7434660713215885312/"
+    assert post.author == "Douglas Guen"
+    assert post.author_url.startswith("https://www.linkedin.com/in/dguen")
+    assert (post.engagement_likes, post.engagement_comments, post.engagement_reposts) == (1204, 37, 5)
+    assert datetime.utcnow() - post.published_at < timedelta(hours=4)
+
+
+async def test_post_from_extracted_cutoff_and_fallbacks():
+    collector = _collector()
+    old = _raw(time_attr=(datetime.utcnow() - timedelta(days=30)).isoformat() + "Z")
+    assert await collector._post_from_extracted(old, page=None) is None
+    assert await collector._post_from_extracted(_raw(content=""), page=None) is None
+
+    # 관리 메뉴 라벨이 없으면 프로필 라벨, 카운트는 레거시 텍스트로 보충
+    post = await collector._post_from_extracted(
+        _raw(mgmt_label="", full_text="", legacy_counts=["12", "", "1"]), page=None
+    )
+    assert post.author == "Jane Doe"
+    assert (post.engagement_likes, post.engagement_comments, post.engagement_reposts) == (12, 0, 1)
+
+
+def test_author_url_requires_name_match():
+    assert _match_author_url([["Someone Else", "/in/else/"]], "Douglas Guen") == ""
+    assert _match_author_url([["Douglas Guen", "/in/dguen/"]], "") == ""
+
+
+def test_engagement_from_english_ui():
+    assert _engagement_from_text("1.2K reactions · 8 comments · 2 reposts") == (1200, 8, 2)
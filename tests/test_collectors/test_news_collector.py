@@ -1,4 +1,4 @@
-"""NewsCollector 파싱 테스트 — RSS 2.0 / Atom / Google News 프록시 형태."""
+"""NewsCollector 파싱 테스트 — RSS 2.0 / Atom / Google News 프록시 형태, 스트리밍 조기 종료."""
 
 from __future__ import annotations
 
@@ -46,13 +46,33 @@ def _config(**over) -> CollectorConfig:
     return CollectorConfig({"max_age_days": 2, "max_items_per_feed": 30, **over})
 
 
+def _stream(fetch, chunk_size: int = 64, reads: list[int] | None = None):
+    """fetch_stream 대역 — fetch(url, source)의 본문을 작은 바이트 조각으로 흘려 보낸다.
+    None이면 실패. reads에는 피드별로 실제 넘긴 조각 수를 남긴다."""
+    async def fake_stream(url, source, consume, **kw):
+        body = await fetch(url, source)
+        if body is None:
+            return False
+        data = body.encode()
+        count = 0
+        for i in range(0, len(data), chunk_size):
+            count += 1
+            if consume(data[i:i + chunk_size]):
+                break
+        if reads is not None:
+            reads.append(count)
+        return True
+
+    return fake_stream
+
+
 async def test_rss2_parsing_and_cutoff(monkeypatch):
     recent = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S +0000")
 
     async def fake_fetch(url, source, **kw):
         return RSS2.format(recent=recent)
 
-    monkeypatch.setattr(nc, "fetch_text", fake_fetch)
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
     collector = NewsCollector(_config(feeds=[
         {"name": "TechCrunch", "tier": "official", "url": "https://techcrunch.com/feed/"},
     ]))
@@ -77,7 +97,7 @@ async def test_atom_parsing(monkeypatch):
     async def fake_fetch(url, source, **kw):
         return ATOM.format(recent_iso=recent_iso)
 
-    monkeypatch.setattr(nc, "fetch_text", fake_fetch)
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
     collector = NewsCollector(_config(feeds=[
         {"name": "The Verge", "tier": "official", "url": "https://www.theverge.com/rss/index.xml"},
     ]))
@@ -99,7 +119,7 @@ async def test_feed_failure_does_not_block_others(monkeypatch):
             return None  # fetch 실패
         return RSS2.format(recent=recent)
 
-    monkeypatch.setattr(nc, "fetch_text", fake_fetch)
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
     monkeypatch.setattr(nc, "_FEED_DELAY", 0)
     collector = NewsCollector(_config(feeds=[
         {"name": "Broken", "tier": "paywalled", "url": "https://broken.example/rss"},
@@ -115,8 +135,117 @@ async def test_malformed_xml_skipped(monkeypatch):
     async def fake_fetch(url, source, **kw):
         return "<rss><channel><item><title>unclosed"
 
-    monkeypatch.setattr(nc, "fetch_text", fake_fetch)
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
     collector = NewsCollector(_config(feeds=[
         {"name": "Bad", "tier": "official", "url": "https://bad.example/rss"},
     ]))
     assert await collector.collect() == []
+
+
+def _rss(items: list[tuple[int, datetime]]) -> str:
+    body = "".join(
+        f"<item><title>Story {n}</title><link>https://a.example/{n}</link><guid>g{n}</guid>"
+        f"<pubDate>{dt.strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate></item>"
+        for n, dt in items
+    )
+    return f'<?xml version="1.0"?><rss><channel>{body}</channel></rss>'
+
+
+async def test_stream_stops_at_item_limit(monkeypatch):
+    now = datetime.utcnow()
+    reads: list[int] = []
+
+    async def fake_fetch(url, source, **kw):
+        return _rss([(n, now) for n in range(40)])
+
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch, reads=reads))
+    collector = NewsCollector(_config(max_items_per_feed=5, feeds=[
+        {"name": "A", "tier": "official", "url": "https://a.example/rss"},
+    ]))
+
+    posts = await collector.collect()
+    assert [p.url for p in posts] == [f"https://a.example/{n}" for n in range(5)]
+    total_chunks = -(-len(_rss([(n, now) for n in range(40)]).encode()) // 64)
+    assert reads[0] < total_chunks // 4  # 상한에 닿자 나머지 본문은 읽지 않는다
+
+
+async def test_stream_stops_after_consecutive_stale_entries(monkeypatch):
+    now = datetime.utcnow()
+    old = now - timedelta(days=30)
+    # 날짜순이 아닌 피드: 오래된 항목 하나 뒤에 최신 항목이 와도 계속 읽는다
+    items = [(0, now), (1, old), (2, now)] + [(n, old) for n in range(3, 20)] + [(99, now)]
+
+    async def fake_fetch(url, source, **kw):
+        return _rss(items)
+
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
+    collector = NewsCollector(_config(feed_stale_stop=3, feeds=[
+        {"name": "A", "tier": "official", "url": "https://a.example/rss"},
+    ]))
+
+    posts = await collector.collect()
+    assert [p.url.rsplit("/", 1)[1] for p in posts] == ["0", "2"]  # 99는 연속 컷오프 뒤라 안 읽힘
+
+
+async def test_feeds_fetched_concurrently_with_host_limit(monkeypatch):
+    """전역 동시성 안에서 병렬로 받되, 같은 호스트는 한 번에 하나씩."""
+    import asyncio
+
+    recent = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S +0000")
+    active: dict[str, int] = {}
+    peak = {"all": 0, "news.google.com": 0}
+
+    async def fake_fetch(url, source, **kw):
+        host = url.split("/")[2]
+        active[host] = active.get(host, 0) + 1
+        peak["all"] = max(peak["all"], sum(active.values()))
+        peak["news.google.com"] = max(peak["news.google.com"], active.get("news.google.com", 0))
+        await asyncio.sleep(0.02)
+        active[host] -= 1
+        return RSS2.format(recent=recent).replace("p=111", f"p={source}")
+
+    monkeypatch.setattr(nc, "fetch_stream", _stream(fake_fetch))
+    monkeypatch.setattr(nc, "_FEED_DELAY", 0)
+    feeds = [
+        {"name": f"Direct{i}", "tier": "official", "url": f"https://site{i}.example/rss"}
+        for i in range(4)
+    ] + [
+        {"name": f"Proxy{i}", "tier": "paywalled", "url": f"https://news.google.com/rss/search?q={i}"}
+        for i in range(3)
+    ]
+    collector = NewsCollector(_config(feeds=feeds, feed_concurrency=3, per_host_concurrency=1))
+
+    posts = await collector.collect()
+
+    assert 1 < peak["all"] <= 3
+    assert peak["news.google.com"] == 1
+    # 결과는 동시 수집과 무관하게 설정 순서대로
+    assert [p.author for p in posts] == [f["name"] for f in feeds]
+
+
+async def test_host_limiter_spacing():
+    import asyncio
+
+    from src.infrastructure.collectors.http import HostLimiter
+
+    limiter = HostLimiter(per_host=1, min_interval=0.05)
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def hit():
+        async with limiter.slot("https://news.google.com/rss?q=x"):
+            starts.append(loop.time())
+
+    await asyncio.gather(hit(), hit(), hit())
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(g >= 0.045 for g in gaps)
+
+
+async def test_shared_client_reused_per_loop():
+    from src.infrastructure.collectors.http import SharedHttpClient
+
+    shared = SharedHttpClient()
+    try:
+        assert shared.get() is shared.get()
+    finally:
+        await shared.aclose()
@@ -0,0 +1,100 @@
+"""신규 수확률 기반 스크롤 — 이미 본 글만 나오면 일찍 멈추고, 새 글이 이어지면 연장한다."""
+
+from __future__ import annotations
+
+from src.domain.entities import Post
+from src.infrastructure.collectors.base_collector import BaseCdpCollector, NoveltyTracker
+from src.infrastructure.config.settings import CollectorConfig
+
+
+class _Mouse:
+    def __init__(self):
+        self.wheels = 0
+
+    async def wheel(self, dx, dy):
+        self.wheels += 1
+
+
+class _Page:
+    def __init__(self):
+        self.mouse = _Mouse()
+
+
+class _Collector(BaseCdpCollector):
+    SOURCE = "test"
+
+
+def _config(**over) -> CollectorConfig:
+    return CollectorConfig({
+        "scroll_rounds": 6, "scroll_delay_min": 0, "scroll_delay_max": 0,
+        "min_new_per_round": 2, "stale_rounds": 2, "min_scroll_rounds": 2, **over,
+    })
+
+
+def _feed(per_round: list[list[str]]):
+    """라운드마다 정해진 id 묶음을 내놓는 harvest (첫 호출 = 첫 로드)."""
+    rounds = iter(per_round)
+    return lambda: next(rounds, [])
+
+
+async def test_stops_early_when_feed_repeats_known_posts():
+    known = {f"old{i}" for i in range(20)}
+    collector = _Collector(_config(), known_ids=lambda ids: {i for i in ids if i in known})
+    page = _Page()
+    harvest = _feed([
+        ["new0", "new1", "old0"],
+        ["new2", "new3", "old1"],
+        ["old2", "old3", "old4"],  # DB에 있는 글뿐
+        ["old5", "new4"],          # 신규 1 < 2
+    ])
+
+    stats = await collector._scroll_for_novelty(page, harvest, (800, 1500))
+
+    assert stats.yields == [2, 2, 0, 1]
+    assert stats.stopped_early and stats.rounds == 3 and page.mouse.wheels == 3
+
+
+async def test_extends_past_scroll_rounds_while_yielding():
+    collector = _Collector(_config(scroll_rounds=3, max_scroll_rounds=6))
+    harvest = _feed([[f"r{r}_{i}" for i in range(5)] for r in range(5)])  # 4라운드까지 5건씩
+
+    stats = await collector._scroll_for_novelty(_Page(), harvest, (800, 1500))
+
+    # 기본 3라운드 이후에도 수확이 이어져 연장, 5라운드가 비자 종료
+    assert stats.yields == [5, 5, 5, 5, 5, 0]
+    assert stats.rounds == 5 and not stats.stopped_early
+
+
+async def test_min_rounds_before_early_stop():
+    collector = _Collector(_config(min_scroll_rounds=4))
+    stats = await collector._scroll_for_novelty(_Page(), _feed([]), (800, 1500))
+    assert stats.rounds == 4 and stats.stopped_early
+
+
+def test_tracker_counts_each_id_once_and_survives_lookup_errors():
+    tracker = NoveltyTracker(known_ids=lambda ids: {"a"} & set(ids))
+    assert tracker.observe(["a", "b", "b", "c"]) == 2
+    assert tracker.observe(["b", "c", "d"]) == 1
+
+    def broken(ids):
+        raise RuntimeError("db locked")
+
+    assert NoveltyTracker(known_ids=broken).observe(["x", "y"]) == 2
+
+
+def test_harvester_parses_only_new_responses():
+    calls: list[int] = []
+
+    def parse(batch):
+        calls.append(len(batch))
+        return [Post(source="t", external_id=eid, url="", author="", content_text="x")
+                for resp in batch for eid in resp]
+
+    captured: list[list[str]] = [["a", "b"]]
+    posts, harvest = BaseCdpCollector._graphql_harvester(captured, parse)
+    assert harvest() == ["a", "b"]
+    captured.append(["b", "c"])
+    assert harvest() == ["c"]
+    assert harvest() == []
+    assert calls == [1, 1, 0]
+    assert [p.external_id for p in posts] == ["a", "b", "c"]
@@ -0,0 +1,46 @@
+"""페이로드 기록·재생 — 기록분이 파일명 label로 파서에 연결되고, 계측·회귀 비교가 동작한다."""
+
+from __future__ import annotations
+
+from src.infrastructure.collectors.payload_recorder import PayloadRecorder
+from src.infrastructure.collectors.replay import compare_to_history, discover, replay
+
+ATOM = """<?xml version="1.0"?><feed>
+<entry><id>tag:www.producthunt.com,2005:Post/101</id><title>Alpha</title>
+<link rel="alternate" href="https://www.producthunt.com/products/alpha"/>
+<published>2026-10-01T09:00:00Z</published><content>&lt;p&gt;AI notes&lt;/p&gt;</content></entry>
+<entry><id>tag:www.producthunt.com,2005:Post/102</id><title>Beta</title>
+<link rel="alternate" href="https://www.producthunt.com/products/beta"/>
+<published>2026-10-01T10:00:00Z</published><content>&lt;p&gt;Agent IDE&lt;/p&gt;</content></entry>
+</feed>"""
+
+
+def test_recorder_writes_labelled_files_and_prunes(tmp_path):
+    recorder = PayloadRecorder(tmp_path, keep=2)
+    for _ in range(3):
+        recorder.record("producthunt", "atom", ATOM)
+    recorder.record_many("twitter", "graphql", [{"data": {}}])
+
+    ph = sorted((tmp_path / "producthunt").iterdir())
+    assert len(ph) == 2 and all(p.name.endswith("-atom.xml") for p in ph)
+    assert next((tmp_path / "twitter").iterdir()).suffix == ".json"
+
+    found = discover(tmp_path)
+    assert set(found) == {("producthunt", "atom"), ("twitter", "graphql")}
+
+
+def test_replay_measures_parser_and_flags_regressions(tmp_path):
+    PayloadRecorder(tmp_path).record("producthunt", "atom", ATOM)
+    (tmp_path / "producthunt" / "notes.txt").write_text("무시")  # 파서 없는 label
+
+    paths = discover(tmp_path)[("producthunt", "atom")]
+    result = replay(("producthunt", "atom"), paths, runs=3)
+    row = result.as_dict()
+    assert (row["parser"], row["fixtures"], row["items"], row["runs"]) == ("producthunt/atom", 1, 2, 3)
+    assert row["posts_per_sec"] > 0 and row["peak_kb"] >= 0
+
+    baseline = {**row, "posts_per_sec": row["posts_per_sec"] * 2}
+    assert compare_to_history([row], [baseline], threshold=0.2)
+    assert not compare_to_history([row], [row], threshold=0.2)
+    # 기록분이 바뀌면(파일 수 다름) 비교하지 않는다
+    assert not compare_to_history([row], [{**baseline, "fixtures": 5}], threshold=0.2)
@@ -0,0 +1,64 @@
+"""수집 탭 리소스 차단 — 수집 엔드포인트는 통과, 미디어·트래킹만 abort. 측정 모드는 on/off 교대."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.infrastructure.collectors.resource_policy import ResourceBlockPolicy, ResourceGuard
+from src.infrastructure.config.settings import CollectorConfig
+
+POLICY = ResourceBlockPolicy.from_config(CollectorConfig({
+    "block_resource_types": ["image", "media", "font"],
+    "block_url_patterns": ["/1.1/jot/", "google-analytics.com"],
+    "allow_url_patterns": ["/i/api/graphql/"],
+}))
+
+
+def test_policy_allows_feed_api_and_documents():
+    assert not POLICY.should_block("xhr", "https://x.com/i/api/graphql/abc/HomeTimeline")
+    assert not POLICY.should_block("document", "https://x.com/home")
+    assert not POLICY.should_block("script", "https://abs.twimg.com/main.js")
+    assert POLICY.should_block("image", "https://pbs.twimg.com/media/a.jpg")
+    assert POLICY.should_block("xhr", "https://x.com/1.1/jot/client_event.json")
+    assert not ResourceBlockPolicy.from_config(CollectorConfig({})).active
+
+
+class _Route:
+    def __init__(self, resource_type: str, url: str):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.outcome = ""
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+class _Page:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+async def test_guard_routes_requests_and_alternates_in_measure_mode():
+    guard = ResourceGuard("twitter", POLICY)
+    page = _Page()
+    meter = await guard.attach(page)
+
+    routes = [
+        _Route("image", "https://pbs.twimg.com/media/a.jpg"),
+        _Route("fetch", "https://x.com/i/api/graphql/abc/HomeTimeline"),
+    ]
+    for route in routes:
+        await page.handler(route)
+    assert [r.outcome for r in routes] == ["abort", "continue"]
+    assert meter.blocking and meter.blocked == 1
+
+    # 측정 모드: 1회차 차단, 2회차 미차단 (CDP 세션이 없는 대역 페이지라 측정은 건너뛴다)
+    measuring = ResourceGuard("twitter", POLICY, measure=True)
+    first, second = _Page(), _Page()
+    assert (await measuring.attach(first)).blocking and first.handler is not None
+    assert not (await measuring.attach(second)).blocking and second.handler is None
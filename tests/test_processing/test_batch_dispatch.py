@@ -0,0 +1,138 @@
+"""필터·분류 배치 — 토큰 예산 패킹, 상한만큼 동시 디스패치(결과는 배치 순서, 실패는 그 배치만)."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from src.domain.entities import Post
+from src.infrastructure.ai.llm_processor import (
+    BaseLLMProcessor,
+    LLMBackendError,
+    _pack_batches,
+    _posts_to_json_filter,
+    estimate_tokens,
+    record_input_tokens,
+)
+from src.infrastructure.config.settings import ProcessingConfig
+
+_ID = re.compile(r'"post_id": ?(\d+)')
+
+
+def _post(i: int) -> Post:
+    return Post(
+        id=i, external_id=f"e{i}", source="twitter", author="a",
+        url="https://x.com/1", content_text="구체적 수치가 있는 충분히 긴 기술 게시물 본문 " * 3,
+    )
+
+
+class _Slow(BaseLLMProcessor):
+    """배치 안 첫 게시물 id로 지연을 달리한다 — 앞 배치가 늦게 끝나도 순서가 유지되는지."""
+
+    def __init__(self, concurrency: int, fail_on: int | None = None, down_on: int | None = None):
+        self._config = ProcessingConfig({"batch_size_filter": 2, "batch_size_categorize": 2})
+        self._concurrency = {"filter": concurrency}
+        self._fail_on = fail_on
+        self._down_on = down_on
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def _call_api(self, model, prompt, max_tokens=4096, *, lean=False):
+        ids = [int(i) for i in _ID.findall(prompt)]
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05 if ids[0] == 1 else 0.02)
+            if ids[0] == self._down_on:
+                raise LLMBackendError("claude CLI 한도 소진")
+            if ids[0] == self._fail_on:
+                raise RuntimeError("LLM 빈 응답")
+            return json.dumps([
+                {"post_id": i, "is_relevant": True, "summary": f"s{i}", "categories": ["AI"]}
+                for i in ids
+            ])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+async def test_filter_runs_batches_concurrently_in_order():
+    proc = _Slow(concurrency=3)
+    results = await proc.filter_and_summarize([_post(i) for i in range(1, 11)])
+
+    assert [r.post_id for r in results] == list(range(1, 11))
+    assert proc.peak == 3
+
+
+async def test_failed_batch_only_fails_itself():
+    proc = _Slow(concurrency=3, fail_on=3)
+    posts = [_post(i) for i in range(1, 7)]
+
+    filtered = await proc.filter_and_summarize(posts)
+    assert [r.post_id for r in filtered] == [1, 2, 3, 4, 5, 6]
+    assert [r.is_relevant for r in filtered] == [True, True, False, False, True, True]
+
+    categorized = await proc.categorize(posts)
+    assert [r.post_id for r in categorized] == [1, 2, 5, 6]
+
+
+async def test_default_limit_is_sequential():
+    proc = _Slow(concurrency=1)
+    proc._concurrency = {}
+    await proc.categorize([_post(i) for i in range(1, 7)])
+    assert proc.peak == 1
+
+
+async def test_backend_error_cancels_pending_batches():
+    proc = _Slow(concurrency=2, down_on=3)
+    with pytest.raises(LLMBackendError):
+        await proc.filter_and_summarize([_post(i) for i in range(1, 21)])
+    assert proc.calls < 10
+
+
+def _sized(i: int, chars: int) -> Post:
+    return Post(
+        id=i, external_id=f"e{i}", source="linkedin", author="a",
+        url="https://x.com/1", content_text="가" * chars,
+    )
+
+
+def test_pack_fills_token_budget_within_post_bounds():
+    short = [_sized(i, 20) for i in range(1, 31)]
+    long_ = [_sized(i, 900) for i in range(31, 41)]
+    batches = _pack_batches(short + long_, _posts_to_json_filter, 3000, 2, 25)
+
+    assert [p.id for b in batches for p in b] == list(range(1, 41))
+    assert len(batches[0]) == 25  # 짧은 글은 상한(건)까지
+    assert all(len(b) == 3 for b in batches[2:-1])  # 긴 글은 예산(900토큰대 × 3)까지
+    # 예산을 혼자 넘는 글이어도 최소 건수는 채운다
+    assert [len(b) for b in _pack_batches(long_, _posts_to_json_filter, 500, 2, 25)] == [2] * 5
+    # 예산 0 = 기존 고정 건수
+    assert [len(b) for b in _pack_batches(short, _posts_to_json_filter, 0, 2, 25)] == [25, 5]
+
+
+def test_estimate_counts_hangul_per_char_and_ascii_per_four():
+    assert estimate_tokens("가" * 100) == 101
+    assert estimate_tokens("a" * 100) == 26
+
+
+async def test_completion_log_compares_estimate_with_usage(caplog):
+    proc = _Slow(concurrency=2)
+    inner = proc._call_api
+
+    def call(model, prompt, max_tokens=4096, *, lean=False):
+        record_input_tokens(estimate_tokens(prompt) + 1000)  # CLI 고정 오버헤드
+        return inner(model, prompt, max_tokens, lean=lean)
+
+    proc._call_api = call
+    with caplog.at_level("INFO"):
+        await proc.filter_and_summarize([_post(i) for i in range(1, 5)])
+    assert "(호출당 차이 +1,000, 실측 2/2배치)" in caplog.text
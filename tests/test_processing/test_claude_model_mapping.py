@@ -21,7 +21,7 @@ def _processor() -> tuple[ClaudeCodeProcessor, dict]:
     )
     captured: dict = {}
 
-    def fake_run(args, prompt, label="claude", use_system_prompt=True, model=None):
+    def fake_run(args, prompt, label="claude", use_system_prompt=True, model=None, cache_note=""):
         captured["args"] = args
         captured["model"] = model
         return "[]"
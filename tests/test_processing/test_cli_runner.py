@@ -0,0 +1,71 @@
+"""CLI 자식 프로세스 실행기 — stdin/stdout 스트리밍, 타임아웃·취소 시 트리 종료, 동시 상한."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.infrastructure.ai.cli_runner import CliRunner
+
+PY = sys.executable
+ECHO = "import sys; sys.stdout.write(sys.stdin.read())"
+
+
+def _spawns_grandchild(marker) -> list[str]:
+    """손자 프로세스가 1초 뒤 marker를 만든다 — 트리째 죽었으면 파일이 생기지 않는다."""
+    grandchild = f"import time, pathlib; time.sleep(1); pathlib.Path({str(marker)!r}).touch()"
+    return [PY, "-c", f"import subprocess; subprocess.run([{PY!r}, '-c', {grandchild!r}])"]
+
+
+def test_streams_large_stdin_and_reports_timings(caplog):
+    runner = CliRunner("t")
+    text = "한글 프롬프트 line\n" * 20000  # 파이프 버퍼보다 큰 입력·출력
+    with caplog.at_level("INFO"):
+        result = runner.call_sync(runner.run([PY, "-c", ECHO], text, timeout=30))
+
+    assert (result.returncode, result.stdout) == (0, text)
+    assert result.first_byte_ms is not None
+    assert result.spawn_ms <= result.first_byte_ms <= result.total_ms
+    assert "[cli] t 생성 " in caplog.text and "(rc=0)" in caplog.text
+
+
+def test_timeout_kills_process_tree(tmp_path):
+    runner = CliRunner("t")
+    marker = tmp_path / "orphan"
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.call_sync(runner.run(_spawns_grandchild(marker), "", timeout=0.5))
+    time.sleep(1.2)
+    assert not marker.exists(), "타임아웃 뒤 손자 프로세스가 고아로 살아남았다"
+
+
+async def test_cancel_kills_process_tree(tmp_path):
+    runner = CliRunner("t")
+    marker = tmp_path / "orphan"
+    task = asyncio.create_task(runner.run(_spawns_grandchild(marker), "", timeout=30))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(1.2)
+    assert not marker.exists(), "취소 뒤 손자 프로세스가 고아로 살아남았다"
+
+
+async def test_max_processes_caps_concurrent_children():
+    runner = CliRunner("t", max_processes=2)
+    sleep = [PY, "-c", "import time; time.sleep(0.4)"]
+    start = time.perf_counter()
+    results = await asyncio.gather(*(runner.run(sleep, "", timeout=30) for _ in range(4)))
+    elapsed = time.perf_counter() - start
+
+    assert [r.returncode for r in results] == [0] * 4
+    assert elapsed >= 0.8, "상한 2인데 4개가 한꺼번에 돌았다"
+
+
+def test_missing_binary_raises_oserror():
+    runner = CliRunner("t")
+    with pytest.raises(OSError):
+        runner.call_sync(runner.run(["/nonexistent/claude"], "", timeout=5))
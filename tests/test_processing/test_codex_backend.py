@@ -10,6 +10,7 @@ import subprocess
 
 import pytest
 
+from src.infrastructure.ai.cli_runner import CliResult, CliRunner
 from src.infrastructure.ai.codex_cli_processor import CodexCliProcessor
 from src.infrastructure.ai.llm_processor import LLMBackendError
 from src.infrastructure.config.settings import ProcessingConfig
@@ -19,29 +20,29 @@ def _proc(**kw) -> CodexCliProcessor:
     return CodexCliProcessor(config=ProcessingConfig({}), codex_bin="codex", **kw)
 
 
-class _Run:
-    """subprocess.run 대역 — 호출 인자를 기록하고 -o 파일에 결과를 쓴다."""
+class _Run(CliRunner):
+    """자식 프로세스 대역 — 호출 인자를 기록하고 -o 파일에 결과를 쓴다."""
 
     def __init__(self, result="[]", returncode=0, stdout="", raises=None):
+        super().__init__("codex-test")
         self.result, self.returncode, self.stdout, self.raises = result, returncode, stdout, raises
         self.cmd = None
         self.input = None
 
-    def __call__(self, cmd, **kw):
-        self.cmd, self.input = cmd, kw.get("input")
+    async def _execute(self, cmd, input_text, cwd, env, timeout, label):
+        self.cmd, self.input = cmd, input_text
         if self.raises:
             raise self.raises
         out_path = cmd[cmd.index("-o") + 1]
         with open(out_path, "w", encoding="utf-8") as f:
             f.write(self.result)
-        return subprocess.CompletedProcess(cmd, self.returncode, self.stdout, "")
+        return CliResult(self.returncode, self.stdout, "", 0.0, None, 0.0)
 
 
-def test_headless_flags_are_set(monkeypatch):
+def test_headless_flags_are_set():
     run = _Run(result='[{"ok":true}]')
-    monkeypatch.setattr(subprocess, "run", run)
 
-    assert _proc()._call_api("gpt-5-mini", "프롬프트") == '[{"ok":true}]'
+    assert _proc(runner=run)._call_api("gpt-5-mini", "프롬프트") == '[{"ok":true}]'
 
     cmd = run.cmd
     assert "exec" in cmd
@@ -51,11 +52,10 @@ def test_headless_flags_are_set(monkeypatch):
     assert cmd[-1] == "-", "프롬프트는 stdin으로 넘긴다"
 
 
-def test_system_prompt_is_prepended(monkeypatch):
+def test_system_prompt_is_prepended():
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
-    _proc()._call_api("m", "사용자프롬프트")
+    _proc(runner=run)._call_api("m", "사용자프롬프트")
 
     assert run.input.endswith("사용자프롬프트")
     assert len(run.input) > len("사용자프롬프트"), "SYSTEM_PROMPT가 앞에 붙어야 한다"
@@ -65,12 +65,13 @@ def test_system_prompt_is_prepended(monkeypatch):
     "tier,expected",
     [("filter", "F"), ("process", "P"), ("dedup", "P"), ("consolidate", "P")],
 )
-def test_tier_selects_model(monkeypatch, tier, expected):
+def test_tier_selects_model(tier, expected):
     """model 인자가 아니라 호출부의 tier로 모델을 고른다."""
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
-    _proc(model_filter="F", model_process="P")._call_api("무시되는-openai-모델명", "p", tier=tier)
+    _proc(model_filter="F", model_process="P", runner=run)._call_api(
+        "무시되는-openai-모델명", "p", tier=tier
+    )
 
     assert run.cmd[run.cmd.index("-m") + 1] == expected
 
@@ -84,25 +85,24 @@ def test_tier_selects_model(monkeypatch, tier, expected):
         ("consolidate", "gpt-5.6-terra"),
     ],
 )
-def test_configured_tier_models_reach_codex_cli(monkeypatch, tier, expected):
+def test_configured_tier_models_reach_codex_cli(tier, expected):
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
     _proc(
         model_filter="gpt-5.6-luna",
         model_process="gpt-5.6-sol",
         model_dedup="gpt-5.6-sol",
         model_consolidate="gpt-5.6-terra",
+        runner=run,
     )._call_api("compat", "p", tier=tier)
 
     assert run.cmd[run.cmd.index("-m") + 1] == expected
 
 
-def test_lean_filter_uses_supported_low_effort(monkeypatch):
+def test_lean_filter_uses_supported_low_effort():
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
-    _proc(model_filter="gpt-5.6-luna", effort_filter="low")._call_api(
+    _proc(model_filter="gpt-5.6-luna", effort_filter="low", runner=run)._call_api(
         "compat", "p", lean=True
     )
 
@@ -110,12 +110,11 @@ def test_lean_filter_uses_supported_low_effort(monkeypatch):
     assert effort == "model_reasoning_effort=low"
 
 
-def test_no_model_flag_when_unset(monkeypatch):
+def test_no_model_flag_when_unset():
     """모델 미지정이면 -m 을 붙이지 않아 codex 기본 모델을 쓴다."""
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
-    _proc()._call_api("m", "p")
+    _proc(runner=run)._call_api("m", "p")
 
     assert "-m" not in run.cmd
 
@@ -129,35 +128,36 @@ def test_no_model_flag_when_unset(monkeypatch):
         {"raises": OSError("실행 불가")},
     ],
 )
-def test_failures_raise_backend_error(monkeypatch, kwargs):
+def test_failures_raise_backend_error(kwargs):
     """장애는 LLMBackendError로 전파돼야 hybrid 폴백이 작동한다."""
-    monkeypatch.setattr(subprocess, "run", _Run(**kwargs))
+    run = _Run(**kwargs)
 
     with pytest.raises(LLMBackendError):
-        _proc()._call_api("m", "p")
+        _proc(runner=run)._call_api("m", "p")
 
 
-def test_usage_is_logged(monkeypatch, caplog):
+def test_usage_is_logged(caplog):
     stdout = (
         '{"type":"thread.started"}\n'
         '{"type":"turn.completed","usage":{"input_tokens":100,"output_tokens":20,'
         '"cached_input_tokens":80,"reasoning_output_tokens":5}}\n'
     )
-    monkeypatch.setattr(subprocess, "run", _Run(stdout=stdout))
+    run = _Run(stdout=stdout)
 
     with caplog.at_level("INFO"):
-        _proc(model_filter="M")._call_api("m", "p")
+        _proc(model_filter="M", runner=run)._call_api("m", "p")
 
     line = next(r.message for r in caplog.records if "[usage]" in r.message)
     assert "in=100" in line and "out=20" in line and "cached=80" in line
 
 
-def test_cmd_shim_is_wrapped(monkeypatch):
+def test_cmd_shim_is_wrapped():
     """npm .cmd 셰임은 cmd.exe /c 로 감싸야 실행된다."""
     run = _Run()
-    monkeypatch.setattr(subprocess, "run", run)
 
-    CodexCliProcessor(config=ProcessingConfig({}), codex_bin="C:/npm/codex.cmd")._call_api("m", "p")
+    CodexCliProcessor(
+        config=ProcessingConfig({}), codex_bin="C:/npm/codex.cmd", runner=run
+    )._call_api("m", "p")
 
     assert run.cmd[1] == "/c" and run.cmd[2].endswith("codex.cmd")
 
@@ -0,0 +1,95 @@
+"""필터→분류 파이프라인 — 청크 N 분류 중 N+1 필터, 저장 전 재조회 중복 방지, 예외 시 진행분 보존."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.application.use_cases.process_posts import ProcessPostsUseCase
+from src.domain.entities import Post
+from src.domain.services.ai_processor import CategoryResult, FilterResult
+from src.infrastructure.ai.llm_processor import LLMBackendError
+
+
+def _post(pid: int) -> Post:
+    return Post(
+        source="news", external_id=f"n_{pid}", url="", author="a",
+        content_text=f"파이프라인 검증용 기술 뉴스 본문 {pid}", id=pid,
+    )
+
+
+class FakeRepo:
+    """DB처럼 update_many로 반영된 게시물만 미처리에서 빠진다 (객체 필드 변경과 무관)."""
+
+    def __init__(self, n: int):
+        self.posts = [_post(i) for i in range(1, n + 1)]
+        self.stored: set[int] = set()
+
+    def get_unprocessed(self, limit: int = 100) -> list[Post]:
+        return [p for p in self.posts if p.id not in self.stored][:limit]
+
+    def find_rejected_hashes(self, hashes):
+        return set()
+
+    def update_many(self, posts: list[Post]) -> int:
+        self.stored.update(p.id for p in posts)
+        return len(posts)
+
+
+class FakeAI:
+    def __init__(self, skip_categorize: set[int] = frozenset(), down_after: int = 0):
+        self.events: list[str] = []
+        self.filtered: list[int] = []
+        self._skip = skip_categorize
+        self._down_after = down_after
+        self._filters = 0
+        self._cats = 0
+
+    async def filter_and_summarize(self, posts):
+        self._filters += 1
+        n = self._filters
+        if self._down_after and n > self._down_after:
+            raise LLMBackendError("CLI 한도 소진")
+        self.events.append(f"filter{n}+")
+        await asyncio.sleep(0.02)
+        self.events.append(f"filter{n}-")
+        self.filtered.extend(p.id for p in posts)
+        return [FilterResult(post_id=p.id, is_relevant=True, summary="요약", language="ko") for p in posts]
+
+    async def categorize(self, posts):
+        self._cats += 1
+        n = self._cats
+        self.events.append(f"cat{n}+")
+        await asyncio.sleep(0.05)
+        self.events.append(f"cat{n}-")
+        return [
+            CategoryResult(post_id=p.id, categories=["AI"], importance_score=0.8, keywords=[])
+            for p in posts if p.id not in self._skip
+        ]
+
+
+async def test_next_chunk_filters_while_previous_categorizes():
+    repo, ai = FakeRepo(30), FakeAI()
+    totals = await ProcessPostsUseCase(repo, ai).execute(limit=30, chunk_size=10)
+
+    assert totals == {"total": 30, "relevant": 30, "filtered_out": 0}
+    assert ai.events.index("filter2+") < ai.events.index("cat1-")
+    # 저장 전 재조회된 앞 청크는 다시 필터에 들어가지 않는다
+    assert sorted(ai.filtered) == list(range(1, 31))
+    assert repo.stored == set(range(1, 31))
+
+
+async def test_categorize_miss_is_not_refiltered_in_same_run():
+    repo, ai = FakeRepo(20), FakeAI(skip_categorize={1, 2})
+    await ProcessPostsUseCase(repo, ai).execute(limit=40, chunk_size=10)
+
+    assert sorted(ai.filtered) == list(range(1, 21))
+    assert {1, 2}.isdisjoint(repo.stored)
+
+
+async def test_backend_error_keeps_already_filtered_chunks():
+    repo, ai = FakeRepo(30), FakeAI(down_after=2)
+    with pytest.raises(LLMBackendError):
+        await ProcessPostsUseCase(repo, ai, pipeline_depth=2).execute(limit=30, chunk_size=10)
+    assert repo.stored == set(range(1, 21))
@@ -0,0 +1,118 @@
+"""LLM 응답 디스크 캐시 — 같은 (백엔드·티어·모델·강도·프롬프트)는 CLI를 다시 띄우지 않는다."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+from src.infrastructure.ai.claude_code_processor import ClaudeCodeProcessor
+from src.infrastructure.ai.response_cache import LLMResponseCache
+from src.infrastructure.config.settings import ProcessingConfig
+
+
+def _processor(tmp_path, **cache_kw) -> tuple[ClaudeCodeProcessor, list]:
+    cache = LLMResponseCache(tmp_path, **cache_kw)
+    p = ClaudeCodeProcessor(config=ProcessingConfig({}), claude_bin="claude", response_cache=cache)
+    calls: list = []
+
+    def fake_run(args, prompt, label="claude", use_system_prompt=True, model=None, cache_note=""):
+        calls.append((model, cache_note))
+        return f"[{len(calls)}]"
+
+    p._run_claude = fake_run
+    return p, calls
+
+
+def test_repeat_prompt_is_served_from_disk(tmp_path, caplog):
+    p, calls = _processor(tmp_path)
+    assert p._call_api("m", "같은 프롬프트", lean=True) == "[1]"
+    with caplog.at_level("INFO"):
+        assert p._call_api("m", "같은 프롬프트", lean=True) == "[1]"
+    assert len(calls) == 1
+    assert calls[0][1] == " llm_cache=miss (hits=0 misses=1)"
+    assert "[usage] model=claude-haiku-4-5 in=0 out=0 llm_cache=hit (hits=1 misses=1)" in caplog.text
+
+    # 새 프로세스(재시작)도 디스크에서 읽는다
+    fresh, fresh_calls = _processor(tmp_path)
+    assert fresh._call_api("m", "같은 프롬프트", lean=True) == "[1]"
+    assert fresh_calls == []
+
+
+def test_key_separates_tier_and_lean(tmp_path):
+    p, calls = _processor(tmp_path)
+    p._call_api("m", "프롬프트")
+    p._call_api("m", "프롬프트", lean=True)
+    p._call_api("m", "프롬프트", tier="process")
+    assert len(calls) == 3
+
+
+def test_bypass_refreshes_cached_response(tmp_path):
+    p, calls = _processor(tmp_path)
+    p._call_api("m", "프롬프트")
+    assert p._call_api("m", "프롬프트", cache=False) == "[2]"
+    assert p._call_api("m", "프롬프트") == "[2]"  # 우회 호출 결과로 갱신됨
+
+
+async def test_discard_drops_only_the_failed_variant(tmp_path):
+    p, calls = _processor(tmp_path)
+
+    async def fake_arun(args, prompt, label="claude", use_system_prompt=True, model=None,
+                        cache_note=""):
+        calls.append((model, cache_note))
+        return f"[{len(calls)}]"
+
+    p._arun_claude = fake_arun
+    assert await p._acall_api("m", "프롬프트", tier="process") == "[1]"
+    assert await p._acall_api("m", "프롬프트", lean=True) == "[2]"
+
+    await p._discard_cached("다른 프롬프트")  # 이 태스크가 마지막에 본 프롬프트가 아니면 그대로
+    await p._discard_cached("프롬프트")       # lean 응답이 파싱 실패 → 그 키만 지운다
+    assert await p._acall_api("m", "프롬프트", lean=True) == "[3]"
+    assert await p._acall_api("m", "프롬프트", tier="process") == "[1]"
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = LLMResponseCache(tmp_path, ttl_hours=1)
+    key = cache.key("claude", "filter", "m", "", "오래된")
+    cache.put(key, "x")
+    path = next(tmp_path.glob(f"*/{key}.json"))
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["created"] = time.time() - 7200
+    path.write_text(json.dumps(entry), encoding="utf-8")
+    assert cache.get(key) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path, max_mb=0.02)
+    keys = [cache.key("claude", "filter", "m", "", f"p{i}") for i in range(6)]
+    now = time.time()
+    for i, key in enumerate(keys):
+        cache.put(key, "y" * 3000)
+        for f in tmp_path.glob(f"*/{key}.json"):
+            os.utime(f, (now - 100 + i, now - 100 + i))
+    cache.get(keys[0])  # 적중 → 최근 사용으로
+    cache.put(cache.key("claude", "filter", "m", "", "마지막"), "y" * 3000)
+
+    remaining = {p.stem for p in tmp_path.glob("*/*.json")}
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*.json")) <= 0.02 * 1024 * 1024
+    assert keys[0] in remaining and keys[1] not in remaining
+
+
+def test_disabled_in_config_builds_no_cache():
+    assert LLMResponseCache.from_config(ProcessingConfig({"llm_cache": False})) is None
+
+
+def test_index_tracks_size_without_rescanning(tmp_path):
+    cache = LLMResponseCache(tmp_path)
+    key = cache.key("claude", "filter", "m", "", "p")
+    cache.put(key, "a" * 100)
+    cache.put(key, "b" * 50)  # 같은 키 덮어쓰기는 크기를 두 번 세지 않는다
+    cache.discard(key)
+    assert cache._size == 0 and list(tmp_path.glob("*/*.json")) == []
+
+    cache.put(key, "c")
+    fresh = LLMResponseCache(tmp_path)  # 재시작하면 한 번 훑어 색인을 만든다
+    assert fresh.get(key) == "c"
+    assert fresh._size == cache._size
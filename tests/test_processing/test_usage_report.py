@@ -42,3 +42,14 @@ def test_parses_claude_cli_line_with_cache():
 
 def test_ignores_non_usage_lines():
     assert usage_report.LINE.search("INFO 필터/요약 완료: 40건 (관련: 8건)") is None
+
+
+def test_llm_cache_hit_line_is_tagged():
+    m = usage_report.LINE.search(
+        "[usage] model=claude-haiku-4-5 in=0 out=0 llm_cache=hit (hits=4 misses=10)"
+    )
+    assert m and m.group("llm_cache") == "hit"
+    miss = usage_report.LINE.search(
+        "[usage] model=gpt-5.6-luna/low in=100 out=20 (cached=80 reasoning=5) llm_cache=miss (hits=4 misses=11)"
+    )
+    assert miss and (miss.group("cached"), miss.group("llm_cache")) == ("80", "miss")
@@ -0,0 +1,56 @@
+"""저장소 테스트 공용 — 임시 DB 레포 픽스처와 게시물 빌더."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities import Post
+
+
+@pytest.fixture()
+def post_db(tmp_path, monkeypatch):
+    """임시 DB로 바꿔 끼운 post_repo_sqlite 모듈 (실제 data/posts.db를 건드리지 않는다)."""
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    monkeypatch.setattr(mod, "DB_PATH", tmp_path / "t.db")
+    monkeypatch.setattr(mod._thread_local, "db", None, raising=False)
+    yield mod
+    mod._get_db().close()
+    monkeypatch.setattr(mod._thread_local, "db", None, raising=False)
+
+
+@pytest.fixture()
+def repo(post_db):
+    return post_db.PostRepositorySQLite()
+
+
+def make_post(
+    pid: str,
+    *,
+    source: str = "twitter",
+    text: str | None = None,
+    at: datetime | None = None,
+    likes: int = 0,
+    **fields,
+) -> Post:
+    """수집 직후 상태의 게시물. 본문 기본값은 '본문 <pid>', 수집 시각은 지금."""
+    return Post(
+        source=source, external_id=pid, url=f"https://x.com/{pid}",
+        author=fields.pop("author", "a"),
+        content_text=f"본문 {pid}" if text is None else text,
+        engagement_likes=likes,
+        collected_at=at or datetime.now(),
+        **fields,
+    )
+
+
+def save_processed(repo, post: Post, **processed) -> Post:
+    """저장 뒤 AI 처리 결과(요약·관련성·카테고리 등)를 update_many로 덮어쓴다."""
+    repo.save_many([post])
+    stored = repo.find_by_id(post.external_id)
+    for name, value in processed.items():
+        setattr(stored, name, value)
+    repo.update_many([stored])
+    return stored
@@ -0,0 +1,93 @@
+"""시간별 집계 롤업 — 트리거 증분 갱신이 posts 원본 집계와 항상 같아야 한다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from functools import partial
+
+from tests.test_storage.conftest import make_post
+
+
+_T0 = datetime(2026, 3, 1, 9, 15, 0)
+
+
+_post = partial(make_post, at=_T0)
+
+
+def _rollup_rows() -> list[tuple]:
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    rows = mod._get_db().execute(
+        "SELECT hour, source, relevant, category, count FROM post_hourly_counts "
+        "WHERE count != 0 ORDER BY 1, 2, 3, 4"
+    ).fetchall()
+    return [tuple(r) for r in rows]
+
+
+def _rebuilt_rows() -> list[tuple]:
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    mod.rebuild_rollups()
+    return _rollup_rows()
+
+
+def _process(repo, pid: str, relevant: bool, categories: list[str]) -> None:
+    post = repo.find_by_id(pid)
+    post.is_relevant, post.category_names = relevant, categories
+    repo.update_many([post])
+
+
+async def test_counts_follow_insert_process_and_delete(repo):
+    repo.save_many([_post("1"), _post("2"), _post("3", source="threads")])
+    _process(repo, "1", True, ["AI", "Cloud"])
+    _process(repo, "2", False, [])
+
+    start, end = _T0 - timedelta(hours=1), _T0 + timedelta(hours=1)
+    assert await repo.count_by_source(start, end) == {"twitter": 2, "threads": 1}
+    assert await repo.count_by_category(start, end) == {"AI": 1, "Cloud": 1}
+    hourly = await repo.get_hourly_counts(start, end)
+    assert {(h["source"], h["total"], h["relevant"]) for h in hourly} == {
+        ("twitter", 2, 1), ("threads", 1, 0),
+    }
+
+    repo.delete("1")
+    assert await repo.count_by_source(start, end) == {"twitter": 1, "threads": 1}
+    assert await repo.count_by_category(start, end) == {}
+
+
+async def test_recollection_moves_hour_bucket(repo):
+    repo.save_many([_post("1")])
+    later = _T0 + timedelta(hours=3)
+    repo.save_many([_post("1", at=later, likes=5)])  # 변경 있는 재수집 → collected_at 갱신
+
+    assert await repo.count_by_source(_T0, _T0) == {}
+    assert await repo.count_by_source(later, later) == {"twitter": 1}
+
+
+def test_incremental_matches_rebuild(repo):
+    repo.save_many([_post(str(i), at=_T0 + timedelta(minutes=25 * i)) for i in range(8)])
+    for i in range(0, 8, 2):
+        _process(repo, str(i), True, ["AI"] if i % 4 else ["AI", "AI", "Startup"])
+    _process(repo, "1", False, [])
+    repo.delete("4")
+    repo.save_many([_post("3", at=_T0 + timedelta(days=1), likes=1)])
+
+    assert _rollup_rows() == _rebuilt_rows()
+
+
+async def test_first_seen_counts_stay_in_discovery_hour(repo):
+    """재수집으로 collected_at이 옮겨 가도 수확률 분자는 처음 저장된 시간에 남는다."""
+    saved_at = datetime.utcnow()
+    repo.save_many([_post("1"), _post("2", source="threads")])
+    _process(repo, "1", True, ["AI"])
+    _process(repo, "2", False, [])
+    repo.save_many([_post("1", at=_T0 + timedelta(days=2), likes=9)])
+
+    now = datetime.utcnow()
+    first_seen = await repo.count_relevant_by_first_seen(
+        now - timedelta(days=1), now + timedelta(hours=1)
+    )
+    hours = {t.strftime("%Y-%m-%d %H:00:00") for t in (saved_at, now)}  # 정시 경계 대비
+    assert len(first_seen) == 1
+    ((source, hour), count), = first_seen.items()
+    assert (source, count) == ("twitter", 1) and hour in hours
@@ -0,0 +1,109 @@
+"""게시물 검색 키셋 페이지네이션 — 커서로 전 페이지를 돌면 빠짐·중복이 없어야 한다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.infrastructure.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from tests.test_storage.conftest import make_post
+
+
+def _seed(repo, n: int) -> None:
+    # 같은 collected_at을 3건씩 묶어 id 타이브레이크까지 검증한다
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    posts = [
+        make_post(
+            f"p{i:02d}",
+            text=("엔비디아 " * (1 + i % 4)) + f"본문 {i}",
+            at=base - timedelta(minutes=i // 3),
+        )
+        for i in range(n)
+    ]
+    repo.save_many(posts)
+    for post in posts:
+        post.id = post.external_id
+        post.is_relevant = True
+        post.summary = f"요약 {post.external_id}"
+    repo.update_many(posts)
+
+
+def _relevant(post):
+    post.is_relevant, post.summary = True, f"요약 {post.external_id}"
+    return post
+
+
+async def _walk(repo, limit: int, **kw) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        posts, cursor = await repo.search_page(limit=limit, cursor=cursor, **kw)
+        pages.append([p.id for p in posts])
+        if cursor is None:
+            return pages
+
+
+async def test_cursor_walk_matches_single_query(repo):
+    _seed(repo, 23)
+    everything = [p.id for p in await repo.search(limit=100)]
+    pages = await _walk(repo, limit=5)
+
+    assert [len(p) for p in pages] == [5, 5, 5, 5, 3]
+    assert [pid for page in pages for pid in page] == everything
+
+
+async def test_cursor_walk_with_fts_query(repo):
+    _seed(repo, 17)
+    everything = [p.id for p in await repo.search(query="엔비디아", limit=100)]
+    pages = await _walk(repo, limit=4, query="엔비디아")
+
+    walked = [pid for page in pages for pid in page]
+    assert len(everything) == 17
+    assert sorted(walked) == sorted(everything) and len(set(walked)) == 17
+    # 페이지는 최신순(collected_at, id DESC)으로 나뉘고, 그 안은 관련도순
+    assert sorted(pages[0]) == ["p00", "p01", "p02", "p05"]
+    assert pages[0][0] == "p02", "엔비디아 3회로 페이지 안에서 관련도가 가장 높다"
+
+
+async def test_fts_pages_stable_across_inserts(repo):
+    """bm25는 말뭉치가 바뀌면 값이 달라진다 — 페이지 사이 삽입이 경계를 흔들면 안 된다."""
+    _seed(repo, 12)
+    first, cursor = await repo.search_page(query="엔비디아", limit=5)
+
+    repo.save_many([make_post(f"n{i}", text="엔비디아 " * 8 + "신규") for i in range(3)])
+    repo.update_many([_relevant(repo.find_by_id(f"n{i}")) for i in range(3)])
+    rest: list[str] = []
+    while cursor is not None:
+        posts, cursor = await repo.search_page(query="엔비디아", limit=5, cursor=cursor)
+        rest += [p.id for p in posts]
+
+    walked = [p.id for p in first] + rest
+    assert sorted(walked) == [f"p{i:02d}" for i in range(12)], "빠짐·중복 없이 원래 12건"
+
+
+async def test_exact_multiple_has_no_empty_tail_page(repo):
+    _seed(repo, 10)
+    pages = await _walk(repo, limit=5)
+    assert [len(p) for p in pages] == [5, 5]
+
+
+async def test_invalid_or_mismatched_cursor_rejected(repo):
+    _seed(repo, 6)
+    with pytest.raises(InvalidCursorError):
+        await repo.search_page(limit=2, cursor="!!not-a-cursor")
+
+    # 검색어 없는 목록의 커서를 FTS 검색에 재사용하면 정렬 키가 달라 거부한다
+    _, cursor = await repo.search_page(limit=2)
+    with pytest.raises(InvalidCursorError):
+        await repo.search_page(query="엔비디아", limit=2, cursor=cursor)
+
+
+def test_cursor_token_roundtrip():
+    key = {"c": "2026-01-01 12:00:00", "i": "p01", "r": -1.8395610138489678e-06}
+    token = encode_cursor(key)
+    assert "=" not in token and "/" not in token and "+" not in token
+    assert decode_cursor(token) == key
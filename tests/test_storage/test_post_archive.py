@@ -0,0 +1,90 @@
+"""콜드 스토리지 — 보존기한 경과 게시물을 월별 압축 아카이브로 옮기고 다시 읽는다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.infrastructure.database.post_archive import PostArchive
+from tests.test_storage.conftest import make_post, save_processed
+
+
+@pytest.fixture()
+def archive(tmp_path):
+    return PostArchive(tmp_path / "archive")
+
+
+@pytest.fixture()
+def repo(post_db, archive):
+    """임시 DB + 임시 아카이브를 쓰는 레포 (실제 data/를 건드리지 않는다)."""
+    return post_db.PostRepositorySQLite(archive=archive)
+
+
+def _seed(repo, pid: str, age_days: float, relevant: bool = True, source: str = "twitter") -> None:
+    post = make_post(
+        pid, source=source, content_html=f"<div>본문 {pid}</div>",
+        at=datetime.now() - timedelta(days=age_days),
+    )
+    save_processed(repo, post, is_relevant=relevant, summary=f"요약 {pid}", category_names=["AI"])
+
+
+def test_retention_moves_rows_instead_of_deleting(repo, archive):
+    _seed(repo, "old", age_days=40)
+    _seed(repo, "new", age_days=1)
+
+    assert repo.archive_older_than(days=30) == 1
+
+    assert repo.find_by_id("old") is None
+    assert repo.find_by_id("new") is not None
+    archived = archive.get("old")
+    assert archived.content_html == "<div>본문 old</div>"
+    assert archived.summary == "요약 old" and archived.category_names == ["AI"]
+    assert archive.stats()["rows"] == 1
+
+
+def test_irrelevant_cutoff_only_moves_filtered_out(repo, archive):
+    _seed(repo, "drop", age_days=5, relevant=False)
+    _seed(repo, "keep", age_days=5, relevant=True)
+
+    assert repo.archive_irrelevant_older_than(days=3) == 1
+    assert repo.find_by_id("keep") is not None
+    assert archive.get("drop").is_relevant is False
+
+
+def test_monthly_files_and_range_read(repo, archive):
+    _seed(repo, "a", age_days=90, source="threads")
+    _seed(repo, "b", age_days=60)
+    _seed(repo, "c", age_days=35)
+    repo.archive_older_than(days=30)
+
+    assert len(archive.months()) >= 2
+    start = datetime.now() - timedelta(days=70)
+    assert [p.id for p in archive.iter_posts(start=start)] == ["b", "c"]
+    assert [p.id for p in archive.iter_posts(source="threads")] == ["a"]
+
+
+def test_rearchive_is_idempotent(archive):
+    row = {"id": "x", "source": "twitter", "collected_at": "2026-01-05 10:00:00",
+           "content_text": "본문", "media_urls": "[]", "category_names": "[]",
+           "keywords": "[]"}
+    assert archive.append([row], reason="retention") == 1
+    # 삭제 직전에 죽어 같은 행을 다시 옮겨도 중복되지 않는다
+    assert archive.append([row], reason="retention") == 0
+    assert archive.months() == ["2026-01"]
+
+
+def test_without_archive_falls_back_to_delete(tmp_path, monkeypatch):
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    monkeypatch.setattr(mod, "DB_PATH", tmp_path / "plain.db")
+    monkeypatch.setattr(mod._thread_local, "db", None, raising=False)
+    repo = mod.PostRepositorySQLite()
+    try:
+        _seed(repo, "old", age_days=40)
+        assert repo.archive_older_than(days=30) == 1
+        assert repo.find_by_id("old") is None
+        assert repo.get_archive_stats() == {}
+    finally:
+        mod._get_db().close()
+        monkeypatch.setattr(mod._thread_local, "db", None, raising=False)
@@ -0,0 +1,53 @@
+"""브리핑 경로 프로젝션 — PostSummary 경량 조회와 id 하이드레이션."""
+
+from __future__ import annotations
+
+from src.domain.entities import PostSummary
+from src.infrastructure.ai.llm_processor import _fallback_topic_from_post
+from tests.test_storage.conftest import make_post, save_processed
+
+
+def _seed(repo, pid: str, text: str = "본문", source: str = "twitter") -> None:
+    post = make_post(
+        pid, source=source, text=text, likes=7,
+        content_html="<div>" + text + "</div>", media_urls=["m.jpg"],
+    )
+    save_processed(
+        repo, post,
+        summary=f"요약 {pid}", is_relevant=True, category_names=["AI"], importance_score=0.8,
+    )
+
+
+async def test_summaries_project_light_columns(repo):
+    _seed(repo, "1", text="가" * 1000)
+    _seed(repo, "d1", source="donga_series")
+
+    got = await repo.get_unbriefed_summaries()
+
+    assert [s.id for s in got] == ["1"], "슬랙 전용 소스는 get_unbriefed와 똑같이 제외"
+    s = got[0]
+    assert isinstance(s, PostSummary)
+    assert s.category_names == ["AI"] and s.engagement_likes == 7 and s.importance_score == 0.8
+    assert len(s.content_text) == 300, "원문은 미리보기만 읽는다"
+    assert not hasattr(s, "content_html") and not hasattr(s, "media_urls")
+
+
+async def test_get_by_ids_hydrates_in_order(repo):
+    for pid in ("1", "2", "3"):
+        _seed(repo, pid)
+
+    got = await repo.get_by_ids(["3", "없음", "1", "3"])
+
+    assert [p.id for p in got] == ["3", "1"]
+    assert got[0].content_html == "<div>본문</div>" and got[0].media_urls == ["m.jpg"]
+
+
+async def test_summary_feeds_fallback_topic(repo):
+    _seed(repo, "1")
+    summary = (await repo.get_unbriefed_summaries())[0]
+
+    topic = _fallback_topic_from_post(summary)
+
+    assert topic.post_ids == ["1"]
+    assert topic.headline == "요약 1"
+    assert topic.primary_category == "AI"
@@ -0,0 +1,107 @@
+"""PostRepositorySQLite.search — FTS5(trigram) 인덱스 동기화·랭킹·하이라이트."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.domain.entities import Post
+from tests.test_storage.conftest import make_post
+
+
+def _post(pid: str, text: str, summary: str | None = None, author: str = "작성자") -> Post:
+    return make_post(pid, text=text, summary=summary, author=author, is_relevant=True)
+
+
+async def test_korean_substring_match_via_upsert(repo):
+    repo.save_many([
+        _post("1", "삼성전자가 HBM4 양산을 시작했다"),
+        _post("2", "엔비디아 신제품 발표"),
+    ])
+
+    got = await repo.search(query="삼성전자")
+
+    assert [p.id for p in got] == ["1"]
+
+
+async def test_ranked_by_relevance(repo):
+    repo.save_many([
+        _post("weak", "오늘 날씨 이야기, 끝에 반도체 한 번"),
+        _post("strong", "반도체 반도체 반도체 수출 급증", summary="반도체 수출 호조"),
+    ])
+
+    got = await repo.search(query="반도체")
+
+    assert [p.id for p in got] == ["strong", "weak"]
+
+
+async def test_snippet_is_highlighted_and_escaped(repo):
+    repo.save_many([_post("1", "<b>OpenAI</b>가 새 모델을 공개")])
+
+    got = await repo.search(query="OpenAI")
+
+    snippet = got[0].raw_data["snippet"]
+    assert "<mark>OpenAI</mark>" in snippet
+    assert "&lt;b&gt;" in snippet, "본문 HTML은 이스케이프돼야 한다"
+
+
+async def test_index_follows_update_and_delete(repo):
+    repo.save_many([_post("1", "원문 텍스트")])
+    p = repo.find_by_id("1")
+    p.summary = "엔비디아 실적 요약"
+    p.is_relevant = True
+    repo.update_many([p])
+
+    assert [x.id for x in await repo.search(query="엔비디아")] == ["1"]
+
+    repo.save_many([_post("1", "재수집된 새 본문")])  # ON CONFLICT UPDATE 경로
+    assert await repo.search(query="원문 텍스트") == []
+    assert [x.id for x in await repo.search(query="재수집된")] == ["1"]
+
+    repo.delete("1")
+    assert await repo.search(query="재수집된") == []
+
+
+async def test_short_terms_fall_back_to_like(repo):
+    """trigram은 3글자 미만을 색인 못 한다 — 2글자 한국어 검색어도 찾아야 한다."""
+    repo.save_many([_post("1", "애플 신제품 공개"), _post("2", "구글 검색 개편")])
+
+    got = await repo.search(query="애플")
+
+    assert [p.id for p in got] == ["1"]
+
+
+async def test_fts_operators_in_query_are_literal(repo):
+    repo.save_many([_post("1", "AI OR NOT 논쟁")])
+
+    # 따옴표·연산자가 섞여도 구문 오류 없이 리터럴로 검색된다
+    assert await repo.search(query='"NOT') == []
+    assert [p.id for p in await repo.search(query="AI OR NOT")] == ["1"]
+
+
+def test_existing_rows_indexed_on_first_init(post_db):
+    """FTS 도입 전 DB도 최초 init 때 기존 행이 색인된다."""
+    import asyncio
+    import sqlite3
+
+    conn = sqlite3.connect(post_db.DB_PATH)
+    conn.execute(
+        "CREATE TABLE posts (id TEXT PRIMARY KEY, source TEXT NOT NULL, external_id TEXT NOT NULL,"
+        " url TEXT, author TEXT, author_url TEXT, content_text TEXT NOT NULL, content_html TEXT,"
+        " media_urls TEXT, engagement_likes INTEGER DEFAULT 0, engagement_reposts INTEGER DEFAULT 0,"
+        " engagement_comments INTEGER DEFAULT 0, engagement_views INTEGER DEFAULT 0,"
+        " published_at TIMESTAMP, collected_at TIMESTAMP NOT NULL, summary TEXT,"
+        " importance_score REAL, language TEXT, is_relevant INTEGER, category_names TEXT,"
+        " keywords TEXT, briefed_at TIMESTAMP, content_hash TEXT, dedup_cluster_id INTEGER,"
+        " created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO posts (id, source, external_id, content_text, collected_at, is_relevant)"
+        " VALUES ('old1', 'news', 'old1', '레거시 게시물 본문', ?, 1)",
+        (datetime.utcnow().isoformat(),),
+    )
+    conn.commit()
+    conn.close()
+
+    repo = post_db.PostRepositorySQLite()
+    got = asyncio.run(repo.search(query="레거시"))
+    assert [p.id for p in got] == ["old1"]
@@ -0,0 +1,75 @@
+"""save_many 변경 감지 — 아무것도 안 바뀐 재수집분은 다시 쓰지 않는다."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from functools import partial
+
+from src.domain.value_objects.save_result import SaveResult
+from tests.test_storage.conftest import make_post
+
+
+_T0 = datetime(2026, 3, 1, 9, 0, 0)
+
+
+_post = partial(make_post, text="본문", likes=10, at=_T0)
+
+
+def _raw_row(pid: str):
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    return mod._get_db().execute(
+        "SELECT collected_at, updated_at, engagement_likes FROM posts WHERE id = ?", (pid,)
+    ).fetchone()
+
+
+def test_counts_inserted_updated_unchanged(repo):
+    assert repo.save_many([_post("1"), _post("2")]) == SaveResult(inserted=2)
+
+    later = _T0 + timedelta(minutes=20)
+    result = repo.save_many([
+        _post("1", at=later),             # 그대로 재수집
+        _post("2", likes=99, at=later),   # 인게이지먼트 변화
+        _post("3", at=later),             # 신규
+    ])
+    assert result == SaveResult(inserted=1, updated=1, unchanged=1)
+    assert result.total == 3 and result.written == 2
+
+
+def test_unchanged_row_is_not_rewritten(repo):
+    repo.save_many([_post("1")])
+    before = _raw_row("1")
+
+    repo.save_many([_post("1", at=_T0 + timedelta(hours=1))])
+
+    # 무변경이면 collected_at·updated_at 모두 그대로 (행을 건드리지 않았다)
+    assert tuple(_raw_row("1")) == tuple(before)
+
+
+def test_changed_row_refreshes_and_keeps_processing_state(repo):
+    repo.save_many([_post("1")])
+    post = repo.find_by_id("1")
+    post.summary, post.is_relevant = "요약", True
+    repo.update_many([post])
+
+    later = _T0 + timedelta(hours=1)
+    assert repo.save_many([_post("1", text="수정된 본문", at=later)]).updated == 1
+
+    saved = repo.find_by_id("1")
+    assert saved.content_text == "수정된 본문"
+    assert saved.collected_at == later
+    assert saved.summary == "요약" and saved.is_relevant
+
+
+def test_duplicate_ids_within_one_batch(repo):
+    result = repo.save_many([_post("1"), _post("1"), _post("1", likes=11)])
+    assert result == SaveResult(inserted=1, updated=1, unchanged=1)
+    assert _raw_row("1")["engagement_likes"] == 11
+
+
+async def test_async_variant_shares_change_detection(repo):
+    assert await repo.save_many_async([_post("1"), _post("2")]) == SaveResult(inserted=2)
+    result = await repo.save_many_async([_post("1"), _post("2", likes=99)])
+    assert result == SaveResult(updated=1, unchanged=1)
+    assert await repo.save_many_async([]) == SaveResult()
@@ -0,0 +1,121 @@
+"""이미 저장된 글 인덱스 — 지문이 같은 재수집분은 해시·저장 전에 걸러낸다."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+
+from src.application.use_cases.collect_posts import CollectPostsUseCase
+from src.domain.entities import CollectionRun
+from src.infrastructure.database.seen_index import BloomFilter, SeenPostIndex
+from tests.test_storage.conftest import make_post, save_processed
+
+
+def _index(repo, capacity: int = 1000) -> SeenPostIndex:
+    index = SeenPostIndex(
+        load_recent=lambda: repo.iter_fingerprints(7),
+        lookup=repo.find_fingerprints,
+        capacity=capacity,
+        expected_items=1000,
+    )
+    index.warm()
+    return index
+
+
+_post = partial(make_post, text="본문", likes=10)
+
+
+def test_warmed_index_matches_db_fingerprints(repo):
+    repo.save_many([_post("1", media_urls=["https://img/1.jpg"]), _post("2")])
+    index = _index(repo)
+
+    changed, skipped = index.split_unchanged([
+        _post("1", media_urls=["https://img/1.jpg"]),  # 그대로
+        _post("2", likes=11),                     # 인게이지먼트 변화
+        _post("3"),                               # 신규
+    ])
+    assert [p.external_id for p in changed] == ["2", "3"]
+    assert skipped == 1
+    assert index.known_ids("twitter", ["1", "3"]) == {"1"}
+    assert index.known_ids("threads", ["1"]) == set()  # 키는 (source, external_id)
+
+
+def test_lru_miss_falls_back_to_db(repo):
+    repo.save_many([_post(str(i)) for i in range(5)])
+    index = _index(repo, capacity=2)  # LRU엔 마지막 2건만
+
+    changed, skipped = index.split_unchanged([_post("0"), _post("1", text="수정")])
+    assert [p.external_id for p in changed] == ["1"] and skipped == 1
+    assert index.stats()["db_lookups"] == 1
+
+
+def test_engagement_only_check(repo):
+    repo.save_many([_post("1", likes=3)])
+    index = _index(repo)
+    assert index.engagement_unchanged(_post("1", likes=3, text="목록 행엔 제목뿐"))
+    assert not index.engagement_unchanged(_post("1", likes=4))
+    assert not index.engagement_unchanged(_post("9"))
+
+
+class _Collector:
+    source_name = "twitter"
+
+    def __init__(self, posts):
+        self._posts = posts
+
+    async def is_session_valid(self):
+        return True
+
+    async def collect(self):
+        return self._posts
+
+
+class _RunRepo:
+    async def save(self, run: CollectionRun) -> CollectionRun:
+        return run
+
+    async def update(self, run: CollectionRun) -> CollectionRun:
+        return run
+
+
+async def test_use_case_skips_hash_and_write_for_unchanged(repo):
+    index = _index(repo)
+    first = await CollectPostsUseCase(
+        _Collector([_post("1"), _post("2")]), repo, _RunRepo(), seen=index
+    ).execute()
+    assert (first.posts_inserted, first.posts_unchanged) == (2, 0)
+
+    again = [_post("1"), _post("2", likes=99)]
+    run = await CollectPostsUseCase(_Collector(again), repo, _RunRepo(), seen=index).execute()
+
+    assert (run.posts_collected, run.posts_updated, run.posts_unchanged) == (2, 1, 1)
+    assert again[0].content_hash is None  # 걸러진 글은 해시도 계산하지 않았다
+    assert again[1].content_hash is not None
+
+
+async def test_purged_low_importance_post_is_new_again(repo):
+    save_processed(repo, _post("low"), is_relevant=True, summary="요약", importance_score=0.1)
+    save_processed(repo, _post("high"), is_relevant=True, summary="요약", importance_score=0.9)
+    await repo.mark_briefed(["low", "high"], datetime.now())
+    index = _index(repo)
+    assert index.engagement_unchanged(_post("low"))
+
+    purged = await repo.delete_low_importance(0.3)
+    index.forget(purged)
+
+    assert purged == [("twitter", "low")]
+    assert not index.engagement_unchanged(_post("low")), "지운 글을 '본 글'로 남기면 안 된다"
+    changed, skipped = index.split_unchanged([_post("low"), _post("high")])
+    assert [p.external_id for p in changed] == ["low"] and skipped == 1
+    assert index.known_ids("twitter", ["low", "high"]) == _index(repo).known_ids(
+        "twitter", ["low", "high"]
+    ), "재시작(warm) 뒤와 판정이 같아야 한다"
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"in-{i}")
+    assert all(f"in-{i}" in bloom for i in range(5000))
+    false_hits = sum(f"out-{i}" in bloom for i in range(5000))
+    assert false_hits < 5000 * 0.03
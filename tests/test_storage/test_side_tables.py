@@ -0,0 +1,88 @@
+"""post_categories·post_keywords 정규화 테이블 — update_many 동기화·이관·조회."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+from src.domain.entities import Post
+from tests.test_storage.conftest import make_post, save_processed
+
+
+def _processed(repo, pid: str, categories: list[str], keywords: list[str], relevant: bool = True) -> Post:
+    return save_processed(
+        repo, make_post(pid),
+        summary="요약", is_relevant=relevant, category_names=categories, keywords=keywords,
+    )
+
+
+def _rows(table: str) -> list[tuple]:
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    col = "category" if table == "post_categories" else "keyword"
+    return [tuple(r) for r in mod._get_db().execute(
+        f"SELECT post_id, {col} FROM {table} ORDER BY post_id, {col}"
+    )]
+
+
+async def test_category_filter_uses_side_table(repo):
+    _processed(repo, "1", ["AI", "Cloud"], ["GPT"])
+    _processed(repo, "2", ["Semiconductor"], ["HBM"])
+
+    got = await repo.search(category="AI")
+
+    assert [p.id for p in got] == ["1"]
+
+
+def test_update_many_replaces_rows(repo):
+    post = _processed(repo, "1", ["AI"], ["GPT", "GPT", "OpenAI"])
+    assert _rows("post_categories") == [("1", "AI")]
+    assert _rows("post_keywords") == [("1", "GPT"), ("1", "OpenAI")]
+
+    post.category_names = ["Cloud"]
+    post.keywords = ["AWS"]
+    repo.update_many([post])
+    assert _rows("post_categories") == [("1", "Cloud")]
+    assert _rows("post_keywords") == [("1", "AWS")]
+
+    # 비관련 강등 시 정규화 테이블에서 빠진다
+    post.is_relevant = False
+    repo.update_many([post])
+    assert _rows("post_categories") == []
+    assert _rows("post_keywords") == []
+
+
+def test_delete_cascades_via_trigger(repo):
+    _processed(repo, "1", ["AI"], ["GPT"])
+
+    repo.delete("1")
+
+    assert _rows("post_categories") == []
+    assert _rows("post_keywords") == []
+
+
+async def test_top_keywords_counts_posts(repo):
+    _processed(repo, "1", ["AI"], ["GPT", "OpenAI"])
+    _processed(repo, "2", ["AI"], ["GPT"])
+    _processed(repo, "3", [], ["무관"], relevant=False)
+
+    got = await repo.get_top_keywords(limit=10)
+
+    assert got == [{"keyword": "GPT", "count": 2}, {"keyword": "OpenAI", "count": 1}]
+
+
+def test_existing_json_columns_migrated_once(post_db):
+    """정규화 테이블 도입 전 DB는 최초 init 때 JSON 컬럼에서 이관된다."""
+    post_db.init_sqlite_db()
+    conn = post_db._get_db()
+    conn.execute("DROP TABLE post_categories")
+    conn.execute("DROP TABLE post_keywords")
+    conn.execute(
+        "INSERT INTO posts (id, source, external_id, content_text, collected_at, is_relevant,"
+        " category_names, keywords) VALUES ('old1', 'news', 'old1', '본문', ?, 1, ?, ?)",
+        (datetime.utcnow().isoformat(), json.dumps(["AI"]), json.dumps(["GPT"])),
+    )
+    conn.commit()
+    post_db.init_sqlite_db()
+    assert _rows("post_categories") == [("old1", "AI")]
+    assert _rows("post_keywords") == [("old1", "GPT")]
@@ -0,0 +1,93 @@
+"""SQLiteWriter — 단일 writer 스레드의 그룹 커밋·실패 격리·지표."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.infrastructure.database.sqlite_writer import SQLiteWriter
+
+
+@pytest.fixture()
+def writer(tmp_path):
+    w = SQLiteWriter(tmp_path / "w.db")
+    w.write(lambda conn: conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER)"))
+    yield w
+    w.close()
+
+
+def _count(path) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _hold(writer) -> tuple[threading.Event, object]:
+    """writer를 붙잡는 작업을 넣고 실행이 시작될 때까지 기다린다 — 이후 쓰기는 큐에 쌓인다."""
+    started, gate = threading.Event(), threading.Event()
+    fut = writer.submit(lambda conn: (started.set(), gate.wait(5)))
+    assert started.wait(5)
+    return gate, fut
+
+
+def test_concurrent_writes_are_group_committed(writer):
+    gate, first = _hold(writer)
+    futures = [
+        writer.submit(lambda conn, i=i: conn.execute("INSERT INTO t VALUES (?, ?)", (f"k{i}", i)))
+        for i in range(50)
+    ]
+    assert writer.stats()["queue_depth"] >= 1
+    gate.set()
+    first.result(5)
+    for f in futures:
+        f.result(5)
+
+    stats = writer.stats()
+    assert _count(writer.path) == 50
+    assert stats["ops"] == 52  # CREATE + gate + INSERT 50
+    assert stats["batches"] < stats["ops"], "쌓인 쓰기는 한 번에 커밋돼야 한다"
+    assert stats["max_queue_depth"] >= 50
+
+
+def test_failing_op_does_not_roll_back_batch_mates(writer):
+    gate, _ = _hold(writer)
+    ok1 = writer.submit(lambda conn: conn.execute("INSERT INTO t VALUES ('a', 1)"))
+    bad = writer.submit(lambda conn: conn.execute("INSERT INTO t VALUES ('a', 2)"))  # PK 충돌
+    ok2 = writer.submit(lambda conn: conn.execute("INSERT INTO t VALUES ('b', 3)"))
+    gate.set()
+
+    ok1.result(5)
+    ok2.result(5)
+    with pytest.raises(sqlite3.IntegrityError):
+        bad.result(5)
+    assert _count(writer.path) == 2
+    assert writer.stats()["failed_ops"] == 1
+
+
+async def test_write_async_returns_value(writer):
+    rowcount = await writer.write_async(
+        lambda conn: conn.execute("INSERT INTO t VALUES ('x', 1)").rowcount
+    )
+
+    assert rowcount == 1
+    assert writer.stats()["commit_ms_avg"] >= 0
+
+
+def test_repo_reads_are_read_only(tmp_path, monkeypatch):
+    import src.infrastructure.database.repositories.post_repo_sqlite as mod
+
+    monkeypatch.setattr(mod, "DB_PATH", tmp_path / "t.db")
+    monkeypatch.setattr(mod._thread_local, "db", None, raising=False)
+    mod.init_sqlite_db()
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            mod._get_read_db().execute("DELETE FROM posts")
+        mod.PostRepositorySQLite().delete("없는-id")
+        assert mod.writer_stats()["ops"] >= 1
+    finally:
+        mod._get_db().close()
+        monkeypatch.setattr(mod._thread_local, "db", None, raising=False)